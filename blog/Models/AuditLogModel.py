@@ -84,5 +84,5 @@ class AuditLog(models.Model):
     
     def save(self, *args, **kwargs):
         """Guarda el log con validaciones adicionales."""
-        logger.info(f"Registrando operación de auditoría: {self.change_type} en {self.table_name}")
+        logger.info("Registrando operación de auditoría: %s en %s", self.change_type, self.table_name)
         super().save(*args, **kwargs)
\ No newline at end of file
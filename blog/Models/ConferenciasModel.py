@@ -77,5 +77,5 @@ class Conferencias(models.Model):
     
     def save(self, *args, **kwargs):
         """Guarda el objeto con logging."""
-        logger.info(f"Guardando conferencia: {self.nombre_conferencia}")
+        logger.info("Guardando conferencia: %s", self.nombre_conferencia)
         super().save(*args, **kwargs)
\ No newline at end of file
@@ -76,7 +76,7 @@ class Cursos(models.Model):
             if self.fechainicial_curso >= self.fechafinal_curso:
                 raise ValueError("La fecha inicial debe ser anterior a la fecha final")
         
-        logger.info(f"Guardando curso: {self.nombre_curso}")
+        logger.info("Guardando curso: %s", self.nombre_curso)
         super().save(*args, **kwargs)
     
     @property
@@ -86,5 +86,5 @@ class Integrantes(models.Model):
     
     def save(self, *args, **kwargs):
         """Guarda el objeto con logging."""
-        logger.info(f"Guardando integrante: {self.nombre_integrante}")
+        logger.info("Guardando integrante: %s", self.nombre_integrante)
         super().save(*args, **kwargs)
@@ -83,7 +83,7 @@ class Noticias(models.Model):
     
     def save(self, *args, **kwargs):
         """Guarda la noticia con logging y validaciones."""
-        logger.info(f"Guardando noticia: {self.nombre_noticia}")
+        logger.info("Guardando noticia: %s", self.nombre_noticia)
         super().save(*args, **kwargs)
     
     @property
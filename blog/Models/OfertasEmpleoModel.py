@@ -88,7 +88,7 @@ class OfertasEmpleo(models.Model):
         """
         if not self.pk:  # Si el objeto es nuevo
             self.fecha_publicacion = timezone.now()
-            logger.info(f"Nueva oferta creada: {self.titulo_empleo} - {self.empresa}")
+            logger.info("Nueva oferta creada: %s - %s", self.titulo_empleo, self.empresa)
             
         if not self.fecha_expiracion:
             self.fecha_expiracion = self.fecha_publicacion + timedelta(days=60)
@@ -50,5 +50,5 @@ class ProyectosIntegrantesProyecto(models.Model):
     
     def save(self, *args, **kwargs):
         """Guarda la relación con logging."""
-        logger.info(f"Asignando {self.integrantes.nombre_integrante} al proyecto {self.proyectos.nombre_proyecto}")
+        logger.info("Asignando %s al proyecto %s", self.integrantes.nombre_integrante, self.proyectos.nombre_proyecto)
         super().save(*args, **kwargs)
@@ -10,10 +10,14 @@ from django.contrib.auth.models import User
 from django.core.validators import URLValidator
 from blog.Models.IntegrantesModel import Integrantes
 from django.utils import timezone
+from blog.tecnologias import extraer_tecnologias
 import logging
 
 logger = logging.getLogger(__name__)
 
+# Descripción no cargada (instancia creada a mano o campo diferido)
+_SIN_CARGAR = object()
+
 
 class Proyectos(models.Model):
     """
@@ -73,13 +77,44 @@ class Proyectos(models.Model):
         """Representación string del objeto."""
         return self.nombre_proyecto
     
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        """Recuerda la descripción cargada para saber al guardar si cambió."""
+        instancia = super().from_db(db, field_names, values)
+        instancia._descripcion_guardada = instancia.__dict__.get('description_proyecto', _SIN_CARGAR)
+        return instancia
+
     def save(self, *args, **kwargs):
         """Guarda el proyecto con logging y validaciones."""
         if not self.fecha_proyecto:
             self.fecha_proyecto = timezone.now()
             
-        logger.info(f"Guardando proyecto: {self.nombre_proyecto}")
+        logger.info("Guardando proyecto: %s", self.nombre_proyecto)
+        # Solo al crear o si cambió la descripción (un campo diferido sin
+        # asignar no está en __dict__ y cuenta como sin cambios)
+        descripcion = self.__dict__.get('description_proyecto', _SIN_CARGAR)
+        reindexar = self._state.adding or descripcion != getattr(self, '_descripcion_guardada', _SIN_CARGAR)
         super().save(*args, **kwargs)
+
+        update_fields = kwargs.get('update_fields')
+        if reindexar and (update_fields is None or 'description_proyecto' in update_fields):
+            self.actualizar_tecnologias()
+            self._descripcion_guardada = descripcion
+
+    def actualizar_tecnologias(self):
+        """Sincroniza las tecnologías indexadas con la descripción actual."""
+        nuevas = extraer_tecnologias(self.description_proyecto)
+        actuales = set(self.tecnologias.values_list('tecnologia', flat=True))
+        if nuevas == actuales:
+            return
+
+        if actuales - nuevas:
+            self.tecnologias.filter(tecnologia__in=actuales - nuevas).delete()
+        modelo = self.tecnologias.model
+        modelo.objects.bulk_create(
+            [modelo(proyecto=self, tecnologia=tecnologia) for tecnologia in nuevas - actuales],
+            ignore_conflicts=True
+        )
     
     @property
     def total_integrantes(self):
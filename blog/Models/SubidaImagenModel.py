@@ -0,0 +1,101 @@
+"""
+Modelo para las subidas de imágenes diferidas.
+
+Con `IMAGE_UPLOAD_ASYNC` activo, las imágenes recibidas en las escrituras
+se guardan en un almacenamiento temporal y cada una queda registrada aquí
+hasta que la tarea `blog.tasks.finalizar_subida_imagen` la sube al
+almacenamiento definitivo y actualiza el registro (ver `blog/subidas.py`).
+"""
+
+from django.contrib.contenttypes.models import ContentType
+from django.db import models
+import logging
+
+logger = logging.getLogger(__name__)
+
+
+class SubidaImagen(models.Model):
+    """
+    Imagen pendiente de subir para un campo de un registro.
+
+    Attributes:
+        content_type (ContentType): Modelo del registro
+        object_id (str): Clave primaria del registro
+        campo (str): Nombre del campo de imagen
+        archivo (str): Ruta del archivo en el almacenamiento temporal
+        nombre_original (str): Nombre del archivo recibido
+        estado (str): pendiente, completada, reemplazada o error
+        intentos (int): Intentos de subida realizados
+        error (str): Último error de subida
+        creada (datetime): Fecha de recepción
+        actualizada (datetime): Fecha del último cambio de estado
+    """
+
+    PENDIENTE = 'pendiente'
+    COMPLETADA = 'completada'
+    REEMPLAZADA = 'reemplazada'
+    ERROR = 'error'
+    ESTADOS = [
+        (PENDIENTE, 'Pendiente'),
+        (COMPLETADA, 'Completada'),
+        (REEMPLAZADA, 'Reemplazada'),
+        (ERROR, 'Error'),
+    ]
+
+    content_type = models.ForeignKey(
+        ContentType,
+        on_delete=models.CASCADE,
+        help_text="Modelo del registro al que pertenece la imagen"
+    )
+    object_id = models.CharField(
+        max_length=64,
+        help_text="Clave primaria del registro"
+    )
+    campo = models.CharField(
+        max_length=100,
+        help_text="Campo de imagen del registro"
+    )
+    archivo = models.CharField(
+        max_length=255,
+        help_text="Ruta del archivo en el almacenamiento temporal"
+    )
+    nombre_original = models.CharField(
+        max_length=255,
+        help_text="Nombre del archivo recibido"
+    )
+    estado = models.CharField(
+        max_length=12,
+        choices=ESTADOS,
+        default=PENDIENTE,
+        help_text="Estado de la subida"
+    )
+    intentos = models.PositiveSmallIntegerField(
+        default=0,
+        help_text="Intentos de subida realizados"
+    )
+    error = models.TextField(
+        blank=True,
+        default='',
+        help_text="Último error de subida"
+    )
+    creada = models.DateTimeField(
+        auto_now_add=True,
+        help_text="Fecha de recepción de la imagen"
+    )
+    actualizada = models.DateTimeField(
+        auto_now=True,
+        help_text="Fecha del último cambio de estado"
+    )
+
+    class Meta:
+        verbose_name = "Subida de imagen"
+        verbose_name_plural = "Subidas de imágenes"
+        ordering = ['-creada']
+        indexes = [
+            models.Index(fields=['content_type', 'object_id', 'campo']),
+            models.Index(fields=['estado']),
+        ]
+
+    def __str__(self):
+        """Representación string del objeto."""
+        return f"{self.content_type.model}#{self.object_id}.{self.campo} ({self.estado})"
@@ -0,0 +1,46 @@
+"""
+Modelo para el índice de tecnologías de cada proyecto.
+
+Este modelo guarda las tecnologías detectadas en la descripción de los
+proyectos para poder agregarlas sin volver a analizar el texto.
+"""
+
+from django.db import models
+from blog.Models.ProyectosModel import Proyectos
+
+
+class TecnologiaProyecto(models.Model):
+    """
+    Tecnología mencionada en la descripción de un proyecto.
+
+    Las filas se generan automáticamente al guardar el proyecto
+    (ver `Proyectos.actualizar_tecnologias`) y con el comando
+    `reindexar_tecnologias` tras cambiar `TECNOLOGIAS_PROYECTOS`.
+
+    Attributes:
+        proyecto (Proyectos): Proyecto que menciona la tecnología
+        tecnologia (str): Nombre de la tecnología en minúsculas
+    """
+
+    proyecto = models.ForeignKey(
+        Proyectos,
+        on_delete=models.CASCADE,
+        related_name='tecnologias',
+        help_text="Proyecto que menciona la tecnología"
+    )
+    tecnologia = models.CharField(
+        max_length=50,
+        help_text="Tecnología detectada en la descripción (en minúsculas)"
+    )
+
+    class Meta:
+        verbose_name = "Tecnología de Proyecto"
+        verbose_name_plural = "Tecnologías de Proyectos"
+        unique_together = ['proyecto', 'tecnologia']
+        indexes = [
+            models.Index(fields=['tecnologia']),
+        ]
+
+    def __str__(self):
+        """Representación string del objeto."""
+        return f"{self.tecnologia} en {self.proyecto_id}"
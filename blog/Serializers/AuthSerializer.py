@@ -71,3 +71,21 @@ class LogoutResponseSerializer(serializers.Serializer):
     """
     success = serializers.BooleanField()
     message = serializers.CharField()
+
+
+class RefreshTokenSerializer(serializers.Serializer):
+    """
+    Serializer para refrescar o revocar tokens firmados
+    """
+    refresh = serializers.CharField(required=True)
+
+
+class TokenResponseSerializer(serializers.Serializer):
+    """
+    Serializer para la respuesta de emisión de tokens firmados
+    """
+    access = serializers.CharField()
+    refresh = serializers.CharField()
+    token_type = serializers.CharField()
+    expires_in = serializers.IntegerField()
+    user = UserSerializer()
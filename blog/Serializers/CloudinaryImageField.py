@@ -0,0 +1,102 @@
+"""
+Campos de serializer para imágenes de Cloudinary.
+
+`CloudinaryImageField` sustituye a `serializers.ImageField` en los modelos
+con `CloudinaryField`: acepta las mismas subidas (pre-procesadas con
+`blog.preprocesado` si `IMAGE_PREPROCESS` está activo) y representa la
+imagen con la misma URL, pero generada con `blog.imagenes` sin recorrer el
+SDK en cada fila. `CloudinaryVariantsField` expone las variantes redimensionadas y el
+`srcset` de la misma imagen.
+"""
+
+from django.conf import settings
+from PIL import Image
+from rest_framework import serializers
+
+from blog.imagenes import ConstructorURL, es_recurso
+from blog.preprocesado import preprocesar_imagen
+
+
+class CloudinaryImageField(serializers.ImageField):
+    """
+    ImageField con la URL de entrega construida por `ConstructorURL`.
+
+    Args:
+        lado_maximo (int): Píxeles máximos por lado al pre-procesar
+            (default: IMAGE_PREPROCESS_MAX_SIZE)
+    """
+
+    def __init__(self, lado_maximo=None, **kwargs):
+        self.lado_maximo = lado_maximo
+        super().__init__(**kwargs)
+
+    def to_internal_value(self, data):
+        archivo = super().to_internal_value(data)
+        if not getattr(settings, 'IMAGE_PREPROCESS', False):
+            return archivo
+        try:
+            archivo, _ = preprocesar_imagen(archivo, lado_maximo=self.lado_maximo)
+        except (OSError, ValueError, Image.DecompressionBombError):
+            # ImageField solo llama a verify(): un archivo truncado o corrupto
+            # falla aquí, al decodificarlo por completo
+            self.fail('invalid_image')
+        return archivo
+
+    def to_representation(self, value):
+        if not value:
+            return None
+        if not es_recurso(value):
+            return super().to_representation(value)
+        return ConstructorURL.actual().url(value)
+
+    def convertidor(self, contexto):
+        """
+        Convertidor para `ValuesSerializer` (constructor resuelto una vez).
+
+        Args:
+            contexto (dict): Contexto del serializer
+
+        Returns:
+            callable: Valor de la columna → URL
+        """
+        constructor = ConstructorURL.actual()
+
+        def convertir(valor):
+            if not valor:
+                return None
+            return constructor.url(valor) if es_recurso(valor) else self.to_representation(valor)
+        return convertir
+
+
+class CloudinaryVariantsField(serializers.Field):
+    """
+    Variantes de una imagen de Cloudinary para `<img srcset>`.
+
+    Uso:
+        imagen_variantes = CloudinaryVariantsField(source='imagen')
+
+    Representa `{'thumbnail': url, 'card': url, 'full': url, 'srcset': '...'}`
+    (ver `CLOUDINARY_VARIANTES` y `CLOUDINARY_SRCSET_ANCHOS`).
+    """
+
+    def __init__(self, **kwargs):
+        kwargs['read_only'] = True
+        super().__init__(**kwargs)
+
+    def to_representation(self, value):
+        if not value or not es_recurso(value):
+            return None
+        return ConstructorURL.actual().variantes(value)
+
+    def convertidor(self, contexto):
+        """
+        Convertidor para `ValuesSerializer` (constructor resuelto una vez).
+
+        Args:
+            contexto (dict): Contexto del serializer
+
+        Returns:
+            callable: Valor de la columna → variantes
+        """
+        constructor = ConstructorURL.actual()
+        return lambda valor: constructor.variantes(valor) if valor and es_recurso(valor) else None
@@ -1,8 +1,11 @@
 from rest_framework import serializers
+from blog.subidas import SubidaDiferidaMixin
+from blog.Serializers.CloudinaryImageField import CloudinaryImageField, CloudinaryVariantsField
 from blog.Models.ConferenciasModel import Conferencias
 
-class ConferenciasSerializer(serializers.ModelSerializer):
-    imagen_conferencia = serializers.ImageField()
+class ConferenciasSerializer(SubidaDiferidaMixin, serializers.ModelSerializer):
+    imagen_conferencia = CloudinaryImageField()
+    imagen_conferencia_variantes = CloudinaryVariantsField(source='imagen_conferencia')
     class Meta:
         model = Conferencias
         fields = '__all__'
\ No newline at end of file
@@ -1,9 +1,12 @@
 from rest_framework import serializers
+from blog.subidas import SubidaDiferidaMixin
+from blog.Serializers.CloudinaryImageField import CloudinaryImageField, CloudinaryVariantsField
 from blog.Models.IntegrantesModel import Integrantes
 # Convierte el modelo Integrantes(Python) en un JSON para ser
 # Consumido por la API
-class IntegrantesSerializer(serializers.ModelSerializer):
-    imagen = serializers.ImageField()
+class IntegrantesSerializer(SubidaDiferidaMixin, serializers.ModelSerializer):
+    imagen = CloudinaryImageField(lado_maximo=1024)  # Foto de perfil
+    imagen_variantes = CloudinaryVariantsField(source='imagen')
     class Meta:
         model = Integrantes
         fields = '__all__'
\ No newline at end of file
@@ -1,8 +1,11 @@
 from rest_framework import serializers
+from blog.subidas import SubidaDiferidaMixin
+from blog.Serializers.CloudinaryImageField import CloudinaryImageField, CloudinaryVariantsField
 from blog.Models.NoticiasModel import Noticias
 
-class NoticiasSerializer(serializers.ModelSerializer):
-    imagen_noticia = serializers.ImageField()
+class NoticiasSerializer(SubidaDiferidaMixin, serializers.ModelSerializer):
+    imagen_noticia = CloudinaryImageField()
+    imagen_noticia_variantes = CloudinaryVariantsField(source='imagen_noticia')
 
     class Meta:
         model = Noticias
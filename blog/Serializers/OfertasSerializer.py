@@ -1,11 +1,14 @@
 from rest_framework import serializers
+from blog.subidas import SubidaDiferidaMixin
+from blog.Serializers.CloudinaryImageField import CloudinaryImageField, CloudinaryVariantsField
 from blog.Models.OfertasEmpleoModel import OfertasEmpleo
 import base64
 import binascii
 # Convierte el modelo OfertasEmpleo(Python) en un JSON para ser
 # Consumido por la API
-class OfertasEmpleoSerializer(serializers.ModelSerializer):
-    imagen = serializers.ImageField()
+class OfertasEmpleoSerializer(SubidaDiferidaMixin, serializers.ModelSerializer):
+    imagen = CloudinaryImageField()
+    imagen_variantes = CloudinaryVariantsField(source='imagen')
     class Meta:
         model = OfertasEmpleo
         fields = '__all__'
\ No newline at end of file
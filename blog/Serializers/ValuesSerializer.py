@@ -0,0 +1,297 @@
+"""
+Serialización de solo lectura a partir de filas `.values()`.
+
+Los `ModelSerializer` construyen una instancia del modelo por fila y llaman
+a `get_attribute`/`to_representation` de cada campo. Para listados y
+detalles basta con leer las columnas con `.values()` y aplicar a cada una
+un convertidor precompilado por serializer, que reproduce exactamente la
+salida del campo de DRF correspondiente (fechas ISO 8601 en la zona
+actual, URLs absolutas de imágenes, claves primarias de relaciones...).
+
+Los serializers con campos que dependen de la instancia (métodos,
+propiedades, `source='*'`, serializers anidados) no se compilan y siguen
+usando la ruta normal de DRF.
+"""
+
+from functools import lru_cache
+
+from django.conf import settings
+from django.core.exceptions import FieldDoesNotExist
+from django.utils import timezone
+from rest_framework import serializers
+from rest_framework.response import Response
+from rest_framework.settings import ISO_8601, api_settings
+
+# Campos de DRF cuya representación es el propio valor leído de la base de datos
+_CAMPOS_DIRECTOS = (
+    serializers.IntegerField,
+    serializers.CharField,
+    serializers.EmailField,
+    serializers.URLField,
+    serializers.SlugField,
+    serializers.BooleanField,
+    serializers.ReadOnlyField,
+)
+
+
+class _Relacion:
+    """Campo muchos a muchos representado como lista de claves primarias."""
+
+    def __init__(self, campo_modelo):
+        self.modelo = campo_modelo.related_model
+        self.consulta = campo_modelo.related_query_name()
+
+    def cargar(self, ids):
+        """
+        Lee las claves relacionadas de todos los objetos en una consulta.
+
+        Con el mismo orden que `objeto.<relacion>.all()` (el `ordering` del
+        modelo relacionado).
+
+        Returns:
+            dict: pk del objeto → lista de pks relacionadas
+        """
+        relacionados = {pk: [] for pk in ids}
+        filas = self.modelo._default_manager.filter(**{f'{self.consulta}__in': ids})
+        for pk, relacionado in filas.values_list(self.consulta, 'pk'):
+            relacionados[pk].append(relacionado)
+        return relacionados
+
+
+def _directo(campo, contexto):
+    return None
+
+
+def _opciones(campo, contexto):
+    valores = campo.choice_strings_to_values
+    return lambda valor: valor if valor == '' else valores.get(str(valor), valor)
+
+
+def _fecha_hora(campo, contexto):
+    if getattr(campo, 'format', api_settings.DATETIME_FORMAT) != ISO_8601:
+        return campo.to_representation
+    zona = campo.timezone if hasattr(campo, 'timezone') else campo.default_timezone()
+    if zona is None:
+        return campo.to_representation
+
+    def convertir(valor):
+        if not timezone.is_aware(valor):
+            return campo.to_representation(valor)
+        valor = valor.astimezone(zona).isoformat()
+        return valor[:-6] + 'Z' if valor.endswith('+00:00') else valor
+    return convertir
+
+
+def _archivo(campo, contexto):
+    if not getattr(campo, 'use_url', api_settings.UPLOADED_FILES_USE_URL):
+        return campo.to_representation
+    request = contexto.get('request')
+
+    def convertir(valor):
+        if not valor:
+            return None
+        try:
+            url = valor.url
+        except AttributeError:
+            return None
+        return request.build_absolute_uri(url) if request is not None else url
+    return convertir
+
+
+def _representacion(campo, contexto):
+    return campo.to_representation
+
+
+def _propio(campo, contexto):
+    return campo.convertidor(contexto)
+
+
+def _fabrica(campo, campo_modelo):
+    """
+    Elige el convertidor de un campo de DRF.
+
+    Returns:
+        callable | None: Fábrica `(campo, contexto) → convertidor`, o None si
+        el campo no se puede calcular desde una columna
+    """
+    if hasattr(campo, 'convertidor'):
+        # Campos propios que ya saben convertir valores de columna en bloque
+        return _propio
+    if isinstance(campo, serializers.PrimaryKeyRelatedField):
+        es_clave = campo_modelo.many_to_one or campo_modelo.one_to_one
+        return _directo if campo.pk_field is None and es_clave else None
+    if isinstance(campo, (serializers.RelatedField, serializers.ManyRelatedField, serializers.BaseSerializer)):
+        return None
+    if isinstance(campo, (serializers.SerializerMethodField, serializers.HiddenField, serializers.ModelField)):
+        return None
+    if isinstance(campo, serializers.FileField):
+        return _archivo
+    if isinstance(campo, serializers.DateTimeField):
+        return _fecha_hora
+    if isinstance(campo, serializers.ChoiceField):
+        return _opciones
+    if isinstance(campo, serializers.JSONField):
+        return _representacion if campo.binary else _directo
+    if type(campo) in _CAMPOS_DIRECTOS:
+        return _directo
+    return _representacion
+
+
+@lru_cache(maxsize=None)
+def compilar(serializer_class):
+    """
+    Precompila la lectura por columnas de un `ModelSerializer`.
+
+    Args:
+        serializer_class: Clase del serializer
+
+    Returns:
+        tuple | None: (campos, clave primaria), o None si algún campo
+        necesita la instancia del modelo. Cada campo es
+        (nombre, columna, campo de DRF, fábrica, relación)
+    """
+    if not issubclass(serializer_class, serializers.ModelSerializer):
+        return None
+    serializer = serializer_class()
+    modelo = serializer.Meta.model
+    campos = []
+    for campo in serializer._readable_fields:
+        if len(campo.source_attrs) != 1:
+            return None
+        try:
+            campo_modelo = modelo._meta.get_field(campo.source)
+        except FieldDoesNotExist:
+            return None
+        if not campo_modelo.concrete:
+            return None
+
+        if campo_modelo.many_to_many:
+            hijo = getattr(campo, 'child_relation', None)
+            if not isinstance(hijo, serializers.PrimaryKeyRelatedField) or hijo.pk_field is not None:
+                return None
+            campos.append((campo.field_name, None, campo, None, _Relacion(campo_modelo)))
+            continue
+
+        fabrica = _fabrica(campo, campo_modelo)
+        if fabrica is None:
+            return None
+        campos.append((campo.field_name, campo_modelo.attname, campo, fabrica, None))
+    return tuple(campos), modelo._meta.pk.attname
+
+
+class ValuesSerializer:
+    """
+    Serializador de lectura equivalente a un `ModelSerializer`.
+
+    Uso:
+        rapido = ValuesSerializer.para(NoticiasSerializer, contexto)
+        datos = rapido.serializar(rapido.preparar(queryset))
+
+    Attributes:
+        columnas (tuple): Columnas a pedir a `.values()`
+    """
+
+    def __init__(self, plan, contexto=None):
+        campos, self.pk = plan
+        contexto = contexto or {}
+        self.campos = [
+            (nombre, columna, fabrica(campo, contexto) if fabrica else None, relacion)
+            for nombre, columna, campo, fabrica, relacion in campos
+        ]
+        self.relaciones = [relacion for _, _, _, relacion in self.campos if relacion is not None]
+        self.columnas = tuple(dict.fromkeys(
+            [columna for _, columna, _, _ in self.campos if columna] + [self.pk]
+        ))
+
+    @classmethod
+    def para(cls, serializer_class, contexto=None):
+        """
+        Crea el serializador rápido de una clase de serializer.
+
+        Args:
+            serializer_class: Clase del `ModelSerializer`
+            contexto (dict): Contexto del serializer (request, view...)
+
+        Returns:
+            ValuesSerializer | None: None si el serializer no es compatible
+        """
+        plan = compilar(serializer_class)
+        return cls(plan, contexto) if plan is not None else None
+
+    def preparar(self, queryset):
+        """Convierte el queryset en uno de diccionarios con las columnas necesarias."""
+        return queryset.prefetch_related(None).values(*self.columnas)
+
+    def serializar(self, filas):
+        """
+        Serializa filas obtenidas con `preparar`.
+
+        Args:
+            filas: Diccionarios de `.values()` (una página o el queryset)
+
+        Returns:
+            list: Igual que `Serializer(..., many=True).data`
+        """
+        filas = list(filas)
+        cargadas = {
+            relacion: relacion.cargar([fila[self.pk] for fila in filas])
+            for relacion in self.relaciones
+        } if filas else {}
+
+        datos = []
+        for fila in filas:
+            item = {}
+            for nombre, columna, convertir, relacion in self.campos:
+                if relacion is not None:
+                    item[nombre] = cargadas[relacion][fila[self.pk]]
+                    continue
+                valor = fila[columna]
+                item[nombre] = valor if valor is None or convertir is None else convertir(valor)
+            datos.append(item)
+        return datos
+
+    def serializar_instancia(self, instancia):
+        """
+        Serializa una instancia ya cargada (p. ej. la de `get_object`).
+
+        Returns:
+            dict: Igual que `Serializer(instancia).data`
+        """
+        return self.serializar([{columna: getattr(instancia, columna) for columna in self.columnas}])[0]
+
+
+class ValuesReadMixin:
+    """
+    Mixin para ViewSets que sirve `list` y `retrieve` con `ValuesSerializer`.
+
+    Se desactiva con `FAST_READ_SERIALIZERS=False` o si el serializer del
+    ViewSet no es compatible; en ambos casos se usa la ruta normal de DRF.
+    """
+
+    def get_values_serializer(self):
+        """
+        Serializador rápido para la acción actual.
+
+        Returns:
+            ValuesSerializer | None: None si se debe usar el serializer normal
+        """
+        if not getattr(settings, 'FAST_READ_SERIALIZERS', True):
+            return None
+        return ValuesSerializer.para(self.get_serializer_class(), self.get_serializer_context())
+
+    def list(self, request, *args, **kwargs):
+        rapido = self.get_values_serializer()
+        if rapido is None:
+            return super().list(request, *args, **kwargs)
+
+        queryset = rapido.preparar(self.filter_queryset(self.get_queryset()))
+        page = self.paginate_queryset(queryset)
+        if page is not None:
+            return self.get_paginated_response(rapido.serializar(page))
+        return Response(rapido.serializar(queryset))
+
+    def retrieve(self, request, *args, **kwargs):
+        rapido = self.get_values_serializer()
+        if rapido is None:
+            return super().retrieve(request, *args, **kwargs)
+        return Response(rapido.serializar_instancia(self.get_object()))
@@ -0,0 +1,296 @@
+"""
+Vistas asíncronas de solo lectura para el modo de despliegue ASGI.
+
+Cuando `ASYNC_API` está activo, los endpoints públicos de listado, detalle
+y estadísticas se atienden con el ORM asíncrono de Django (`aiterator`,
+`acount`, `aget`) para que un worker uvicorn no quede bloqueado esperando
+a la base de datos. Autenticación, permisos y throttling se siguen
+resolviendo con las mismas clases del ViewSet síncrono, y cualquier
+petición que esta ruta no sepa atender (escrituras, renderizado navegable,
+páginas inválidas, objetos inexistentes) se delega al ViewSet original
+ejecutado con `sync_to_async`. Si `initial` ya se ejecutó, el throttling
+reutiliza lo cobrado en la petición (ver `blog.throttling`) y la delegación
+no vuelve a consumir presupuesto.
+"""
+
+from asgiref.sync import sync_to_async
+from django.core.exceptions import ObjectDoesNotExist, ValidationError as DjangoValidationError
+from django.http import HttpResponse
+from django.urls import re_path
+from django.utils.cache import patch_vary_headers
+from django.views import View
+from rest_framework.relations import ManyRelatedField
+
+from blog.facets import FACETS_PARAM
+
+
+class _PaginaPrecargada:
+    """
+    Filas ya leídas de la base de datos que se presentan al `Paginator`
+    de Django como si fueran un queryset.
+
+    Permite reutilizar sin cambios las clases de paginación de DRF
+    (y por tanto el mismo formato de respuesta) sin que el paginador
+    ejecute consultas síncronas.
+    """
+
+    def __init__(self, filas, total, desplazamiento):
+        self._filas = filas
+        self._total = total
+        self._desplazamiento = desplazamiento
+
+    def count(self):
+        return self._total
+
+    def __len__(self):
+        return self._total
+
+    def __getitem__(self, indice):
+        if not isinstance(indice, slice):
+            return self._filas[indice - self._desplazamiento]
+        inicio = (indice.start or 0) - self._desplazamiento
+        fin = None if indice.stop is None else indice.stop - self._desplazamiento
+        return self._filas[inicio:fin]
+
+
+class AsyncReadOnlyView(View):
+    """
+    Vista asíncrona que atiende las lecturas de un ViewSet de DRF.
+
+    Attributes:
+        viewset_class: ViewSet síncrono cuyas clases de autenticación,
+            permisos, filtros, paginación y serializer se reutilizan
+        acciones (dict): Mapa método → acción de la ruta (como en el router)
+        accion (str): Acción atendida de forma asíncrona para GET
+        viewset_initkwargs (dict): Argumentos con los que el router instancia el ViewSet
+        vista_sync: Vista del ViewSet a la que se delega lo demás
+    """
+
+    viewset_class = None
+    acciones = None
+    accion = None
+    viewset_initkwargs = None
+    vista_sync = None
+
+    @classmethod
+    def as_view(cls, **initkwargs):
+        vista = super().as_view(**initkwargs)
+        # DRF aplica su propia verificación CSRF en SessionAuthentication
+        vista.csrf_exempt = True
+        return vista
+
+    async def get(self, request, *args, **kwargs):
+        """
+        Atiende la lectura de forma asíncrona o la delega al ViewSet.
+
+        Returns:
+            HttpResponse: Respuesta renderizada por el renderer negociado
+        """
+        if 'format' in request.GET or FACETS_PARAM in request.GET:
+            # Las facetas se calculan (y cachean) en el listado síncrono
+            return await self.delegar(request, *args, **kwargs)
+
+        viewset, drf_request = self.crear_viewset(request, args, kwargs)
+        try:
+            await sync_to_async(viewset.initial)(drf_request, *args, **kwargs)
+        except Exception:
+            # El ViewSet síncrono genera la respuesta de error apropiada
+            return await self.delegar(request, *args, **kwargs)
+
+        if getattr(drf_request.accepted_renderer, 'format', None) == 'api':
+            # El renderizado navegable depende de formularios y plantillas síncronas
+            return await self.delegar(request, *args, **kwargs)
+
+        try:
+            datos = await self.obtener_datos(viewset, drf_request)
+        except (ObjectDoesNotExist, ValueError, TypeError, DjangoValidationError):
+            return await self.delegar(request, *args, **kwargs)
+
+        if datos is None:
+            return await self.delegar(request, *args, **kwargs)
+
+        return self.renderizar(viewset, drf_request, datos)
+
+    async def delegar(self, request, *args, **kwargs):
+        """
+        Ejecuta la vista síncrona del ViewSet en un hilo.
+
+        Returns:
+            Response: Respuesta de DRF ya renderizada
+        """
+        def ejecutar():
+            respuesta = self.vista_sync(request, *args, **kwargs)
+            if hasattr(respuesta, 'render') and callable(respuesta.render):
+                respuesta.render()
+            return respuesta
+
+        return await sync_to_async(ejecutar)()
+
+    post = put = patch = delete = options = delegar
+
+    def crear_viewset(self, request, args, kwargs):
+        """
+        Instancia el ViewSet como lo haría `ViewSetMixin.as_view`.
+
+        Returns:
+            tuple: (instancia del ViewSet, Request de DRF)
+        """
+        viewset = self.viewset_class(**self.viewset_initkwargs)
+        viewset.action_map = self.acciones
+        for metodo, accion in self.acciones.items():
+            setattr(viewset, metodo, getattr(viewset, accion))
+        if hasattr(viewset, 'get') and not hasattr(viewset, 'head'):
+            viewset.head = viewset.get
+
+        viewset.args = args
+        viewset.kwargs = kwargs
+        drf_request = viewset.initialize_request(request, *args, **kwargs)
+        viewset.request = drf_request
+        viewset.headers = viewset.default_response_headers
+        return viewset, drf_request
+
+    async def obtener_datos(self, viewset, drf_request):
+        """
+        Obtiene los datos a renderizar para la acción configurada.
+
+        Returns:
+            dict | list | None: Datos serializados, o None para delegar
+        """
+        if self.accion == 'list':
+            return await self.listar(viewset, drf_request)
+        if self.accion == 'retrieve':
+            return await self.recuperar(viewset, drf_request)
+        return await getattr(viewset, f'a{self.accion}')(drf_request)
+
+    def _serializador_rapido(self, viewset):
+        if not hasattr(viewset, 'get_values_serializer'):
+            return None
+        return viewset.get_values_serializer()
+
+    async def _serializar(self, viewset, rapido, filas):
+        if rapido is None:
+            return viewset.get_serializer(filas, many=True).data
+        if rapido.relaciones:
+            # Las relaciones muchos a muchos se leen con una consulta síncrona
+            return await sync_to_async(rapido.serializar)(filas)
+        return rapido.serializar(filas)
+
+    def _queryset(self, viewset, rapido=None):
+        queryset = viewset.filter_queryset(viewset.get_queryset())
+        if rapido is not None:
+            return rapido.preparar(queryset)
+        relaciones = [
+            campo.source
+            for campo in viewset.get_serializer().fields.values()
+            if isinstance(campo, ManyRelatedField) and campo.source != '*'
+        ]
+        if relaciones:
+            queryset = queryset.prefetch_related(*relaciones)
+        return queryset
+
+    async def listar(self, viewset, drf_request):
+        """Versión asíncrona de `ListModelMixin.list`."""
+        rapido = self._serializador_rapido(viewset)
+        queryset = self._queryset(viewset, rapido)
+        paginador = viewset.paginator
+
+        tamano = paginador.get_page_size(drf_request) if paginador is not None else None
+        if not tamano:
+            filas = [obj async for obj in queryset.aiterator(chunk_size=2000)]
+            return await self._serializar(viewset, rapido, filas)
+
+        numero = drf_request.query_params.get(paginador.page_query_param) or 1
+        try:
+            numero = int(numero)
+        except (TypeError, ValueError):
+            return None
+        if numero < 1:
+            return None
+
+        total = await queryset.acount()
+        desplazamiento = (numero - 1) * tamano
+        if numero > 1 and desplazamiento >= total:
+            return None
+
+        filas = [
+            obj async for obj in queryset[desplazamiento:desplazamiento + tamano].aiterator(chunk_size=tamano)
+        ]
+        pagina = paginador.paginate_queryset(
+            _PaginaPrecargada(filas, total, desplazamiento), drf_request, view=viewset
+        )
+        datos = await self._serializar(viewset, rapido, pagina)
+        return paginador.get_paginated_response(datos).data
+
+    async def recuperar(self, viewset, drf_request):
+        """Versión asíncrona de `RetrieveModelMixin.retrieve`."""
+        lookup_url_kwarg = viewset.lookup_url_kwarg or viewset.lookup_field
+        filtro = {viewset.lookup_field: viewset.kwargs[lookup_url_kwarg]}
+        obj = await self._queryset(viewset).aget(**filtro)
+        await sync_to_async(viewset.check_object_permissions)(drf_request, obj)
+        return viewset.get_serializer(obj).data
+
+    def renderizar(self, viewset, drf_request, datos):
+        """
+        Renderiza los datos con el renderer negociado por DRF.
+
+        Returns:
+            HttpResponse: Respuesta con las mismas cabeceras que el ViewSet
+        """
+        renderer = drf_request.accepted_renderer
+        media_type = drf_request.accepted_media_type
+        contexto = {'view': viewset, 'request': drf_request, 'args': viewset.args, 'kwargs': viewset.kwargs}
+        contenido = renderer.render(datos, media_type, contexto)
+
+        content_type = media_type
+        if renderer.charset and 'charset' not in content_type:
+            content_type = f'{content_type}; charset={renderer.charset}'
+
+        respuesta = HttpResponse(contenido, content_type=content_type)
+        for cabecera, valor in viewset.headers.items():
+            if cabecera == 'Vary':
+                patch_vary_headers(respuesta, [valor])
+            else:
+                respuesta[cabecera] = valor
+        return respuesta
+
+
+ACCIONES_LISTA = {'get': 'list', 'post': 'create'}
+ACCIONES_DETALLE = {'get': 'retrieve', 'put': 'update', 'patch': 'partial_update', 'delete': 'destroy'}
+
+
+def rutas_asincronas(prefijo, viewset_class, basename, acciones_extra=()):
+    """
+    Construye las rutas asíncronas equivalentes a las del router de DRF.
+
+    Args:
+        prefijo (str): Prefijo de la ruta (p. ej. 'noticias')
+        viewset_class: ViewSet registrado en el router
+        basename (str): Nombre base usado por el router
+        acciones_extra (tuple): Acciones `detail=False` con versión asíncrona
+            (el ViewSet debe definir `a<accion>`)
+
+    Returns:
+        list: Patrones de URL a incluir antes de las rutas del router
+    """
+    def vista(acciones, accion, detail):
+        initkwargs = {'basename': basename, 'detail': detail}
+        # Igual que el router, las opciones declaradas en @action llegan al ViewSet
+        initkwargs.update(getattr(getattr(viewset_class, accion), 'kwargs', {}))
+        return AsyncReadOnlyView.as_view(
+            viewset_class=viewset_class,
+            acciones=acciones,
+            accion=accion,
+            viewset_initkwargs=initkwargs,
+            vista_sync=viewset_class.as_view(acciones, **initkwargs),
+        )
+
+    rutas = [
+        re_path(rf'^{prefijo}/$', vista(ACCIONES_LISTA, 'list', False)),
+    ]
+    for accion in acciones_extra:
+        rutas.append(re_path(
+            rf'^{prefijo}/{accion}/$',
+            vista({'get': accion}, accion, False),
+        ))
+    rutas.append(re_path(rf'^{prefijo}/(?P<pk>[^/.]+)/$', vista(ACCIONES_DETALLE, 'retrieve', True)))
+    return rutas
@@ -8,7 +8,6 @@ con capacidades avanzadas de filtrado para monitoreo y análisis.
 from rest_framework import viewsets, status, permissions
 from rest_framework.decorators import action
 from rest_framework.response import Response
-from rest_framework.throttling import UserRateThrottle, AnonRateThrottle
 from django_filters.rest_framework import DjangoFilterBackend
 from rest_framework.filters import SearchFilter, OrderingFilter
 from django.utils import timezone
@@ -17,12 +16,14 @@ import logging
 
 from blog.Models.AuditLogModel import AuditLog
 from blog.Serializers.AuditLogSerializer import AuditLogSerializer
+from blog.Serializers.ValuesSerializer import ValuesReadMixin
 from blog.pagination import LargeResultsSetPagination
+from blog.throttling import AnonSlidingWindowThrottle, UserSlidingWindowThrottle
 
 logger = logging.getLogger(__name__)
 
 
-class AuditLogViewSet(viewsets.ReadOnlyModelViewSet):
+class AuditLogViewSet(ValuesReadMixin, viewsets.ReadOnlyModelViewSet):
     """
     ViewSet para consultar logs de auditoría (solo lectura).
     
@@ -53,10 +54,12 @@ class AuditLogViewSet(viewsets.ReadOnlyModelViewSet):
     search_fields = ['accion', 'detalles', 'usuario__username']
     ordering_fields = ['timestamp', 'accion', 'usuario__username']
     ordering = ['-timestamp']  # Ordenamiento por defecto
-    throttle_classes = [UserRateThrottle, AnonRateThrottle]
+    throttle_classes = [UserSlidingWindowThrottle, AnonSlidingWindowThrottle]
+    throttle_scope = 'audit_log'
+    throttle_cost = 1
     pagination_class = LargeResultsSetPagination
     
-    @action(detail=False, methods=['get'])
+    @action(detail=False, methods=['get'], throttle_cost=10)
     def resumen_actividad(self, request):
         """
         Endpoint para obtener un resumen de actividad del sistema.
@@ -96,10 +99,10 @@ class AuditLogViewSet(viewsets.ReadOnlyModelViewSet):
             'total_logs': self.get_queryset().count()
         }
         
-        logger.info(f"Resumen de actividad solicitado por {request.user}")
+        logger.info("Resumen de actividad solicitado por %s", request.user)
         return Response(data, status=status.HTTP_200_OK)
     
-    @action(detail=False, methods=['get'])
+    @action(detail=False, methods=['get'], throttle_cost=2)
     def errores_recientes(self, request):
         """
         Endpoint para obtener errores recientes del sistema.
@@ -124,7 +127,7 @@ class AuditLogViewSet(viewsets.ReadOnlyModelViewSet):
         serializer = self.get_serializer(errores, many=True)
         return Response(serializer.data)
     
-    @action(detail=False, methods=['post'])
+    @action(detail=False, methods=['post'], throttle_cost=20)
     def limpiar_logs_antiguos(self, request):
         """
         Endpoint para limpiar logs antiguos (solo superusuarios).
@@ -145,7 +148,7 @@ class AuditLogViewSet(viewsets.ReadOnlyModelViewSet):
         count = logs_antiguos.count()
         logs_antiguos.delete()
         
-        logger.info(f"Superusuario {request.user} eliminó {count} logs antiguos")
+        logger.info("Superusuario %s eliminó %s logs antiguos", request.user, count)
         return Response(
             {'mensaje': f'Se eliminaron {count} logs antiguos'},
             status=status.HTTP_200_OK
@@ -1,3 +1,6 @@
+import hashlib
+import json
+
 from rest_framework import status
 from rest_framework.decorators import api_view, permission_classes
 from rest_framework.permissions import AllowAny, IsAuthenticated
@@ -5,6 +8,8 @@ from rest_framework.response import Response
 from django.contrib.auth import login, logout
 from django.views.decorators.csrf import csrf_exempt
 from django.utils.decorators import method_decorator
+from django.utils.cache import patch_vary_headers
+from django.utils.http import parse_etags
 from django.contrib.sessions.models import Session
 from drf_yasg.utils import swagger_auto_schema
 from drf_yasg import openapi
@@ -13,8 +18,28 @@ from ..Serializers.AuthSerializer import (
     LoginSerializer, 
     UserSerializer, 
     LoginResponseSerializer,
-    LogoutResponseSerializer
+    LogoutResponseSerializer,
+    RefreshTokenSerializer,
+    TokenResponseSerializer
 )
+from ..ratelimit import GuardiaLogin
+from ..tokens import REFRESCO, TokenInvalido, emitir_tokens, refrescar_tokens, revocar_token, verificar_token
+
+
+def _demasiados_intentos(espera):
+    """Respuesta 429 del login bloqueado por `GuardiaLogin`."""
+    response = Response({
+        'success': False,
+        'message': 'Demasiados intentos de inicio de sesión. Inténtalo más tarde.',
+        'retry_after': espera
+    }, status=status.HTTP_429_TOO_MANY_REQUESTS)
+    response['Retry-After'] = str(espera)
+    return response
+
+
+def _username(request):
+    """Usuario del intento de login; None si el cuerpo no es un objeto (p. ej. una lista JSON)."""
+    return request.data.get('username') if hasattr(request.data, 'get') else None
 
 
 @swagger_auto_schema(
@@ -23,6 +48,7 @@ from ..Serializers.AuthSerializer import (
     responses={
         200: LoginResponseSerializer,
         400: 'Bad Request - Credenciales inválidas',
+        429: 'Demasiados intentos de inicio de sesión',
         500: 'Error interno del servidor'
     },
     operation_description="Endpoint para autenticar usuarios. Requiere username y password.",
@@ -58,11 +84,19 @@ def login_view(request):
         "session_id": "abc123..."
     }
     """
+    # Se comprueba antes de autenticar: un intento bloqueado no calcula el hash
+    guardia = GuardiaLogin()
+    username = _username(request)
+    espera = guardia.comprobar(request, username)
+    if espera:
+        return _demasiados_intentos(espera)
+
     try:
         serializer = LoginSerializer(data=request.data, context={'request': request})
         
         if serializer.is_valid():
             user = serializer.validated_data['user']
+            guardia.exito(username)
             
             # Autenticar al usuario (crear sesión)
             login(request, user)
@@ -82,6 +116,7 @@ def login_view(request):
             
             return Response(response_data, status=status.HTTP_200_OK)
         else:
+            guardia.fallo(username)
             return Response({
                 'success': False,
                 'message': 'Credenciales inválidas',
@@ -177,6 +212,12 @@ def profile_view(request):
 
 @swagger_auto_schema(
     method='get',
+    manual_parameters=[
+        openapi.Parameter(
+            'compact', openapi.IN_QUERY, type=openapi.TYPE_BOOLEAN,
+            description="Resumen compacto con ETag; responde 304 si If-None-Match coincide"
+        )
+    ],
     responses={
         200: openapi.Response(
             description="Estado de autenticación",
@@ -185,10 +226,12 @@ def profile_view(request):
                 properties={
                     'authenticated': openapi.Schema(type=openapi.TYPE_BOOLEAN),
                     'user': openapi.Schema(type=openapi.TYPE_OBJECT),
-                    'session_id': openapi.Schema(type=openapi.TYPE_STRING)
+                    'session_id': openapi.Schema(type=openapi.TYPE_STRING),
+                    'version': openapi.Schema(type=openapi.TYPE_STRING)
                 }
             )
-        )
+        ),
+        304: 'Sin cambios (modo compacto)'
     },
     operation_description="Verifica si el usuario actual está autenticado",
     operation_summary="Verificar estado de autenticación"
@@ -206,7 +249,20 @@ def auth_status_view(request):
         "user": {UserData} | null,
         "session_id": "abc123..." | null
     }
+
+    GET /auth/status/?compact=1
+
+    Response: {
+        "authenticated": true,
+        "user": {"id": 1, "username": "admin", "full_name": "Admin User",
+                 "is_staff": true, "is_superuser": true} | null,
+        "version": "3f9a1c2b7d4e"
+    }
+    Con `If-None-Match` igual al ETag anterior responde 304 sin cuerpo.
     """
+    if request.query_params.get('compact', '').lower() in ('1', 'true'):
+        return auth_status_compacto(request)
+
     try:
         if request.user.is_authenticated:
             user_serializer = UserSerializer(request.user)
@@ -229,3 +285,191 @@ def auth_status_view(request):
             'session_id': None,
             'error': str(e)
         }, status=status.HTTP_200_OK)
+
+
+def resumen_usuario(user):
+    """
+    Resumen compacto del usuario para el sondeo de estado.
+
+    Args:
+        user: Usuario autenticado o AnonymousUser
+
+    Returns:
+        dict: Campos mínimos que usa el frontend, o None si es anónimo
+    """
+    if not user.is_authenticated:
+        return None
+    return {
+        'id': user.pk,
+        'username': user.username,
+        'full_name': f"{user.first_name} {user.last_name}".strip() or user.username,
+        'is_staff': user.is_staff,
+        'is_superuser': user.is_superuser,
+    }
+
+
+def auth_status_compacto(request):
+    """
+    Estado de autenticación compacto y cacheable por el cliente.
+
+    La versión es un hash del resumen: cambia cuando cambian los datos del
+    usuario o el estado de autenticación, sin necesidad de coordinar un
+    contador entre workers. El usuario llega ya resuelto por las clases de
+    autenticación (caché de sesión/token o claims del token firmado), así
+    que un 304 no consulta la base de datos.
+
+    Returns:
+        Response: 200 con el resumen o 304 si el cliente ya lo tiene
+    """
+    resumen = resumen_usuario(request.user)
+    contenido = json.dumps(resumen, sort_keys=True, separators=(',', ':'))
+    version = hashlib.sha1(contenido.encode()).hexdigest()[:12]
+    etag = f'W/"{version}"'
+
+    if etag in parse_etags(request.META.get('HTTP_IF_NONE_MATCH', '')):
+        response = Response(status=status.HTTP_304_NOT_MODIFIED)
+    else:
+        response = Response({
+            'authenticated': resumen is not None,
+            'user': resumen,
+            'version': version
+        }, status=status.HTTP_200_OK)
+
+    response['ETag'] = etag
+    # El cliente puede reutilizarlo, pero siempre debe revalidar
+    response['Cache-Control'] = 'private, no-cache'
+    patch_vary_headers(response, ('Cookie', 'Authorization'))
+    return response
+
+
+@swagger_auto_schema(
+    method='post',
+    request_body=LoginSerializer,
+    responses={
+        200: TokenResponseSerializer,
+        400: 'Bad Request - Credenciales inválidas'
+    },
+    operation_description="Emite tokens firmados sin estado (acceso de vida corta y refresco). "
+                          "El token de acceso se envía como 'Authorization: Bearer <access>'.",
+    operation_summary="Obtener tokens firmados"
+)
+@api_view(['POST'])
+@permission_classes([AllowAny])
+@csrf_exempt
+def token_obtain_view(request):
+    """
+    Endpoint para obtener tokens firmados sin crear una sesión
+
+    POST /auth/token/
+    Body: {
+        "username": "string",
+        "password": "string"
+    }
+
+    Response: {
+        "access": "eyJ...",
+        "refresh": "eyJ...",
+        "token_type": "Bearer",
+        "expires_in": 300,
+        "user": {UserData}
+    }
+    """
+    guardia = GuardiaLogin()
+    username = _username(request)
+    espera = guardia.comprobar(request, username)
+    if espera:
+        return _demasiados_intentos(espera)
+
+    serializer = LoginSerializer(data=request.data, context={'request': request})
+    if not serializer.is_valid():
+        guardia.fallo(username)
+        return Response({
+            'success': False,
+            'message': 'Credenciales inválidas',
+            'errors': serializer.errors
+        }, status=status.HTTP_400_BAD_REQUEST)
+
+    guardia.exito(username)
+    return Response(emitir_tokens(serializer.validated_data['user']), status=status.HTTP_200_OK)
+
+
+@swagger_auto_schema(
+    method='post',
+    request_body=RefreshTokenSerializer,
+    responses={
+        200: TokenResponseSerializer,
+        401: 'Token de refresco inválido, expirado o revocado'
+    },
+    operation_description="Emite un nuevo par de tokens. El token de refresco usado queda revocado.",
+    operation_summary="Refrescar tokens firmados"
+)
+@api_view(['POST'])
+@permission_classes([AllowAny])
+@csrf_exempt
+def token_refresh_view(request):
+    """
+    Endpoint para refrescar los tokens firmados
+
+    POST /auth/token/refresh/
+    Body: {
+        "refresh": "eyJ..."
+    }
+
+    Response: igual que /auth/token/
+    """
+    serializer = RefreshTokenSerializer(data=request.data)
+    serializer.is_valid(raise_exception=True)
+
+    try:
+        tokens = refrescar_tokens(serializer.validated_data['refresh'])
+    except TokenInvalido as e:
+        return Response({
+            'success': False,
+            'message': str(e)
+        }, status=status.HTTP_401_UNAUTHORIZED)
+
+    return Response(tokens, status=status.HTTP_200_OK)
+
+
+@swagger_auto_schema(
+    method='post',
+    request_body=RefreshTokenSerializer,
+    responses={
+        200: LogoutResponseSerializer,
+        401: 'Token de refresco inválido'
+    },
+    operation_description="Revoca el token de refresco y, si se envía, el token de acceso actual.",
+    operation_summary="Revocar tokens firmados"
+)
+@api_view(['POST'])
+@permission_classes([AllowAny])
+@csrf_exempt
+def token_revoke_view(request):
+    """
+    Endpoint para cerrar sesión en el modo de tokens firmados
+
+    POST /auth/token/revoke/
+    Headers: Authorization: Bearer <access> (opcional)
+    Body: {
+        "refresh": "eyJ..."
+    }
+    """
+    serializer = RefreshTokenSerializer(data=request.data)
+    serializer.is_valid(raise_exception=True)
+
+    try:
+        revocar_token(verificar_token(serializer.validated_data['refresh'], REFRESCO))
+    except TokenInvalido as e:
+        return Response({
+            'success': False,
+            'message': str(e)
+        }, status=status.HTTP_401_UNAUTHORIZED)
+
+    # request.auth contiene los claims cuando se autenticó con Bearer
+    if isinstance(request.auth, dict) and 'jti' in request.auth:
+        revocar_token(request.auth)
+
+    return Response({
+        'success': True,
+        'message': 'Tokens revocados'
+    }, status=status.HTTP_200_OK)
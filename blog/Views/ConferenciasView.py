@@ -8,7 +8,6 @@ y eliminar conferencias, con capacidades avanzadas de filtrado y búsqueda.
 from rest_framework import viewsets, status
 from rest_framework.decorators import action
 from rest_framework.response import Response
-from rest_framework.throttling import UserRateThrottle, AnonRateThrottle
 from django_filters.rest_framework import DjangoFilterBackend
 from rest_framework.filters import SearchFilter, OrderingFilter
 from django.utils import timezone
@@ -16,13 +15,15 @@ import logging
 
 from blog.Models.ConferenciasModel import Conferencias
 from blog.Serializers.ConferenciasSerializer import ConferenciasSerializer
+from blog.Serializers.ValuesSerializer import ValuesReadMixin
 from blog.filters import ConferenciasFilter
 from blog.pagination import StandardResultsSetPagination
+from blog.throttling import AnonSlidingWindowThrottle, UserSlidingWindowThrottle
 
 logger = logging.getLogger(__name__)
 
 
-class ConferenciasViewSet(viewsets.ModelViewSet):
+class ConferenciasViewSet(ValuesReadMixin, viewsets.ModelViewSet):
     """
     ViewSet para gestionar conferencias.
     
@@ -54,7 +55,9 @@ class ConferenciasViewSet(viewsets.ModelViewSet):
     search_fields = ['nombre_conferencia', 'ponente_conferencia', 'descripcion_conferencia']
     ordering_fields = ['fecha_conferencia', 'nombre_conferencia', 'ponente_conferencia']
     ordering = ['-fecha_conferencia']  # Ordenamiento por defecto
-    throttle_classes = [UserRateThrottle, AnonRateThrottle]
+    throttle_classes = [UserSlidingWindowThrottle, AnonSlidingWindowThrottle]
+    throttle_scope = 'conferencias'
+    throttle_cost = 1
     
     def perform_create(self, serializer):
         """
@@ -63,7 +66,7 @@ class ConferenciasViewSet(viewsets.ModelViewSet):
         Args:
             serializer: Serializer con los datos validados
         """
-        logger.info(f"Usuario {self.request.user} creando nueva conferencia")
+        logger.info("Usuario %s creando nueva conferencia", self.request.user)
         serializer.save(creador=self.request.user)
     
     def perform_update(self, serializer):
@@ -73,7 +76,7 @@ class ConferenciasViewSet(viewsets.ModelViewSet):
         Args:
             serializer: Serializer con los datos validados
         """
-        logger.info(f"Usuario {self.request.user} actualizando conferencia {serializer.instance.idconferencia}")
+        logger.info("Usuario %s actualizando conferencia %s", self.request.user, serializer.instance.idconferencia)
         serializer.save()
     
     def perform_destroy(self, instance):
@@ -83,7 +86,7 @@ class ConferenciasViewSet(viewsets.ModelViewSet):
         Args:
             instance: Instancia de la conferencia a eliminar
         """
-        logger.info(f"Usuario {self.request.user} eliminando conferencia {instance.idconferencia}")
+        logger.info("Usuario %s eliminando conferencia %s", self.request.user, instance.idconferencia)
         instance.delete()
     
     @action(detail=False, methods=['get'])
@@ -106,7 +109,7 @@ class ConferenciasViewSet(viewsets.ModelViewSet):
         serializer = self.get_serializer(queryset, many=True)
         return Response(serializer.data)
     
-    @action(detail=False, methods=['get'])
+    @action(detail=False, methods=['get'], throttle_cost=5)
     def estadisticas(self, request):
         """
         Endpoint para obtener estadísticas de conferencias.
@@ -124,5 +127,22 @@ class ConferenciasViewSet(viewsets.ModelViewSet):
             'conferencias_pasadas': pasadas
         }
         
-        logger.info(f"Estadísticas solicitadas por {request.user}")
-        return Response(data, status=status.HTTP_200_OK)
\ No newline at end of file
+        logger.info("Estadísticas solicitadas por %s", request.user)
+        return Response(data, status=status.HTTP_200_OK)
+    
+    async def aestadisticas(self, request):
+        """
+        Versión asíncrona de `estadisticas` usada por el modo ASGI.
+        
+        Returns:
+            dict: Las mismas estadísticas que el endpoint síncrono
+        """
+        total = await self.get_queryset().acount()
+        proximas = await self.get_queryset().filter(fecha_conferencia__gte=timezone.now()).acount()
+        
+        logger.info("Estadísticas solicitadas por %s", request.user)
+        return {
+            'total_conferencias': total,
+            'conferencias_proximas': proximas,
+            'conferencias_pasadas': total - proximas
+        }
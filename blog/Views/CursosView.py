@@ -8,19 +8,20 @@ con capacidades avanzadas de filtrado y búsqueda.
 from rest_framework import viewsets, status
 from rest_framework.decorators import action
 from rest_framework.response import Response
-from rest_framework.throttling import UserRateThrottle, AnonRateThrottle
 from django_filters.rest_framework import DjangoFilterBackend
 from rest_framework.filters import SearchFilter, OrderingFilter
 import logging
 
 from blog.Models.CursosModel import Cursos
 from blog.Serializers.CursosSerializer import CursosSerializer
+from blog.Serializers.ValuesSerializer import ValuesReadMixin
 from blog.filters import CursosFilter
+from blog.throttling import AnonSlidingWindowThrottle, UserSlidingWindowThrottle
 
 logger = logging.getLogger(__name__)
 
 
-class CursosViewSet(viewsets.ModelViewSet):
+class CursosViewSet(ValuesReadMixin, viewsets.ModelViewSet):
     """
     ViewSet para gestionar cursos.
     
@@ -48,7 +49,9 @@ class CursosViewSet(viewsets.ModelViewSet):
     search_fields = ['nombre_curso', 'descripcion_curso']
     ordering_fields = ['nombre_curso', 'fechainicial_curso', 'fechafinal_curso']
     ordering = ['-fechainicial_curso']  # Ordenamiento por defecto
-    throttle_classes = [UserRateThrottle, AnonRateThrottle]
+    throttle_classes = [UserSlidingWindowThrottle, AnonSlidingWindowThrottle]
+    throttle_scope = 'cursos'
+    throttle_cost = 1
     
     def perform_create(self, serializer):
         """
@@ -57,7 +60,7 @@ class CursosViewSet(viewsets.ModelViewSet):
         Args:
             serializer: Serializer con los datos validados
         """
-        logger.info(f"Usuario {self.request.user} creando nuevo curso")
+        logger.info("Usuario %s creando nuevo curso", self.request.user)
         serializer.save(creador=self.request.user)
     
     def perform_update(self, serializer):
@@ -66,7 +69,7 @@ class CursosViewSet(viewsets.ModelViewSet):
         
         Args:
             serializer: Serializer con los datos validados        """
-        logger.info(f"Usuario {self.request.user} actualizando curso {serializer.instance.pk}")
+        logger.info("Usuario %s actualizando curso %s", self.request.user, serializer.instance.pk)
         serializer.save()
     
     @action(detail=False, methods=['get'])
@@ -93,5 +96,5 @@ class CursosViewSet(viewsets.ModelViewSet):
             return self.get_paginated_response(serializer.data)
         
         serializer = self.get_serializer(queryset, many=True)
-        logger.info(f"Cursos activos solicitados por {request.user}")
+        logger.info("Cursos activos solicitados por %s", request.user)
         return Response(serializer.data, status=status.HTTP_200_OK)
\ No newline at end of file
@@ -8,19 +8,21 @@ de los integrantes con filtros avanzados y búsqueda.
 from rest_framework import viewsets, status
 from rest_framework.decorators import action
 from rest_framework.response import Response
-from rest_framework.throttling import UserRateThrottle, AnonRateThrottle
 from django_filters.rest_framework import DjangoFilterBackend
 from rest_framework.filters import SearchFilter, OrderingFilter
 import logging
 
 from blog.Models.IntegrantesModel import Integrantes
 from blog.Serializers.IntegrantesSerializer import IntegrantesSerializer
+from blog.Serializers.ValuesSerializer import ValuesReadMixin
+from blog.facets import FacetasMixin
 from blog.filters import IntegrantesFilter
+from blog.throttling import AnonSlidingWindowThrottle, UserSlidingWindowThrottle
 
 logger = logging.getLogger(__name__)
 
 
-class IntegrantesViewSet(viewsets.ModelViewSet):
+class IntegrantesViewSet(FacetasMixin, ValuesReadMixin, viewsets.ModelViewSet):
     """
     ViewSet para gestionar integrantes del equipo.
     
@@ -42,6 +44,9 @@ class IntegrantesViewSet(viewsets.ModelViewSet):
     
     **Ordenamiento:**
     Usar `ordering` con campos: nombre_integrante, semestre, correo
+    
+    **Facetas:**
+    Usar `facets=semestre,estado` para obtener conteos por valor junto al listado.
     """
     
     serializer_class = IntegrantesSerializer
@@ -51,7 +56,10 @@ class IntegrantesViewSet(viewsets.ModelViewSet):
     search_fields = ['nombre_integrante', 'correo', 'reseña', 'semestre']
     ordering_fields = ['nombre_integrante', 'semestre', 'correo']
     ordering = ['nombre_integrante']  # Ordenamiento por defecto
-    throttle_classes = [UserRateThrottle, AnonRateThrottle]
+    throttle_classes = [UserSlidingWindowThrottle, AnonSlidingWindowThrottle]
+    throttle_scope = 'integrantes'
+    throttle_cost = 1
+    facet_fields = {'semestre': 'semestre', 'estado': 'estado'}
     
     def perform_create(self, serializer):
         """
@@ -60,7 +68,7 @@ class IntegrantesViewSet(viewsets.ModelViewSet):
         Args:
             serializer: Serializer con los datos validados
         """
-        logger.info(f"Usuario {self.request.user} agregando nuevo integrante")
+        logger.info("Usuario %s agregando nuevo integrante", self.request.user)
         serializer.save(creador=self.request.user)
     
     def perform_update(self, serializer):
@@ -70,7 +78,7 @@ class IntegrantesViewSet(viewsets.ModelViewSet):
         Args:
             serializer: Serializer con los datos validados
         """
-        logger.info(f"Usuario {self.request.user} actualizando integrante {serializer.instance.idintegrantes}")
+        logger.info("Usuario %s actualizando integrante %s", self.request.user, serializer.instance.idintegrantes)
         serializer.save()
     
     @action(detail=False, methods=['get'])
@@ -93,7 +101,7 @@ class IntegrantesViewSet(viewsets.ModelViewSet):
         serializer = self.get_serializer(queryset, many=True)
         return Response(serializer.data)
     
-    @action(detail=False, methods=['get'])
+    @action(detail=False, methods=['get'], throttle_cost=5)
     def por_semestre(self, request):
         """
         Endpoint para agrupar integrantes por semestre.
@@ -108,5 +116,24 @@ class IntegrantesViewSet(viewsets.ModelViewSet):
                     .annotate(total=Count('idintegrantes'))
                     .order_by('semestre'))
         
-        logger.info(f"Estadísticas por semestre solicitadas por {request.user}")
-        return Response(semestres, status=status.HTTP_200_OK)
\ No newline at end of file
+        logger.info("Estadísticas por semestre solicitadas por %s", request.user)
+        return Response(semestres, status=status.HTTP_200_OK)
+    
+    async def apor_semestre(self, request):
+        """
+        Versión asíncrona de `por_semestre` usada por el modo ASGI.
+        
+        Returns:
+            list: Integrantes agrupados por semestre
+        """
+        from django.db.models import Count
+        
+        semestres = [
+            fila async for fila in (self.get_queryset()
+                                    .values('semestre')
+                                    .annotate(total=Count('idintegrantes'))
+                                    .order_by('semestre'))
+        ]
+        
+        logger.info("Estadísticas por semestre solicitadas por %s", request.user)
+        return semestres
@@ -0,0 +1,145 @@
+"""
+API Views de métricas internas.
+
+Este módulo proporciona endpoints de solo lectura para el staff con las
+estadísticas de los workers de gunicorn, de la base de datos y de las
+tareas de Celery.
+"""
+
+from rest_framework import status
+from rest_framework.decorators import api_view, permission_classes
+from rest_framework.permissions import IsAdminUser
+from rest_framework.response import Response
+from drf_yasg.utils import swagger_auto_schema
+from django.conf import settings
+
+from blog import db_metrics, task_metrics
+from mysite.celery import app as celery_app
+from mysite.runtime import configuracion_gunicorn, leer_estadisticas_workers
+
+
+@swagger_auto_schema(
+    method='get',
+    operation_description="Estadísticas de los workers de gunicorn y recursos detectados. Solo staff.",
+    operation_summary="Métricas de workers"
+)
+@api_view(['GET'])
+@permission_classes([IsAdminUser])
+def workers_metrics_view(request):
+    """
+    Endpoint con las estadísticas publicadas por cada worker de gunicorn
+
+    GET /metrics/workers/
+
+    Response: {
+        "recursos": {"cpus": 2, "memoria_mb": 1024, "workers": 5, "threads": 2},
+        "workers_activos": 5,
+        "peticiones": 1234,
+        "errores": 0,
+        "memoria_total_mb": 612.4,
+        "workers": [{"pid": 12, "peticiones": 250, ...}]
+    }
+    """
+    datos = leer_estadisticas_workers()
+    datos['recursos'] = configuracion_gunicorn()
+    return Response(datos, status=status.HTTP_200_OK)
+
+
+@swagger_auto_schema(
+    method='get',
+    operation_description="Rotación de conexiones a la base de datos y esperas del pool. Solo staff.",
+    operation_summary="Métricas de conexiones a la base de datos"
+)
+@api_view(['GET'])
+@permission_classes([IsAdminUser])
+def db_metrics_view(request):
+    """
+    Endpoint con las métricas de conexiones a la base de datos
+
+    GET /metrics/db/
+
+    Response: {
+        "configuracion": {"modo": "persistent", "conn_max_age": 600, "pool": null},
+        "proceso": {"peticiones": 120, "conexiones_creadas": 3, ...},
+        "workers": {"peticiones": 1234, "conexiones_creadas": 12, "conexiones_por_peticion": 0.01,
+                    "espera_pool_ms": 0}
+    }
+    """
+    base = settings.DATABASES['default']
+    configuracion = {
+        'modo': settings.DB_POOL_MODE,
+        'motor': base['ENGINE'],
+        'conn_max_age': base.get('CONN_MAX_AGE', 0),
+        'health_checks': base.get('CONN_HEALTH_CHECKS', False),
+        'pool': base.get('OPTIONS', {}).get('pool'),
+    }
+
+    # Cada worker de gunicorn publica sus contadores junto a sus estadísticas
+    por_worker = [w['db'] for w in leer_estadisticas_workers()['workers'] if 'db' in w]
+    peticiones = sum(d['peticiones'] for d in por_worker)
+    creadas = sum(d['conexiones_creadas'] for d in por_worker)
+    total_workers = {
+        'workers': len(por_worker),
+        'peticiones': peticiones,
+        'conexiones_creadas': creadas,
+        'conexiones_por_peticion': round(creadas / peticiones, 3) if peticiones else 0.0,
+        'espera_pool_ms': sum((d['pool'] or {}).get('espera_total_ms', 0) for d in por_worker),
+        'esperas_pool': sum((d['pool'] or {}).get('peticiones_en_espera', 0) for d in por_worker),
+    }
+
+    return Response({
+        'configuracion': configuracion,
+        'proceso': db_metrics.resumen(),
+        'workers': total_workers,
+    }, status=status.HTTP_200_OK)
+
+
+@swagger_auto_schema(
+    method='get',
+    operation_description="Tiempos de espera y ejecución, errores, reintentos y filas afectadas de las tareas de Celery. Solo staff.",
+    operation_summary="Métricas de tareas"
+)
+@api_view(['GET'])
+@permission_classes([IsAdminUser])
+def tasks_metrics_view(request):
+    """
+    Endpoint con las métricas de las tareas de Celery (ver blog/task_metrics.py)
+
+    GET /metrics/tasks/?horas=24
+
+    Response: {
+        "horas": 24,
+        "tareas": {
+            "blog.tasks.eliminar_ofertas_expiradas": {
+                "cola": "mantenimiento", "programacion_s": 86400.0,
+                "limites_s": {"soft": 120, "hard": 150},
+                "ejecuciones": 1, "errores": 0, "tasa_error": 0.0, "reintentos": 0,
+                "filas_afectadas": 12, "duracion_media_ms": 85, "duracion_p95_ms": 85,
+                "espera_media_ms": 4, "espera_p95_ms": 4, "ultimas": [...]
+            }
+        }
+    }
+    """
+    ventana = settings.TASK_METRICS_WINDOW_HOURS
+    try:
+        horas = min(max(int(request.query_params.get('horas', ventana)), 1), ventana)
+    except ValueError:
+        return Response({'error': 'horas debe ser un entero'}, status=status.HTTP_400_BAD_REQUEST)
+
+    programacion = {
+        entrada['task']: entrada['schedule'] for entrada in settings.CELERY_BEAT_SCHEDULE.values()
+        if isinstance(entrada.get('schedule'), (int, float))
+    }
+    # Los procesos web no ejecutan el autodescubrimiento de tareas del worker
+    celery_app.loader.import_default_modules()
+    tareas = {}
+    for nombre, tarea in sorted(celery_app.tasks.items()):
+        if nombre.startswith('celery.'):
+            continue
+        tareas[nombre] = {
+            'cola': settings.CELERY_TASK_ROUTES.get(nombre, {}).get('queue', settings.CELERY_TASK_DEFAULT_QUEUE),
+            'programacion_s': programacion.get(nombre),
+            'limites_s': {'soft': tarea.soft_time_limit, 'hard': tarea.time_limit},
+            **task_metrics.resumen_tarea(nombre, horas),
+        }
+    return Response({'horas': horas, 'tareas': tareas}, status=status.HTTP_200_OK)
@@ -8,7 +8,6 @@ con capacidades avanzadas de filtrado y búsqueda.
 from rest_framework import viewsets, status
 from rest_framework.decorators import action
 from rest_framework.response import Response
-from rest_framework.throttling import UserRateThrottle, AnonRateThrottle
 from django_filters.rest_framework import DjangoFilterBackend
 from rest_framework.filters import SearchFilter, OrderingFilter
 from django.utils import timezone
@@ -16,12 +15,15 @@ import logging
 
 from blog.Models.NoticiasModel import Noticias
 from blog.Serializers.NoticiasSerializer import NoticiasSerializer
+from blog.Serializers.ValuesSerializer import ValuesReadMixin
+from blog.facets import FacetasMixin
 from blog.filters import NoticiasFilter
+from blog.throttling import AnonSlidingWindowThrottle, UserSlidingWindowThrottle
 
 logger = logging.getLogger(__name__)
 
 
-class NoticiasViewSet(viewsets.ModelViewSet):
+class NoticiasViewSet(FacetasMixin, ValuesReadMixin, viewsets.ModelViewSet):
     """
     ViewSet para gestionar noticias.
     
@@ -40,6 +42,9 @@ class NoticiasViewSet(viewsets.ModelViewSet):
     Usar el parámetro `search` para buscar en título y descripción.
       **Ordenamiento:**
     Usar `ordering` con campos: fecha_noticia, nombre_noticia
+    
+    **Facetas:**
+    Usar `facets=fuente` para obtener conteos por valor junto al listado.
     """
     
     serializer_class = NoticiasSerializer
@@ -49,7 +54,10 @@ class NoticiasViewSet(viewsets.ModelViewSet):
     search_fields = ['nombre_noticia', 'description_noticia', 'fuente']
     ordering_fields = ['fecha_noticia', 'nombre_noticia']
     ordering = ['-fecha_noticia']  # Ordenamiento por defecto
-    throttle_classes = [UserRateThrottle, AnonRateThrottle]
+    throttle_classes = [UserSlidingWindowThrottle, AnonSlidingWindowThrottle]
+    throttle_scope = 'noticias'
+    throttle_cost = 1
+    facet_fields = {'fuente': 'fuente'}
     
     def perform_create(self, serializer):
         """
@@ -58,7 +66,7 @@ class NoticiasViewSet(viewsets.ModelViewSet):
         Args:
             serializer: Serializer con los datos validados
         """
-        logger.info(f"Usuario {self.request.user} creando nueva noticia")
+        logger.info("Usuario %s creando nueva noticia", self.request.user)
         serializer.save(creador=self.request.user)
     
     def perform_update(self, serializer):
@@ -68,7 +76,7 @@ class NoticiasViewSet(viewsets.ModelViewSet):
         Args:
             serializer: Serializer con los datos validados
         """
-        logger.info(f"Usuario {self.request.user} actualizando noticia {serializer.instance.pk}")
+        logger.info("Usuario %s actualizando noticia %s", self.request.user, serializer.instance.pk)
         serializer.save()
     
     @action(detail=False, methods=['get'])
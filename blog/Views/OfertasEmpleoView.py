@@ -8,7 +8,6 @@ con filtros avanzados, búsqueda y gestión de expiración automática.
 from rest_framework import viewsets, status
 from rest_framework.decorators import action
 from rest_framework.response import Response
-from rest_framework.throttling import UserRateThrottle, AnonRateThrottle
 from django_filters.rest_framework import DjangoFilterBackend
 from rest_framework.filters import SearchFilter, OrderingFilter
 from django.utils import timezone
@@ -16,12 +15,15 @@ import logging
 
 from blog.Models.OfertasEmpleoModel import OfertasEmpleo
 from blog.Serializers.OfertasSerializer import OfertasEmpleoSerializer
+from blog.Serializers.ValuesSerializer import ValuesReadMixin
+from blog.facets import FacetasMixin
 from blog.filters import OfertasEmpleoFilter
+from blog.throttling import AnonSlidingWindowThrottle, UserSlidingWindowThrottle
 
 logger = logging.getLogger(__name__)
 
 
-class OfertasEmpleoViewSet(viewsets.ModelViewSet):
+class OfertasEmpleoViewSet(FacetasMixin, ValuesReadMixin, viewsets.ModelViewSet):
     """
     ViewSet para gestionar ofertas de empleo.
     
@@ -43,6 +45,9 @@ class OfertasEmpleoViewSet(viewsets.ModelViewSet):
     
     **Ordenamiento:**
     Usar `ordering` con campos: fecha_publicacion, titulo_empleo, empresa
+    
+    **Facetas:**
+    Usar `facets=empresa` para obtener conteos por valor junto al listado.
     """
     
     serializer_class = OfertasEmpleoSerializer
@@ -52,7 +57,10 @@ class OfertasEmpleoViewSet(viewsets.ModelViewSet):
     search_fields = ['titulo_empleo', 'empresa', 'descripcion_empleo']
     ordering_fields = ['fecha_publicacion', 'titulo_empleo', 'empresa', 'fecha_expiracion']
     ordering = ['-fecha_publicacion']  # Ordenamiento por defecto
-    throttle_classes = [UserRateThrottle, AnonRateThrottle]
+    throttle_classes = [UserSlidingWindowThrottle, AnonSlidingWindowThrottle]
+    throttle_scope = 'ofertas'
+    throttle_cost = 1
+    facet_fields = {'empresa': 'empresa'}
     
     def perform_create(self, serializer):
         """
@@ -61,7 +69,7 @@ class OfertasEmpleoViewSet(viewsets.ModelViewSet):
         Args:
             serializer: Serializer con los datos validados
         """
-        logger.info(f"Usuario {self.request.user} publicando nueva oferta de empleo")
+        logger.info("Usuario %s publicando nueva oferta de empleo", self.request.user)
         serializer.save(creador=self.request.user)
     
     def perform_update(self, serializer):
@@ -71,7 +79,7 @@ class OfertasEmpleoViewSet(viewsets.ModelViewSet):
         Args:
             serializer: Serializer con los datos validados
         """
-        logger.info(f"Usuario {self.request.user} actualizando oferta {serializer.instance.idoferta}")
+        logger.info("Usuario %s actualizando oferta %s", self.request.user, serializer.instance.idoferta)
         serializer.save()
     
     @action(detail=False, methods=['get'])
@@ -114,7 +122,7 @@ class OfertasEmpleoViewSet(viewsets.ModelViewSet):
         serializer = self.get_serializer(queryset, many=True)
         return Response(serializer.data)
     
-    @action(detail=False, methods=['post'])
+    @action(detail=False, methods=['post'], throttle_cost=20)
     def limpiar_expiradas(self, request):
         """
         Endpoint para eliminar ofertas expiradas manualmente.
@@ -132,13 +140,13 @@ class OfertasEmpleoViewSet(viewsets.ModelViewSet):
         count = expiradas.count()
         expiradas.delete()
         
-        logger.info(f"Usuario {request.user} eliminó {count} ofertas expiradas")
+        logger.info("Usuario %s eliminó %s ofertas expiradas", request.user, count)
         return Response(
             {'mensaje': f'Se eliminaron {count} ofertas expiradas'},
             status=status.HTTP_200_OK
         )
     
-    @action(detail=False, methods=['get'])
+    @action(detail=False, methods=['get'], throttle_cost=5)
     def estadisticas(self, request):
         """
         Endpoint para obtener estadísticas de ofertas de empleo.
@@ -164,5 +172,31 @@ class OfertasEmpleoViewSet(viewsets.ModelViewSet):
             'empresas_mas_activas': list(empresas_activas)
         }
         
-        logger.info(f"Estadísticas de ofertas solicitadas por {request.user}")
-        return Response(data, status=status.HTTP_200_OK)
\ No newline at end of file
+        logger.info("Estadísticas de ofertas solicitadas por %s", request.user)
+        return Response(data, status=status.HTTP_200_OK)
+    
+    async def aestadisticas(self, request):
+        """
+        Versión asíncrona de `estadisticas` usada por el modo ASGI.
+        
+        Returns:
+            dict: Las mismas estadísticas que el endpoint síncrono
+        """
+        from django.db.models import Count
+        
+        total = await self.get_queryset().acount()
+        vigentes = await self.get_queryset().filter(fecha_expiracion__gte=timezone.now()).acount()
+        empresas_activas = [
+            fila async for fila in (self.get_queryset()
+                                    .values('empresa')
+                                    .annotate(total=Count('idoferta'))
+                                    .order_by('-total')[:5])
+        ]
+        
+        logger.info("Estadísticas de ofertas solicitadas por %s", request.user)
+        return {
+            'total_ofertas': total,
+            'ofertas_vigentes': vigentes,
+            'ofertas_expiradas': total - vigentes,
+            'empresas_mas_activas': empresas_activas
+        }
@@ -8,19 +8,24 @@ con capacidades avanzadas de filtrado y búsqueda.
 from rest_framework import viewsets, status
 from rest_framework.decorators import action
 from rest_framework.response import Response
-from rest_framework.throttling import UserRateThrottle, AnonRateThrottle
 from django_filters.rest_framework import DjangoFilterBackend
 from rest_framework.filters import SearchFilter, OrderingFilter
+from django.db.models import Count
 import logging
 
 from blog.Models.ProyectosModel import Proyectos
+from blog.Models.TecnologiaProyectoModel import TecnologiaProyecto
 from blog.Serializers.ProyectosSerializer import ProyectosSerializer
+from blog.Serializers.ValuesSerializer import ValuesReadMixin
+from blog.facets import FacetasMixin
 from blog.filters import ProyectosFilter
+from blog.tecnologias import palabras_clave
+from blog.throttling import AnonSlidingWindowThrottle, UserSlidingWindowThrottle
 
 logger = logging.getLogger(__name__)
 
 
-class ProyectosViewSet(viewsets.ModelViewSet):
+class ProyectosViewSet(FacetasMixin, ValuesReadMixin, viewsets.ModelViewSet):
     """
     ViewSet para gestionar proyectos.
     
@@ -40,16 +45,22 @@ class ProyectosViewSet(viewsets.ModelViewSet):
     
     **Ordenamiento:**
     Usar `ordering` con campos: nombre_proyecto, fecha_proyecto
+    
+    **Facetas:**
+    Usar `facets=tecnologia` para obtener conteos por valor junto al listado.
     """
     
     serializer_class = ProyectosSerializer
     queryset = Proyectos.objects.all()
     filterset_class = ProyectosFilter
     filter_backends = [DjangoFilterBackend, SearchFilter, OrderingFilter]
-    search_fields = ['nombre_proyecto', 'descripcion_proyecto']
+    search_fields = ['nombre_proyecto', 'description_proyecto']
     ordering_fields = ['nombre_proyecto', 'fecha_proyecto']
     ordering = ['-fecha_proyecto']  # Ordenamiento por defecto
-    throttle_classes = [UserRateThrottle, AnonRateThrottle]
+    throttle_classes = [UserSlidingWindowThrottle, AnonSlidingWindowThrottle]
+    throttle_scope = 'proyectos'
+    throttle_cost = 1
+    facet_fields = {'tecnologia': 'tecnologias__tecnologia'}
     
     def perform_create(self, serializer):
         """
@@ -58,7 +69,7 @@ class ProyectosViewSet(viewsets.ModelViewSet):
         Args:
             serializer: Serializer con los datos validados
         """
-        logger.info(f"Usuario {self.request.user} creando nuevo proyecto")
+        logger.info("Usuario %s creando nuevo proyecto", self.request.user)
         serializer.save(creador=self.request.user)
     
     def perform_update(self, serializer):
@@ -68,44 +79,29 @@ class ProyectosViewSet(viewsets.ModelViewSet):
         Args:
             serializer: Serializer con los datos validados
         """
-        logger.info(f"Usuario {self.request.user} actualizando proyecto {serializer.instance.pk}")
+        logger.info("Usuario %s actualizando proyecto %s", self.request.user, serializer.instance.pk)
         serializer.save()
     
-    @action(detail=False, methods=['get'])
+    @action(detail=False, methods=['get'], throttle_cost=2)
     def tecnologias_populares(self, request):
         """
         Endpoint para obtener las tecnologías más populares en proyectos.
         
+        Las tecnologías se detectan al guardar cada proyecto, así que aquí
+        solo se agrupa el índice `TecnologiaProyecto` (una consulta).
+        
         Returns:
             Response: Lista de tecnologías mencionadas con frecuencia
         """
-        # Análisis simple de palabras clave en descripciones
-        tecnologias_comunes = [
-            'python', 'django', 'javascript', 'react', 'vue', 'angular',
-            'nodejs', 'java', 'spring', 'docker', 'kubernetes', 'aws',
-            'postgresql', 'mysql', 'mongodb', 'redis', 'git'
-        ]
-        
-        from django.db.models import Q
-        import re
-        
-        tecnologias_encontradas = {}
-        
-        proyectos = self.get_queryset()
-        for proyecto in proyectos:
-            texto = (proyecto.descripcion_proyecto or '').lower()
-            for tech in tecnologias_comunes:
-                if re.search(r'\b' + tech + r'\b', texto):
-                    tecnologias_encontradas[tech] = tecnologias_encontradas.get(tech, 0) + 1
-        
-        # Ordenar por frecuencia
-        tecnologias_ordenadas = sorted(
-            tecnologias_encontradas.items(),
-            key=lambda x: x[1],
-            reverse=True
-        )[:10]
+        tecnologias_ordenadas = (
+            TecnologiaProyecto.objects
+            .filter(tecnologia__in=palabras_clave())
+            .values('tecnologia')
+            .annotate(proyectos=Count('proyecto'))
+            .order_by('-proyectos', 'tecnologia')[:10]
+        )
         
-        resultado = [{'tecnologia': tech, 'proyectos': count} for tech, count in tecnologias_ordenadas]
+        resultado = list(tecnologias_ordenadas)
         
-        logger.info(f"Tecnologías populares solicitadas por {request.user}")
+        logger.info("Tecnologías populares solicitadas por %s", request.user)
         return Response(resultado, status=status.HTTP_200_OK)
\ No newline at end of file
@@ -6,6 +6,7 @@ from blog.Models.NoticiasModel import Noticias
 from blog.Models.AuditLogModel import AuditLog
 from blog.Models.ConferenciasModel import Conferencias
 from blog.Models.OfertasEmpleoModel import OfertasEmpleo
+from blog.Models.SubidaImagenModel import SubidaImagen
 
 # Registrar modelos para que aparezcan en el panel de administración
 admin.site.register(AuditLog)
@@ -14,4 +15,5 @@ admin.site.register(Cursos)
 admin.site.register(Noticias)
 admin.site.register(Integrantes)
 admin.site.register(Proyectos)
-admin.site.register(OfertasEmpleo)
\ No newline at end of file
+admin.site.register(OfertasEmpleo)
+admin.site.register(SubidaImagen)
@@ -10,6 +10,22 @@ class BlogConfig(AppConfig):
         # Conectar la señal post_migrate para ejecutar código después de las migraciones
         post_migrate.connect(blog_callback, sender=self)
 
+        # Contadores de conexiones a la base de datos por proceso
+        from blog.db_metrics import registrar_senales
+        registrar_senales()
+
+        # Invalidación de la caché de autenticación
+        from blog import authentication
+        authentication.registrar_senales()
+
+        # Invalidación de las facetas cacheadas de los listados
+        from blog import facets
+        facets.registrar_senales()
+
+        # Métricas de ejecución de las tareas de Celery
+        from blog import task_metrics
+        task_metrics.registrar_senales()
+
 def blog_callback(sender, **kwargs):
     # Ejecutar el comando setup_groups después de las migraciones
     call_command('setup_groups')
\ No newline at end of file
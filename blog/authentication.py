@@ -0,0 +1,152 @@
+"""
+Autenticación con caché de usuarios y tokens.
+
+Cada petición autenticada resolvía el usuario con una consulta (token →
+usuario o sesión → usuario). Aquí esa resolución se guarda en la caché
+durante `AUTH_CACHE_TTL` segundos:
+
+- `CachedModelBackend` cachea `get_user`, que es lo que usa el
+  `AuthenticationMiddleware` de Django (y por tanto `SessionAuthentication`
+  de DRF) para cargar el usuario de la sesión. La verificación del hash de
+  sesión de Django se sigue haciendo con el usuario cacheado.
+- `CachedTokenAuthentication` cachea el token por su clave (hasheada) y
+  reutiliza la misma entrada de usuario.
+
+Las entradas se invalidan al guardar o eliminar el usuario (cambio de
+contraseña, `is_active`), al hacer logout y al eliminar el token.
+Con `AUTH_CACHE_TTL = 0` la caché queda desactivada.
+
+`SignedTokenAuthentication` acepta los tokens firmados sin estado de
+`blog.tokens` (`Authorization: Bearer <access>`) sin consultar la base
+de datos.
+"""
+
+import hashlib
+
+from django.conf import settings
+from django.contrib.auth import get_user_model, user_logged_out
+from django.contrib.auth.backends import ModelBackend
+from django.core.cache import cache
+from django.db.models.signals import post_delete, post_save
+from rest_framework import exceptions
+from rest_framework.authentication import BaseAuthentication, TokenAuthentication, get_authorization_header
+from rest_framework.authtoken.models import Token
+
+from blog.tokens import ACCESO, TokenInvalido, usuario_desde_claims, verificar_token
+
+
+def _ttl():
+    return getattr(settings, 'AUTH_CACHE_TTL', 0)
+
+
+def clave_usuario(user_id):
+    return f'auth:usuario:{user_id}'
+
+
+def clave_token(key):
+    # No se guardan tokens en claro como claves de Redis
+    return f"auth:token:{hashlib.sha256(key.encode()).hexdigest()}"
+
+
+class CachedModelBackend(ModelBackend):
+    """
+    `ModelBackend` que cachea la carga del usuario por id.
+
+    `ModelBackend.get_user` devuelve None para usuarios inactivos, así que
+    solo se cachean usuarios que pueden autenticarse.
+    """
+
+    def get_user(self, user_id):
+        if not _ttl():
+            return super().get_user(user_id)
+
+        usuario = cache.get(clave_usuario(user_id))
+        if usuario is None:
+            usuario = super().get_user(user_id)
+            if usuario is not None:
+                cache.set(clave_usuario(user_id), usuario, _ttl())
+        return usuario
+
+
+class CachedTokenAuthentication(TokenAuthentication):
+    """
+    `TokenAuthentication` que resuelve token y usuario desde la caché.
+
+    Los tokens inválidos no se cachean: siguen consultando la base de datos.
+    """
+
+    def authenticate_credentials(self, key):
+        if not _ttl():
+            return super().authenticate_credentials(key)
+
+        token = cache.get(clave_token(key))
+        if token is None:
+            usuario, token = super().authenticate_credentials(key)
+            # Se cachea el token sin el usuario relacionado: el usuario tiene
+            # su propia entrada, que es la que se invalida al modificarlo
+            cache.set(clave_token(key), Token(key=token.key, user_id=token.user_id, created=token.created), _ttl())
+            cache.set(clave_usuario(usuario.pk), usuario, _ttl())
+            return usuario, token
+
+        usuario = CachedModelBackend().get_user(token.user_id)
+        if usuario is None:
+            raise exceptions.AuthenticationFailed('User inactive or deleted.')
+        token.user = usuario
+        return usuario, token
+
+
+class SignedTokenAuthentication(BaseAuthentication):
+    """
+    Autenticación con tokens de acceso firmados (`Authorization: Bearer <token>`).
+
+    El usuario se reconstruye desde los claims del token; `request.auth`
+    contiene los claims (incluido el `jti` para revocarlo).
+    """
+
+    keyword = 'Bearer'
+
+    def authenticate(self, request):
+        partes = get_authorization_header(request).split()
+        if not partes or partes[0].lower() != self.keyword.lower().encode():
+            return None
+        if len(partes) != 2:
+            raise exceptions.AuthenticationFailed('Cabecera Bearer inválida.')
+
+        try:
+            payload = verificar_token(partes[1].decode(), ACCESO)
+        except (TokenInvalido, UnicodeError) as exc:
+            raise exceptions.AuthenticationFailed(str(exc) or 'Token inválido.')
+        return usuario_desde_claims(payload['usr']), payload
+
+    def authenticate_header(self, request):
+        return self.keyword
+
+
+def invalidar_usuario(user_id):
+    """Elimina de la caché el usuario indicado."""
+    cache.delete(clave_usuario(user_id))
+
+
+def _al_modificar_usuario(sender, instance, **kwargs):
+    invalidar_usuario(instance.pk)
+
+
+def _al_cerrar_sesion(sender, request, user, **kwargs):
+    if user is None:
+        return
+    invalidar_usuario(user.pk)
+    claves = Token.objects.filter(user_id=user.pk).values_list('key', flat=True)
+    cache.delete_many([clave_token(key) for key in claves])
+
+
+def _al_eliminar_token(sender, instance, **kwargs):
+    cache.delete(clave_token(instance.key))
+
+
+def registrar_senales():
+    """Conecta la invalidación de la caché (llamado desde `BlogConfig.ready`)."""
+    usuario = get_user_model()
+    post_save.connect(_al_modificar_usuario, sender=usuario, dispatch_uid='auth_cache_usuario_guardado')
+    post_delete.connect(_al_modificar_usuario, sender=usuario, dispatch_uid='auth_cache_usuario_eliminado')
+    user_logged_out.connect(_al_cerrar_sesion, dispatch_uid='auth_cache_logout')
+    post_delete.connect(_al_eliminar_token, sender=Token, dispatch_uid='auth_cache_token_eliminado')
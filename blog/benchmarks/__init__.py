@@ -0,0 +1,7 @@
+"""
+Herramientas de medición de rendimiento para la API del blog.
+
+Los módulos de este paquete se usan desde comandos de gestión
+(`python manage.py prueba_carga`, etc.) y no se cargan en tiempo de
+ejecución del servidor.
+"""
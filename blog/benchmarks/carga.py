@@ -0,0 +1,327 @@
+"""
+Arnés de generación de carga para la API.
+
+Reproduce mezclas ponderadas de tráfico (listado de noticias, búsqueda de
+ofertas, estadísticas y estado de autenticación) con clientes virtuales
+asíncronos basados en httpx, contra un servidor gunicorn levantado
+localmente o contra una URL ya existente.
+
+No depende de servicios externos: todo se ejecuta en el mismo equipo
+y los resultados se resumen en rendimiento (peticiones/segundo) y
+percentiles de latencia por perfil de concurrencia.
+"""
+
+import asyncio
+import math
+import os
+import random
+import re
+import socket
+import subprocess
+import sys
+import tempfile
+import time
+from collections import Counter, defaultdict
+from dataclasses import dataclass, field
+from itertools import accumulate
+
+import httpx
+
+
+@dataclass(frozen=True)
+class Peticion:
+    """
+    Petición que forma parte de una mezcla de tráfico.
+
+    Attributes:
+        nombre (str): Identificador usado en los reportes
+        ruta (str): Ruta relativa; `{termino}` se sustituye por un término de búsqueda
+        peso (float): Peso relativo dentro de la mezcla
+        metodo (str): Método HTTP
+    """
+    nombre: str
+    ruta: str
+    peso: float
+    metodo: str = 'GET'
+
+
+# Términos usados para las búsquedas de ofertas
+TERMINOS_BUSQUEDA = ('python', 'django', 'seguridad', 'remoto', 'pentesting', 'analista')
+
+# Mezcla por defecto basada en el uso observado desde el frontend Next.js:
+# la portada lista noticias, la sección de empleo busca ofertas, el dashboard
+# consulta estadísticas y cada navegación consulta el estado de autenticación.
+MEZCLA_POR_DEFECTO = (
+    Peticion('listar_noticias', '/api/hl4/v1/noticias/', 40),
+    Peticion('buscar_ofertas', '/api/hl4/v1/ofertasempleo/?search={termino}', 20),
+    Peticion('estadisticas_ofertas', '/api/hl4/v1/ofertasempleo/estadisticas/', 8),
+    Peticion('estadisticas_conferencias', '/api/hl4/v1/conferencias/estadisticas/', 7),
+    Peticion('auth_status', '/api/auth/status/', 25),
+)
+
+_PATRON_METODO = re.compile(r'"method":\s*"(?P<metodo>[A-Z]+)"')
+_PATRON_ENDPOINT = re.compile(r'"endpoint":\s*"(?P<endpoint>[^"]+)"')
+
+
+def mezcla_desde_log(ruta_log, minimo=1, solo_lectura=True):
+    """
+    Construye una mezcla de tráfico a partir del log de uso de la API.
+
+    Lee el archivo generado por `APIUsageMiddleware` (logger `api_usage`)
+    y pondera cada endpoint según el número de veces que aparece.
+
+    Args:
+        ruta_log (str): Ruta al archivo `api_usage.log`
+        minimo (int): Número mínimo de apariciones para incluir un endpoint
+        solo_lectura (bool): Ignorar peticiones que no sean GET
+
+    Returns:
+        tuple: Peticiones ordenadas de mayor a menor frecuencia
+    """
+    conteo = Counter()
+    with open(ruta_log, encoding='utf-8', errors='replace') as archivo:
+        for linea in archivo:
+            endpoint = _PATRON_ENDPOINT.search(linea)
+            if not endpoint:
+                continue
+            metodo = _PATRON_METODO.search(linea)
+            metodo = metodo['metodo'] if metodo else 'GET'
+            if solo_lectura and metodo != 'GET':
+                continue
+            conteo[(metodo, endpoint['endpoint'])] += 1
+
+    return tuple(
+        Peticion(nombre=endpoint, ruta=endpoint, peso=total, metodo=metodo)
+        for (metodo, endpoint), total in conteo.most_common()
+        if total >= minimo
+    )
+
+
+class SelectorPeticiones:
+    """Elige peticiones de una mezcla respetando sus pesos."""
+
+    def __init__(self, mezcla, semilla=None):
+        if not mezcla:
+            raise ValueError('La mezcla de tráfico no puede estar vacía')
+        self._mezcla = list(mezcla)
+        self._pesos_acumulados = list(accumulate(p.peso for p in self._mezcla))
+        self._rng = random.Random(semilla)
+
+    def siguiente(self):
+        """
+        Retorna la siguiente petición y su ruta final.
+
+        Returns:
+            tuple: (Peticion, ruta con el término de búsqueda sustituido)
+        """
+        peticion = self._rng.choices(self._mezcla, cum_weights=self._pesos_acumulados)[0]
+        ruta = peticion.ruta.replace('{termino}', self._rng.choice(TERMINOS_BUSQUEDA))
+        return peticion, ruta
+
+
+def percentil(valores_ordenados, porcentaje):
+    """
+    Calcula un percentil por el método del rango más cercano.
+
+    Args:
+        valores_ordenados (list): Valores ya ordenados de menor a mayor
+        porcentaje (float): Percentil entre 0 y 100
+
+    Returns:
+        float: Valor del percentil, o 0.0 si no hay valores
+    """
+    if not valores_ordenados:
+        return 0.0
+    rango = max(0, math.ceil(porcentaje / 100 * len(valores_ordenados)) - 1)
+    return valores_ordenados[rango]
+
+
+@dataclass
+class ResultadoPerfil:
+    """Resultado de ejecutar un perfil de concurrencia."""
+    concurrencia: int
+    duracion: float = 0.0
+    latencias: dict = field(default_factory=lambda: defaultdict(list))
+    estados: Counter = field(default_factory=Counter)
+    errores: Counter = field(default_factory=Counter)
+    fallos: Counter = field(default_factory=Counter)
+
+    def registrar(self, nombre, estado, latencia):
+        self.latencias[nombre].append(latencia)
+        self.estados[estado] += 1
+        if estado >= 400:
+            self.errores[nombre] += 1
+
+    def registrar_fallo(self, nombre, tipo_error):
+        self.estados[tipo_error] += 1
+        self.errores[nombre] += 1
+        self.fallos[nombre] += 1
+
+    @property
+    def total(self):
+        return sum(self.estados.values())
+
+    def _resumir(self, latencias, errores, fallos):
+        ordenadas = sorted(latencias)
+        return {
+            'peticiones': len(ordenadas) + fallos,
+            'errores': errores,
+            'p50_ms': round(percentil(ordenadas, 50) * 1000, 2),
+            'p90_ms': round(percentil(ordenadas, 90) * 1000, 2),
+            'p99_ms': round(percentil(ordenadas, 99) * 1000, 2),
+            'max_ms': round((ordenadas[-1] if ordenadas else 0.0) * 1000, 2),
+        }
+
+    def resumen(self):
+        """
+        Resume el perfil en un diccionario serializable.
+
+        Returns:
+            dict: Rendimiento global, percentiles y desglose por endpoint
+        """
+        todas = [latencia for valores in self.latencias.values() for latencia in valores]
+        resumen = self._resumir(todas, sum(self.errores.values()), sum(self.fallos.values()))
+        resumen.update({
+            'concurrencia': self.concurrencia,
+            'duracion_s': round(self.duracion, 3),
+            'rps': round(self.total / self.duracion, 2) if self.duracion else 0.0,
+            'estados': {str(estado): total for estado, total in sorted(self.estados.items(), key=lambda item: str(item[0]))},
+            'endpoints': {
+                nombre: self._resumir(
+                    self.latencias.get(nombre, []),
+                    self.errores.get(nombre, 0),
+                    self.fallos.get(nombre, 0),
+                )
+                for nombre in sorted(set(self.latencias) | set(self.errores))
+            },
+        })
+        return resumen
+
+
+async def ejecutar_perfil(url_base, mezcla, concurrencia, duracion, cabeceras=None,
+                          timeout=10.0, semilla=None, transport=None):
+    """
+    Ejecuta un perfil de carga de lazo cerrado.
+
+    Cada cliente virtual envía una petición, espera la respuesta y
+    envía la siguiente hasta agotar la duración indicada.
+
+    Args:
+        url_base (str): URL base del servidor (p. ej. http://127.0.0.1:8000)
+        mezcla (tuple): Peticiones ponderadas a reproducir
+        concurrencia (int): Número de clientes virtuales simultáneos
+        duracion (float): Duración del perfil en segundos
+        cabeceras (dict): Cabeceras adicionales (p. ej. Authorization)
+        timeout (float): Tiempo máximo por petición en segundos
+        semilla (int): Semilla para reproducir la misma secuencia
+        transport: Transporte httpx alternativo (usado en pruebas)
+
+    Returns:
+        ResultadoPerfil: Latencias y estados registrados
+    """
+    selector = SelectorPeticiones(mezcla, semilla)
+    resultado = ResultadoPerfil(concurrencia=concurrencia)
+    limites = httpx.Limits(max_connections=concurrencia, max_keepalive_connections=concurrencia)
+
+    async with httpx.AsyncClient(base_url=url_base, headers=cabeceras, timeout=timeout,
+                                 limits=limites, transport=transport) as cliente:
+        inicio = time.perf_counter()
+        fin = inicio + duracion
+
+        async def cliente_virtual():
+            while time.perf_counter() < fin:
+                peticion, ruta = selector.siguiente()
+                enviado = time.perf_counter()
+                try:
+                    respuesta = await cliente.request(peticion.metodo, ruta)
+                except httpx.HTTPError as exc:
+                    resultado.registrar_fallo(peticion.nombre, type(exc).__name__)
+                    continue
+                resultado.registrar(peticion.nombre, respuesta.status_code, time.perf_counter() - enviado)
+
+        await asyncio.gather(*(cliente_virtual() for _ in range(concurrencia)))
+        resultado.duracion = time.perf_counter() - inicio
+
+    return resultado
+
+
+def _puerto_libre():
+    with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as sock:
+        sock.bind(('127.0.0.1', 0))
+        return sock.getsockname()[1]
+
+
+class ServidorLocal:
+    """
+    Levanta gunicorn en un puerto local libre mientras dura el bloque `with`.
+
+    Ejemplo:
+        with ServidorLocal(worker_class='gthread', workers=2, threads=4) as url:
+            asyncio.run(ejecutar_perfil(url, MEZCLA_POR_DEFECTO, 10, 5))
+    """
+
+    def __init__(self, directorio, app='mysite.wsgi:application', worker_class='sync',
+                 workers=1, threads=1, entorno=None, espera=30.0):
+        self.directorio = directorio
+        self.app = app
+        self.worker_class = worker_class
+        self.workers = workers
+        self.threads = threads
+        self.entorno = entorno or {}
+        self.espera = espera
+        self.url = None
+        self._proceso = None
+        self._salida = None
+
+    def comando(self, puerto):
+        return [
+            sys.executable, '-m', 'gunicorn', self.app,
+            '--bind', f'127.0.0.1:{puerto}',
+            '--workers', str(self.workers),
+            '--threads', str(self.threads),
+            '--worker-class', self.worker_class,
+            '--log-level', 'warning',
+        ]
+
+    def __enter__(self):
+        puerto = _puerto_libre()
+        entorno = os.environ.copy()
+        entorno.update(self.entorno)
+        self._salida = tempfile.TemporaryFile()
+        self._proceso = subprocess.Popen(
+            self.comando(puerto),
+            cwd=self.directorio,
+            env=entorno,
+            stdout=subprocess.DEVNULL,
+            stderr=self._salida,
+        )
+        self.url = f'http://127.0.0.1:{puerto}'
+        self._esperar_listo()
+        return self.url
+
+    def _esperar_listo(self):
+        limite = time.monotonic() + self.espera
+        while time.monotonic() < limite:
+            if self._proceso.poll() is not None:
+                self._salida.seek(0)
+                detalle = self._salida.read().decode(errors='replace')[-2000:]
+                raise RuntimeError(f'gunicorn terminó durante el arranque:\n{detalle}')
+            try:
+                httpx.get(f'{self.url}/api/auth/status/', timeout=1.0)
+                return
+            except httpx.HTTPError:
+                time.sleep(0.2)
+        self.__exit__(None, None, None)
+        raise RuntimeError(f'gunicorn no respondió en {self.espera} segundos')
+
+    def __exit__(self, *exc_info):
+        if self._proceso and self._proceso.poll() is None:
+            self._proceso.terminate()
+            try:
+                self._proceso.wait(timeout=15)
+            except subprocess.TimeoutExpired:
+                self._proceso.kill()
+                self._proceso.wait()
+        if self._salida:
+            self._salida.close()
+        return False
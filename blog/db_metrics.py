@@ -0,0 +1,102 @@
+"""
+Métricas de conexiones a la base de datos.
+
+Cuenta las conexiones nuevas frente a las peticiones atendidas en el
+proceso actual: con conexiones persistentes o un pool la proporción debe
+tender a cero, mientras que sin ellas cada petición abre una conexión
+(y un handshake TLS) nueva. En modo `pool` también expone las
+estadísticas de espera de `psycopg_pool`.
+
+Las métricas son por proceso; gunicorn las publica junto con las
+estadísticas de cada worker (ver `gunicorn.conf.py`).
+"""
+
+import threading
+import time
+from collections import Counter
+
+from django.conf import settings
+from django.core.signals import request_finished
+from django.db import connections
+from django.db.backends.signals import connection_created
+
+_lock = threading.Lock()
+_conexiones_creadas = Counter()
+_peticiones = 0
+_inicio = time.time()
+
+
+def _al_crear_conexion(sender, connection, **kwargs):
+    with _lock:
+        _conexiones_creadas[connection.alias] += 1
+
+
+def _al_terminar_peticion(sender, **kwargs):
+    global _peticiones
+    with _lock:
+        _peticiones += 1
+
+
+def registrar_senales():
+    """Conecta los receptores de señales (llamado desde `BlogConfig.ready`)."""
+    connection_created.connect(_al_crear_conexion, dispatch_uid='db_metrics_conexiones')
+    request_finished.connect(_al_terminar_peticion, dispatch_uid='db_metrics_peticiones')
+
+
+def estadisticas_pool(alias='default'):
+    """
+    Estadísticas del pool de psycopg para una conexión, si existe.
+
+    Returns:
+        dict | None: Tamaño, conexiones disponibles y esperas del pool
+    """
+    # Se consulta el registro de pools del backend en lugar de la propiedad
+    # `pool`, que crearía uno nuevo si todavía no existe.
+    pool = getattr(type(connections[alias]), '_connection_pools', {}).get(alias)
+    if pool is None:
+        return None
+    datos = pool.get_stats()
+    return {
+        'tamano': datos.get('pool_size', 0),
+        'disponibles': datos.get('pool_available', 0),
+        'minimo': datos.get('pool_min', 0),
+        'maximo': datos.get('pool_max', 0),
+        'esperando': datos.get('requests_waiting', 0),
+        'peticiones_pool': datos.get('requests_num', 0),
+        'peticiones_en_espera': datos.get('requests_queued', 0),
+        'espera_total_ms': datos.get('requests_wait_ms', 0),
+        'errores_pool': datos.get('requests_errors', 0),
+        'conexiones_perdidas': datos.get('connections_lost', 0),
+    }
+
+
+def resumen():
+    """
+    Resume las métricas del proceso actual.
+
+    Returns:
+        dict: Conexiones creadas, peticiones y conexiones por petición
+    """
+    with _lock:
+        creadas = dict(_conexiones_creadas)
+        peticiones = _peticiones
+
+    total = sum(creadas.values())
+    return {
+        'modo': getattr(settings, 'DB_POOL_MODE', 'none'),
+        'desde': _inicio,
+        'peticiones': peticiones,
+        'conexiones_creadas': total,
+        'conexiones_por_alias': creadas,
+        'conexiones_por_peticion': round(total / peticiones, 3) if peticiones else 0.0,
+        'pool': estadisticas_pool(),
+    }
+
+
+def reiniciar():
+    """Reinicia los contadores (usado en pruebas)."""
+    global _peticiones, _inicio
+    with _lock:
+        _conexiones_creadas.clear()
+        _peticiones = 0
+        _inicio = time.time()
@@ -0,0 +1,224 @@
+"""
+Facetas con conteos para los listados de la API.
+
+`?facets=semestre,estado` añade a la respuesta del listado los conteos por
+valor de cada campo, calculados sobre el queryset ya filtrado (filtros,
+búsqueda), para construir los filtros laterales del frontend sin descargar
+listas completas ni llamar a los endpoints de estadísticas.
+
+Todas las facetas pedidas se calculan en una sola consulta (`UNION ALL` de
+un GROUP BY por campo) y el resultado se cachea por firma de filtros
+durante `FACETS_CACHE_TTL` segundos. Guardar o eliminar un objeto de los
+modelos involucrados incrementa una generación que invalida la caché.
+"""
+
+import hashlib
+import json
+
+from django.conf import settings
+from django.core.cache import cache
+from django.core.exceptions import ValidationError as DjangoValidationError
+from django.db.models import BooleanField, CharField, Count, F, IntegerField, Value
+from django.db.models.functions import Cast
+from django.db.models.signals import post_delete, post_save
+from drf_yasg import openapi
+from drf_yasg.utils import swagger_auto_schema
+from rest_framework.exceptions import ValidationError
+
+FACETS_PARAM = 'facets'
+CLAVE_GENERACION = 'facetas:generacion'
+
+# Parámetros que no cambian el conjunto filtrado
+_PARAMETROS_IGNORADOS = {FACETS_PARAM, 'page', 'page_size', 'ordering', 'format'}
+
+# Modelos cuyo guardado invalida las facetas cacheadas
+_modelos_con_facetas = set()
+
+
+def _resolver_campo(modelo, ruta):
+    """
+    Recorre una ruta del ORM (`tecnologias__tecnologia`).
+
+    Returns:
+        tuple: (campo final, modelos recorridos)
+    """
+    modelos = [modelo]
+    partes = ruta.split('__')
+    for parte in partes[:-1]:
+        modelo = modelo._meta.get_field(parte).related_model
+        modelos.append(modelo)
+    return modelo._meta.get_field(partes[-1]), modelos
+
+
+def _generacion():
+    return cache.get_or_set(CLAVE_GENERACION, 1, timeout=None)
+
+
+def invalidar_facetas(sender, **kwargs):
+    """Invalida las facetas cacheadas al modificar un modelo con facetas."""
+    if sender._meta.label not in _modelos_con_facetas:
+        return
+    if not cache.add(CLAVE_GENERACION, 2, timeout=None):
+        try:
+            cache.incr(CLAVE_GENERACION)
+        except ValueError:
+            cache.set(CLAVE_GENERACION, 2, timeout=None)
+
+
+def registrar_senales():
+    """Conecta la invalidación de facetas (llamado desde `BlogConfig.ready`)."""
+    post_save.connect(invalidar_facetas, dispatch_uid='facetas_guardado')
+    post_delete.connect(invalidar_facetas, dispatch_uid='facetas_eliminado')
+
+
+def _consulta_faceta(queryset, nombre, ruta, campo):
+    expresion = F(ruta)
+    if isinstance(campo, BooleanField):
+        # Mismo texto ('1'/'0') en SQLite y PostgreSQL
+        expresion = Cast(expresion, output_field=IntegerField())
+    return (
+        queryset.order_by()
+        .annotate(
+            faceta_nombre=Value(nombre, output_field=CharField()),
+            faceta_valor=Cast(expresion, output_field=CharField()),
+        )
+        .values('faceta_nombre', 'faceta_valor')
+        .annotate(faceta_total=Count('pk', distinct=True))
+    )
+
+
+def _convertir(campo, valor):
+    if valor is None:
+        return None
+    if isinstance(campo, BooleanField):
+        return valor not in ('0', 'false', 'f')
+    try:
+        return campo.to_python(valor)
+    except DjangoValidationError:
+        return valor
+
+
+def calcular_facetas(queryset, campos):
+    """
+    Cuenta los objetos del queryset por valor de cada campo.
+
+    Args:
+        queryset (QuerySet): Queryset ya filtrado
+        campos (dict): Nombre público de la faceta → ruta del ORM
+
+    Returns:
+        dict: Faceta → lista de {'valor', 'total'} ordenada por total
+    """
+    definiciones = {
+        nombre: _resolver_campo(queryset.model, ruta)[0]
+        for nombre, ruta in campos.items()
+    }
+    consultas = [
+        _consulta_faceta(queryset, nombre, ruta, definiciones[nombre])
+        for nombre, ruta in campos.items()
+    ]
+    consulta = consultas[0].union(*consultas[1:], all=True) if len(consultas) > 1 else consultas[0]
+
+    facetas = {nombre: [] for nombre in campos}
+    for fila in consulta:
+        nombre = fila['faceta_nombre']
+        facetas[nombre].append({
+            'valor': _convertir(definiciones[nombre], fila['faceta_valor']),
+            'total': fila['faceta_total'],
+        })
+
+    maximo = getattr(settings, 'FACETS_MAX_BUCKETS', 50)
+    for nombre, buckets in facetas.items():
+        buckets.sort(key=lambda bucket: (-bucket['total'], str(bucket['valor'])))
+        facetas[nombre] = buckets[:maximo]
+    return facetas
+
+
+class FacetasMixin:
+    """
+    Mixin para ViewSets que añade `?facets=` al listado.
+
+    Attributes:
+        facet_fields (dict): Nombre público de la faceta → ruta del ORM
+    """
+
+    facet_fields = {}
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        queryset = getattr(cls, 'queryset', None)
+        if queryset is None:
+            return
+        for ruta in cls.facet_fields.values():
+            _, modelos = _resolver_campo(queryset.model, ruta)
+            _modelos_con_facetas.update(modelo._meta.label for modelo in modelos)
+
+    def facetas_solicitadas(self, request):
+        """
+        Facetas pedidas en `?facets=`, validadas contra `facet_fields`.
+
+        Returns:
+            list: Nombres de las facetas (vacía si no se pidieron)
+
+        Raises:
+            ValidationError: Si se pide una faceta no disponible
+        """
+        valor = request.query_params.get(FACETS_PARAM, '')
+        nombres = list(dict.fromkeys(nombre.strip() for nombre in valor.split(',') if nombre.strip()))
+        desconocidas = [nombre for nombre in nombres if nombre not in self.facet_fields]
+        if desconocidas:
+            raise ValidationError({
+                FACETS_PARAM: f"Facetas no disponibles: {', '.join(desconocidas)}. "
+                              f"Disponibles: {', '.join(self.facet_fields)}"
+            })
+        return nombres
+
+    def firma_facetas(self, request, nombres):
+        """Clave de caché para las facetas de esta combinación de filtros."""
+        filtros = sorted(
+            (clave, sorted(request.query_params.getlist(clave)))
+            for clave in request.query_params
+            if clave not in _PARAMETROS_IGNORADOS
+        )
+        firma = json.dumps([self.queryset.model._meta.label, sorted(nombres), filtros])
+        return f'facetas:{_generacion()}:{hashlib.sha1(firma.encode()).hexdigest()}'
+
+    def obtener_facetas(self, request, nombres):
+        """
+        Calcula (o lee de la caché) las facetas pedidas.
+
+        Args:
+            request: Request de DRF
+            nombres (list): Facetas validadas
+
+        Returns:
+            dict: Resultado de `calcular_facetas`
+        """
+        clave = self.firma_facetas(request, nombres)
+        facetas = cache.get(clave)
+        if facetas is None:
+            queryset = self.filter_queryset(self.get_queryset())
+            facetas = calcular_facetas(queryset, {nombre: self.facet_fields[nombre] for nombre in nombres})
+            cache.set(clave, facetas, getattr(settings, 'FACETS_CACHE_TTL', 300))
+        return facetas
+
+    @swagger_auto_schema(manual_parameters=[
+        openapi.Parameter(
+            FACETS_PARAM,
+            openapi.IN_QUERY,
+            description="Facetas separadas por comas; añade 'facets' con los conteos por valor",
+            type=openapi.TYPE_STRING,
+        )
+    ])
+    def list(self, request, *args, **kwargs):
+        nombres = self.facetas_solicitadas(request)
+        response = super().list(request, *args, **kwargs)
+        if not nombres:
+            return response
+
+        facetas = self.obtener_facetas(request, nombres)
+        if isinstance(response.data, dict):
+            response.data['facets'] = facetas
+        else:
+            response.data = {'results': response.data, 'facets': facetas}
+        return response
@@ -14,6 +14,7 @@ from .Models.OfertasEmpleoModel import OfertasEmpleo
 from .Models.NoticiasModel import Noticias
 from .Models.CursosModel import Cursos
 from .Models.ProyectosModel import Proyectos
+from .tecnologias import palabras_clave
 
 
 class ConferenciasFilter(django_filters.FilterSet):
@@ -219,11 +220,16 @@ class ProyectosFilter(django_filters.FilterSet):
     )
     
     tecnologia = django_filters.CharFilter(
-        field_name='descripcion_proyecto',
-        lookup_expr='icontains',
+        method='filter_tecnologia',
         help_text="Buscar por tecnología en la descripción"
     )
 
     class Meta:
         model = Proyectos
         fields = ['nombre', 'tecnologia']
+
+    def filter_tecnologia(self, queryset, name, value):
+        """Usa el índice de tecnologías si la palabra está configurada."""
+        if value.strip().lower() in palabras_clave():
+            return queryset.filter(tecnologias__tecnologia=value.strip().lower())
+        return queryset.filter(description_proyecto__icontains=value)
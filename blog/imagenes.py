@@ -0,0 +1,160 @@
+"""
+URLs de entrega de imágenes de Cloudinary.
+
+`CloudinaryResource.url` recorre el SDK completo en cada llamada (lectura
+de la configuración, generación de la transformación, expresiones
+regulares, escape del public_id). Para los listados se construye, una vez
+por configuración y transformación, el prefijo que genera el propio SDK
+(`https://res.cloudinary.com/<cloud>/image/upload/<transformación>`) y en
+cada fila solo se concatenan versión, public_id y formato.
+
+Las configuraciones en las que la URL depende de cada recurso (URLs
+firmadas, auth tokens, subdominios CDN repartidos por public_id) y los
+public_id con caracteres que el SDK escaparía se delegan al SDK, así que
+el resultado es siempre el mismo que el de `recurso.url`.
+
+Además de la original, cada imagen ofrece variantes (`thumbnail`, `card`,
+`full`) y un `srcset` con `f_auto,q_auto` para que los clientes descarguen
+el tamaño y formato adecuados.
+"""
+
+import re
+from functools import lru_cache
+
+import cloudinary
+from cloudinary import CloudinaryResource
+from cloudinary.utils import cloudinary_url
+from django.conf import settings
+
+# Formato y calidad automáticos (WebP/AVIF según el navegador)
+OPCIONES_AUTO = 'f_auto,q_auto'
+
+VARIANTES_POR_DEFECTO = {
+    'thumbnail': 'c_fill,g_auto,h_150,w_150',
+    'card': 'c_limit,w_640',
+    'full': 'c_limit,w_1600',
+}
+ANCHOS_SRCSET_POR_DEFECTO = [320, 640, 960, 1280]
+
+# public_id que el SDK deja intactos (sin escape, sin barras repetidas ni URLs)
+_ID_SIMPLE = re.compile(r'^[a-zA-Z0-9_.\-]+(/[a-zA-Z0-9_.\-]+)*$')
+_VERSION_EN_ID = re.compile(r'^v[0-9]+')
+
+
+class ConstructorURL:
+    """
+    Construye URLs de entrega con prefijos cacheados para una configuración.
+
+    Attributes:
+        rapido (bool): Si la configuración permite concatenar sin el SDK
+        forzar_version (bool): `force_version` del SDK (añade `v1/` a los
+            public_id con carpetas y sin versión)
+    """
+
+    def __init__(self, firma):
+        (cloud_name, force_version, sign_url, auth_token,
+         cdn_subdomain, secure_cdn_subdomain) = firma[:6]
+        self.rapido = bool(cloud_name) and not (sign_url or auth_token or cdn_subdomain or secure_cdn_subdomain)
+        self.forzar_version = force_version is None or bool(force_version)
+        self._prefijos = {}
+
+    @classmethod
+    def actual(cls):
+        """Constructor para la configuración de Cloudinary vigente."""
+        config = cloudinary.config()
+        return _constructor((
+            config.cloud_name, config.force_version, config.sign_url, bool(config.auth_token),
+            config.cdn_subdomain, config.secure_cdn_subdomain,
+            config.secure, config.private_cdn, config.cname, config.secure_distribution,
+            config.shorten, config.use_root_path,
+        ))
+
+    def prefijo(self, transformacion, resource_type):
+        """
+        Prefijo de la URL hasta la transformación, generado por el SDK.
+
+        Args:
+            transformacion (str): Transformación en crudo ('' para la original)
+            resource_type (str): Tipo de recurso ('image', 'video'...)
+
+        Returns:
+            str: Prefijo sin barra final
+        """
+        clave = (transformacion, resource_type)
+        prefijo = self._prefijos.get(clave)
+        if prefijo is None:
+            url, _ = cloudinary_url(
+                'x', type='upload', resource_type=resource_type,
+                raw_transformation=transformacion or None, force_version=False,
+            )
+            prefijo = self._prefijos[clave] = url[:-2]
+        return prefijo
+
+    def url(self, recurso, transformacion=''):
+        """
+        URL de entrega de un recurso, idéntica a la del SDK.
+
+        Args:
+            recurso (CloudinaryResource): Imagen
+            transformacion (str): Transformación en crudo ('' para la original)
+
+        Returns:
+            str: URL de la imagen
+        """
+        public_id = recurso.public_id
+        if (not self.rapido or recurso.url_options or recurso.type not in (None, 'upload')
+                or not public_id or not _ID_SIMPLE.match(public_id)):
+            return recurso.build_url(raw_transformation=transformacion) if transformacion else recurso.url
+
+        if recurso.version:
+            version = f'v{recurso.version}/'
+        elif self.forzar_version and '/' in public_id and not _VERSION_EN_ID.match(public_id):
+            version = 'v1/'
+        else:
+            version = ''
+        formato = f'.{recurso.format}' if recurso.format else ''
+        return f'{self.prefijo(transformacion, recurso.resource_type or "image")}/{version}{public_id}{formato}'
+
+    def variantes(self, recurso):
+        """
+        Variantes configuradas y `srcset` de un recurso.
+
+        Args:
+            recurso (CloudinaryResource): Imagen
+
+        Returns:
+            dict: Nombre de la variante → URL, más 'srcset'
+        """
+        datos = {
+            nombre: self.url(recurso, f'{transformacion},{OPCIONES_AUTO}')
+            for nombre, transformacion in getattr(settings, 'CLOUDINARY_VARIANTES', VARIANTES_POR_DEFECTO).items()
+        }
+        datos['srcset'] = ', '.join(
+            f"{self.url(recurso, f'c_limit,w_{ancho},{OPCIONES_AUTO}')} {ancho}w"
+            for ancho in getattr(settings, 'CLOUDINARY_SRCSET_ANCHOS', ANCHOS_SRCSET_POR_DEFECTO)
+        )
+        return datos
+
+
+@lru_cache(maxsize=8)
+def _constructor(firma):
+    return ConstructorURL(firma)
+
+
+def url_imagen(recurso, transformacion=''):
+    """
+    URL de entrega de una imagen (ver `ConstructorURL.url`).
+
+    Args:
+        recurso (CloudinaryResource): Imagen
+        transformacion (str): Transformación en crudo
+
+    Returns:
+        str: URL de la imagen
+    """
+    return ConstructorURL.actual().url(recurso, transformacion)
+
+
+def es_recurso(valor):
+    """Indica si el valor es un recurso de Cloudinary (y no un archivo subido)."""
+    return isinstance(valor, CloudinaryResource)
@@ -0,0 +1,232 @@
+"""
+Ciclo de vida de los archivos de log.
+
+Los `RotatingFileHandler` de `LOGGING` dejan copias `django.log.1` …
+`django.log.N` junto al archivo activo. `gestionar_logs` recorre el
+directorio con `os.scandir` (un solo `stat` por entrada) y:
+
+1. Elimina los archivos con más de `dias` de antigüedad.
+2. Comprime con gzip las copias rotadas que quedan, en un pool de hilos
+   (zlib libera el GIL) y en streaming, con un nombre fechado
+   (`django.log.20240501-120000.gz`): el handler reutiliza `.1`, `.2`…
+   en cada rotación y un nombre fijo se sobrescribiría.
+3. Si lo que queda supera `max_bytes`, elimina los más antiguos.
+
+Los archivos activos (los `filename` de los handlers de `LOGGING`) nunca
+se tocan. Devuelve un resumen con los bytes recuperados por motivo.
+"""
+
+import gzip
+import logging
+import os
+import re
+import shutil
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from django.conf import settings
+
+logger = logging.getLogger(__name__)
+
+# Copias de RotatingFileHandler (`.1`) y de TimedRotatingFileHandler (`.2024-05-01`)
+_SUFIJO_ROTADO = re.compile(r'^\.(\d+|\d{4}-\d{2}-\d{2}(_\d{2}(-\d{2}){0,2})?)$')
+_TAMANO_BLOQUE = 1024 * 1024
+
+
+def directorio_logs():
+    """Directorio de los archivos de log (`LOGS_DIR`)."""
+    return getattr(settings, 'LOGS_DIR', os.path.join(settings.BASE_DIR, 'logs'))
+
+
+def archivos_activos():
+    """
+    Archivos en los que escriben los handlers de `LOGGING`.
+
+    Returns:
+        set: Rutas absolutas
+    """
+    handlers = (getattr(settings, 'LOGGING', None) or {}).get('handlers', {})
+    return {os.path.abspath(h['filename']) for h in handlers.values() if h.get('filename')}
+
+
+def clasificar(nombre, activos):
+    """
+    Tipo de un archivo del directorio de logs.
+
+    Args:
+        nombre (str): Nombre del archivo
+        activos (set): Nombres de los archivos activos
+
+    Returns:
+        str: 'activo', 'rotado', 'comprimido' u 'otro'
+    """
+    if nombre in activos:
+        return 'activo'
+    if nombre.endswith('.gz'):
+        return 'comprimido'
+    for base in activos:
+        if nombre.startswith(base) and _SUFIJO_ROTADO.match(nombre[len(base):]):
+            return 'rotado'
+    return 'otro'
+
+
+def escanear(directorio, activos):
+    """
+    Archivos del directorio con su tamaño, fecha y tipo.
+
+    Args:
+        directorio (str): Directorio de logs
+        activos (set): Rutas absolutas de los archivos activos
+
+    Returns:
+        list: Dicts con nombre, ruta, bytes, mtime y tipo
+    """
+    nombres_activos = {os.path.basename(ruta) for ruta in activos if os.path.dirname(ruta) == directorio}
+    archivos = []
+    with os.scandir(directorio) as entradas:
+        for entrada in entradas:
+            if not entrada.is_file(follow_symlinks=False):
+                continue
+            datos = entrada.stat(follow_symlinks=False)
+            archivos.append({
+                'nombre': entrada.name,
+                'ruta': entrada.path,
+                'bytes': datos.st_size,
+                'mtime': datos.st_mtime,
+                'tipo': clasificar(entrada.name, nombres_activos),
+            })
+    return archivos
+
+
+def _nombre_comprimido(directorio, archivo, activos):
+    base = next((a for a in sorted(activos, key=len, reverse=True) if archivo['nombre'].startswith(a)), archivo['nombre'])
+    fecha = time.strftime('%Y%m%d-%H%M%S', time.localtime(archivo['mtime']))
+    nombre, n = f'{base}.{fecha}.gz', 1
+    while os.path.exists(os.path.join(directorio, nombre)):
+        n += 1
+        nombre = f'{base}.{fecha}-{n}.gz'
+    return os.path.join(directorio, nombre)
+
+
+def comprimir(archivo, destino, nivel):
+    """
+    Comprime un archivo con gzip en streaming y elimina el original.
+
+    El resultado conserva la fecha de modificación del original para que
+    la retención por antigüedad siga contando desde la rotación.
+
+    Args:
+        archivo (dict): Entrada de `escanear`
+        destino (str): Ruta del `.gz`
+        nivel (int): Nivel de compresión
+
+    Returns:
+        dict: Entrada del archivo comprimido
+    """
+    temporal = f'{destino}.tmp'
+    with open(archivo['ruta'], 'rb') as origen, gzip.open(temporal, 'wb', compresslevel=nivel) as salida:
+        shutil.copyfileobj(origen, salida, _TAMANO_BLOQUE)
+    os.utime(temporal, (archivo['mtime'], archivo['mtime']))
+    os.replace(temporal, destino)
+    os.remove(archivo['ruta'])
+    return {
+        'nombre': os.path.basename(destino),
+        'ruta': destino,
+        'bytes': os.path.getsize(destino),
+        'mtime': archivo['mtime'],
+        'tipo': 'comprimido',
+    }
+
+
+def _eliminar(archivo, resumen, motivo):
+    try:
+        os.remove(archivo['ruta'])
+    except FileNotFoundError:
+        # Otra ejecución (o una reentrega de la tarea) ya lo eliminó
+        return
+    resumen['archivos_eliminados'] += 1
+    resumen['bytes_recuperados'][motivo] += archivo['bytes']
+
+
+def gestionar_logs(directorio=None, dias=None, max_bytes=None, comprimir_rotados=None, hilos=None, ahora=None):
+    """
+    Aplica la retención por antigüedad y tamaño y comprime las copias rotadas.
+
+    Args:
+        directorio (str): Directorio de logs (default: LOGS_DIR)
+        dias (int): Antigüedad máxima (default: LOG_RETENTION_DAYS)
+        max_bytes (int): Tamaño máximo de los archivos no activos (default: LOG_RETENTION_MAX_BYTES)
+        comprimir_rotados (bool): Comprimir las copias rotadas (default: LOG_COMPRESS_ROTATED)
+        hilos (int): Hilos de compresión (default: LOG_COMPRESSION_WORKERS)
+        ahora (float): Instante de referencia (epoch)
+
+    Returns:
+        dict: Archivos eliminados y comprimidos, bytes antes/después y
+            bytes recuperados por motivo
+    """
+    directorio = os.path.abspath(directorio or directorio_logs())
+    dias = settings.LOG_RETENTION_DAYS if dias is None else dias
+    max_bytes = settings.LOG_RETENTION_MAX_BYTES if max_bytes is None else max_bytes
+    comprimir_rotados = settings.LOG_COMPRESS_ROTATED if comprimir_rotados is None else comprimir_rotados
+    hilos = hilos or settings.LOG_COMPRESSION_WORKERS
+    limite = (ahora or time.time()) - dias * 86400
+
+    resumen = {
+        'directorio': directorio,
+        'archivos_eliminados': 0,
+        'archivos_comprimidos': 0,
+        'bytes_antes': 0,
+        'bytes_despues': 0,
+        'bytes_recuperados': {'antiguedad': 0, 'compresion': 0, 'tamano': 0},
+    }
+    if not os.path.isdir(directorio):
+        return resumen
+
+    activos = archivos_activos()
+    archivos = escanear(directorio, activos)
+    resumen['bytes_antes'] = sum(a['bytes'] for a in archivos)
+
+    # 1. Antigüedad
+    conservados = []
+    for archivo in archivos:
+        if archivo['tipo'] != 'activo' and archivo['mtime'] < limite:
+            _eliminar(archivo, resumen, 'antiguedad')
+        else:
+            conservados.append(archivo)
+
+    # 2. Compresión de las copias rotadas
+    rotados = [a for a in conservados if a['tipo'] == 'rotado'] if comprimir_rotados else []
+    if rotados:
+        nombres_activos = {os.path.basename(ruta) for ruta in activos}
+        destinos = [_nombre_comprimido(directorio, a, nombres_activos) for a in rotados]
+        nivel = settings.LOG_COMPRESSION_LEVEL
+        with ThreadPoolExecutor(max_workers=hilos, thread_name_prefix='logs-gzip') as pool:
+            futuros = [pool.submit(comprimir, a, d, nivel) for a, d in zip(rotados, destinos)]
+        conservados = [a for a in conservados if a['tipo'] != 'rotado']
+        for archivo, futuro in zip(rotados, futuros):
+            try:
+                comprimido = futuro.result()
+            except OSError as e:
+                logger.warning("No se pudo comprimir %s: %s", archivo['nombre'], e)
+                conservados.append(archivo)
+                continue
+            resumen['archivos_comprimidos'] += 1
+            resumen['bytes_recuperados']['compresion'] += archivo['bytes'] - comprimido['bytes']
+            conservados.append(comprimido)
+
+    # 3. Tamaño total de lo no activo, eliminando primero lo más antiguo
+    historico = sorted((a for a in conservados if a['tipo'] != 'activo'), key=lambda a: a['mtime'])
+    exceso = sum(a['bytes'] for a in historico) - max_bytes
+    for archivo in historico:
+        if exceso <= 0:
+            break
+        _eliminar(archivo, resumen, 'tamano')
+        exceso -= archivo['bytes']
+
+    resumen['bytes_despues'] = resumen['bytes_antes'] - sum(resumen['bytes_recuperados'].values())
+    logger.info(
+        "Logs: %s eliminados, %s comprimidos, %s bytes recuperados (%s)",
+        resumen['archivos_eliminados'], resumen['archivos_comprimidos'],
+        sum(resumen['bytes_recuperados'].values()), resumen['bytes_recuperados'],
+    )
+    return resumen
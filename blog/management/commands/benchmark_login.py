@@ -0,0 +1,255 @@
+"""
+Comando de gestión para medir el login bajo un ataque de fuerza bruta.
+
+Por cada hasher lanza ráfagas de contraseñas incorrectas contra
+/api/auth/login/ desde una IP atacante, con y sin `GuardiaLogin`, mientras
+un usuario legítimo inicia sesión desde otra IP. Reporta intentos por
+segundo, CPU consumida por intento y la latencia del login legítimo.
+"""
+
+import json
+import logging
+import threading
+import time
+
+from django.conf import settings
+from django.contrib.auth.hashers import make_password
+from django.contrib.auth.models import User
+from django.core.management.base import BaseCommand, CommandError
+from django.test import Client
+from django.test.utils import override_settings
+
+from blog.benchmarks.carga import percentil
+from blog.ratelimit import GuardiaLogin
+
+URL_LOGIN = '/api/auth/login/'
+IP_ATACANTE = '203.0.113.10'
+IP_LEGITIMA = '198.51.100.20'
+USUARIO_VICTIMA = 'benchmark_login_victima'
+USUARIO_LEGITIMO = 'benchmark_login_legitimo'
+CONTRASENA = 'Benchmark-Login-2024'
+SIN_LIMITE = '1000000/s'
+
+
+class Command(BaseCommand):
+    """
+    Comando para comparar hashers y la guardia del login bajo ataque.
+
+    Uso:
+        python manage.py benchmark_login
+        python manage.py benchmark_login --hashers pbkdf2,argon2 --intentos 300
+        python manage.py benchmark_login --hilos 16 --formato json
+    """
+
+    help = 'Mide el rendimiento del login bajo un ataque de fuerza bruta'
+
+    def add_arguments(self, parser):
+        """
+        Agrega argumentos al comando.
+
+        Args:
+            parser: ArgumentParser de Django
+        """
+        parser.add_argument(
+            '--hashers',
+            type=str,
+            default='pbkdf2,argon2,scrypt',
+            help='Hashers a comparar, separados por comas (default: pbkdf2,argon2,scrypt)'
+        )
+
+        parser.add_argument(
+            '--intentos',
+            type=int,
+            default=200,
+            help='Intentos del atacante por escenario (default: 200)'
+        )
+
+        parser.add_argument(
+            '--hilos',
+            type=int,
+            default=8,
+            help='Hilos atacantes concurrentes (default: 8)'
+        )
+
+        parser.add_argument(
+            '--formato',
+            type=str,
+            default='texto',
+            choices=['texto', 'json'],
+            help='Formato de salida del reporte (texto o json)'
+        )
+
+    def handle(self, *args, **options):
+        """
+        Ejecuta el comando principal.
+
+        Args:
+            *args: Argumentos posicionales
+            **options: Opciones del comando
+        """
+        hashers = [nombre.strip() for nombre in options['hashers'].split(',') if nombre.strip()]
+        disponibles = {hasher.rsplit('.', 1)[-1]: hasher for hasher in settings.PASSWORD_HASHERS}
+        rutas = {
+            'pbkdf2': disponibles.get('PBKDF2PasswordHasher'),
+            'argon2': disponibles.get('TunedArgon2PasswordHasher'),
+            'scrypt': disponibles.get('TunedScryptPasswordHasher'),
+        }
+        for nombre in hashers:
+            if not rutas.get(nombre):
+                raise CommandError(f'Hasher no soportado: {nombre}')
+
+        # El throttling global de la API cortaría el ataque por sí solo y
+        # ocultaría el coste del hash: se desactiva durante la medición
+        sin_throttling = {**settings.REST_FRAMEWORK, 'DEFAULT_THROTTLE_RATES': {}}
+        # Los 400/429 del ataque llenarían el log de peticiones
+        logging.disable(logging.WARNING)
+        resultados = []
+        try:
+            with override_settings(
+                ALLOWED_HOSTS=[*settings.ALLOWED_HOSTS, 'testserver'],
+                REST_FRAMEWORK=sin_throttling,
+            ):
+                for nombre in hashers:
+                    lista = [rutas[nombre]] + [h for h in settings.PASSWORD_HASHERS if h != rutas[nombre]]
+                    with override_settings(PASSWORD_HASHERS=lista):
+                        self.stdout.write(f'Midiendo {nombre}...')
+                        resultados.append(self.medir_hasher(nombre, options['intentos'], options['hilos']))
+        finally:
+            logging.disable(logging.NOTSET)
+            User.objects.filter(username__in=[USUARIO_VICTIMA, USUARIO_LEGITIMO]).delete()
+
+        if options['formato'] == 'json':
+            self.stdout.write(json.dumps(resultados, indent=2))
+        else:
+            self.stdout.write(self.formatear_texto(resultados))
+
+    def medir_hasher(self, nombre, intentos, hilos):
+        """
+        Mide un hasher: coste de un hash y login bajo ataque con y sin guardia.
+
+        Args:
+            nombre (str): Nombre del hasher
+            intentos (int): Intentos del atacante por escenario
+            hilos (int): Hilos atacantes concurrentes
+
+        Returns:
+            dict: Resultados del hasher
+        """
+        User.objects.filter(username__in=[USUARIO_VICTIMA, USUARIO_LEGITIMO]).delete()
+        for username in (USUARIO_VICTIMA, USUARIO_LEGITIMO):
+            User.objects.create_user(username=username, password=CONTRASENA)
+
+        inicio = time.perf_counter()
+        for _ in range(5):
+            make_password(CONTRASENA)
+        hash_ms = (time.perf_counter() - inicio) / 5 * 1000
+
+        with override_settings(LOGIN_RATE_IP=SIN_LIMITE, LOGIN_RATE_USERNAME=SIN_LIMITE):
+            sin_guardia = self.ejecutar_ataque(intentos, hilos)
+        con_guardia = self.ejecutar_ataque(intentos, hilos)
+
+        return {
+            'hasher': nombre,
+            'hash_ms': round(hash_ms, 1),
+            'sin_guardia': sin_guardia,
+            'con_guardia': con_guardia,
+        }
+
+    def ejecutar_ataque(self, intentos, hilos):
+        """
+        Lanza el ataque contra la víctima mientras el usuario legítimo inicia sesión.
+
+        Args:
+            intentos (int): Intentos totales del atacante
+            hilos (int): Hilos atacantes concurrentes
+
+        Returns:
+            dict: Rendimiento del ataque y latencia del login legítimo
+        """
+        guardia = GuardiaLogin()
+        guardia.por_ip.reiniciar(IP_ATACANTE)
+        guardia.por_ip.reiniciar(IP_LEGITIMA)
+        guardia.exito(USUARIO_VICTIMA)
+
+        pendientes = iter(range(intentos))
+        cerrojo = threading.Lock()
+        codigos = {}
+        terminado = threading.Event()
+        latencias_legitimas = []
+
+        def atacante():
+            cliente = Client(REMOTE_ADDR=IP_ATACANTE)
+            while True:
+                with cerrojo:
+                    if next(pendientes, None) is None:
+                        return
+                respuesta = cliente.post(
+                    URL_LOGIN,
+                    {'username': USUARIO_VICTIMA, 'password': 'incorrecta'},
+                    content_type='application/json'
+                )
+                with cerrojo:
+                    codigos[respuesta.status_code] = codigos.get(respuesta.status_code, 0) + 1
+
+        def legitimo():
+            cliente = Client(REMOTE_ADDR=IP_LEGITIMA)
+            while not terminado.is_set():
+                inicio = time.perf_counter()
+                cliente.post(
+                    URL_LOGIN,
+                    {'username': USUARIO_LEGITIMO, 'password': CONTRASENA},
+                    content_type='application/json'
+                )
+                latencias_legitimas.append((time.perf_counter() - inicio) * 1000)
+                # Ritmo de un usuario real, no otro atacante
+                terminado.wait(0.2)
+
+        hilo_legitimo = threading.Thread(target=legitimo)
+        atacantes = [threading.Thread(target=atacante) for _ in range(hilos)]
+
+        cpu_inicio = time.process_time()
+        inicio = time.perf_counter()
+        hilo_legitimo.start()
+        for hilo in atacantes:
+            hilo.start()
+        for hilo in atacantes:
+            hilo.join()
+        duracion = time.perf_counter() - inicio
+        cpu = time.process_time() - cpu_inicio
+        terminado.set()
+        hilo_legitimo.join()
+
+        latencias_legitimas.sort()
+        return {
+            'intentos_por_segundo': round(intentos / duracion, 1),
+            'cpu_ms_por_intento': round(cpu / intentos * 1000, 2),
+            'codigos': {str(codigo): total for codigo, total in sorted(codigos.items())},
+            'legitimo_p50_ms': round(percentil(latencias_legitimas, 50), 1),
+            'legitimo_p95_ms': round(percentil(latencias_legitimas, 95), 1),
+            'logins_legitimos': len(latencias_legitimas),
+        }
+
+    def formatear_texto(self, resultados):
+        """
+        Formatea los resultados como tabla de texto.
+
+        Args:
+            resultados (list): Resultados por hasher
+
+        Returns:
+            str: Reporte en texto plano
+        """
+        lineas = [
+            '',
+            f"{'hasher':<8} {'hash ms':>8} {'guardia':>8} {'int/s':>8} {'cpu ms/int':>11} "
+            f"{'legít. p50':>11} {'legít. p95':>11}  códigos",
+        ]
+        for resultado in resultados:
+            for escenario, etiqueta in (('sin_guardia', 'no'), ('con_guardia', 'sí')):
+                datos = resultado[escenario]
+                lineas.append(
+                    f"{resultado['hasher']:<8} {resultado['hash_ms']:>8} {etiqueta:>8} "
+                    f"{datos['intentos_por_segundo']:>8} {datos['cpu_ms_por_intento']:>11} "
+                    f"{datos['legitimo_p50_ms']:>11} {datos['legitimo_p95_ms']:>11}  {datos['codigos']}"
+                )
+        return '\n'.join(lineas)
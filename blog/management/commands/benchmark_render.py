@@ -0,0 +1,186 @@
+"""
+Comando de gestión para medir el coste de renderizar las respuestas JSON.
+
+Obtiene los datos ya serializados de varios endpoints (incluida una página
+de 200 registros de auditoría con `modified_data`) y mide cuánto tarda en
+convertirlos a bytes el `JSONRenderer` de DRF frente a `FastJSONRenderer`.
+Los datos sintéticos se crean dentro de una transacción que se revierte.
+"""
+
+import json
+import logging
+import time
+
+from django.conf import settings
+from django.contrib.auth.models import User
+from django.core.management.base import BaseCommand
+from django.db import transaction
+from django.test.utils import override_settings
+from rest_framework.renderers import JSONRenderer
+from rest_framework.test import APIClient
+
+from blog.Models.AuditLogModel import AuditLog
+from blog.renderers import FastJSONRenderer
+
+ENDPOINTS = [
+    ('auditlog', '/api/hl4/v1/auditlog/?page_size=200'),
+    ('noticias', '/api/hl4/v1/noticias/'),
+    ('proyectos', '/api/hl4/v1/proyectos/'),
+    ('ofertas', '/api/hl4/v1/ofertasempleo/'),
+    ('integrantes', '/api/hl4/v1/integrantes/?facets=semestre,estado'),
+]
+
+
+class Command(BaseCommand):
+    """
+    Comando para comparar renderers JSON por endpoint.
+
+    Uso:
+        python manage.py benchmark_render
+        python manage.py benchmark_render --filas 500 --repeticiones 100
+        python manage.py benchmark_render --formato json
+    """
+
+    help = 'Mide el tiempo de renderizado JSON por endpoint'
+
+    def add_arguments(self, parser):
+        """
+        Agrega argumentos al comando.
+
+        Args:
+            parser: ArgumentParser de Django
+        """
+        parser.add_argument(
+            '--filas',
+            type=int,
+            default=200,
+            help='Registros de auditoría sintéticos (default: 200)'
+        )
+
+        parser.add_argument(
+            '--repeticiones',
+            type=int,
+            default=50,
+            help='Renderizados por endpoint y renderer (default: 50)'
+        )
+
+        parser.add_argument(
+            '--formato',
+            type=str,
+            default='texto',
+            choices=['texto', 'json'],
+            help='Formato de salida del reporte (texto o json)'
+        )
+
+    def handle(self, *args, **options):
+        """
+        Ejecuta el comando principal.
+
+        Args:
+            *args: Argumentos posicionales
+            **options: Opciones del comando
+        """
+        sin_throttling = {**settings.REST_FRAMEWORK, 'DEFAULT_THROTTLE_RATES': {}}
+        logging.disable(logging.WARNING)
+        try:
+            with override_settings(
+                ALLOWED_HOSTS=[*settings.ALLOWED_HOSTS, 'testserver'],
+                REST_FRAMEWORK=sin_throttling,
+            ), transaction.atomic():
+                datos = self.obtener_datos(options['filas'])
+                transaction.set_rollback(True)
+        finally:
+            logging.disable(logging.NOTSET)
+
+        renderers = {'drf': JSONRenderer(), 'rapido': FastJSONRenderer()}
+        resultados = []
+        for nombre, contenido in datos.items():
+            self.stdout.write(f'Midiendo {nombre}...')
+            resultado = {'endpoint': nombre}
+            for etiqueta, renderer in renderers.items():
+                resultado[etiqueta] = self.medir(renderer, contenido, options['repeticiones'])
+            resultado['aceleracion'] = round(resultado['drf']['ms'] / max(resultado['rapido']['ms'], 0.001), 1)
+            resultados.append(resultado)
+
+        if options['formato'] == 'json':
+            self.stdout.write(json.dumps(resultados, indent=2))
+        else:
+            self.stdout.write(self.formatear_texto(resultados))
+
+    def obtener_datos(self, filas):
+        """
+        Crea los datos sintéticos y obtiene la respuesta de cada endpoint.
+
+        Args:
+            filas (int): Registros de auditoría a crear
+
+        Returns:
+            dict: Endpoint → datos serializados (`response.data`)
+        """
+        usuario = User.objects.create_superuser(username='benchmark_render', password=None)
+        AuditLog.objects.bulk_create([
+            AuditLog(
+                user=usuario,
+                table_name='blog_proyectos',
+                change_type='UPDATE',
+                affected_record_id=indice,
+                modified_data={
+                    'antes': {'nombre': f'Proyecto {indice}', 'estado': 'borrador', 'etiquetas': ['django', 'react']},
+                    'despues': {'nombre': f'Proyecto {indice} v2', 'estado': 'publicado', 'visitas': indice * 3},
+                    'ip': '198.51.100.20',
+                },
+            )
+            for indice in range(filas)
+        ])
+
+        cliente = APIClient()
+        cliente.force_authenticate(usuario)
+        datos = {}
+        for nombre, url in ENDPOINTS:
+            respuesta = cliente.get(url)
+            if respuesta.status_code == 200:
+                datos[nombre] = respuesta.data
+            else:
+                self.stderr.write(f'{nombre}: HTTP {respuesta.status_code}, se omite')
+        return datos
+
+    def medir(self, renderer, datos, repeticiones):
+        """
+        Mide el renderizado de unos datos.
+
+        Args:
+            renderer: Renderer a medir
+            datos: Datos serializados
+            repeticiones (int): Renderizados a promediar
+
+        Returns:
+            dict: Milisegundos por renderizado y tamaño en bytes
+        """
+        contenido = renderer.render(datos, 'application/json')
+        inicio = time.perf_counter()
+        for _ in range(repeticiones):
+            renderer.render(datos, 'application/json')
+        duracion = time.perf_counter() - inicio
+        return {'ms': round(duracion / repeticiones * 1000, 3), 'bytes': len(contenido)}
+
+    def formatear_texto(self, resultados):
+        """
+        Formatea los resultados como tabla de texto.
+
+        Args:
+            resultados (list): Resultados por endpoint
+
+        Returns:
+            str: Reporte en texto plano
+        """
+        lineas = [
+            '',
+            f"{'endpoint':<12} {'bytes':>9} {'drf ms':>9} {'rápido ms':>10} {'aceleración':>12}",
+        ]
+        for resultado in resultados:
+            lineas.append(
+                f"{resultado['endpoint']:<12} {resultado['rapido']['bytes']:>9} "
+                f"{resultado['drf']['ms']:>9} {resultado['rapido']['ms']:>10} "
+                f"{resultado['aceleracion']:>11}x"
+            )
+        return '\n'.join(lineas)
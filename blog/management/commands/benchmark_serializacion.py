@@ -0,0 +1,217 @@
+"""
+Comando de gestión para medir la serialización de los listados.
+
+Para cada serializer de la API compara el `ModelSerializer` de DRF
+(instancias del modelo + `to_representation` por campo) con
+`ValuesSerializer` (filas `.values()` + convertidores precompilados),
+incluyendo la consulta a la base de datos, y reporta filas por segundo.
+Los datos sintéticos se crean dentro de una transacción que se revierte.
+"""
+
+import json
+import time
+from datetime import timedelta
+
+from django.contrib.auth.models import User
+from django.core.management.base import BaseCommand
+from django.db import transaction
+from django.utils import timezone
+from rest_framework.request import Request
+from rest_framework.test import APIRequestFactory
+
+from blog.Models.AuditLogModel import AuditLog
+from blog.Models.IntegrantesModel import Integrantes
+from blog.Models.NoticiasModel import Noticias
+from blog.Models.OfertasEmpleoModel import OfertasEmpleo
+from blog.Models.ProyectosModel import Proyectos
+from blog.Serializers.AuditLogSerializer import AuditLogSerializer
+from blog.Serializers.IntegrantesSerializer import IntegrantesSerializer
+from blog.Serializers.NoticiasSerializer import NoticiasSerializer
+from blog.Serializers.OfertasSerializer import OfertasEmpleoSerializer
+from blog.Serializers.ProyectosSerializer import ProyectosSerializer
+from blog.Serializers.ValuesSerializer import ValuesSerializer
+
+SERIALIZERS = {
+    'noticias': NoticiasSerializer,
+    'integrantes': IntegrantesSerializer,
+    'ofertas': OfertasEmpleoSerializer,
+    'proyectos': ProyectosSerializer,
+    'auditlog': AuditLogSerializer,
+}
+
+
+class Command(BaseCommand):
+    """
+    Comando para comparar la serialización de DRF con la ruta `.values()`.
+
+    Uso:
+        python manage.py benchmark_serializacion
+        python manage.py benchmark_serializacion --filas 1000 --repeticiones 10
+        python manage.py benchmark_serializacion --formato json
+    """
+
+    help = 'Mide filas por segundo serializadas con DRF y con ValuesSerializer'
+
+    def add_arguments(self, parser):
+        """
+        Agrega argumentos al comando.
+
+        Args:
+            parser: ArgumentParser de Django
+        """
+        parser.add_argument(
+            '--filas',
+            type=int,
+            default=500,
+            help='Filas sintéticas por modelo (default: 500)'
+        )
+
+        parser.add_argument(
+            '--repeticiones',
+            type=int,
+            default=5,
+            help='Serializaciones completas por modelo y ruta (default: 5)'
+        )
+
+        parser.add_argument(
+            '--formato',
+            type=str,
+            default='texto',
+            choices=['texto', 'json'],
+            help='Formato de salida del reporte (texto o json)'
+        )
+
+    def handle(self, *args, **options):
+        """
+        Ejecuta el comando principal.
+
+        Args:
+            *args: Argumentos posicionales
+            **options: Opciones del comando
+        """
+        contexto = {'request': Request(APIRequestFactory().get('/api/hl4/v1/'))}
+        resultados = []
+        with transaction.atomic():
+            self.crear_datos(options['filas'])
+            for nombre, serializer_class in SERIALIZERS.items():
+                self.stdout.write(f'Midiendo {nombre}...')
+                resultados.append(self.medir(nombre, serializer_class, contexto, options['repeticiones']))
+            transaction.set_rollback(True)
+
+        if options['formato'] == 'json':
+            self.stdout.write(json.dumps(resultados, indent=2))
+        else:
+            self.stdout.write(self.formatear_texto(resultados))
+
+    def crear_datos(self, filas):
+        """
+        Crea filas sintéticas de cada modelo.
+
+        Args:
+            filas (int): Filas por modelo
+        """
+        usuario = User.objects.create_user(username='benchmark_serializacion', password=None)
+        ahora = timezone.now()
+        Noticias.objects.bulk_create([
+            Noticias(
+                nombre_noticia=f'Noticia {i}', link_noticia='https://example.com/noticia',
+                description_noticia='Contenido ' * 20, creador=usuario, fuente='Fuente',
+                imagen_noticia='image/upload/v1/noticias/foto.jpg', fecha_noticia=ahora,
+            )
+            for i in range(filas)
+        ])
+        integrantes = Integrantes.objects.bulk_create([
+            Integrantes(
+                nombre_integrante=f'Integrante {i}', semestre=str(i % 10), correo=f'i{i}@example.com',
+                link_git='https://github.com/integrante', creador=usuario,
+                imagen='image/upload/v1/integrantes/perfil.jpg', reseña='Django y React',
+            )
+            for i in range(filas)
+        ])
+        OfertasEmpleo.objects.bulk_create([
+            OfertasEmpleo(
+                titulo_empleo=f'Oferta {i}', empresa='ACME', descripcion_empleo='Backend',
+                link_oferta='https://example.com/oferta', creador=usuario,
+                imagen='image/upload/v1/ofertas/logo.png', fecha_expiracion=ahora + timedelta(days=30),
+            )
+            for i in range(filas)
+        ])
+        proyectos = Proyectos.objects.bulk_create([
+            Proyectos(
+                nombre_proyecto=f'Proyecto {i}', fecha_proyecto=ahora, link_proyecto='https://example.com/p',
+                description_proyecto='Django', creador=usuario,
+            )
+            for i in range(filas)
+        ])
+        Proyectos.integrantes.through.objects.bulk_create([
+            Proyectos.integrantes.through(proyectos=proyecto, integrantes=integrante)
+            for proyecto, integrante in zip(proyectos, integrantes)
+        ])
+        AuditLog.objects.bulk_create([
+            AuditLog(
+                user=usuario, table_name='blog_proyectos', change_type='UPDATE', affected_record_id=i,
+                modified_data={'antes': {'estado': 'borrador'}, 'despues': {'estado': 'publicado', 'visitas': i}},
+            )
+            for i in range(filas)
+        ])
+
+    def medir(self, nombre, serializer_class, contexto, repeticiones):
+        """
+        Mide ambas rutas de serialización para un serializer.
+
+        Args:
+            nombre (str): Nombre del recurso
+            serializer_class: Clase del serializer
+            contexto (dict): Contexto con la request
+            repeticiones (int): Serializaciones completas a promediar
+
+        Returns:
+            dict: Filas por segundo de cada ruta y aceleración
+        """
+        queryset = serializer_class.Meta.model.objects.all()
+        relaciones = [
+            campo.source for campo in serializer_class().fields.values()
+            if hasattr(campo, 'child_relation')
+        ]
+
+        def drf():
+            return serializer_class(queryset.prefetch_related(*relaciones), many=True, context=contexto).data
+
+        def rapido():
+            serializador = ValuesSerializer.para(serializer_class, contexto)
+            return serializador.serializar(serializador.preparar(queryset))
+
+        resultado = {'recurso': nombre, 'filas': queryset.count()}
+        for etiqueta, funcion in (('drf', drf), ('values', rapido)):
+            funcion()
+            inicio = time.perf_counter()
+            for _ in range(repeticiones):
+                funcion()
+            duracion = (time.perf_counter() - inicio) / repeticiones
+            resultado[f'{etiqueta}_filas_por_segundo'] = round(resultado['filas'] / duracion)
+        resultado['aceleracion'] = round(
+            resultado['values_filas_por_segundo'] / max(resultado['drf_filas_por_segundo'], 1), 1
+        )
+        return resultado
+
+    def formatear_texto(self, resultados):
+        """
+        Formatea los resultados como tabla de texto.
+
+        Args:
+            resultados (list): Resultados por recurso
+
+        Returns:
+            str: Reporte en texto plano
+        """
+        lineas = [
+            '',
+            f"{'recurso':<12} {'filas':>7} {'drf filas/s':>12} {'values filas/s':>15} {'aceleración':>12}",
+        ]
+        for resultado in resultados:
+            lineas.append(
+                f"{resultado['recurso']:<12} {resultado['filas']:>7} "
+                f"{resultado['drf_filas_por_segundo']:>12} {resultado['values_filas_por_segundo']:>15} "
+                f"{resultado['aceleracion']:>11}x"
+            )
+        return '\n'.join(lineas)
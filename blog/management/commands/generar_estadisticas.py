@@ -11,6 +11,8 @@ from django.db.models import Count, Q
 from datetime import timedelta
 import json
 
+from blog.routers import leer_de_replica
+
 
 class Command(BaseCommand):
     """
@@ -68,8 +70,9 @@ class Command(BaseCommand):
         dias = options['dias']
         output_file = options.get('output')
         
-        # Generar estadísticas
-        estadisticas = self.generar_estadisticas(dias)
+        # Generar estadísticas (solo lecturas: desde una réplica si hay configuradas)
+        with leer_de_replica():
+            estadisticas = self.generar_estadisticas(dias)
         
         # Formatear salida
         if formato == 'json':
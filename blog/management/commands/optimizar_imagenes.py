@@ -0,0 +1,144 @@
+"""
+Comando de gestión para pre-procesar imágenes locales.
+
+Aplica `blog.preprocesado.preprocesar_imagen` (redimensionado, sin EXIF,
+recodificación) a archivos del disco, sin pasar por Cloudinary, y reporta
+los bytes ahorrados por archivo. Sin `--destino` solo mide.
+"""
+
+import json
+import os
+import shutil
+
+from django.core.files import File
+from django.core.management.base import BaseCommand, CommandError
+from PIL import UnidentifiedImageError
+
+from blog.preprocesado import FORMATOS, preprocesar_imagen
+
+
+class Command(BaseCommand):
+    """
+    Comando para medir o aplicar el pre-procesado de imágenes.
+
+    Uso:
+        python manage.py optimizar_imagenes foto.jpg perfil.png
+        python manage.py optimizar_imagenes fotos/*.jpg --lado 1024 --destino optimizadas/
+        python manage.py optimizar_imagenes foto.jpg --formato-imagen JPEG --calidad 75 --formato json
+    """
+
+    help = 'Pre-procesa imágenes locales y reporta los bytes ahorrados'
+
+    def add_arguments(self, parser):
+        """
+        Agrega argumentos al comando.
+
+        Args:
+            parser: ArgumentParser de Django
+        """
+        parser.add_argument('rutas', nargs='+', help='Imágenes a procesar')
+
+        parser.add_argument(
+            '--lado',
+            type=int,
+            default=None,
+            help='Píxeles máximos por lado (default: IMAGE_PREPROCESS_MAX_SIZE)'
+        )
+
+        parser.add_argument(
+            '--formato-imagen',
+            type=str.upper,
+            default=None,
+            choices=list(FORMATOS),
+            help='Formato de salida (default: IMAGE_PREPROCESS_FORMAT)'
+        )
+
+        parser.add_argument(
+            '--calidad',
+            type=int,
+            default=None,
+            help='Calidad de codificación (default: IMAGE_PREPROCESS_QUALITY)'
+        )
+
+        parser.add_argument(
+            '--destino',
+            type=str,
+            default=None,
+            help='Directorio donde guardar los resultados (sin él solo se mide)'
+        )
+
+        parser.add_argument(
+            '--formato',
+            type=str,
+            default='texto',
+            choices=['texto', 'json'],
+            help='Formato de salida del reporte (texto o json)'
+        )
+
+    def handle(self, *args, **options):
+        """
+        Ejecuta el comando principal.
+
+        Args:
+            *args: Argumentos posicionales
+            **options: Opciones del comando
+        """
+        if options['destino']:
+            os.makedirs(options['destino'], exist_ok=True)
+
+        informes = []
+        for ruta in options['rutas']:
+            try:
+                informes.append(self.procesar(ruta, options))
+            except (OSError, UnidentifiedImageError) as e:
+                raise CommandError(f'No se pudo procesar {ruta}: {e}')
+
+        if options['formato'] == 'json':
+            self.stdout.write(json.dumps(informes, indent=2))
+        else:
+            self.stdout.write(self.formatear_texto(informes))
+
+    def procesar(self, ruta, options):
+        """
+        Pre-procesa una imagen y, con `--destino`, guarda el resultado.
+
+        Args:
+            ruta (str): Ruta de la imagen
+            options (dict): Opciones del comando
+
+        Returns:
+            dict: Informe de `preprocesar_imagen`
+        """
+        with open(ruta, 'rb') as contenido:
+            resultado, informe = preprocesar_imagen(
+                File(contenido, name=os.path.basename(ruta)),
+                lado_maximo=options['lado'], formato=options['formato_imagen'], calidad=options['calidad'],
+            )
+            if options['destino']:
+                resultado.seek(0)
+                informe['destino'] = os.path.join(options['destino'], os.path.basename(resultado.name))
+                with open(informe['destino'], 'wb') as salida:
+                    shutil.copyfileobj(resultado, salida)
+        return informe
+
+    def formatear_texto(self, informes):
+        """
+        Formatea los informes como tabla de texto.
+
+        Args:
+            informes (list): Informes por imagen
+
+        Returns:
+            str: Reporte en texto plano
+        """
+        lineas = ['', f"{'imagen':<30} {'original':>10} {'final':>10} {'ahorro':>8} {'dimensiones':>12} formato"]
+        for informe in informes:
+            porcentaje = 100 * informe['bytes_ahorrados'] / max(informe['bytes_originales'], 1)
+            lineas.append(
+                f"{informe['nombre'][:30]:<30} {informe['bytes_originales']:>10} {informe['bytes_finales']:>10} "
+                f"{porcentaje:>7.1f}% {'x'.join(map(str, informe['dimensiones'])):>12} {informe['formato']}"
+            )
+        originales = sum(informe['bytes_originales'] for informe in informes)
+        ahorrados = sum(informe['bytes_ahorrados'] for informe in informes)
+        lineas.append(f'\nTotal: {ahorrados} de {originales} bytes ahorrados')
+        return '\n'.join(lineas)
@@ -0,0 +1,270 @@
+"""
+Comando de gestión para ejecutar pruebas de carga contra la API.
+
+Levanta gunicorn localmente con la clase de worker elegida (o usa una
+URL existente) y reproduce una mezcla ponderada de tráfico con varios
+perfiles de concurrencia, reportando rendimiento y percentiles de latencia.
+"""
+
+import asyncio
+import json
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+
+from blog.benchmarks.carga import (
+    MEZCLA_POR_DEFECTO,
+    ServidorLocal,
+    ejecutar_perfil,
+    mezcla_desde_log,
+)
+
+
+class Command(BaseCommand):
+    """
+    Comando para medir cuántos clientes concurrentes soporta el servidor.
+
+    Uso:
+        python manage.py prueba_carga
+        python manage.py prueba_carga --worker-class gthread --workers 3 --threads 4
+        python manage.py prueba_carga --concurrencia 1,10,50 --duracion 20
+        python manage.py prueba_carga --desde-log logs/api_usage.log
+        python manage.py prueba_carga --url https://mi-app.up.railway.app
+        python manage.py prueba_carga --modo comparar --workers 2
+    """
+
+    help = 'Ejecuta una prueba de carga con perfiles de concurrencia contra gunicorn'
+
+    def add_arguments(self, parser):
+        """
+        Agrega argumentos al comando.
+
+        Args:
+            parser: ArgumentParser de Django
+        """
+        parser.add_argument(
+            '--url',
+            type=str,
+            help='URL de un servidor ya en ejecución (no se levanta gunicorn)'
+        )
+        parser.add_argument(
+            '--modo',
+            type=str,
+            default='wsgi',
+            choices=['wsgi', 'asgi', 'comparar'],
+            help='Servir por WSGI, por ASGI con workers uvicorn, o comparar ambos (default: wsgi)'
+        )
+        parser.add_argument(
+            '--worker-class',
+            type=str,
+            default='sync',
+            help='Clase de worker de gunicorn: sync, gthread, ... (default: sync)'
+        )
+        parser.add_argument(
+            '--workers',
+            type=int,
+            default=1,
+            help='Número de workers de gunicorn (default: 1)'
+        )
+        parser.add_argument(
+            '--threads',
+            type=int,
+            default=1,
+            help='Hilos por worker de gunicorn (default: 1)'
+        )
+        parser.add_argument(
+            '--concurrencia',
+            type=str,
+            default='1,10,50',
+            help='Perfiles de concurrencia separados por comas (default: 1,10,50)'
+        )
+        parser.add_argument(
+            '--duracion',
+            type=float,
+            default=10.0,
+            help='Duración de cada perfil en segundos (default: 10)'
+        )
+        parser.add_argument(
+            '--desde-log',
+            type=str,
+            help='Derivar la mezcla de tráfico del log de uso de la API'
+        )
+        parser.add_argument(
+            '--token',
+            type=str,
+            help='Token para enviar en la cabecera Authorization'
+        )
+        parser.add_argument(
+            '--semilla',
+            type=int,
+            help='Semilla para reproducir la misma secuencia de peticiones'
+        )
+        parser.add_argument(
+            '--con-throttling',
+            action='store_true',
+            help='Mantener los límites de tasa normales en el servidor levantado'
+        )
+        parser.add_argument(
+            '--formato',
+            type=str,
+            default='texto',
+            choices=['texto', 'json'],
+            help='Formato de salida del reporte (texto o json)'
+        )
+
+    def handle(self, *args, **options):
+        """
+        Ejecuta el comando principal.
+
+        Args:
+            *args: Argumentos posicionales
+            **options: Opciones del comando
+        """
+        try:
+            perfiles = [int(valor) for valor in options['concurrencia'].split(',') if valor.strip()]
+        except ValueError:
+            raise CommandError('--concurrencia debe ser una lista de enteros separados por comas')
+
+        mezcla = MEZCLA_POR_DEFECTO
+        if options.get('desde_log'):
+            mezcla = mezcla_desde_log(options['desde_log'])
+            if not mezcla:
+                raise CommandError(f"No se encontraron endpoints en {options['desde_log']}")
+
+        cabeceras = {}
+        if options.get('token'):
+            cabeceras['Authorization'] = f"Token {options['token']}"
+
+        if options.get('url'):
+            resultados = {'remoto': self.ejecutar_perfiles(
+                options['url'].rstrip('/'), mezcla, perfiles, cabeceras, options
+            )}
+        else:
+            modos = ['wsgi', 'asgi'] if options['modo'] == 'comparar' else [options['modo']]
+            resultados = {
+                modo: self.ejecutar_en_servidor(modo, mezcla, perfiles, cabeceras, options)
+                for modo in modos
+            }
+
+        if options['formato'] == 'json':
+            self.stdout.write(json.dumps(resultados, indent=2))
+        else:
+            self.stdout.write(self.formatear_texto(resultados))
+
+    def ejecutar_en_servidor(self, modo, mezcla, perfiles, cabeceras, options):
+        """
+        Levanta gunicorn en el modo indicado y ejecuta los perfiles.
+
+        Args:
+            modo (str): 'wsgi' (worker elegido) o 'asgi' (workers uvicorn + vistas asíncronas)
+
+        Returns:
+            list: Resumen de cada perfil
+        """
+        entorno = {}
+        if not options['con_throttling']:
+            # Evita que la prueba mida respuestas 429 en lugar del servidor
+            entorno.update({
+                'THROTTLE_RATE_ANON': '1000000/hour',
+                'THROTTLE_RATE_USER': '1000000/hour',
+            })
+
+        if modo == 'asgi':
+            app = 'mysite.asgi:application'
+            worker_class = 'uvicorn.workers.UvicornWorker'
+            threads = 1
+            entorno['ASYNC_API'] = 'True'
+        else:
+            app = 'mysite.wsgi:application'
+            worker_class = options['worker_class']
+            threads = options['threads']
+            entorno['ASYNC_API'] = 'False'
+
+        servidor = ServidorLocal(
+            settings.BASE_DIR,
+            app=app,
+            worker_class=worker_class,
+            workers=options['workers'],
+            threads=threads,
+            entorno=entorno,
+        )
+        try:
+            with servidor as url:
+                self.stdout.write(self.style.SUCCESS(
+                    f"[{modo}] gunicorn listo en {url} ({worker_class}, "
+                    f"{options['workers']} workers x {threads} hilos)"
+                ))
+                return self.ejecutar_perfiles(url, mezcla, perfiles, cabeceras, options)
+        except RuntimeError as exc:
+            raise CommandError(str(exc))
+
+    def ejecutar_perfiles(self, url, mezcla, perfiles, cabeceras, options):
+        """
+        Ejecuta cada perfil de concurrencia de forma secuencial.
+
+        Returns:
+            list: Resumen de cada perfil
+        """
+        resultados = []
+        for concurrencia in perfiles:
+            self.stderr.write(f'Ejecutando perfil de {concurrencia} clientes...')
+            resultado = asyncio.run(ejecutar_perfil(
+                url,
+                mezcla,
+                concurrencia,
+                options['duracion'],
+                cabeceras=cabeceras,
+                semilla=options.get('semilla'),
+            ))
+            resultados.append(resultado.resumen())
+        return resultados
+
+    def formatear_texto(self, resultados):
+        """
+        Formatea los resultados como texto legible.
+
+        Args:
+            resultados (dict): Resúmenes de los perfiles ejecutados por modo
+
+        Returns:
+            str: Texto formateado
+        """
+        texto = []
+        texto.append("=" * 78)
+        texto.append("RESULTADOS DE LA PRUEBA DE CARGA")
+        texto.append("=" * 78)
+        texto.append(
+            f"{'Modo':<7} {'Clientes':>8} {'Peticiones':>10} {'Errores':>8} {'RPS':>9} "
+            f"{'p50 ms':>8} {'p90 ms':>8} {'p99 ms':>8} {'máx ms':>8}"
+        )
+        for modo, perfiles in resultados.items():
+            for perfil in perfiles:
+                texto.append(
+                    f"{modo:<7} {perfil['concurrencia']:>8} {perfil['peticiones']:>10} "
+                    f"{perfil['errores']:>8} {perfil['rps']:>9} {perfil['p50_ms']:>8} "
+                    f"{perfil['p90_ms']:>8} {perfil['p99_ms']:>8} {perfil['max_ms']:>8}"
+                )
+
+        if 'wsgi' in resultados and 'asgi' in resultados:
+            texto.append("")
+            texto.append("COMPARACIÓN ASGI vs WSGI:")
+            for wsgi, asgi in zip(resultados['wsgi'], resultados['asgi']):
+                factor = asgi['rps'] / wsgi['rps'] if wsgi['rps'] else 0.0
+                texto.append(
+                    f"  {wsgi['concurrencia']:>4} clientes: RPS x{factor:.2f}, "
+                    f"p99 {wsgi['p99_ms']}ms -> {asgi['p99_ms']}ms"
+                )
+
+        for modo, perfiles in resultados.items():
+            for perfil in perfiles:
+                texto.append("")
+                texto.append(
+                    f"[{modo}] PERFIL {perfil['concurrencia']} CLIENTES - estados: {perfil['estados']}"
+                )
+                for nombre, datos in perfil['endpoints'].items():
+                    texto.append(
+                        f"  {nombre[:40]:<40} n={datos['peticiones']:<6} err={datos['errores']:<4} "
+                        f"p50={datos['p50_ms']}ms p99={datos['p99_ms']}ms"
+                    )
+
+        return "\n".join(texto)
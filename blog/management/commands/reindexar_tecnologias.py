@@ -0,0 +1,71 @@
+"""
+Comando de gestión para reconstruir el índice de tecnologías de proyectos.
+
+Las tecnologías se indexan al guardar cada proyecto; este comando solo es
+necesario tras cambiar `TECNOLOGIAS_PROYECTOS` o para poblar el índice de
+proyectos creados antes de que existiera.
+"""
+
+from django.core.management.base import BaseCommand
+from django.db import transaction
+
+from blog.Models.ProyectosModel import Proyectos
+from blog.Models.TecnologiaProyectoModel import TecnologiaProyecto
+from blog.tecnologias import extraer_tecnologias
+
+
+class Command(BaseCommand):
+    """
+    Comando para recalcular las tecnologías de todos los proyectos.
+
+    Uso:
+        python manage.py reindexar_tecnologias
+        python manage.py reindexar_tecnologias --lote 500
+    """
+
+    help = 'Reconstruye el índice de tecnologías de los proyectos'
+
+    def add_arguments(self, parser):
+        """
+        Agrega argumentos al comando.
+
+        Args:
+            parser: ArgumentParser de Django
+        """
+        parser.add_argument(
+            '--lote',
+            type=int,
+            default=1000,
+            help='Filas insertadas por consulta (default: 1000)'
+        )
+
+    def handle(self, *args, **options):
+        """
+        Ejecuta el comando principal.
+
+        Args:
+            *args: Argumentos posicionales
+            **options: Opciones del comando
+        """
+        lote = options['lote']
+        proyectos = 0
+        etiquetas = 0
+        pendientes = []
+
+        with transaction.atomic():
+            TecnologiaProyecto.objects.all().delete()
+            filas = Proyectos.objects.values_list('idproyectos', 'description_proyecto')
+            for proyecto_id, descripcion in filas.iterator(chunk_size=lote):
+                proyectos += 1
+                for tecnologia in extraer_tecnologias(descripcion):
+                    pendientes.append(TecnologiaProyecto(proyecto_id=proyecto_id, tecnologia=tecnologia))
+                if len(pendientes) >= lote:
+                    TecnologiaProyecto.objects.bulk_create(pendientes)
+                    etiquetas += len(pendientes)
+                    pendientes = []
+            TecnologiaProyecto.objects.bulk_create(pendientes)
+            etiquetas += len(pendientes)
+
+        self.stdout.write(self.style.SUCCESS(
+            f'Índice reconstruido: {etiquetas} tecnologías en {proyectos} proyectos'
+        ))
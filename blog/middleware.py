@@ -6,17 +6,80 @@ las solicitudes HTTP y respuestas para análisis y depuración.
 """
 
 import logging
+import re
 import time
-import json
+import uuid
+import zlib
+from django.utils.cache import patch_vary_headers
 from django.utils.deprecation import MiddlewareMixin
 from django.conf import settings
 from django.contrib.auth.models import AnonymousUser
 
+from blog.routers import leer_de_replica, replicas_disponibles
+from blog.structured_logging import desvincular, vincular
+from blog.throttling import ATRIBUTO_REQUEST
+
+try:
+    import brotli
+except ImportError:  # pragma: no cover - llega con whitenoise[brotli]
+    brotli = None
+
 logger = logging.getLogger(__name__)
+api_logger = logging.getLogger('api_usage')
 
 # Detectar si estamos en entorno de producción
 IS_PRODUCTION = getattr(settings, 'IS_PRODUCTION', False)
 
+# Identificadores aceptados en la cabecera X-Request-ID del proxy o cliente
+_REQUEST_ID_VALIDO = re.compile(r'^[A-Za-z0-9._-]{1,64}$')
+
+
+class LogContextMiddleware(MiddlewareMixin):
+    """
+    Middleware que vincula el contexto de la petición a los logs.
+
+    Asigna un identificador a cada solicitud (el de la cabecera
+    `X-Request-ID` si es válido, o uno nuevo), lo devuelve en la respuesta
+    y lo guarda junto con el método y la ruta en el contexto de
+    `blog.structured_logging`, de modo que todos los registros emitidos
+    durante la petición lo incluyen. El usuario y la ruta de la URL se
+    resuelven al registrar. Debe ir el primero de `MIDDLEWARE`.
+    """
+
+    def process_request(self, request):
+        """
+        Vincula el contexto de la solicitud.
+
+        Args:
+            request: Objeto HttpRequest de Django
+        """
+        request_id = request.META.get('HTTP_X_REQUEST_ID', '')
+        if not _REQUEST_ID_VALIDO.match(request_id):
+            request_id = uuid.uuid4().hex
+        request.request_id = request_id
+        request._log_contexto = vincular(
+            request_id=request_id, method=request.method, path=request.path, request=request,
+        )
+        return None
+
+    def process_response(self, request, response):
+        """
+        Devuelve el identificador y restaura el contexto anterior.
+
+        Args:
+            request: Objeto HttpRequest de Django
+            response: Objeto HttpResponse de Django
+
+        Returns:
+            HttpResponse: La respuesta con la cabecera X-Request-ID
+        """
+        token = getattr(request, '_log_contexto', None)
+        if token is not None:
+            response['X-Request-ID'] = request.request_id
+            desvincular(token)
+            del request._log_contexto
+        return response
+
 
 class RequestLoggingMiddleware(MiddlewareMixin):
     """
@@ -39,18 +102,12 @@ class RequestLoggingMiddleware(MiddlewareMixin):
         """
         request.start_time = time.time()
           # En entornos de producción, limitamos el logging para mejor performance
-        if not IS_PRODUCTION:
-            # Obtener información del cliente
-            user_agent = request.META.get('HTTP_USER_AGENT', 'Unknown')
-            ip_address = self.get_client_ip(request)
-            user = getattr(request, 'user', AnonymousUser())
-            
+        if not IS_PRODUCTION and logger.isEnabledFor(logging.INFO):
             # Registrar solicitud entrante
             logger.info(
-                f"REQUEST: {request.method} {request.get_full_path()} | "
-                f"User: {user.username if not isinstance(user, AnonymousUser) else 'Anonymous'} | "
-                f"IP: {ip_address} | "
-                f"UA: {user_agent[:100]}"
+                "REQUEST: %s %s | User: %s | IP: %s | UA: %.100s",
+                request.method, request.get_full_path(), self.get_username(request),
+                self.get_client_ip(request), request.META.get('HTTP_USER_AGENT', 'Unknown'),
             )
         
         return None
@@ -69,9 +126,6 @@ class RequestLoggingMiddleware(MiddlewareMixin):
         if hasattr(request, 'start_time'):
             duration = time.time() - request.start_time
             
-            user = getattr(request, 'user', AnonymousUser())
-            ip_address = self.get_client_ip(request)
-            
             # Determinar el nivel de log basado en el código de estado
             log_level = logging.INFO
             if response.status_code >= 400:
@@ -80,14 +134,13 @@ class RequestLoggingMiddleware(MiddlewareMixin):
                 log_level = logging.ERROR
             
             # Registrar respuesta
-            logger.log(
-                log_level,
-                f"RESPONSE: {request.method} {request.get_full_path()} | "
-                f"Status: {response.status_code} | "
-                f"Duration: {duration:.3f}s | "
-                f"User: {user.username if not isinstance(user, AnonymousUser) else 'Anonymous'} | "
-                f"IP: {ip_address}"
-            )
+            if logger.isEnabledFor(log_level):
+                logger.log(
+                    log_level,
+                    "RESPONSE: %s %s | Status: %s | Duration: %.3fs | User: %s | IP: %s",
+                    request.method, request.get_full_path(), response.status_code, duration,
+                    self.get_username(request), self.get_client_ip(request),
+                )
         
         return response
     
@@ -99,20 +152,28 @@ class RequestLoggingMiddleware(MiddlewareMixin):
             request: Objeto HttpRequest de Django
             exception: La excepción que ocurrió
         """
-        user = getattr(request, 'user', AnonymousUser())
-        ip_address = self.get_client_ip(request)
-        
         logger.error(
-            f"EXCEPTION: {request.method} {request.get_full_path()} | "
-            f"Error: {str(exception)} | "
-            f"Type: {type(exception).__name__} | "
-            f"User: {user.username if not isinstance(user, AnonymousUser) else 'Anonymous'} | "
-            f"IP: {ip_address}",
+            "EXCEPTION: %s %s | Error: %s | Type: %s | User: %s | IP: %s",
+            request.method, request.get_full_path(), exception, type(exception).__name__,
+            self.get_username(request), self.get_client_ip(request),
             exc_info=True
         )
         
         return None
     
+    def get_username(self, request):
+        """
+        Obtiene el nombre del usuario de la solicitud.
+
+        Args:
+            request: Objeto HttpRequest de Django
+
+        Returns:
+            str: Nombre de usuario o 'Anonymous'
+        """
+        user = getattr(request, 'user', AnonymousUser())
+        return user.username if not isinstance(user, AnonymousUser) else 'Anonymous'
+
     def get_client_ip(self, request):
         """
         Obtiene la dirección IP real del cliente.
@@ -151,14 +212,14 @@ class APIUsageMiddleware(MiddlewareMixin):
             HttpResponse: La respuesta original sin modificar
         """
         # Solo registrar para endpoints de API
-        if request.path.startswith('/api/'):
+        if request.path.startswith('/api/') and api_logger.isEnabledFor(logging.INFO):
             user = getattr(request, 'user', AnonymousUser())
             
-            # Registrar uso de API
-            api_logger = logging.getLogger('api_usage')
+            # Registrar uso de API: los campos van como `extra` y el
+            # JSONFormatter los escribe como campos propios
             api_logger.info(
-                json.dumps({
-                    'timestamp': time.time(),
+                "%s %s %s", request.method, request.path, response.status_code,
+                extra={
                     'method': request.method,
                     'endpoint': request.path,
                     'status_code': response.status_code,
@@ -167,7 +228,7 @@ class APIUsageMiddleware(MiddlewareMixin):
                     'ip_address': self.get_client_ip(request),
                     'query_params': dict(request.GET),
                     'content_length': len(response.content) if hasattr(response, 'content') else 0
-                })
+                },
             )
         
         return response
@@ -211,10 +272,288 @@ class SecurityHeadersMiddleware(MiddlewareMixin):
         if not settings.DEBUG:
             response['Strict-Transport-Security'] = 'max-age=31536000; includeSubDomains'
         
-        # Headers específicos para API
-        if request.path.startswith('/api/'):
+        # Headers específicos para API (sin pisar la política de la vista)
+        if request.path.startswith('/api/') and not response.has_header('Cache-Control'):
             response['Cache-Control'] = 'no-cache, no-store, must-revalidate'
             response['Pragma'] = 'no-cache'
             response['Expires'] = '0'
         
         return response
+
+
+class SessionRefreshMiddleware(MiddlewareMixin):
+    """
+    Middleware de expiración deslizante de la sesión.
+
+    Sustituye a `SESSION_SAVE_EVERY_REQUEST`: en lugar de escribir la sesión
+    en cada petición, solo la marca como modificada cuando quedan menos de
+    `SESSION_REFRESH_THRESHOLD` segundos para que expire, de modo que
+    `SessionMiddleware` la guarde y renueve la cookie. Debe ir después de
+    `SessionMiddleware` para ejecutarse antes de su `process_response`.
+    """
+
+    CLAVE_RENOVACION = '_renovada_en'
+
+    def process_response(self, request, response):
+        """
+        Renueva la sesión si está cerca de expirar.
+
+        Args:
+            request: Objeto HttpRequest de Django
+            response: Objeto HttpResponse de Django
+
+        Returns:
+            HttpResponse: La respuesta sin modificar
+        """
+        session = getattr(request, 'session', None)
+        # Solo sesiones ya cargadas durante la petición y con clave (no
+        # vaciadas por un logout): no añade consultas
+        if session is None or not session.accessed or not session.session_key:
+            return response
+        if session.get_expire_at_browser_close():
+            return response
+
+        ahora = int(time.time())
+        if session.modified:
+            # Se va a guardar de todos modos (p. ej. en el login): la expiración
+            # se renueva al guardar, así que se registra el momento
+            session[self.CLAVE_RENOVACION] = ahora
+            return response
+
+        renovada = session.get(self.CLAVE_RENOVACION)
+        restante = session.get_expiry_age() - (ahora - renovada) if renovada else 0
+        if restante < getattr(settings, 'SESSION_REFRESH_THRESHOLD', 0):
+            session[self.CLAVE_RENOVACION] = ahora
+        return response
+
+
+class ReplicaRoutingMiddleware:
+    """
+    Middleware que envía a las réplicas las lecturas de peticiones seguras.
+
+    Las peticiones GET, HEAD y OPTIONS leen de una réplica. Después de una
+    escritura (POST, PUT, PATCH, DELETE) con éxito se fija una cookie durante
+    `REPLICA_STICKY_SECONDS` para que el mismo cliente siga leyendo de la
+    primaria y vea sus propios cambios aunque la réplica vaya retrasada.
+    """
+
+    METODOS_SEGUROS = ('GET', 'HEAD', 'OPTIONS')
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+
+    def __call__(self, request):
+        if not replicas_disponibles():
+            return self.get_response(request)
+
+        cookie = getattr(settings, 'REPLICA_STICKY_COOKIE', 'db_primaria')
+        usar_replica = request.method in self.METODOS_SEGUROS and cookie not in request.COOKIES
+
+        with leer_de_replica(usar_replica):
+            response = self.get_response(request)
+
+        # Solo si la escritura pudo completarse: un 4xx/5xx no cambió nada
+        if request.method not in self.METODOS_SEGUROS and response.status_code < 400:
+            response.set_cookie(
+                cookie,
+                '1',
+                max_age=getattr(settings, 'REPLICA_STICKY_SECONDS', 15),
+                httponly=True,
+                secure=request.is_secure(),
+                samesite='Lax',
+            )
+        return response
+
+
+class RateLimitHeadersMiddleware(MiddlewareMixin):
+    """
+    Middleware que publica el estado del throttling en cabeceras `RateLimit-*`.
+
+    Los throttles de `blog.throttling` dejan en la petición el límite más
+    restrictivo evaluado; aquí se convierte en cabeceras (borrador IETF
+    RateLimit Fields) para que los clientes regulen su ritmo sin esperar
+    a un 429.
+    """
+
+    def process_response(self, request, response):
+        """
+        Agrega las cabeceras de límite de tasa a la respuesta.
+
+        Args:
+            request: Objeto HttpRequest de Django
+            response: Objeto HttpResponse de Django
+
+        Returns:
+            HttpResponse: La respuesta con las cabeceras agregadas
+        """
+        publicado = getattr(request, ATRIBUTO_REQUEST, None)
+        if publicado is None:
+            return response
+
+        resultado, ventana = publicado
+        response['RateLimit-Limit'] = str(resultado.limite)
+        response['RateLimit-Remaining'] = str(resultado.restantes)
+        response['RateLimit-Reset'] = str(resultado.espera or resultado.reinicio)
+        response['RateLimit-Policy'] = f'{resultado.limite};w={ventana}'
+        return response
+
+
+def elegir_codificacion(accept_encoding):
+    """
+    Elige la codificación de contenido según `Accept-Encoding`.
+
+    Respeta los pesos `q` (incluido `q=0` para rechazar) y el comodín `*`;
+    con el mismo peso prefiere brotli a gzip.
+
+    Args:
+        accept_encoding (str): Valor de la cabecera
+
+    Returns:
+        str | None: 'br', 'gzip' o None si no se debe comprimir
+    """
+    pesos = {}
+    for parte in accept_encoding.lower().split(','):
+        nombre, _, parametros = parte.strip().partition(';')
+        peso = 1.0
+        parametro, _, valor = parametros.strip().partition('=')
+        if parametro.strip() == 'q':
+            try:
+                peso = float(valor)
+            except ValueError:
+                peso = 0.0
+        if nombre:
+            pesos[nombre.strip()] = peso
+
+    comodin = pesos.get('*', 0.0)
+    candidatas = [('br', pesos.get('br', comodin))] if brotli is not None else []
+    candidatas.append(('gzip', pesos.get('gzip', pesos.get('x-gzip', comodin))))
+    codificacion, peso = max(candidatas, key=lambda candidata: candidata[1])
+    return codificacion if peso > 0 else None
+
+
+def _compresor(codificacion):
+    if codificacion == 'br':
+        compresor = brotli.Compressor(
+            quality=getattr(settings, 'COMPRESSION_BROTLI_QUALITY', 4), mode=brotli.MODE_TEXT
+        )
+        return compresor.process, compresor.flush, compresor.finish
+    # wbits=31: formato gzip (cabecera y CRC) en lugar de zlib
+    compresor = zlib.compressobj(getattr(settings, 'COMPRESSION_GZIP_LEVEL', 6), zlib.DEFLATED, 31)
+    return compresor.compress, lambda: compresor.flush(zlib.Z_SYNC_FLUSH), compresor.flush
+
+
+def comprimir(contenido, codificacion):
+    """
+    Comprime un cuerpo completo.
+
+    Args:
+        contenido (bytes): Cuerpo de la respuesta
+        codificacion (str): 'br' o 'gzip'
+
+    Returns:
+        bytes: Cuerpo comprimido
+    """
+    procesar, _, terminar = _compresor(codificacion)
+    return procesar(contenido) + terminar()
+
+
+def _comprimir_secuencia(fragmentos, codificacion):
+    procesar, vaciar, terminar = _compresor(codificacion)
+    for fragmento in fragmentos:
+        # Se vacía en cada fragmento para no retener datos de una respuesta progresiva
+        datos = procesar(fragmento) + vaciar()
+        if datos:
+            yield datos
+    yield terminar()
+
+
+async def _comprimir_secuencia_async(fragmentos, codificacion):
+    procesar, vaciar, terminar = _compresor(codificacion)
+    async for fragmento in fragmentos:
+        datos = procesar(fragmento) + vaciar()
+        if datos:
+            yield datos
+    yield terminar()
+
+
+class CompressionMiddleware(MiddlewareMixin):
+    """
+    Middleware de compresión brotli/gzip para las respuestas de la API.
+
+    Comprime las respuestas de `/api/` de tipos textuales (JSON,
+    MessagePack...) a partir de `COMPRESSION_MIN_SIZE` bytes, con la
+    codificación negociada por `Accept-Encoding`. Las respuestas en
+    streaming se comprimen por fragmentos. Debe ir al principio de
+    `MIDDLEWARE`, antes de los middlewares que leen o modifican el cuerpo,
+    para que lo vean sin comprimir.
+
+    Las rutas de `COMPRESSION_EXCLUDE_PATHS` (por defecto la autenticación,
+    que devuelve tokens) no se comprimen para no exponerlas a BREACH.
+    """
+
+    ESTADOS_SIN_CUERPO = (204, 206, 304)
+
+    def debe_comprimir(self, request, response):
+        """
+        Indica si la respuesta es candidata a compresión.
+
+        Args:
+            request: Objeto HttpRequest de Django
+            response: Objeto HttpResponse de Django
+
+        Returns:
+            bool: True si se puede comprimir
+        """
+        if not request.path.startswith('/api/'):
+            return False
+        if any(request.path.startswith(ruta) for ruta in getattr(settings, 'COMPRESSION_EXCLUDE_PATHS', [])):
+            return False
+        if response.status_code in self.ESTADOS_SIN_CUERPO or response.has_header('Content-Encoding'):
+            return False
+        if 'no-transform' in response.get('Cache-Control', ''):
+            return False
+        tipo = response.get('Content-Type', '').split(';', 1)[0].strip().lower()
+        tipos = getattr(settings, 'COMPRESSION_CONTENT_TYPES', ['application/json'])
+        if not (tipo.startswith('text/') or tipo in tipos):
+            return False
+        return response.streaming or len(response.content) >= getattr(settings, 'COMPRESSION_MIN_SIZE', 1024)
+
+    def process_response(self, request, response):
+        """
+        Comprime la respuesta si el cliente lo acepta.
+
+        Args:
+            request: Objeto HttpRequest de Django
+            response: Objeto HttpResponse de Django
+
+        Returns:
+            HttpResponse: La respuesta comprimida o la original
+        """
+        if not self.debe_comprimir(request, response):
+            return response
+
+        # La representación depende de Accept-Encoding aunque este cliente no comprima
+        patch_vary_headers(response, ('Accept-Encoding',))
+        codificacion = elegir_codificacion(request.META.get('HTTP_ACCEPT_ENCODING', ''))
+        if codificacion is None:
+            return response
+
+        if response.streaming:
+            if response.is_async:
+                response.streaming_content = _comprimir_secuencia_async(response.streaming_content, codificacion)
+            else:
+                response.streaming_content = _comprimir_secuencia(response.streaming_content, codificacion)
+            del response['Content-Length']
+        else:
+            comprimido = comprimir(response.content, codificacion)
+            if len(comprimido) >= len(response.content):
+                return response
+            response.content = comprimido
+            response['Content-Length'] = str(len(comprimido))
+
+        # Los bytes cambian: un ETag fuerte pasa a débil (como GZipMiddleware)
+        etag = response.get('ETag')
+        if etag and etag.startswith('"'):
+            response['ETag'] = 'W/' + etag
+        response['Content-Encoding'] = codificacion
+        return response
@@ -0,0 +1,58 @@
+"""
+Parsers binarios de la API.
+
+Aceptan cuerpos MessagePack (`Content-Type: application/msgpack`) y CBOR
+(`application/cbor`) además de JSON y formularios. Las fechas nativas de
+ambos formatos (timestamp de MessagePack, etiquetas 0/1 de CBOR) llegan a
+los serializers como `datetime` con zona horaria.
+"""
+
+from rest_framework.exceptions import ParseError
+from rest_framework.parsers import BaseParser
+
+try:
+    import msgpack
+except ImportError:  # pragma: no cover - dependencia opcional
+    msgpack = None
+
+try:
+    import cbor2
+except ImportError:  # pragma: no cover - dependencia opcional
+    cbor2 = None
+
+
+class MessagePackParser(BaseParser):
+    """Parser MessagePack (requiere `msgpack`)."""
+
+    media_type = 'application/msgpack'
+
+    def parse(self, stream, media_type=None, parser_context=None):
+        """
+        Decodifica el cuerpo de la petición.
+
+        Raises:
+            ParseError: Si el cuerpo no es MessagePack válido
+        """
+        try:
+            # timestamp=3: las marcas de tiempo se decodifican como datetime UTC
+            return msgpack.unpackb(stream.read(), raw=False, timestamp=3)
+        except (ValueError, msgpack.UnpackException) as exc:
+            raise ParseError(f'MessagePack inválido: {exc}')
+
+
+class CBORParser(BaseParser):
+    """Parser CBOR (requiere `cbor2`)."""
+
+    media_type = 'application/cbor'
+
+    def parse(self, stream, media_type=None, parser_context=None):
+        """
+        Decodifica el cuerpo de la petición.
+
+        Raises:
+            ParseError: Si el cuerpo no es CBOR válido
+        """
+        try:
+            return cbor2.loads(stream.read())
+        except (ValueError, cbor2.CBORDecodeError) as exc:
+            raise ParseError(f'CBOR inválido: {exc}')
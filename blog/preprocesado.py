@@ -0,0 +1,154 @@
+"""
+Pre-procesado de imágenes antes de guardarlas.
+
+Las fotos subidas (a menudo de varios MB desde el móvil) se reducen a
+`IMAGE_PREPROCESS_MAX_SIZE` píxeles por lado, se giran según su
+orientación EXIF, se descartan sus metadatos (EXIF, GPS; se conserva el
+perfil ICC) y se recodifican a `IMAGE_PREPROCESS_FORMAT` con
+`IMAGE_PREPROCESS_QUALITY`.
+
+No depende de Cloudinary: recibe y devuelve archivos de Django, así que
+sirve igual para `CloudinaryImageField`, para la subida diferida o para
+archivos locales (`python manage.py optimizar_imagenes`).
+
+Para no cargar la imagen completa en memoria, Pillow lee el archivo de
+forma perezosa, los JPEG se decodifican directamente a escala reducida
+(`Image.draft`) y el resultado se escribe en un `SpooledTemporaryFile`
+que pasa a disco por encima de `FILE_UPLOAD_MAX_MEMORY_SIZE`.
+"""
+
+import logging
+import math
+import os
+import tempfile
+
+from django.conf import settings
+from django.core.files.uploadedfile import UploadedFile
+from PIL import Image, ImageOps
+
+logger = logging.getLogger(__name__)
+
+# Formato de Pillow → (extensión, content type, opciones de guardado)
+FORMATOS = {
+    'WEBP': ('webp', 'image/webp', {'method': 4}),
+    'AVIF': ('avif', 'image/avif', {}),
+    'JPEG': ('jpg', 'image/jpeg', {'optimize': True, 'progressive': True}),
+}
+# AVIF necesita Pillow >= 11.3 o pillow-avif-plugin; si no, se usa el siguiente
+_ALTERNATIVAS = ['WEBP', 'JPEG']
+
+
+def formato_disponible(formato):
+    """
+    Primer formato que Pillow puede escribir, empezando por el pedido.
+
+    Args:
+        formato (str): Formato de Pillow ('WEBP', 'AVIF', 'JPEG')
+
+    Returns:
+        str: Formato disponible
+    """
+    Image.init()
+    for candidato in [formato.upper()] + _ALTERNATIVAS:
+        if candidato in FORMATOS and candidato in Image.SAVE:
+            return candidato
+    return 'JPEG'
+
+
+def _tamano(archivo):
+    tamano = getattr(archivo, 'size', None)
+    if tamano is None:
+        archivo.seek(0, os.SEEK_END)
+        tamano = archivo.tell()
+    return tamano
+
+
+def _modo_salida(imagen, formato):
+    transparente = imagen.mode in ('RGBA', 'LA', 'PA') or (imagen.mode == 'P' and 'transparency' in imagen.info)
+    if transparente and formato != 'JPEG':
+        return 'RGBA'
+    return 'RGB'
+
+
+def preprocesar_imagen(archivo, lado_maximo=None, formato=None, calidad=None):
+    """
+    Redimensiona, limpia metadatos y recodifica una imagen.
+
+    Se devuelve el archivo original si ya era válido tal cual (animada, o
+    sin redimensionar ni metadatos y el resultado no es más pequeño).
+
+    Args:
+        archivo (File): Imagen a procesar (se lee desde el principio)
+        lado_maximo (int): Píxeles máximos por lado (default: IMAGE_PREPROCESS_MAX_SIZE)
+        formato (str): Formato de salida (default: IMAGE_PREPROCESS_FORMAT)
+        calidad (int): Calidad de codificación (default: IMAGE_PREPROCESS_QUALITY)
+
+    Returns:
+        tuple: (archivo resultante, informe) con bytes antes/después/ahorrados,
+            dimensiones y formato final
+    """
+    lado_maximo = lado_maximo or settings.IMAGE_PREPROCESS_MAX_SIZE
+    formato = formato_disponible(formato or settings.IMAGE_PREPROCESS_FORMAT)
+    calidad = calidad or settings.IMAGE_PREPROCESS_QUALITY
+    bytes_originales = _tamano(archivo)
+    archivo.seek(0)
+
+    with Image.open(archivo) as imagen:
+        informe = {
+            'nombre': os.path.basename(archivo.name or ''),
+            'bytes_originales': bytes_originales,
+            'dimensiones_originales': list(imagen.size),
+        }
+        if getattr(imagen, 'is_animated', False):
+            archivo.seek(0)
+            return archivo, _sin_cambios(informe, imagen)
+
+        con_metadatos = bool(imagen.info.get('exif') or imagen.getexif() or imagen.info.get('xmp'))
+        escala = lado_maximo / max(imagen.size)
+        redimensionada = escala < 1
+        if redimensionada:
+            # JPEG: decodifica a 1/2, 1/4 u 1/8 sin bajar del tamaño final
+            imagen.draft('RGB', (math.ceil(imagen.width * escala), math.ceil(imagen.height * escala)))
+        procesada = ImageOps.exif_transpose(imagen)
+        procesada.thumbnail((lado_maximo, lado_maximo), Image.Resampling.LANCZOS, reducing_gap=3.0)
+        procesada = procesada.convert(_modo_salida(procesada, formato))
+
+        extension, content_type, opciones = FORMATOS[formato]
+        salida = tempfile.SpooledTemporaryFile(max_size=settings.FILE_UPLOAD_MAX_MEMORY_SIZE)
+        procesada.save(
+            salida, formato, quality=calidad, icc_profile=imagen.info.get('icc_profile'), **opciones,
+        )
+        bytes_finales = salida.tell()
+
+        if bytes_finales >= bytes_originales and not redimensionada and not con_metadatos:
+            salida.close()
+            archivo.seek(0)
+            return archivo, _sin_cambios(informe, imagen)
+
+    salida.seek(0)
+    nombre = f'{os.path.splitext(informe["nombre"])[0] or "imagen"}.{extension}'
+    resultado = UploadedFile(salida, name=nombre, content_type=content_type, size=bytes_finales)
+    informe.update({
+        'procesada': True,
+        'bytes_finales': bytes_finales,
+        'bytes_ahorrados': bytes_originales - bytes_finales,
+        'dimensiones': list(procesada.size),
+        'formato': formato,
+    })
+    logger.info(
+        "Imagen %s pre-procesada: %s → %s bytes (%s ahorrados), %sx%s %s",
+        informe['nombre'], bytes_originales, bytes_finales, informe['bytes_ahorrados'],
+        procesada.width, procesada.height, formato,
+    )
+    return resultado, informe
+
+
+def _sin_cambios(informe, imagen):
+    informe.update({
+        'procesada': False,
+        'bytes_finales': informe['bytes_originales'],
+        'bytes_ahorrados': 0,
+        'dimensiones': informe['dimensiones_originales'],
+        'formato': imagen.format,
+    })
+    return informe
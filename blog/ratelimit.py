@@ -0,0 +1,279 @@
+"""
+Limitadores de tasa de ventana deslizante sobre la caché de Django.
+
+Se usa el algoritmo de contador de ventana deslizante: se guardan los
+contadores de la ventana actual y la anterior, y la tasa se estima como
+`anterior * fracción_restante + actual`. Son dos claves por identificador
+con un script Lua atómico en Redis, sin listas de marcas de tiempo.
+
+`GuardiaLogin` aplica estos límites al login por IP y por nombre de
+usuario antes de llamar a `authenticate()`, de modo que un ataque de
+credential stuffing no consume CPU en el hash de contraseñas.
+"""
+
+import hashlib
+import math
+import re
+import threading
+import time
+from typing import NamedTuple
+
+from django.conf import settings
+from django.core.cache import cache, caches
+from django.core.cache.backends.redis import RedisCache
+
+_PATRON_TASA = re.compile(r'^(?P<limite>\d+)/(?P<multiplo>\d*)(?P<unidad>[smhd])')
+_SEGUNDOS = {'s': 1, 'm': 60, 'h': 3600, 'd': 86400}
+
+
+def parse_tasa(tasa):
+    """
+    Interpreta una tasa como las de DRF, con múltiplo opcional del periodo.
+
+    Ejemplos: '20/min', '5/15m', '1000/hour', '3/10s'
+
+    Args:
+        tasa (str): Tasa en formato `<límite>/<múltiplo><unidad>`
+
+    Returns:
+        tuple: (límite, ventana en segundos)
+    """
+    coincidencia = _PATRON_TASA.match(tasa.strip())
+    if not coincidencia:
+        raise ValueError(f'Tasa inválida: {tasa!r}')
+    multiplo = int(coincidencia['multiplo'] or 1)
+    return int(coincidencia['limite']), multiplo * _SEGUNDOS[coincidencia['unidad']]
+
+
+def ip_cliente(request):
+    """
+    Obtiene la IP del cliente según los proxies de confianza.
+
+    Como `get_ident` de DRF con `NUM_PROXIES`: la entrada de
+    X-Forwarded-For que añadió el proxy más externo de confianza. Las
+    anteriores las controla el cliente, así que nunca se usan.
+
+    Args:
+        request: Objeto HttpRequest de Django
+
+    Returns:
+        str: Dirección IP
+    """
+    proxies = getattr(settings, 'NUM_PROXIES', 0)
+    x_forwarded_for = request.META.get('HTTP_X_FORWARDED_FOR')
+    if proxies and x_forwarded_for:
+        direcciones = x_forwarded_for.split(',')
+        return direcciones[-min(proxies, len(direcciones))].strip()
+    return request.META.get('REMOTE_ADDR', '')
+
+
+class ResultadoVentana(NamedTuple):
+    """Resultado de contar un evento en una `VentanaDeslizante`."""
+
+    permitido: bool
+    limite: int
+    restantes: int
+    reinicio: int
+    espera: int
+
+
+# Comprobación e incremento en un único viaje a Redis, atómico entre workers.
+# KEYS: ventana actual, ventana anterior
+# ARGV: coste, límite, peso de la ventana anterior, ttl, contar aunque se rechace
+_SCRIPT_VENTANA = """
+local actual = tonumber(redis.call('GET', KEYS[1]) or '0')
+local anterior = tonumber(redis.call('GET', KEYS[2]) or '0')
+local coste = tonumber(ARGV[1])
+local permitido = anterior * tonumber(ARGV[3]) + actual + coste <= tonumber(ARGV[2])
+if permitido or ARGV[5] == '1' then
+    actual = redis.call('INCRBY', KEYS[1], coste)
+    if actual == coste then
+        redis.call('EXPIRE', KEYS[1], tonumber(ARGV[4]))
+    end
+end
+return {permitido and 1 or 0, actual, anterior}
+"""
+
+_script = None
+_cerrojo = threading.Lock()
+
+
+def _contar_redis(backend, clave_actual, clave_anterior, argumentos):
+    global _script
+    cliente = backend._cache.get_client(clave_actual, write=True)
+    if _script is None:
+        _script = cliente.register_script(_SCRIPT_VENTANA)
+    permitido, actual, anterior = _script(
+        keys=[backend.make_key(clave_actual), backend.make_key(clave_anterior)],
+        args=argumentos,
+        client=cliente,
+    )
+    return bool(permitido), int(actual), int(anterior)
+
+
+def _contar_cache(clave_actual, clave_anterior, coste, limite, peso, ttl, siempre):
+    # Sin Redis (LocMem en desarrollo y tests) el cerrojo da atomicidad dentro
+    # del proceso, que es todo lo que comparte una caché local
+    with _cerrojo:
+        valores = cache.get_many([clave_actual, clave_anterior])
+        actual, anterior = valores.get(clave_actual, 0), valores.get(clave_anterior, 0)
+        permitido = anterior * peso + actual + coste <= limite
+        if permitido or siempre:
+            if cache.add(clave_actual, coste, timeout=ttl):
+                actual = coste
+            else:
+                actual = cache.incr(clave_actual, coste)
+        return permitido, actual, anterior
+
+
+class VentanaDeslizante:
+    """
+    Contador de ventana deslizante por identificador.
+
+    Con Redis cada evento es un único script Lua (dos GET y un INCRBY):
+    coste constante por petición y sin carreras entre workers.
+
+    Attributes:
+        prefijo (str): Prefijo de las claves en caché
+        limite (int): Eventos permitidos por ventana
+        ventana (int): Duración de la ventana en segundos
+    """
+
+    def __init__(self, prefijo, limite, ventana):
+        self.prefijo = prefijo
+        self.limite = limite
+        self.ventana = ventana
+
+    def _claves(self, identificador, ahora):
+        numero = int(ahora // self.ventana)
+        base = f'rl:{self.prefijo}:{identificador}'
+        return f'{base}:{numero}', f'{base}:{numero - 1}'
+
+    def _peso_anterior(self, ahora):
+        return 1 - (ahora % self.ventana) / self.ventana
+
+    def _espera(self, actual, anterior, ahora, coste=1):
+        """Segundos hasta que un evento de `coste` vuelva a caber en el límite."""
+        restante_ventana = self.ventana - (ahora % self.ventana)
+        margen = self.limite - actual - coste
+        if margen < 0 or not anterior:
+            # Solo la ventana siguiente libera cupo
+            return max(1, math.ceil(restante_ventana))
+        # El peso de la ventana anterior decrece linealmente
+        peso_necesario = margen / anterior
+        return max(1, math.ceil((1 - peso_necesario) * self.ventana - (self.ventana - restante_ventana)))
+
+    def _resultado(self, permitido, actual, anterior, ahora, coste):
+        estimado = anterior * self._peso_anterior(ahora) + actual
+        return ResultadoVentana(
+            permitido=permitido,
+            limite=self.limite,
+            restantes=max(0, math.floor(self.limite - estimado)),
+            reinicio=max(1, math.ceil(self.ventana - (ahora % self.ventana))),
+            espera=0 if permitido else self._espera(actual, anterior, ahora, coste),
+        )
+
+    def contar(self, identificador, coste=1, siempre=False):
+        """
+        Comprueba el límite y, si hay cupo, registra el evento.
+
+        Args:
+            identificador (str): IP, usuario o clave a limitar
+            coste (int): Unidades que consume el evento
+            siempre (bool): Registrar el evento aunque se rechace
+
+        Returns:
+            ResultadoVentana: Si se permitió, cupo restante y esperas
+        """
+        ahora = time.time()
+        clave_actual, clave_anterior = self._claves(identificador, ahora)
+        peso = self._peso_anterior(ahora)
+        ttl = self.ventana * 2
+        backend = caches['default']
+        if isinstance(backend, RedisCache):
+            permitido, actual, anterior = _contar_redis(
+                backend, clave_actual, clave_anterior, [coste, self.limite, repr(peso), ttl, int(siempre)]
+            )
+        else:
+            permitido, actual, anterior = _contar_cache(
+                clave_actual, clave_anterior, coste, self.limite, peso, ttl, siempre
+            )
+        return self._resultado(permitido, actual, anterior, ahora, coste)
+
+    def estado(self, identificador):
+        """
+        Consulta si cabe un evento más sin registrarlo.
+
+        Returns:
+            int: Segundos de espera (0 si está permitido)
+        """
+        ahora = time.time()
+        clave_actual, clave_anterior = self._claves(identificador, ahora)
+        valores = cache.get_many([clave_actual, clave_anterior])
+        actual, anterior = valores.get(clave_actual, 0), valores.get(clave_anterior, 0)
+        if anterior * self._peso_anterior(ahora) + actual + 1 <= self.limite:
+            return 0
+        return self._espera(actual, anterior, ahora)
+
+    def registrar(self, identificador):
+        """
+        Registra un evento (también si se rechaza) y devuelve la espera.
+
+        Un cliente que sigue insistiendo mientras está bloqueado no recupera
+        cupo: es lo que se quiere para intentos de login.
+
+        Returns:
+            int: Segundos de espera (0 si está permitido)
+        """
+        return self.contar(identificador, siempre=True).espera
+
+    def reiniciar(self, identificador):
+        """Elimina los contadores del identificador."""
+        cache.delete_many(self._claves(identificador, time.time()))
+
+
+class GuardiaLogin:
+    """
+    Protección del login contra fuerza bruta y credential stuffing.
+
+    - Por IP (`LOGIN_RATE_IP`): cuenta todos los intentos de la IP.
+    - Por usuario (`LOGIN_RATE_USERNAME`): cuenta solo los fallos y se
+      reinicia con un login correcto.
+
+    Ambos se comprueban antes de `authenticate()`, así que un intento
+    bloqueado no calcula ningún hash.
+    """
+
+    def __init__(self):
+        self.por_ip = VentanaDeslizante('login:ip', *parse_tasa(settings.LOGIN_RATE_IP))
+        self.por_usuario = VentanaDeslizante('login:usuario', *parse_tasa(settings.LOGIN_RATE_USERNAME))
+
+    @staticmethod
+    def _usuario(username):
+        # Normalizado y hasheado para no guardar nombres de usuario en claro
+        return hashlib.sha256(str(username).strip().lower().encode()).hexdigest()[:32]
+
+    def comprobar(self, request, username):
+        """
+        Registra el intento y comprueba si está permitido.
+
+        Args:
+            request: Objeto HttpRequest de Django
+            username (str): Usuario indicado en el intento
+
+        Returns:
+            int: Segundos de espera (0 si el intento puede continuar)
+        """
+        espera = self.por_ip.registrar(ip_cliente(request))
+        if username:
+            espera = max(espera, self.por_usuario.estado(self._usuario(username)))
+        return espera
+
+    def fallo(self, username):
+        """Registra un intento fallido para el usuario."""
+        if username:
+            self.por_usuario.registrar(self._usuario(username))
+
+    def exito(self, username):
+        """Reinicia los fallos del usuario tras un login correcto."""
+        self.por_usuario.reiniciar(self._usuario(username))
@@ -0,0 +1,142 @@
+"""
+Renderers de la API.
+
+`FastJSONRenderer` serializa con orjson (si está instalado) y produce el
+mismo JSON compacto que el `JSONRenderer` de DRF: las fechas, decimales,
+cadenas perezosas y demás tipos que orjson no trata igual se delegan al
+`JSONEncoder` de DRF. Sin orjson, o si se pide sangría (`; indent=4`, la
+API navegable), se usa la ruta de la librería estándar.
+
+`MessagePackRenderer` y `CBORRenderer` ofrecen las mismas respuestas en
+formato binario (`Accept: application/msgpack` / `application/cbor`, o
+`?format=msgpack`). Los tipos que JSON representa como texto (fechas,
+decimales, UUID, cadenas perezosas) pasan por el mismo `JSONEncoder` de
+DRF, así que los datos decodificados son idénticos a los del JSON.
+"""
+
+import datetime
+import decimal
+import uuid
+
+from rest_framework.renderers import BaseRenderer, JSONRenderer
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - dependencia opcional
+    orjson = None
+
+try:
+    import msgpack
+except ImportError:  # pragma: no cover - dependencia opcional
+    msgpack = None
+
+try:
+    import cbor2
+except ImportError:  # pragma: no cover - dependencia opcional
+    cbor2 = None
+
+# Fechas, horas y demás tipos especiales pasan por el encoder de DRF para
+# conservar su formato (p. ej. 'Z' en lugar de '+00:00')
+_OPCIONES_ORJSON = (
+    orjson.OPT_NON_STR_KEYS | orjson.OPT_PASSTHROUGH_DATETIME | orjson.OPT_PASSTHROUGH_DATACLASS
+    if orjson else 0
+)
+
+
+class FastJSONRenderer(JSONRenderer):
+    """
+    JSONRenderer compacto basado en orjson.
+
+    Attributes:
+        disponible (bool): Si orjson está instalado
+    """
+
+    disponible = orjson is not None
+
+    def __init__(self):
+        super().__init__()
+        self._por_defecto = self.encoder_class().default
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        """
+        Renderiza `data` como JSON en bytes.
+
+        Args:
+            data: Datos a serializar
+            accepted_media_type (str): Media type negociado
+            renderer_context (dict): Contexto del renderer
+
+        Returns:
+            bytes: JSON codificado en UTF-8
+        """
+        if data is None:
+            return b''
+        if not self.disponible or self.get_indent(accepted_media_type, renderer_context or {}) is not None:
+            return super().render(data, accepted_media_type, renderer_context)
+
+        try:
+            contenido = orjson.dumps(data, default=self._por_defecto, option=_OPCIONES_ORJSON)
+        except orjson.JSONEncodeError:
+            # Enteros de más de 64 bits, claves no soportadas...
+            return super().render(data, accepted_media_type, renderer_context)
+
+        # Igual que DRF: JSON que sea un subconjunto estricto de JavaScript
+        if b'\xe2\x80\xa8' in contenido or b'\xe2\x80\xa9' in contenido:
+            contenido = contenido.replace(b'\xe2\x80\xa8', b'\\u2028').replace(b'\xe2\x80\xa9', b'\\u2029')
+        return contenido
+
+
+# Mismo tratamiento que JSONRenderer para los tipos sin equivalente en JSON
+_por_defecto = JSONRenderer.encoder_class().default
+
+
+class MessagePackRenderer(BaseRenderer):
+    """Renderer MessagePack (requiere `msgpack`)."""
+
+    media_type = 'application/msgpack'
+    format = 'msgpack'
+    charset = None
+    render_style = 'binary'
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        """
+        Renderiza `data` como MessagePack.
+
+        Returns:
+            bytes: Datos empaquetados
+        """
+        if data is None:
+            return b''
+        # datetime=False: las fechas llegan a `default` y se envían como en el JSON
+        return msgpack.packb(data, default=_por_defecto, use_bin_type=True, datetime=False)
+
+
+def _como_json(codificador, valor):
+    codificador.encode(_por_defecto(valor))
+
+
+class CBORRenderer(BaseRenderer):
+    """Renderer CBOR (requiere `cbor2`)."""
+
+    media_type = 'application/cbor'
+    format = 'cbor'
+    charset = None
+    render_style = 'binary'
+
+    # cbor2 codifica estos tipos con etiquetas propias: se fuerzan a su forma JSON
+    encoders = {
+        tipo: _como_json
+        for tipo in (datetime.datetime, datetime.date, datetime.time, datetime.timedelta,
+                     decimal.Decimal, uuid.UUID, set, frozenset)
+    }
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        """
+        Renderiza `data` como CBOR.
+
+        Returns:
+            bytes: Datos codificados
+        """
+        if data is None:
+            return b''
+        return cbor2.dumps(data, encoders=self.encoders, default=_como_json)
@@ -0,0 +1,80 @@
+"""
+Enrutamiento de lecturas hacia réplicas de PostgreSQL.
+
+Las escrituras siempre van a la base de datos primaria (`default`). Las
+lecturas solo se envían a una réplica cuando el contexto actual lo
+permite: `ReplicaRoutingMiddleware` lo activa para peticiones con métodos
+seguros y las tareas de reportes lo activan con `leer_de_replica()`.
+Fuera de esos contextos (peticiones de escritura, transacciones, tareas
+de mantenimiento) todo se lee de la primaria, por lo que no se leen datos
+desactualizados por el retraso de replicación.
+"""
+
+import random
+from contextlib import contextmanager
+from contextvars import ContextVar
+
+from django.conf import settings
+from django.db import transaction
+
+_usar_replica = ContextVar('usar_replica', default=False)
+
+
+def replicas_disponibles():
+    """
+    Alias de las réplicas configuradas.
+
+    Returns:
+        list: Alias de DATABASES usados como réplicas
+    """
+    return getattr(settings, 'DATABASE_REPLICAS', [])
+
+
+@contextmanager
+def leer_de_replica(activo=True):
+    """
+    Envía a las réplicas las lecturas ejecutadas dentro del bloque.
+
+    Ejemplo:
+        with leer_de_replica():
+            total = Noticias.objects.count()
+
+    Args:
+        activo (bool): False fuerza la lectura desde la primaria
+    """
+    token = _usar_replica.set(activo)
+    try:
+        yield
+    finally:
+        _usar_replica.reset(token)
+
+
+class ReplicaRouter:
+    """
+    Router de base de datos primaria/réplicas.
+
+    Los modelos de las apps en `REPLICA_EXCLUDED_APPS` (sesiones y tokens
+    por defecto) se leen siempre de la primaria: se crean justo antes de
+    usarse y una réplica retrasada devolvería un usuario no autenticado.
+    """
+
+    def db_for_read(self, model, **hints):
+        if not _usar_replica.get():
+            return 'default'
+        if model._meta.app_label in getattr(settings, 'REPLICA_EXCLUDED_APPS', ()):
+            return 'default'
+        # Dentro de una transacción atómica se lee lo que se acaba de escribir
+        if transaction.get_connection('default').in_atomic_block:
+            return 'default'
+        replicas = replicas_disponibles()
+        return random.choice(replicas) if replicas else 'default'
+
+    def db_for_write(self, model, **hints):
+        return 'default'
+
+    def allow_relation(self, obj1, obj2, **hints):
+        # Primaria y réplicas contienen los mismos datos
+        return True
+
+    def allow_migrate(self, db, app_label, model_name=None, **hints):
+        return db == 'default'
@@ -0,0 +1,269 @@
+"""
+Logging estructurado.
+
+- `JSONFormatter` produce una línea JSON válida por registro (con orjson
+  si está instalado): el mensaje se escapa correctamente aunque contenga
+  comillas o saltos de línea, la traza de una excepción va en su propio
+  campo y los `extra=` del registro se añaden como campos.
+- El contexto de la petición (`request_id`, usuario, ruta) se guarda en
+  una `ContextVar` que fija `LogContextMiddleware` y se añade a cada
+  registro sin pasarlo en cada llamada.
+- `ColaHandler` saca la escritura de los logs del hilo de la petición: el
+  registro se encola (con el mensaje ya formateado y el contexto
+  capturado) y un `QueueListener` lo entrega a los handlers reales en un
+  hilo aparte. El hilo se arranca con el primer registro de cada proceso,
+  así que funciona con `preload_app` de gunicorn y con el pool prefork de
+  Celery; si la cola se llena, los registros se descartan y se cuentan en
+  lugar de bloquear la petición.
+
+Este módulo se importa al configurar `LOGGING`, antes de cargar las apps:
+no debe importar modelos ni DRF.
+"""
+
+import atexit
+import contextvars
+import copy
+import json
+import logging
+import logging.handlers
+import os
+import queue
+import threading
+import weakref
+from datetime import datetime, timezone
+
+from django.utils.functional import LazyObject, empty
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - dependencia opcional
+    orjson = None
+
+_contexto = contextvars.ContextVar('log_contexto', default=None)
+
+# Atributos propios de LogRecord; el resto son `extra=` de la llamada
+_ATRIBUTOS_REGISTRO = frozenset(vars(logging.LogRecord('', 0, '', 0, '', (), None))) | {
+    'message', 'asctime', 'contexto',
+}
+_formateador_base = logging.Formatter()
+_colas = weakref.WeakSet()
+
+
+def vincular(**campos):
+    """
+    Añade campos al contexto de log actual.
+
+    Args:
+        **campos: Campos a añadir (`request` se resuelve al registrar)
+
+    Returns:
+        Token: Token para restaurar el contexto anterior con `desvincular`
+    """
+    return _contexto.set({**(_contexto.get() or {}), **campos})
+
+
+def desvincular(token):
+    """Restaura el contexto de log anterior a `vincular`."""
+    try:
+        _contexto.reset(token)
+    except ValueError:
+        # Token creado en otro contexto (p. ej. middleware síncrono bajo ASGI)
+        _contexto.set(None)
+
+
+def _usuario(request):
+    # Solo si la autenticación ya se resolvió: registrar no debe consultar la sesión
+    usuario = request.__dict__.get('user')
+    if usuario is None or (isinstance(usuario, LazyObject) and usuario._wrapped is empty):
+        return None
+    return usuario.get_username() if usuario.is_authenticated else 'anonymous'
+
+
+def contexto_actual():
+    """
+    Campos del contexto de log actual.
+
+    Returns:
+        dict: `request_id`, método, ruta, usuario y demás campos vinculados
+    """
+    campos = _contexto.get()
+    if not campos:
+        return {}
+    contexto = dict(campos)
+    request = contexto.pop('request', None)
+    if request is not None:
+        resolver_match = getattr(request, 'resolver_match', None)
+        if resolver_match is not None:
+            contexto['route'] = resolver_match.route
+        usuario = _usuario(request)
+        if usuario is not None:
+            contexto['user'] = usuario
+    return contexto
+
+
+def volcar(datos):
+    """
+    Serializa un registro a una línea JSON.
+
+    Args:
+        datos (dict): Campos del registro
+
+    Returns:
+        str: JSON compacto
+    """
+    if orjson is not None:
+        try:
+            return orjson.dumps(datos, default=str, option=orjson.OPT_NON_STR_KEYS).decode()
+        except TypeError:
+            # Enteros de más de 64 bits y otros casos que orjson rechaza
+            pass
+    return json.dumps(datos, default=str, ensure_ascii=False, separators=(',', ':'))
+
+
+class JSONFormatter(logging.Formatter):
+    """
+    Formatea cada registro como un objeto JSON en una línea.
+
+    Campos: time (ISO 8601 UTC), level, logger, module, message, los del
+    contexto de la petición, los `extra=` de la llamada y, si los hay,
+    exception y stack.
+    """
+
+    def format(self, record):
+        """
+        Formatea un registro.
+
+        Args:
+            record (LogRecord): Registro a formatear
+
+        Returns:
+            str: Línea JSON
+        """
+        datos = {
+            'time': datetime.fromtimestamp(record.created, timezone.utc).isoformat(timespec='milliseconds'),
+            'level': record.levelname,
+            'logger': record.name,
+            'module': record.module,
+            'message': record.getMessage(),
+        }
+        contexto = getattr(record, 'contexto', None)
+        for campo, valor in (contexto_actual() if contexto is None else contexto).items():
+            datos.setdefault(campo, valor)
+        for campo, valor in record.__dict__.items():
+            if campo not in _ATRIBUTOS_REGISTRO and not campo.startswith('_'):
+                datos.setdefault(campo, valor)
+        if record.exc_info and not record.exc_text:
+            record.exc_text = self.formatException(record.exc_info)
+        if record.exc_text:
+            datos['exception'] = record.exc_text
+        if record.stack_info:
+            datos['stack'] = self.formatStack(record.stack_info)
+        return volcar(datos)
+
+
+class ColaHandler(logging.handlers.QueueHandler):
+    """
+    Encola los registros para que otro hilo los escriba.
+
+    Args:
+        handlers (list): Handlers que escriben; en `LOGGING`, referencias
+            'cfg://handlers.<nombre>' a handlers ya configurados (dictConfig
+            los crea por orden alfabético de nombre)
+        tamano (int): Registros máximos en cola (los que no caben se descartan)
+    """
+
+    def __init__(self, handlers=(), tamano=10000):
+        super().__init__(queue.Queue(tamano))
+        # dictConfig resuelve las referencias 'cfg://' al acceder por índice
+        self.destinos = [handlers[i] for i in range(len(handlers))]
+        if not all(isinstance(handler, logging.Handler) for handler in self.destinos):
+            raise ValueError('Los handlers de destino deben configurarse antes que la cola')
+        self.tamano = tamano
+        self.listener = None
+        self.descartados = 0
+        self._pid = None
+        self._lock_inicio = threading.Lock()
+        _colas.add(self)
+
+    def iniciar(self):
+        """Arranca el hilo que escribe los registros en este proceso."""
+        with self._lock_inicio:
+            if self._pid == os.getpid():
+                return
+            # Tras un fork la cola heredada puede tener registros del padre
+            self.queue = queue.Queue(self.tamano)
+            self.listener = logging.handlers.QueueListener(
+                self.queue, *self.destinos, respect_handler_level=True,
+            )
+            self.listener.start()
+            self._pid = os.getpid()
+
+    def detener(self):
+        """Escribe los registros pendientes y detiene el hilo."""
+        with self._lock_inicio:
+            if self.listener is not None and self._pid == os.getpid():
+                self.listener.stop()
+            self.listener = None
+            self._pid = None
+
+    def _tras_fork(self):
+        # El hilo del padre no existe en el hijo y el lock pudo quedar tomado
+        self._lock_inicio = threading.Lock()
+        self.listener = None
+        self._pid = None
+
+    def prepare(self, record):
+        """
+        Prepara el registro para cruzar de hilo.
+
+        Formatea el mensaje y la traza y captura el contexto de la petición
+        en el hilo que registra; los argumentos de la llamada no se
+        conservan porque podrían cambiar antes de escribirse.
+
+        Args:
+            record (LogRecord): Registro original
+
+        Returns:
+            LogRecord: Copia lista para encolar
+        """
+        record = copy.copy(record)
+        record.contexto = contexto_actual()
+        record.message = record.getMessage()
+        record.msg, record.args = record.message, None
+        if record.exc_info:
+            record.exc_text = record.exc_text or _formateador_base.formatException(record.exc_info)
+            record.exc_info = None
+        return record
+
+    def enqueue(self, record):
+        """Encola sin bloquear; si la cola está llena, descarta el registro."""
+        try:
+            self.queue.put_nowait(record)
+        except queue.Full:
+            self.descartados += 1
+
+    def emit(self, record):
+        """Encola un registro, arrancando el hilo si hace falta."""
+        if self._pid != os.getpid():
+            self.iniciar()
+        super().emit(record)
+
+    def close(self):
+        """Vacía la cola antes de cerrar."""
+        self.detener()
+        super().close()
+
+
+def _detener_colas():
+    for cola in list(_colas):
+        cola.detener()
+
+
+def _reiniciar_colas():
+    for cola in list(_colas):
+        cola._tras_fork()
+
+
+# Antes de logging.shutdown (registrado antes, se ejecuta después)
+atexit.register(_detener_colas)
+os.register_at_fork(after_in_child=_reiniciar_colas)
@@ -0,0 +1,247 @@
+"""
+Subida diferida de imágenes a Cloudinary.
+
+`CloudinaryField` sube la imagen en `pre_save`, dentro de la petición, y el
+worker de gunicorn queda bloqueado durante la subida. Con
+`IMAGE_UPLOAD_ASYNC` activo, `SubidaDiferidaMixin` (en los serializers con
+imágenes) guarda el archivo recibido en un almacenamiento temporal
+(`IMAGE_UPLOAD_STAGING_DIR`), guarda el registro sin tocar la imagen
+(vacía al crear, la anterior al actualizar) y, tras el commit, encola
+`blog.tasks.finalizar_subida_imagen`, que sube el archivo con el backend
+configurado (`IMAGE_UPLOAD_BACKEND`) y actualiza el registro.
+
+El estado de cada subida queda en `SubidaImagen`; la respuesta de la
+escritura incluye `imagenes_pendientes` con los campos en curso.
+
+El almacenamiento temporal es un directorio local: el worker de Celery
+debe compartirlo con los procesos web (mismo contenedor o volumen).
+
+Backends:
+    SubidaCloudinary: sube a Cloudinary con las opciones del campo
+        (`folder`, `type`, `resource_type`), como `CloudinaryField`
+    SubidaLocal: guarda en `IMAGE_UPLOAD_LOCAL_DIR`; sustituto para
+        pruebas y desarrollo sin credenciales de Cloudinary
+"""
+
+import logging
+import os
+import time
+import uuid
+
+from cloudinary import CloudinaryResource, uploader
+from cloudinary.models import CloudinaryField
+from django.conf import settings
+from django.contrib.contenttypes.models import ContentType
+from django.core.files import File
+from django.core.files.storage import FileSystemStorage
+from django.core.files.uploadedfile import UploadedFile
+from django.db import transaction
+from django.db.models import F
+from django.utils.module_loading import import_string
+
+from blog.Models.SubidaImagenModel import SubidaImagen
+
+logger = logging.getLogger(__name__)
+
+
+def subida_asincrona_activa():
+    """Indica si las imágenes se suben en segundo plano (`IMAGE_UPLOAD_ASYNC`)."""
+    return getattr(settings, 'IMAGE_UPLOAD_ASYNC', False)
+
+
+def almacen_temporal():
+    """Almacenamiento de los archivos pendientes de subir."""
+    return FileSystemStorage(location=settings.IMAGE_UPLOAD_STAGING_DIR)
+
+
+def opciones_subida(instancia, campo):
+    """
+    Opciones de subida de un campo, como las calcula `CloudinaryField.pre_save`.
+
+    Args:
+        instancia (Model): Registro al que pertenece la imagen
+        campo (str): Nombre del campo de imagen
+
+    Returns:
+        dict: Opciones para el uploader de Cloudinary
+    """
+    field = instancia._meta.get_field(campo)
+    opciones = {'type': field.type, 'resource_type': field.resource_type}
+    opciones.update({clave: valor(instancia) if callable(valor) else valor for clave, valor in field.options.items()})
+    return opciones
+
+
+class SubidaCloudinary:
+    """Sube las imágenes a Cloudinary."""
+
+    def subir(self, archivo, instancia, campo):
+        """
+        Sube un archivo para un campo de un registro.
+
+        Args:
+            archivo (File): Archivo abierto
+            instancia (Model): Registro al que pertenece la imagen
+            campo (str): Nombre del campo de imagen
+
+        Returns:
+            CloudinaryResource: Recurso subido
+        """
+        return uploader.upload_resource(archivo, **opciones_subida(instancia, campo))
+
+
+class SubidaLocal:
+    """
+    Guarda las imágenes en disco (`IMAGE_UPLOAD_LOCAL_DIR`).
+
+    Devuelve un `CloudinaryResource` con el mismo formato de columna que una
+    subida real (`image/upload/v<versión>/<carpeta>/<nombre>.<formato>`).
+    """
+
+    def subir(self, archivo, instancia, campo):
+        opciones = opciones_subida(instancia, campo)
+        almacen = FileSystemStorage(location=settings.IMAGE_UPLOAD_LOCAL_DIR)
+        ruta = almacen.save(f"{opciones.get('folder', '')}{os.path.basename(archivo.name)}", archivo)
+        public_id, formato = os.path.splitext(ruta)
+        return CloudinaryResource(
+            public_id, version=str(int(time.time())), format=formato[1:] or None,
+            type=opciones['type'], resource_type=opciones['resource_type'],
+        )
+
+
+def backend():
+    """Backend de subida configurado en `IMAGE_UPLOAD_BACKEND`."""
+    return import_string(settings.IMAGE_UPLOAD_BACKEND)()
+
+
+def diferir_subida(instancia, campo, archivo):
+    """
+    Guarda una imagen en el almacenamiento temporal y encola su subida.
+
+    Las subidas pendientes anteriores del mismo campo pasan a reemplazadas.
+
+    Args:
+        instancia (Model): Registro ya guardado
+        campo (str): Nombre del campo de imagen
+        archivo (UploadedFile): Imagen recibida
+
+    Returns:
+        SubidaImagen: Subida pendiente
+    """
+    from blog.tasks import finalizar_subida_imagen
+
+    _, extension = os.path.splitext(archivo.name)
+    ruta = almacen_temporal().save(f'{instancia._meta.model_name}/{uuid.uuid4().hex}{extension.lower()}', archivo)
+
+    content_type = ContentType.objects.get_for_model(instancia)
+    SubidaImagen.objects.filter(
+        content_type=content_type, object_id=str(instancia.pk), campo=campo, estado=SubidaImagen.PENDIENTE,
+    ).update(estado=SubidaImagen.REEMPLAZADA)
+    subida = SubidaImagen.objects.create(
+        content_type=content_type, object_id=str(instancia.pk), campo=campo,
+        archivo=ruta, nombre_original=os.path.basename(archivo.name)[:255],
+    )
+    transaction.on_commit(lambda: finalizar_subida_imagen.delay(subida.pk))
+    logger.info("Imagen %s de %s#%s pendiente de subir (%s)", campo, instancia._meta.label, instancia.pk, subida.pk)
+    return subida
+
+
+def finalizar_subida(subida_id):
+    """
+    Sube una imagen pendiente y la asigna a su registro.
+
+    Si la subida fue reemplazada entretanto, el registro no se modifica.
+
+    Args:
+        subida_id (int): Identificador de la `SubidaImagen`
+
+    Returns:
+        dict: Resultado con el estado final de la subida
+    """
+    subida = SubidaImagen.objects.select_related('content_type').filter(pk=subida_id).first()
+    if subida is None:
+        return {'status': 'error', 'mensaje': f'Subida {subida_id} no encontrada'}
+
+    almacen = almacen_temporal()
+    if subida.estado != SubidaImagen.PENDIENTE:
+        if subida.estado == SubidaImagen.REEMPLAZADA:
+            almacen.delete(subida.archivo)
+        return {'status': 'success', 'estado': subida.estado}
+
+    instancia = subida.content_type.model_class()._default_manager.filter(pk=subida.object_id).first()
+    if instancia is None:
+        almacen.delete(subida.archivo)
+        registrar_error(subida_id, 'El registro ya no existe')
+        return {'status': 'error', 'mensaje': 'El registro ya no existe'}
+
+    SubidaImagen.objects.filter(pk=subida_id).update(intentos=F('intentos') + 1)
+    with almacen.open(subida.archivo, 'rb') as contenido:
+        recurso = backend().subir(File(contenido, name=subida.nombre_original), instancia, subida.campo)
+
+    with transaction.atomic():
+        actualizada = SubidaImagen.objects.filter(pk=subida_id, estado=SubidaImagen.PENDIENTE).update(
+            estado=SubidaImagen.COMPLETADA, error='',
+        )
+        if actualizada:
+            setattr(instancia, subida.campo, recurso)
+            instancia.save(update_fields=[subida.campo])
+    almacen.delete(subida.archivo)
+
+    if not actualizada:
+        logger.info("Subida %s reemplazada durante la subida; se descarta", subida_id)
+        return {'status': 'success', 'estado': SubidaImagen.REEMPLAZADA}
+    logger.info("Imagen %s de %s#%s subida (%s)", subida.campo, instancia._meta.label, instancia.pk, subida_id)
+    return {'status': 'success', 'estado': SubidaImagen.COMPLETADA, 'imagen': recurso.get_prep_value()}
+
+
+def registrar_error(subida_id, error):
+    """Marca una subida pendiente como fallida."""
+    SubidaImagen.objects.filter(pk=subida_id, estado=SubidaImagen.PENDIENTE).update(
+        estado=SubidaImagen.ERROR, error=str(error),
+    )
+
+
+class SubidaDiferidaMixin:
+    """
+    Mixin de serializer que difiere la subida de los campos `CloudinaryField`.
+
+    Sin `IMAGE_UPLOAD_ASYNC` no cambia nada. Con él, las imágenes recibidas
+    se retiran de `validated_data` antes de guardar y se encolan con
+    `diferir_subida`; la representación de la escritura añade
+    `imagenes_pendientes` con los nombres de los campos en curso.
+    """
+
+    def create(self, validated_data):
+        archivos = self._retirar_archivos(validated_data)
+        instancia = super().create(validated_data)
+        self._diferir(instancia, archivos)
+        return instancia
+
+    def update(self, instance, validated_data):
+        archivos = self._retirar_archivos(validated_data)
+        instancia = super().update(instance, validated_data)
+        self._diferir(instancia, archivos)
+        return instancia
+
+    def to_representation(self, instance):
+        datos = super().to_representation(instance)
+        pendientes = getattr(self, '_imagenes_pendientes', None)
+        if pendientes:
+            datos['imagenes_pendientes'] = pendientes
+        return datos
+
+    def _retirar_archivos(self, validated_data):
+        if not subida_asincrona_activa():
+            return {}
+        campos = {
+            field.name for field in self.Meta.model._meta.concrete_fields if isinstance(field, CloudinaryField)
+        }
+        return {
+            campo: validated_data.pop(campo)
+            for campo in list(validated_data)
+            if campo in campos and isinstance(validated_data[campo], UploadedFile)
+        }
+
+    def _diferir(self, instancia, archivos):
+        for campo, archivo in archivos.items():
+            diferir_subida(instancia, campo, archivo)
+        self._imagenes_pendientes = sorted(archivos)
@@ -0,0 +1,238 @@
+"""
+Métricas de ejecución de las tareas de Celery.
+
+Cada tarea se instrumenta con las señales de Celery:
+
+- `before_task_publish` marca el mensaje con la hora de publicación.
+- `task_prerun` calcula la espera en cola (desde la publicación o, si la
+  tarea tenía ETA/countdown, desde esa hora) y arranca el cronómetro.
+- `task_retry` y `task_failure` anotan reintentos y excepciones.
+- `task_postrun` registra la duración, el estado y las filas afectadas
+  (claves de `CLAVES_FILAS` en el dict devuelto; un dict con
+  `'status': 'error'` cuenta como error).
+
+Los workers de Celery y los procesos web no comparten memoria, así que
+las métricas se guardan en la caché por defecto (Redis en producción):
+contadores por tarea y hora con `cache.incr` (atómico) que caducan tras
+`TASK_METRICS_WINDOW_HOURS`, y las últimas `TASK_METRICS_SAMPLES`
+ejecuciones de cada tarea para percentiles. La lista de muestras se
+actualiza con lectura y escritura, así que con varios workers simultáneos
+puede perder alguna muestra; los contadores no.
+"""
+
+import logging
+import threading
+import time
+from datetime import datetime
+
+from celery.signals import before_task_publish, task_failure, task_postrun, task_prerun, task_retry
+from django.conf import settings
+from django.core.cache import cache
+
+logger = logging.getLogger(__name__)
+
+PREFIJO = 'task_metrics:v1'
+# Contadores enteros por tarea y hora
+CAMPOS = ('ejecuciones', 'errores', 'reintentos', 'duracion_ms', 'espera_ms', 'filas')
+# Claves de los resultados de blog/tasks.py con el número de filas afectadas
+CLAVES_FILAS = ('filas_afectadas', 'eliminadas', 'archivos_eliminados', 'sesiones_eliminadas')
+
+_en_curso = {}
+_lock = threading.Lock()
+
+
+def activas():
+    """Indica si se registran métricas (`TASK_METRICS_ENABLED`)."""
+    return getattr(settings, 'TASK_METRICS_ENABLED', True)
+
+
+def _hora(instante):
+    return int(instante // 3600)
+
+
+def _clave(tarea, hora, campo):
+    return f'{PREFIJO}:{tarea}:{hora}:{campo}'
+
+
+def _clave_muestras(tarea):
+    return f'{PREFIJO}:{tarea}:muestras'
+
+
+def _marca_temporal(valor):
+    """Convierte el ETA de la petición (ISO 8601 o datetime) en segundos epoch."""
+    if not valor:
+        return None
+    if isinstance(valor, str):
+        valor = datetime.fromisoformat(valor)
+    return valor.timestamp()
+
+
+def filas_afectadas(resultado):
+    """
+    Filas afectadas declaradas en el resultado de una tarea.
+
+    Args:
+        resultado: Valor devuelto por la tarea
+
+    Returns:
+        int: Suma de las claves de `CLAVES_FILAS` (0 si no hay)
+    """
+    if not isinstance(resultado, dict):
+        return 0
+    return sum(resultado[clave] for clave in CLAVES_FILAS if isinstance(resultado.get(clave), int))
+
+
+def _al_publicar(headers=None, **kwargs):
+    if headers is not None:
+        headers.setdefault('publicado_en', time.time())
+
+
+def _al_empezar(task_id=None, task=None, **kwargs):
+    if not activas():
+        return
+    ahora = time.time()
+    request = task.request
+    # Los workers copian las cabeceras del mensaje en la petición; `apply()` las deja en `headers`
+    publicado = getattr(request, 'publicado_en', None) or (request.headers or {}).get('publicado_en')
+    desde = max(filter(None, (publicado, _marca_temporal(request.eta))), default=None)
+    with _lock:
+        _en_curso[task_id] = {
+            'inicio': ahora,
+            'cronometro': time.perf_counter(),
+            'espera_ms': round(max(ahora - desde, 0) * 1000) if desde else 0,
+            'cola': (request.delivery_info or {}).get('routing_key') or getattr(task, 'queue', None),
+            'reintentos': request.retries or 0,
+        }
+
+
+def _al_reintentar(request=None, reason=None, **kwargs):
+    if not activas() or request is None:
+        return
+    with _lock:
+        datos = _en_curso.get(request.id)
+        if datos is not None:
+            datos['reintentada'] = True
+
+
+def _al_fallar(task_id=None, exception=None, **kwargs):
+    with _lock:
+        datos = _en_curso.get(task_id)
+        if datos is not None:
+            datos['excepcion'] = type(exception).__name__
+
+
+def _al_terminar(task_id=None, task=None, retval=None, state=None, **kwargs):
+    with _lock:
+        datos = _en_curso.pop(task_id, None)
+    if datos is None:
+        return
+    error = state == 'FAILURE' or (isinstance(retval, dict) and retval.get('status') == 'error')
+    muestra = {
+        'inicio': round(datos['inicio'], 3),
+        'duracion_ms': round((time.perf_counter() - datos['cronometro']) * 1000),
+        'espera_ms': datos['espera_ms'],
+        'estado': 'reintento' if state == 'RETRY' or datos.get('reintentada') else ('error' if error else 'ok'),
+        'filas': filas_afectadas(retval),
+        'reintentos': datos['reintentos'],
+        'cola': datos['cola'],
+    }
+    if 'excepcion' in datos:
+        muestra['excepcion'] = datos['excepcion']
+    try:
+        registrar(task.name, muestra)
+    except Exception as e:
+        # Las métricas nunca deben hacer fallar una tarea
+        logger.warning("No se pudieron registrar las métricas de %s: %s", task.name, e)
+
+
+def registrar(tarea, muestra):
+    """
+    Acumula una ejecución en los contadores de su hora y en las muestras.
+
+    Args:
+        tarea (str): Nombre de la tarea
+        muestra (dict): Duración, espera, estado, filas, reintentos y cola
+    """
+    ventana = settings.TASK_METRICS_WINDOW_HOURS * 3600
+    hora = _hora(muestra['inicio'])
+    valores = {
+        'ejecuciones': 1,
+        'errores': int(muestra['estado'] == 'error'),
+        'reintentos': int(muestra['estado'] == 'reintento'),
+        'duracion_ms': muestra['duracion_ms'],
+        'espera_ms': muestra['espera_ms'],
+        'filas': muestra['filas'],
+    }
+    for campo, valor in valores.items():
+        if not valor:
+            continue
+        clave = _clave(tarea, hora, campo)
+        cache.add(clave, 0, timeout=ventana + 3600)
+        try:
+            cache.incr(clave, valor)
+        except ValueError:
+            # La clave caducó entre add e incr
+            cache.set(clave, valor, timeout=ventana + 3600)
+
+    muestras = cache.get(_clave_muestras(tarea)) or []
+    muestras.append(muestra)
+    cache.set(_clave_muestras(tarea), muestras[-settings.TASK_METRICS_SAMPLES:], timeout=ventana)
+
+
+def _percentil(valores, percentil):
+    if not valores:
+        return 0
+    ordenados = sorted(valores)
+    return ordenados[min(len(ordenados) - 1, int(len(ordenados) * percentil / 100))]
+
+
+def resumen_tarea(tarea, horas=None, ahora=None):
+    """
+    Agrega las métricas de una tarea en las últimas horas.
+
+    Args:
+        tarea (str): Nombre de la tarea
+        horas (int): Horas a agregar (default: TASK_METRICS_WINDOW_HOURS)
+        ahora (float): Instante de referencia (epoch)
+
+    Returns:
+        dict: Totales, medias, percentiles y últimas ejecuciones
+    """
+    horas = horas or settings.TASK_METRICS_WINDOW_HOURS
+    actual = _hora(ahora or time.time())
+    claves = {
+        _clave(tarea, hora, campo): campo
+        for hora in range(actual - horas + 1, actual + 1) for campo in CAMPOS
+    }
+    totales = dict.fromkeys(CAMPOS, 0)
+    for clave, valor in cache.get_many(list(claves)).items():
+        totales[claves[clave]] += valor
+
+    desde = (actual - horas + 1) * 3600
+    muestras = [m for m in cache.get(_clave_muestras(tarea)) or [] if m['inicio'] >= desde]
+    duraciones = [m['duracion_ms'] for m in muestras]
+    esperas = [m['espera_ms'] for m in muestras]
+    ejecuciones = totales['ejecuciones']
+    return {
+        'ejecuciones': ejecuciones,
+        'errores': totales['errores'],
+        'tasa_error': round(totales['errores'] / ejecuciones, 3) if ejecuciones else 0.0,
+        'reintentos': totales['reintentos'],
+        'filas_afectadas': totales['filas'],
+        'duracion_media_ms': round(totales['duracion_ms'] / ejecuciones) if ejecuciones else 0,
+        'duracion_p50_ms': _percentil(duraciones, 50),
+        'duracion_p95_ms': _percentil(duraciones, 95),
+        'duracion_max_ms': max(duraciones, default=0),
+        'espera_media_ms': round(totales['espera_ms'] / ejecuciones) if ejecuciones else 0,
+        'espera_p95_ms': _percentil(esperas, 95),
+        'ultimas': muestras[-10:][::-1],
+    }
+
+
+def registrar_senales():
+    """Conecta los receptores de señales de Celery (llamado desde `BlogConfig.ready`)."""
+    before_task_publish.connect(_al_publicar, dispatch_uid='task_metrics_publicacion')
+    task_prerun.connect(_al_empezar, dispatch_uid='task_metrics_inicio')
+    task_retry.connect(_al_reintentar, dispatch_uid='task_metrics_reintento')
+    task_failure.connect(_al_fallar, dispatch_uid='task_metrics_fallo')
+    task_postrun.connect(_al_terminar, dispatch_uid='task_metrics_fin')
@@ -6,34 +6,48 @@ para mantener la integridad y limpieza de los datos.
 """
 
 from celery import shared_task
+from celery.exceptions import SoftTimeLimitExceeded
 from django.utils import timezone
 from django.db.models import Q
 import logging
 
+from blog.routers import leer_de_replica
+
 logger = logging.getLogger(__name__)
 
+# Filas por DELETE en las limpiezas: transacciones cortas que no bloquean
+# la tabla y avance parcial si se alcanza el límite de tiempo
+TAMANO_LOTE = 500
+
 
-@shared_task
+@shared_task(soft_time_limit=120, time_limit=150)
 def eliminar_ofertas_expiradas():
     """
     Tarea programada para eliminar ofertas de empleo expiradas.
     
     Esta tarea se ejecuta periódicamente para limpiar la base de datos
-    de ofertas que ya han superado su fecha de expiración.
+    de ofertas que ya han superado su fecha de expiración. Se eliminan en
+    lotes de `TAMANO_LOTE`; si se alcanza el límite de tiempo, la próxima
+    ejecución continúa con las restantes.
     
     Returns:
         dict: Resultado de la operación con el número de ofertas eliminadas
     """
     from blog.Models.OfertasEmpleoModel import OfertasEmpleo
     
+    count = 0
     try:
         ahora = timezone.now()
         ofertas_expiradas = OfertasEmpleo.objects.filter(fecha_expiracion__lt=ahora)
-        count = ofertas_expiradas.count()
+        while True:
+            lote = list(ofertas_expiradas.order_by('pk').values_list('pk', flat=True)[:TAMANO_LOTE])
+            if not lote:
+                break
+            OfertasEmpleo.objects.filter(pk__in=lote).delete()
+            count += len(lote)
         
         if count > 0:
-            ofertas_expiradas.delete()
-            logger.info(f"Eliminadas {count} ofertas de empleo expiradas")
+            logger.info("Eliminadas %s ofertas de empleo expiradas", count)
             return {
                 'status': 'success',
                 'eliminadas': count,
@@ -47,15 +61,23 @@ def eliminar_ofertas_expiradas():
                 'mensaje': 'No hay ofertas expiradas'
             }
             
+    except SoftTimeLimitExceeded:
+        logger.warning("Límite de tiempo al eliminar ofertas expiradas (%s eliminadas)", count)
+        return {
+            'status': 'partial',
+            'eliminadas': count,
+            'mensaje': f'Se eliminaron {count} ofertas expiradas antes del límite de tiempo'
+        }
+
     except Exception as e:
-        logger.error(f"Error al eliminar ofertas expiradas: {str(e)}")
+        logger.error("Error al eliminar ofertas expiradas: %s", e)
         return {
             'status': 'error',
             'mensaje': f'Error: {str(e)}'
         }
 
 
-@shared_task
+@shared_task(soft_time_limit=60, time_limit=90)
 def generar_reporte_estadisticas():
     """
     Tarea para generar un reporte de estadísticas del sistema.
@@ -76,30 +98,32 @@ def generar_reporte_estadisticas():
         
         ahora = timezone.now()
         
-        estadisticas = {
-            'fecha_reporte': ahora.isoformat(),
-            'conferencias': {
-                'total': Conferencias.objects.count(),
-                'proximas': Conferencias.objects.filter(fecha_conferencia__gte=ahora).count()
-            },
-            'integrantes': {
-                'total': Integrantes.objects.count(),
-                'activos': Integrantes.objects.filter(estado=True).count()
-            },
-            'ofertas_empleo': {
-                'total': OfertasEmpleo.objects.count(),
-                'vigentes': OfertasEmpleo.objects.filter(fecha_expiracion__gte=ahora).count()
-            },
-            'noticias': {
-                'total': Noticias.objects.count()
-            },
-            'cursos': {
-                'total': Cursos.objects.count()
-            },
-            'proyectos': {
-                'total': Proyectos.objects.count()
+        # Solo lecturas: se atienden desde una réplica si hay configuradas
+        with leer_de_replica():
+            estadisticas = {
+                'fecha_reporte': ahora.isoformat(),
+                'conferencias': {
+                    'total': Conferencias.objects.count(),
+                    'proximas': Conferencias.objects.filter(fecha_conferencia__gte=ahora).count()
+                },
+                'integrantes': {
+                    'total': Integrantes.objects.count(),
+                    'activos': Integrantes.objects.filter(estado=True).count()
+                },
+                'ofertas_empleo': {
+                    'total': OfertasEmpleo.objects.count(),
+                    'vigentes': OfertasEmpleo.objects.filter(fecha_expiracion__gte=ahora).count()
+                },
+                'noticias': {
+                    'total': Noticias.objects.count()
+                },
+                'cursos': {
+                    'total': Cursos.objects.count()
+                },
+                'proyectos': {
+                    'total': Proyectos.objects.count()
+                }
             }
-        }
         
         logger.info("Reporte de estadísticas generado exitosamente")
         return {
@@ -108,61 +132,114 @@ def generar_reporte_estadisticas():
         }
         
     except Exception as e:
-        logger.error(f"Error al generar reporte de estadísticas: {str(e)}")
+        logger.error("Error al generar reporte de estadísticas: %s", e)
         return {
             'status': 'error',
             'mensaje': f'Error: {str(e)}'
         }
 
 
-@shared_task
+@shared_task(soft_time_limit=300, time_limit=360)
 def limpiar_logs_antiguos(dias=30):
     """
     Tarea para limpiar logs antiguos del sistema.
     
+    Aplica `blog.log_lifecycle.gestionar_logs`: elimina los archivos con
+    más de `dias` días, comprime las copias rotadas por los handlers de
+    `LOGGING` y recorta el histórico a `LOG_RETENTION_MAX_BYTES`.
+    
     Args:
         dias (int): Número de días de antigüedad para eliminar logs
         
     Returns:
-        dict: Resultado de la operación de limpieza
+        dict: Resultado de la operación de limpieza con los bytes recuperados
     """
     try:
-        import os
-        from datetime import timedelta
-        from django.conf import settings
-        
-        fecha_limite = timezone.now() - timedelta(days=dias)
-        logs_dir = os.path.join(settings.BASE_DIR, 'logs')
-        
-        if not os.path.exists(logs_dir):
-            return {
-                'status': 'success',
-                'mensaje': 'Directorio de logs no existe'
-            }
+        from blog.log_lifecycle import gestionar_logs
         
-        archivos_eliminados = 0
-        for archivo in os.listdir(logs_dir):
-            ruta_archivo = os.path.join(logs_dir, archivo)
-            if os.path.isfile(ruta_archivo):
-                fecha_modificacion = timezone.datetime.fromtimestamp(
-                    os.path.getmtime(ruta_archivo),
-                    tz=timezone.get_current_timezone()
-                )
-                
-                if fecha_modificacion < fecha_limite:
-                    os.remove(ruta_archivo)
-                    archivos_eliminados += 1
-        
-        logger.info(f"Eliminados {archivos_eliminados} archivos de log antiguos")
+        resumen = gestionar_logs(dias=dias)
+        recuperados = sum(resumen['bytes_recuperados'].values())
         return {
             'status': 'success',
-            'archivos_eliminados': archivos_eliminados,
-            'mensaje': f'Se eliminaron {archivos_eliminados} archivos de log'
+            **resumen,
+            'mensaje': (
+                f"Se eliminaron {resumen['archivos_eliminados']} y comprimieron "
+                f"{resumen['archivos_comprimidos']} archivos de log ({recuperados} bytes recuperados)"
+            )
         }
         
     except Exception as e:
-        logger.error(f"Error al limpiar logs antiguos: {str(e)}")
+        logger.error("Error al limpiar logs antiguos: %s", e)
+        return {
+            'status': 'error',
+            'mensaje': f'Error: {str(e)}'
+        }
+
+
+@shared_task(soft_time_limit=120, time_limit=150)
+def limpiar_sesiones_expiradas():
+    """
+    Tarea para eliminar las sesiones expiradas de la base de datos.
+
+    Con SESSION_SAVE_EVERY_REQUEST desactivado las sesiones abandonadas
+    no se sobrescriben, así que se eliminan periódicamente. Los motores
+    basados solo en caché expiran por sí mismos.
+
+    Returns:
+        dict: Resultado de la operación de limpieza
+    """
+    try:
+        from importlib import import_module
+        from django.conf import settings
+        from django.contrib.sessions.models import Session
+
+        antes = Session.objects.count()
+        import_module(settings.SESSION_ENGINE).SessionStore.clear_expired()
+        eliminadas = antes - Session.objects.count()
+
+        logger.info("Eliminadas %s sesiones expiradas", eliminadas)
+        return {
+            'status': 'success',
+            'sesiones_eliminadas': eliminadas,
+            'mensaje': f'Se eliminaron {eliminadas} sesiones expiradas'
+        }
+
+    except Exception as e:
+        logger.error("Error al limpiar sesiones expiradas: %s", e)
         return {
             'status': 'error',
             'mensaje': f'Error: {str(e)}'
-        }
\ No newline at end of file
+        }
+
+
+@shared_task(bind=True, max_retries=3, default_retry_delay=30, soft_time_limit=60, time_limit=90)
+def finalizar_subida_imagen(self, subida_id):
+    """
+    Tarea para subir una imagen diferida y asignarla a su registro.
+
+    Encolada por `blog.subidas.diferir_subida` tras el commit de la
+    escritura. Los errores de subida se reintentan con espera creciente;
+    agotados los reintentos (o sin broker) la subida queda en estado de error.
+
+    Args:
+        subida_id (int): Identificador de la `SubidaImagen`
+
+    Returns:
+        dict: Resultado con el estado final de la subida
+    """
+    from blog.subidas import finalizar_subida, registrar_error
+
+    try:
+        return finalizar_subida(subida_id)
+
+    except Exception as e:
+        # Sin broker (CELERY_TASK_ALWAYS_EAGER) se ejecuta dentro de la petición: sin reintentos
+        if not self.request.is_eager and self.request.retries < self.max_retries:
+            logger.warning("Error al subir la imagen %s, reintentando: %s", subida_id, e)
+            raise self.retry(exc=e, countdown=self.default_retry_delay * 2 ** self.request.retries)
+        logger.error("Error al subir la imagen %s: %s", subida_id, e)
+        registrar_error(subida_id, e)
+        return {
+            'status': 'error',
+            'mensaje': f'Error: {str(e)}'
+        }
@@ -0,0 +1,53 @@
+"""
+Extracción de tecnologías mencionadas en las descripciones de proyectos.
+
+Las palabras clave (`TECNOLOGIAS_PROYECTOS`) se compilan en una única
+expresión regular de alternancia, de modo que cada descripción se recorre
+una sola vez sin importar cuántas tecnologías haya configuradas. Las
+etiquetas se calculan al guardar el proyecto (`Proyectos.save`) y se
+guardan en `TecnologiaProyecto`, así que las consultas de popularidad son
+un GROUP BY sobre una tabla indexada.
+"""
+
+import re
+from functools import lru_cache
+
+from django.conf import settings
+
+
+def palabras_clave():
+    """
+    Tecnologías configuradas, normalizadas a minúsculas.
+
+    Returns:
+        tuple: Palabras clave ordenadas y sin duplicados
+    """
+    return tuple(sorted({
+        palabra.strip().lower()
+        for palabra in settings.TECNOLOGIAS_PROYECTOS
+        if palabra.strip()
+    }))
+
+
+@lru_cache(maxsize=8)
+def _patron(palabras):
+    # Las más largas primero para que 'javascript' gane a 'java' y
+    # 'node.js' a 'node'. Los límites aceptan palabras con '.', '+' o '#'
+    alternativas = '|'.join(re.escape(palabra) for palabra in sorted(palabras, key=len, reverse=True))
+    return re.compile(rf'(?<![\w.+#-])(?:{alternativas})(?![\w+#])', re.IGNORECASE)
+
+
+def extraer_tecnologias(texto):
+    """
+    Obtiene las tecnologías configuradas que aparecen en un texto.
+
+    Args:
+        texto (str): Descripción del proyecto
+
+    Returns:
+        set: Tecnologías encontradas, en minúsculas
+    """
+    palabras = palabras_clave()
+    if not texto or not palabras:
+        return set()
+    return {coincidencia.lower() for coincidencia in _patron(palabras).findall(texto)}
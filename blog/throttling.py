@@ -0,0 +1,154 @@
+"""
+Throttling de la API con ventanas deslizantes atómicas.
+
+Sustituye a `AnonRateThrottle`/`UserRateThrottle` de DRF, que guardan en
+la caché la lista de marcas de tiempo de cada cliente: leer, filtrar,
+añadir y volver a escribir la lista en cada petición es O(n) en peticiones
+por ventana y, con varios workers, dos peticiones simultáneas se pisan la
+escritura. Aquí cada petición es una única operación atómica sobre dos
+contadores (ver `blog.ratelimit.VentanaDeslizante`).
+
+Los límites son por endpoint: los ViewSets declaran `throttle_scope` y cada
+scope tiene sus propios contadores. La tasa se busca en
+`DEFAULT_THROTTLE_RATES` como `<scope>.<anon|user>`, luego `<scope>` y por
+último `anon`/`user`.
+
+Cada petición consume unidades según su coste: `throttle_cost` del ViewSet
+para sus endpoints (listado, detalle, escrituras) y `@action(...,
+throttle_cost=N)` para acciones costosas como estadísticas o limpiezas. Una
+búsqueda (`?search=`) sobre un listado cuesta `THROTTLE_SEARCH_COST`. Así las
+tasas son presupuestos en unidades: las lecturas baratas siguen siendo
+generosas y los endpoints que cargan la base de datos se agotan antes.
+
+El resultado se expone en las cabeceras `RateLimit-Limit`,
+`RateLimit-Remaining`, `RateLimit-Reset` y `RateLimit-Policy`
+(añadidas por `RateLimitHeadersMiddleware`).
+"""
+
+from django.conf import settings
+from rest_framework.settings import api_settings
+from rest_framework.throttling import BaseThrottle
+
+from blog.ratelimit import VentanaDeslizante, parse_tasa
+
+ATRIBUTO_REQUEST = 'ratelimit'
+# Resultados ya contados en la petición, por throttle y scope
+ATRIBUTO_COBRADO = '_ratelimit_cobrado'
+
+
+def publicar_resultado(request, resultado, ventana):
+    """
+    Guarda en la petición el límite más restrictivo para las cabeceras.
+
+    Args:
+        request: Request de DRF
+        resultado (ResultadoVentana): Resultado del throttle
+        ventana (int): Duración de la ventana en segundos
+    """
+    peticion = getattr(request, '_request', request)
+    anterior = getattr(peticion, ATRIBUTO_REQUEST, None)
+    if anterior is None or resultado.restantes < anterior[0].restantes:
+        setattr(peticion, ATRIBUTO_REQUEST, (resultado, ventana))
+
+
+class SlidingWindowThrottle(BaseThrottle):
+    """
+    Throttle base de ventana deslizante.
+
+    Attributes:
+        scope (str): Tasa por defecto ('anon' o 'user')
+    """
+
+    scope = None
+
+    def __init__(self):
+        self.resultado = None
+
+    def identidad(self, request):
+        """Identificador del cliente, o None si este throttle no aplica."""
+        raise NotImplementedError('.identidad() debe implementarse')
+
+    def tasa(self, endpoint):
+        """
+        Busca la tasa del endpoint para este tipo de cliente.
+
+        Args:
+            endpoint (str): `throttle_scope` de la vista (o None)
+
+        Returns:
+            str: Tasa como '100/hour', o None si no hay límite
+        """
+        tasas = api_settings.DEFAULT_THROTTLE_RATES
+        if endpoint:
+            for clave in (f'{endpoint}.{self.scope}', endpoint):
+                if clave in tasas:
+                    return tasas[clave]
+        return tasas.get(self.scope)
+
+    def coste(self, request, view):
+        """
+        Unidades que consume la petición.
+
+        Args:
+            request: Request de DRF
+            view: Vista que atiende la petición
+
+        Returns:
+            int: Coste declarado por la acción o el ViewSet (1 por defecto)
+        """
+        coste = getattr(view, 'throttle_cost', None) or 1
+        if getattr(view, 'action', None) == 'list' and request.query_params.get(api_settings.SEARCH_PARAM):
+            coste = max(coste, getattr(settings, 'THROTTLE_SEARCH_COST', 1))
+        return coste
+
+    def allow_request(self, request, view):
+        identidad = self.identidad(request)
+        if identidad is None:
+            return True
+
+        endpoint = getattr(view, 'throttle_scope', None)
+        tasa = self.tasa(endpoint)
+        if tasa is None:
+            return True
+
+        # Una petición se cobra una sola vez aunque la vista se ejecute de nuevo
+        # (p. ej. AsyncReadOnlyView delegando al ViewSet síncrono tras `initial`)
+        peticion = getattr(request, '_request', request)
+        cobrados = peticion.__dict__.setdefault(ATRIBUTO_COBRADO, {})
+        clave = (self.scope, endpoint)
+        if clave in cobrados:
+            self.resultado = cobrados[clave]
+            return self.resultado.permitido
+
+        limite, ventana = parse_tasa(tasa)
+        contador = VentanaDeslizante(f'throttle:{endpoint or "global"}:{self.scope}', limite, ventana)
+        self.resultado = cobrados[clave] = contador.contar(identidad, coste=self.coste(request, view))
+        publicar_resultado(request, self.resultado, ventana)
+        return self.resultado.permitido
+
+    def wait(self):
+        if self.resultado is None:
+            return None
+        return self.resultado.espera
+
+
+class AnonSlidingWindowThrottle(SlidingWindowThrottle):
+    """Limita a los usuarios anónimos por IP."""
+
+    scope = 'anon'
+
+    def identidad(self, request):
+        if request.user and request.user.is_authenticated:
+            return None
+        return self.get_ident(request)
+
+
+class UserSlidingWindowThrottle(SlidingWindowThrottle):
+    """Limita a los usuarios autenticados por id."""
+
+    scope = 'user'
+
+    def identidad(self, request):
+        if request.user and request.user.is_authenticated:
+            return str(request.user.pk)
+        return None
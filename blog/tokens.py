@@ -0,0 +1,169 @@
+"""
+Tokens firmados sin estado para el frontend.
+
+Alternativa a la sesión de Django: el login emite un token de acceso de
+vida corta y un token de refresco, ambos firmados con `SECRET_KEY` mediante
+`django.core.signing`. El token de acceso lleva los datos de
+`UserSerializer`, así que se verifica y se reconstruye el usuario sin
+consultar la base de datos.
+
+La revocación usa una lista de denegación compacta en caché: solo se
+guarda el `jti` del token revocado hasta que expira por sí mismo. El
+refresco sí consulta la base de datos para comprobar que el usuario sigue
+activo y que su contraseña no cambió desde que se emitió el token.
+"""
+
+import time
+import uuid
+
+from django.conf import settings
+from django.contrib.auth.models import User
+from django.core import signing
+from django.core.cache import cache
+from django.utils.dateparse import parse_datetime
+
+from blog.Serializers.AuthSerializer import UserSerializer
+
+ACCESO = 'access'
+REFRESCO = 'refresh'
+
+_SALES = {
+    ACCESO: 'blog.tokens.acceso',
+    REFRESCO: 'blog.tokens.refresco',
+}
+
+# Campos de UserSerializer que se copian al usuario reconstruido
+_CAMPOS_USUARIO = ('id', 'username', 'email', 'first_name', 'last_name', 'is_staff', 'is_superuser')
+
+
+class TokenInvalido(Exception):
+    """El token no es válido, expiró o fue revocado."""
+
+
+def _ttl(tipo):
+    if tipo == ACCESO:
+        return settings.SIGNED_TOKEN_ACCESS_TTL
+    return settings.SIGNED_TOKEN_REFRESH_TTL
+
+
+def _huella_contrasena(usuario):
+    # Cambia al cambiar la contraseña, igual que el hash de sesión de Django
+    return usuario.get_session_auth_hash()[:16]
+
+
+def _firmar(usuario, tipo, **claims):
+    ttl = _ttl(tipo)
+    payload = {
+        'jti': uuid.uuid4().hex,
+        'uid': usuario.pk,
+        'exp': int(time.time()) + ttl,
+        **claims,
+    }
+    return signing.dumps(payload, salt=_SALES[tipo], compress=True)
+
+
+def emitir_tokens(usuario):
+    """
+    Emite un par de tokens de acceso y refresco.
+
+    Args:
+        usuario (User): Usuario autenticado
+
+    Returns:
+        dict: access, refresh, token_type, expires_in y datos del usuario
+    """
+    datos_usuario = UserSerializer(usuario).data
+    return {
+        'access': _firmar(usuario, ACCESO, usr=datos_usuario),
+        'refresh': _firmar(usuario, REFRESCO, pwd=_huella_contrasena(usuario)),
+        'token_type': 'Bearer',
+        'expires_in': settings.SIGNED_TOKEN_ACCESS_TTL,
+        'user': datos_usuario,
+    }
+
+
+def _clave_revocado(jti):
+    return f'auth:revocado:{jti}'
+
+
+def verificar_token(token, tipo=ACCESO):
+    """
+    Verifica firma, expiración y revocación de un token.
+
+    Args:
+        token (str): Token firmado
+        tipo (str): 'access' o 'refresh'
+
+    Returns:
+        dict: Claims del token
+
+    Raises:
+        TokenInvalido: Si el token no es válido, expiró o fue revocado
+    """
+    try:
+        payload = signing.loads(token, salt=_SALES[tipo], max_age=_ttl(tipo))
+    except signing.SignatureExpired:
+        raise TokenInvalido('El token ha expirado.')
+    except signing.BadSignature:
+        raise TokenInvalido('Token inválido.')
+
+    if cache.get(_clave_revocado(payload['jti'])) is not None:
+        raise TokenInvalido('El token fue revocado.')
+    return payload
+
+
+def revocar_token(payload):
+    """
+    Añade un token a la lista de denegación hasta su expiración.
+
+    Args:
+        payload (dict): Claims de un token ya verificado
+    """
+    restante = payload['exp'] - int(time.time())
+    if restante > 0:
+        cache.set(_clave_revocado(payload['jti']), 1, timeout=restante)
+
+
+def refrescar_tokens(token_refresco):
+    """
+    Emite un nuevo par de tokens y revoca el token de refresco usado.
+
+    Args:
+        token_refresco (str): Token de refresco vigente
+
+    Returns:
+        dict: Nuevo par de tokens (ver `emitir_tokens`)
+
+    Raises:
+        TokenInvalido: Si el token no es válido, el usuario ya no está
+            activo o su contraseña cambió
+    """
+    payload = verificar_token(token_refresco, REFRESCO)
+    usuario = User.objects.filter(pk=payload['uid'], is_active=True).first()
+    if usuario is None or payload.get('pwd') != _huella_contrasena(usuario):
+        raise TokenInvalido('El usuario ya no puede autenticarse.')
+
+    # Rotación: cada token de refresco solo se puede usar una vez
+    revocar_token(payload)
+    return emitir_tokens(usuario)
+
+
+def usuario_desde_claims(claims):
+    """
+    Reconstruye el usuario a partir de los claims del token de acceso.
+
+    El objeto no se carga de la base de datos: tiene `pk` para relaciones
+    (p. ej. `creador=request.user`) y los atributos que usan los permisos.
+
+    Args:
+        claims (dict): Datos de `UserSerializer` incluidos en el token
+
+    Returns:
+        User: Usuario activo no consultado de la base de datos
+    """
+    usuario = User(is_active=True, **{campo: claims.get(campo) for campo in _CAMPOS_USUARIO})
+    if claims.get('date_joined'):
+        usuario.date_joined = parse_datetime(claims['date_joined'])
+    usuario._state.adding = False
+    usuario._state.db = 'default'
+    return usuario
@@ -1,3 +1,4 @@
+from django.conf import settings
 from django.urls import path, include
 from rest_framework import routers
 from drf_yasg.views import get_schema_view
@@ -10,7 +11,12 @@ from blog.Views.IntegrantesView import IntegrantesViewSet
 from blog.Views.NoticiasView import NoticiasViewSet
 from blog.Views.OfertasEmpleoView import OfertasEmpleoViewSet
 from blog.Views.ProyectosView import ProyectosViewSet
-from blog.Views.AuthView import login_view, logout_view, profile_view, auth_status_view
+from blog.Views.AuthView import (
+    login_view, logout_view, profile_view, auth_status_view,
+    token_obtain_view, token_refresh_view, token_revoke_view,
+)
+from blog.Views.AsyncReadView import rutas_asincronas
+from blog.Views.MetricsView import db_metrics_view, tasks_metrics_view, workers_metrics_view
 
 router = routers.DefaultRouter()
 router.register(r'auditlog', AuditLogViewSet)
@@ -38,6 +44,29 @@ urlpatterns = [
     path('auth/logout/', logout_view, name='auth-logout'), 
     path('auth/profile/', profile_view, name='auth-profile'),
     path('auth/status/', auth_status_view, name='auth-status'),
+    path('auth/token/', token_obtain_view, name='auth-token'),
+    path('auth/token/refresh/', token_refresh_view, name='auth-token-refresh'),
+    path('auth/token/revoke/', token_revoke_view, name='auth-token-revoke'),
+    # Métricas operativas (solo staff)
+    path('metrics/workers/', workers_metrics_view, name='metrics-workers'),
+    path('metrics/db/', db_metrics_view, name='metrics-db'),
+    path('metrics/tasks/', tasks_metrics_view, name='metrics-tasks'),
     # Documentación
     path('docs/', schema_view.with_ui('swagger', cache_timeout=0), name='schema-swagger-ui'),
-]
\ No newline at end of file
+]
+
+# Modo ASGI: lecturas públicas atendidas con el ORM asíncrono.
+# Se registran antes que el router para que tengan prioridad.
+if settings.ASYNC_API_ENABLED:
+    recursos_asincronos = [
+        ('conferencias', ConferenciasViewSet, ['estadisticas']),
+        ('cursos', CursosViewSet, []),
+        ('integrantes', IntegrantesViewSet, ['por_semestre']),
+        ('noticias', NoticiasViewSet, []),
+        ('ofertasempleo', OfertasEmpleoViewSet, ['estadisticas']),
+        ('proyectos', ProyectosViewSet, []),
+    ]
+    rutas = []
+    for prefijo, viewset, acciones in recursos_asincronos:
+        rutas += rutas_asincronas(prefijo, viewset, router.get_default_basename(viewset), acciones)
+    urlpatterns.insert(0, path('hl4/v1/', include(rutas)))
\ No newline at end of file
@@ -18,4 +18,8 @@ python manage.py collectstatic --no-input
 echo "🗄️ Ejecutando migraciones de base de datos..."
 python manage.py migrate
 
+# Rellenar el índice de tecnologías de proyectos existentes
+echo "🏷️ Indexando tecnologías de proyectos..."
+python manage.py reindexar_tecnologias
+
 echo "✅ Construcción completada exitosamente!"
@@ -0,0 +1,112 @@
+"""
+Configuración de gunicorn para Railway y Render.
+
+gunicorn carga este archivo automáticamente desde el directorio de trabajo.
+Workers e hilos se calculan a partir de los núcleos y la memoria realmente
+asignados al contenedor (ver `mysite/runtime.py`); los valores pasados por
+línea de comandos tienen prioridad sobre los de este archivo.
+
+Variables de entorno:
+    PORT: Puerto de escucha (default: 8000)
+    WEB_CONCURRENCY / GUNICORN_WORKERS: Número de workers
+    GUNICORN_THREADS: Hilos por worker
+    GUNICORN_WORKER_CLASS: Clase de worker (default: gthread si hay hilos)
+    GUNICORN_WORKER_MEMORY_MB: Memoria estimada por worker para el cálculo
+    GUNICORN_PRELOAD: Cargar la aplicación antes de hacer fork (default: True)
+    GUNICORN_MAX_REQUESTS / GUNICORN_MAX_REQUESTS_JITTER: Reciclado de workers
+    GUNICORN_TIMEOUT: Segundos antes de reiniciar un worker bloqueado
+    GUNICORN_STATS_DIR: Directorio de estadísticas por worker
+    STATSD_HOST / STATSD_PREFIX: Exportar métricas de gunicorn a StatsD
+"""
+
+import os
+import time
+
+from mysite.runtime import EstadisticasWorker, configuracion_gunicorn, directorio_estadisticas
+
+_recursos = configuracion_gunicorn()
+
+bind = f"0.0.0.0:{os.getenv('PORT', '8000')}"
+workers = _recursos['workers']
+threads = _recursos['threads']
+worker_class = os.getenv('GUNICORN_WORKER_CLASS') or ('gthread' if threads > 1 else 'sync')
+
+# Importar Django una sola vez en el maestro: arranque más rápido de los
+# workers y memoria compartida por copy-on-write.
+preload_app = os.getenv('GUNICORN_PRELOAD', 'True').lower() == 'true'
+
+# Reciclar workers de forma escalonada para contener fugas de memoria
+# sin que todos se reinicien a la vez.
+max_requests = int(os.getenv('GUNICORN_MAX_REQUESTS', '1000'))
+max_requests_jitter = int(os.getenv('GUNICORN_MAX_REQUESTS_JITTER', str(max(1, max_requests // 10))))
+
+timeout = int(os.getenv('GUNICORN_TIMEOUT', '30'))
+graceful_timeout = 30
+keepalive = 5
+
+# El latido de los workers en disco puede bloquearse en volúmenes lentos
+if os.path.isdir('/dev/shm'):
+    worker_tmp_dir = '/dev/shm'
+
+if os.getenv('STATSD_HOST'):
+    statsd_host = os.getenv('STATSD_HOST')
+    statsd_prefix = os.getenv('STATSD_PREFIX', 'djangorail')
+
+_estadisticas = None
+# Conexiones heredadas del maestro que el worker no debe cerrar (ver post_fork)
+_conexiones_heredadas = []
+
+
+def on_starting(server):
+    server.log.info(
+        "Recursos detectados: %s CPUs, %s MB -> %s workers x %s hilos (%s)",
+        _recursos['cpus'], _recursos['memoria_mb'], server.cfg.workers, server.cfg.threads,
+        server.cfg.worker_class_str,
+    )
+
+
+def pre_fork(server, worker):
+    # Las conexiones abiertas en el maestro durante la precarga se cierran
+    # aquí, antes de que los workers hereden su socket.
+    if preload_app:
+        from django.db import connections
+        connections.close_all()
+
+
+def post_fork(server, worker):
+    global _estadisticas
+    # Si aun así un worker hereda una conexión, se suelta sin cerrarla:
+    # cerrarla enviaría el Terminate de PostgreSQL por el socket que comparte
+    # con el maestro y los demás workers. La referencia se conserva para que
+    # el recolector tampoco la cierre; cada worker abre las suyas.
+    if preload_app:
+        from django.db import connections
+        for conexion in connections.all(initialized_only=True):
+            if conexion.connection is not None:
+                _conexiones_heredadas.append(conexion.connection)
+                conexion.connection = None
+    from blog import db_metrics
+    db_metrics.reiniciar()
+
+    _estadisticas = EstadisticasWorker(worker.pid, directorio_estadisticas())
+    _estadisticas.fuentes['db'] = db_metrics.resumen
+    _estadisticas.iniciar()
+
+
+def pre_request(worker, req):
+    req.inicio_peticion = time.monotonic()
+
+
+def post_request(worker, req, environ, resp):
+    if _estadisticas is not None and hasattr(req, 'inicio_peticion'):
+        _estadisticas.registrar(time.monotonic() - req.inicio_peticion, resp.status_code or 0)
+
+
+def worker_exit(server, worker):
+    if _estadisticas is not None:
+        _estadisticas.eliminar()
+
+
+def child_exit(server, worker):
+    # Se ejecuta en el maestro: limpia también workers terminados abruptamente
+    EstadisticasWorker(worker.pid, directorio_estadisticas()).eliminar()
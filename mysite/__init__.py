@@ -0,0 +1,4 @@
+# Carga la aplicación de Celery con Django para que @shared_task use su configuración
+from .celery import app as celery_app
+
+__all__ = ('celery_app',)
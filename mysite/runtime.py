@@ -0,0 +1,393 @@
+"""
+Detección de recursos del contenedor y dimensionamiento de gunicorn.
+
+Railway y Render ejecutan la aplicación dentro de contenedores limitados
+por cgroups, donde `os.cpu_count()` devuelve los núcleos del host y no
+los asignados. Este módulo lee los límites reales (afinidad de CPU,
+cuota de cgroup v1/v2 y límite de memoria) para calcular cuántos workers
+e hilos caben sin agotar la memoria, y permite sobrescribir cada valor
+con variables de entorno. Con los mismos datos dimensiona las conexiones
+a PostgreSQL (persistentes, pool de psycopg o PgBouncer).
+
+También mantiene las estadísticas por worker: cada proceso escribe un
+archivo JSON en un directorio compartido que luego se agrega en el
+endpoint de métricas. No importa Django para poder usarse desde
+`gunicorn.conf.py` antes de cargar la aplicación.
+"""
+
+import json
+import math
+import os
+import resource
+import tempfile
+import threading
+import time
+
+# Memoria residente aproximada de un worker de esta aplicación
+# (Django + DRF + drf_yasg + cloudinary) tras atender tráfico normal.
+MEMORIA_POR_WORKER_MB = 160
+
+# Memoria que se deja libre para el proceso maestro y picos puntuales
+MEMORIA_RESERVADA_MB = 128
+
+
+def _leer(ruta):
+    try:
+        with open(ruta, encoding='utf-8') as archivo:
+            return archivo.read().strip()
+    except OSError:
+        return None
+
+
+def _entero_entorno(nombre, defecto=None):
+    valor = os.getenv(nombre)
+    if valor in (None, ''):
+        return defecto
+    try:
+        return int(valor)
+    except ValueError:
+        return defecto
+
+
+def cpus_disponibles():
+    """
+    Núcleos que el proceso puede usar realmente.
+
+    Toma el mínimo entre la afinidad de CPU y la cuota de cgroup
+    (v2 `cpu.max` o v1 `cpu.cfs_quota_us`/`cpu.cfs_period_us`).
+
+    Returns:
+        int: Número de núcleos (al menos 1)
+    """
+    try:
+        cpus = len(os.sched_getaffinity(0))
+    except (AttributeError, OSError):
+        cpus = os.cpu_count() or 1
+
+    cuota = None
+    cpu_max = _leer('/sys/fs/cgroup/cpu.max')
+    if cpu_max:
+        limite, _, periodo = cpu_max.partition(' ')
+        if limite != 'max' and periodo:
+            cuota = int(limite) / int(periodo)
+    else:
+        limite = _leer('/sys/fs/cgroup/cpu/cpu.cfs_quota_us')
+        periodo = _leer('/sys/fs/cgroup/cpu/cpu.cfs_period_us')
+        if limite and periodo and int(limite) > 0:
+            cuota = int(limite) / int(periodo)
+
+    if cuota:
+        cpus = min(cpus, max(1, math.ceil(cuota)))
+    return max(1, cpus)
+
+
+def memoria_disponible_mb():
+    """
+    Memoria asignada al contenedor en MB.
+
+    Usa el límite de cgroup (v2 `memory.max` o v1 `memory.limit_in_bytes`)
+    y, si no hay límite, la memoria física del equipo.
+
+    Returns:
+        int | None: Memoria en MB, o None si no se puede determinar
+    """
+    fisica = None
+    try:
+        fisica = os.sysconf('SC_PHYS_PAGES') * os.sysconf('SC_PAGE_SIZE')
+    except (AttributeError, ValueError, OSError):
+        pass
+
+    limite = _leer('/sys/fs/cgroup/memory.max') or _leer('/sys/fs/cgroup/memory/memory.limit_in_bytes')
+    if limite and limite.isdigit():
+        limite = int(limite)
+        # cgroup v1 usa un valor enorme para "sin límite"
+        if fisica is None or limite < fisica:
+            fisica = limite
+
+    return fisica // (1024 * 1024) if fisica else None
+
+
+def calcular_workers(cpus, memoria_mb, memoria_por_worker_mb=MEMORIA_POR_WORKER_MB):
+    """
+    Calcula el número de workers: `2 * núcleos + 1` acotado por la memoria.
+
+    Args:
+        cpus (int): Núcleos disponibles
+        memoria_mb (int | None): Memoria disponible en MB
+        memoria_por_worker_mb (int): Memoria estimada por worker
+
+    Returns:
+        int: Número de workers (al menos 1)
+    """
+    workers = 2 * cpus + 1
+    if memoria_mb:
+        caben = (memoria_mb - MEMORIA_RESERVADA_MB) // max(1, memoria_por_worker_mb)
+        workers = min(workers, caben)
+    return max(1, workers)
+
+
+def calcular_hilos(cpus, workers):
+    """
+    Calcula los hilos por worker.
+
+    Las peticiones pasan la mayor parte del tiempo esperando a PostgreSQL
+    y Cloudinary, así que se reparten hilos hasta cubrir unas 4 peticiones
+    concurrentes por núcleo; si la memoria recortó los workers, los hilos
+    compensan la concurrencia perdida.
+
+    Args:
+        cpus (int): Núcleos disponibles
+        workers (int): Workers calculados
+
+    Returns:
+        int: Hilos por worker (entre 2 y 8)
+    """
+    return max(2, min(8, math.ceil(4 * cpus / workers)))
+
+
+def configuracion_gunicorn():
+    """
+    Dimensionamiento final de gunicorn, con sobrescrituras por entorno.
+
+    Variables:
+        WEB_CONCURRENCY / GUNICORN_WORKERS: Número de workers
+        GUNICORN_THREADS: Hilos por worker
+        GUNICORN_WORKER_MEMORY_MB: Memoria estimada por worker
+
+    Returns:
+        dict: cpus, memoria_mb, workers y threads
+    """
+    cpus = cpus_disponibles()
+    memoria = memoria_disponible_mb()
+    por_worker = _entero_entorno('GUNICORN_WORKER_MEMORY_MB', MEMORIA_POR_WORKER_MB)
+
+    workers = _entero_entorno('GUNICORN_WORKERS', _entero_entorno('WEB_CONCURRENCY'))
+    if not workers:
+        workers = calcular_workers(cpus, memoria, por_worker)
+    threads = _entero_entorno('GUNICORN_THREADS') or calcular_hilos(cpus, workers)
+
+    return {
+        'cpus': cpus,
+        'memoria_mb': memoria,
+        'workers': workers,
+        'threads': threads,
+    }
+
+
+def tamano_pool_db():
+    """
+    Conexiones máximas del pool de base de datos de cada worker.
+
+    Cada hilo de un worker usa como mucho una conexión a la vez, así que
+    el pool se dimensiona con los hilos por worker. Si se conoce el
+    límite de conexiones del servidor (DB_MAX_CONNECTIONS, descontando
+    las reservadas para Celery y administración con DB_RESERVED_CONNECTIONS)
+    se reparte entre los workers.
+
+    Variables:
+        DB_POOL_MAX_SIZE: Tamaño fijo del pool por worker
+
+    Returns:
+        int: Tamaño máximo del pool (al menos 1)
+    """
+    fijo = _entero_entorno('DB_POOL_MAX_SIZE')
+    if fijo:
+        return max(1, fijo)
+
+    recursos = configuracion_gunicorn()
+    tamano = recursos['threads']
+    limite = _entero_entorno('DB_MAX_CONNECTIONS')
+    if limite:
+        disponibles = limite - _entero_entorno('DB_RESERVED_CONNECTIONS', 5)
+        tamano = min(tamano, disponibles // recursos['workers'])
+    return max(1, tamano)
+
+
+def opciones_conexion_db(modo):
+    """
+    Opciones de `DATABASES['default']` para el modo de conexión indicado.
+
+    Variables:
+        DB_CONN_MAX_AGE: Segundos de vida de una conexión persistente
+        DB_POOL_MIN_SIZE / DB_POOL_TIMEOUT / DB_POOL_MAX_IDLE: Ajustes del pool
+
+    Args:
+        modo (str): none, persistent, pool o pgbouncer
+
+    Returns:
+        dict: Claves a fusionar en la configuración de la base de datos
+    """
+    conn_max_age = _entero_entorno('DB_CONN_MAX_AGE', 600)
+    persistentes = {'CONN_MAX_AGE': conn_max_age, 'CONN_HEALTH_CHECKS': True}
+
+    if modo == 'none':
+        return {'CONN_MAX_AGE': 0}
+
+    if modo == 'pool':
+        try:
+            import psycopg  # noqa: F401
+            import psycopg_pool  # noqa: F401
+        except ImportError:
+            print("DB_POOL_MODE=pool requiere psycopg[pool]; usando conexiones persistentes")
+            return persistentes
+        return {
+            # Django no admite conexiones persistentes junto con el pool
+            'CONN_MAX_AGE': 0,
+            'OPTIONS': {
+                'sslmode': 'require',
+                'pool': {
+                    'min_size': _entero_entorno('DB_POOL_MIN_SIZE', 1),
+                    'max_size': tamano_pool_db(),
+                    'timeout': float(os.getenv('DB_POOL_TIMEOUT', '10')),
+                    'max_idle': float(os.getenv('DB_POOL_MAX_IDLE', '300')),
+                },
+            },
+        }
+
+    if modo == 'pgbouncer':
+        # En modo transacción los cursores del servidor no sobreviven
+        # entre transacciones
+        persistentes['DISABLE_SERVER_SIDE_CURSORS'] = True
+    return persistentes
+
+
+def directorio_estadisticas():
+    """
+    Directorio compartido donde cada worker publica sus estadísticas.
+
+    Returns:
+        str: Ruta (configurable con GUNICORN_STATS_DIR)
+    """
+    return os.getenv('GUNICORN_STATS_DIR') or os.path.join(tempfile.gettempdir(), 'gunicorn-stats')
+
+
+class EstadisticasWorker:
+    """
+    Contadores de un worker que se vuelcan periódicamente a disco.
+
+    Los hooks de gunicorn se ejecutan en el propio worker; con workers
+    `gthread` varios hilos registran a la vez, por eso los contadores se
+    protegen con un lock. Un hilo en segundo plano vuelca el archivo cada
+    `intervalo` segundos para no escribir en disco en cada petición.
+
+    `fuentes` permite añadir métricas de otros componentes (por ejemplo
+    las conexiones a la base de datos) como funciones sin argumentos.
+    """
+
+    def __init__(self, pid, directorio, intervalo=5.0):
+        self.pid = pid
+        self.ruta = os.path.join(directorio, f'worker-{pid}.json')
+        self.intervalo = intervalo
+        self.arranque = time.time()
+        self.peticiones = 0
+        self.errores = 0
+        self.tiempo_total = 0.0
+        self._lock = threading.Lock()
+        self._detener = threading.Event()
+        self.fuentes = {}
+        os.makedirs(directorio, exist_ok=True)
+
+    def iniciar(self):
+        """Publica el archivo y arranca el volcado periódico."""
+        self.volcar()
+        threading.Thread(target=self._volcar_periodicamente, daemon=True).start()
+
+    def _volcar_periodicamente(self):
+        while not self._detener.wait(self.intervalo):
+            try:
+                self.volcar()
+            except OSError:
+                pass
+
+    def registrar(self, duracion, estado):
+        with self._lock:
+            self.peticiones += 1
+            self.tiempo_total += duracion
+            if estado >= 500:
+                self.errores += 1
+
+    def datos(self):
+        with self._lock:
+            peticiones, errores, tiempo_total = self.peticiones, self.errores, self.tiempo_total
+        datos = {
+            'pid': self.pid,
+            'arranque': self.arranque,
+            'actualizado': time.time(),
+            'peticiones': peticiones,
+            'errores': errores,
+            'duracion_media_ms': round(tiempo_total / peticiones * 1000, 2) if peticiones else 0.0,
+            # ru_maxrss está en KB en Linux
+            'memoria_max_mb': round(resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024, 1),
+        }
+        for nombre, fuente in self.fuentes.items():
+            datos[nombre] = fuente()
+        return datos
+
+    def volcar(self):
+        temporal = f'{self.ruta}.tmp'
+        with open(temporal, 'w', encoding='utf-8') as archivo:
+            json.dump(self.datos(), archivo)
+        os.replace(temporal, self.ruta)
+
+    def eliminar(self):
+        self._detener.set()
+        try:
+            os.remove(self.ruta)
+        except OSError:
+            pass
+
+
+def _proceso_vivo(pid):
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        return True
+    return True
+
+
+def leer_estadisticas_workers(directorio=None):
+    """
+    Agrega las estadísticas publicadas por los workers vivos.
+
+    Los archivos de workers que ya no existen (reciclados por
+    `max_requests` o terminados de forma abrupta) se eliminan.
+
+    Args:
+        directorio (str): Directorio de estadísticas (por defecto el configurado)
+
+    Returns:
+        dict: Totales y detalle por worker
+    """
+    directorio = directorio or directorio_estadisticas()
+    workers = []
+    try:
+        entradas = list(os.scandir(directorio))
+    except FileNotFoundError:
+        entradas = []
+
+    for entrada in entradas:
+        if not (entrada.name.startswith('worker-') and entrada.name.endswith('.json')):
+            continue
+        try:
+            with open(entrada.path, encoding='utf-8') as archivo:
+                datos = json.load(archivo)
+        except (OSError, ValueError):
+            continue
+        if not _proceso_vivo(datos.get('pid', 0)):
+            try:
+                os.remove(entrada.path)
+            except OSError:
+                pass
+            continue
+        workers.append(datos)
+
+    workers.sort(key=lambda datos: datos['pid'])
+    return {
+        'workers_activos': len(workers),
+        'peticiones': sum(w['peticiones'] for w in workers),
+        'errores': sum(w['errores'] for w in workers),
+        'memoria_total_mb': round(sum(w['memoria_max_mb'] for w in workers), 1),
+        'workers': workers,
+    }
@@ -12,11 +12,14 @@ https://docs.djangoproject.com/en/5.1/topics/settings/
 For the full list of settings and their values, see
 https://docs.djangoproject.com/en/5.1/ref/settings/
 """
+import importlib.util
 import os
 from pathlib import Path
 from dotenv import load_dotenv
 from urllib.parse import urlparse
 
+from mysite.runtime import opciones_conexion_db
+
 load_dotenv()
 
 # Build paths inside the project like this: BASE_DIR / 'subdir'.
@@ -78,22 +81,30 @@ INSTALLED_APPS = [
 ]
 
 MIDDLEWARE = [
+    # Primero: el request_id y la ruta llegan a los logs de todos los demás
+    'blog.middleware.LogContextMiddleware',
     'corsheaders.middleware.CorsMiddleware',
     'django.middleware.security.SecurityMiddleware',
+    # Antes de los middlewares que leen el cuerpo (ver blog/middleware.py)
+    'blog.middleware.CompressionMiddleware',
     'whitenoise.middleware.WhiteNoiseMiddleware',
     'django.contrib.sessions.middleware.SessionMiddleware',
     'django.middleware.common.CommonMiddleware',
     'django.middleware.csrf.CsrfViewMiddleware',
     'django.contrib.auth.middleware.AuthenticationMiddleware',
+    'blog.middleware.SessionRefreshMiddleware',
     'django.contrib.messages.middleware.MessageMiddleware',
     'django.middleware.clickjacking.XFrameOptionsMiddleware',
+    'blog.middleware.RateLimitHeadersMiddleware',
+    # Después de sesiones y autenticación: solo las vistas leen de réplicas
+    'blog.middleware.ReplicaRoutingMiddleware',
 ]
 
 # Agregar middleware personalizado solo en desarrollo para debug
 if not IS_PRODUCTION:
-    MIDDLEWARE.insert(3, 'blog.middleware.SecurityHeadersMiddleware')
-    MIDDLEWARE.insert(4, 'blog.middleware.RequestLoggingMiddleware')
-    MIDDLEWARE.insert(5, 'blog.middleware.APIUsageMiddleware')
+    MIDDLEWARE.insert(5, 'blog.middleware.SecurityHeadersMiddleware')
+    MIDDLEWARE.insert(6, 'blog.middleware.RequestLoggingMiddleware')
+    MIDDLEWARE.insert(7, 'blog.middleware.APIUsageMiddleware')
 
 ROOT_URLCONF = 'mysite.urls'
 
@@ -114,37 +125,119 @@ TEMPLATES = [
 ]
 
 WSGI_APPLICATION = 'mysite.wsgi.application'
+ASGI_APPLICATION = 'mysite.asgi.application'
+
+# Modo ASGI: atender lecturas públicas con vistas asíncronas (ver blog/Views/AsyncReadView.py)
+ASYNC_API_ENABLED = os.getenv('ASYNC_API', 'False').lower() == 'true'
+
+# Proxies de confianza delante de la aplicación (el de Railway/Render en
+# producción). La IP del cliente es la entrada de X-Forwarded-For que queda a
+# NUM_PROXIES posiciones del final: las anteriores las pone el cliente y no
+# sirven para limitar por IP. Con 0 se usa REMOTE_ADDR.
+NUM_PROXIES = int(os.getenv('NUM_PROXIES', '1' if IS_PRODUCTION else '0'))
 
 # Django REST framework settings
 REST_FRAMEWORK = {
+    'NUM_PROXIES': NUM_PROXIES,
     'DEFAULT_SCHEMA_CLASS': 'rest_framework.schemas.openapi.AutoSchema',
     'DEFAULT_PAGINATION_CLASS': 'rest_framework.pagination.PageNumberPagination',
     'PAGE_SIZE': 20,
+    # JSON compacto con orjson (ver blog/renderers.py); la API navegable solo
+    # en desarrollo o con API_BROWSABLE=True. MessagePack y CBOR se negocian
+    # con Accept/Content-Type si `msgpack`/`cbor2` están instalados
+    'DEFAULT_RENDERER_CLASSES': [
+        'blog.renderers.FastJSONRenderer',
+        *(['blog.renderers.MessagePackRenderer'] if importlib.util.find_spec('msgpack') else []),
+        *(['blog.renderers.CBORRenderer'] if importlib.util.find_spec('cbor2') else []),
+        *(
+            ['rest_framework.renderers.BrowsableAPIRenderer']
+            if os.getenv('API_BROWSABLE', str(DEBUG)).lower() == 'true' else []
+        ),
+    ],
+    'DEFAULT_PARSER_CLASSES': [
+        'rest_framework.parsers.JSONParser',
+        'rest_framework.parsers.FormParser',
+        'rest_framework.parsers.MultiPartParser',
+        *(['blog.parsers.MessagePackParser'] if importlib.util.find_spec('msgpack') else []),
+        *(['blog.parsers.CBORParser'] if importlib.util.find_spec('cbor2') else []),
+    ],
     'DEFAULT_FILTER_BACKENDS': [
         'django_filters.rest_framework.DjangoFilterBackend',
         'rest_framework.filters.SearchFilter',
         'rest_framework.filters.OrderingFilter',
     ],
+    # Ventanas deslizantes atómicas por endpoint (ver blog/throttling.py)
     'DEFAULT_THROTTLE_CLASSES': [
-        'rest_framework.throttling.AnonRateThrottle',
-        'rest_framework.throttling.UserRateThrottle'
+        'blog.throttling.AnonSlidingWindowThrottle',
+        'blog.throttling.UserSlidingWindowThrottle'
     ],
     'DEFAULT_THROTTLE_RATES': {
-        'anon': '100/hour',
-        'user': '1000/hour'
+        'anon': os.getenv('THROTTLE_RATE_ANON', '100/hour'),
+        'user': os.getenv('THROTTLE_RATE_USER', '1000/hour'),
+        # Tasas por endpoint: THROTTLE_SCOPE_RATES="ofertas.anon=60/min,audit_log=300/hour"
+        **dict(
+            entrada.strip().split('=', 1)
+            for entrada in os.getenv('THROTTLE_SCOPE_RATES', '').split(',')
+            if '=' in entrada
+        ),
     },
     'DEFAULT_AUTHENTICATION_CLASSES': [
         'rest_framework.authentication.SessionAuthentication',
-        'rest_framework.authentication.TokenAuthentication',
+        'blog.authentication.CachedTokenAuthentication',
+        'blog.authentication.SignedTokenAuthentication',
     ],
     'DEFAULT_PERMISSION_CLASSES': [
         'rest_framework.permissions.IsAuthenticatedOrReadOnly',
     ],
 }
 
+# Las tasas de throttling son presupuestos en unidades de coste: cada endpoint
+# declara `throttle_cost` (1 por defecto) y las búsquedas en listados cuestan:
+THROTTLE_SEARCH_COST = int(os.getenv('THROTTLE_SEARCH_COST', '3'))
+
+# Facetas de los listados (?facets=), ver blog/facets.py
+FACETS_CACHE_TTL = int(os.getenv('FACETS_CACHE_TTL', '300'))
+FACETS_MAX_BUCKETS = int(os.getenv('FACETS_MAX_BUCKETS', '50'))
+
+# Compresión de las respuestas de la API (brotli si está instalado, o gzip)
+COMPRESSION_MIN_SIZE = int(os.getenv('COMPRESSION_MIN_SIZE', '1024'))
+COMPRESSION_GZIP_LEVEL = int(os.getenv('COMPRESSION_GZIP_LEVEL', '6'))
+COMPRESSION_BROTLI_QUALITY = int(os.getenv('COMPRESSION_BROTLI_QUALITY', '4'))
+COMPRESSION_CONTENT_TYPES = ['application/json', 'application/msgpack', 'application/cbor']
+# Respuestas con tokens: sin compresión para no exponerlas a BREACH
+COMPRESSION_EXCLUDE_PATHS = ['/api/auth/']
+
+# Listados y detalles serializados desde .values() con convertidores
+# precompilados (ver blog/Serializers/ValuesSerializer.py)
+FAST_READ_SERIALIZERS = os.getenv('FAST_READ_SERIALIZERS', 'True').lower() == 'true'
+
+# Tecnologías indexadas en los proyectos (ver blog/tecnologias.py). Tras
+# cambiarlas ejecutar `python manage.py reindexar_tecnologias`.
+TECNOLOGIAS_PROYECTOS = os.getenv(
+    'TECNOLOGIAS_PROYECTOS',
+    'python,django,javascript,react,vue,angular,nodejs,java,spring,docker,'
+    'kubernetes,aws,postgresql,mysql,mongodb,redis,git'
+).split(',')
+
 # Database
 # https://docs.djangoproject.com/en/5.1/ref/settings/#databases
 
+# Gestión de conexiones a PostgreSQL (DB_POOL_MODE):
+#   none       - una conexión nueva (con handshake TLS) por petición
+#   persistent - reutiliza la conexión del hilo durante DB_CONN_MAX_AGE segundos
+#   pool       - pool de psycopg 3 por worker (requiere `psycopg[pool]`)
+#   pgbouncer  - conexiones persistentes hacia PgBouncer en modo transacción
+DB_POOL_MODE = os.getenv('DB_POOL_MODE', 'persistent').lower()
+
+# Réplicas de lectura separadas por comas; se registran como replica_1, replica_2...
+# Las peticiones GET y las tareas de reportes leen de ellas (ver blog/routers.py).
+DATABASE_REPLICA_URLS = [url.strip() for url in os.getenv('DATABASE_REPLICA_URLS', '').split(',') if url.strip()]
+DATABASE_ROUTERS = ['blog.routers.ReplicaRouter']
+REPLICA_EXCLUDED_APPS = ('sessions', 'authtoken')
+REPLICA_STICKY_COOKIE = 'db_primaria'
+REPLICA_STICKY_SECONDS = int(os.getenv('REPLICA_STICKY_SECONDS', '15'))
+
+
 if IS_PRODUCTION:
     # Production database from environment variable
     database_url = os.getenv("DATABASE_URL")
@@ -165,6 +258,20 @@ if IS_PRODUCTION:
                 },
             }
         }
+        DATABASES['default'].update(opciones_conexion_db(DB_POOL_MODE))
+
+        # Réplicas de lectura: mismas opciones que la primaria
+        for indice, replica_url in enumerate(DATABASE_REPLICA_URLS, start=1):
+            tmpReplica = urlparse(replica_url)
+            DATABASES[f'replica_{indice}'] = {
+                **DATABASES['default'],
+                'NAME': tmpReplica.path[1:],
+                'USER': tmpReplica.username,
+                'PASSWORD': tmpReplica.password,
+                'HOST': tmpReplica.hostname,
+                'PORT': tmpReplica.port or 5432,
+                'TEST': {'MIRROR': 'default'},
+            }
         print(f"DATABASES configurado: {DATABASES}")
     else:
         raise ValueError("DATABASE_URL environment variable is required in production")
@@ -179,6 +286,8 @@ else:
     }
     print(f"DATABASES configurado: {DATABASES}")
 
+DATABASE_REPLICAS = [alias for alias in DATABASES if alias.startswith('replica_')]
+
 # Password validation
 # https://docs.djangoproject.com/en/5.1/ref/settings/#auth-password-validators
 
@@ -197,6 +306,44 @@ AUTH_PASSWORD_VALIDATORS = [
     },
 ]
 
+# Hasher de contraseñas (PASSWORD_HASHER): pbkdf2, argon2 o scrypt, ver blog/hashers.py.
+# Todos siguen en la lista para verificar hashes existentes; el elegido va
+# primero y Django rehashea la contraseña en el siguiente login correcto.
+_HASHERS = {
+    'pbkdf2': 'django.contrib.auth.hashers.PBKDF2PasswordHasher',
+    'argon2': 'blog.hashers.TunedArgon2PasswordHasher',
+    'scrypt': 'blog.hashers.TunedScryptPasswordHasher',
+}
+PASSWORD_HASHER = os.getenv('PASSWORD_HASHER', 'pbkdf2').lower()
+if PASSWORD_HASHER not in _HASHERS:
+    print(f"PASSWORD_HASHER desconocido: {PASSWORD_HASHER}, se usa pbkdf2")
+    PASSWORD_HASHER = 'pbkdf2'
+if PASSWORD_HASHER == 'argon2' and importlib.util.find_spec('argon2') is None:
+    print("argon2-cffi no está instalado, se usa pbkdf2")
+    PASSWORD_HASHER = 'pbkdf2'
+PASSWORD_HASHERS = [_HASHERS[PASSWORD_HASHER]] + [
+    hasher for hasher in (
+        'django.contrib.auth.hashers.PBKDF2PasswordHasher',
+        'django.contrib.auth.hashers.PBKDF2SHA1PasswordHasher',
+        'blog.hashers.TunedArgon2PasswordHasher',
+        'django.contrib.auth.hashers.BCryptSHA256PasswordHasher',
+        'blog.hashers.TunedScryptPasswordHasher',
+    ) if hasher != _HASHERS[PASSWORD_HASHER]
+]
+# Argon2id: mínimo recomendado por OWASP (~35 ms por hash)
+ARGON2_TIME_COST = int(os.getenv('ARGON2_TIME_COST', '2'))
+ARGON2_MEMORY_COST = int(os.getenv('ARGON2_MEMORY_COST', '19456'))  # KiB
+ARGON2_PARALLELISM = int(os.getenv('ARGON2_PARALLELISM', '1'))
+# Scrypt: N=2^15, r=8, p=1 (32 MiB, ~120 ms por hash)
+SCRYPT_WORK_FACTOR = int(os.getenv('SCRYPT_WORK_FACTOR', str(2 ** 15)))
+SCRYPT_BLOCK_SIZE = int(os.getenv('SCRYPT_BLOCK_SIZE', '8'))
+SCRYPT_PARALLELISM = int(os.getenv('SCRYPT_PARALLELISM', '1'))
+
+# Límites del login (ver blog/ratelimit.py), comprobados antes de calcular el hash:
+# intentos por IP y fallos por usuario (se reinician con un login correcto)
+LOGIN_RATE_IP = os.getenv('LOGIN_RATE_IP', '20/m')
+LOGIN_RATE_USERNAME = os.getenv('LOGIN_RATE_USERNAME', '10/15m')
+
 # Internationalization
 # https://docs.djangoproject.com/en/5.1/topics/i18n/
 
@@ -235,6 +382,8 @@ if FRONTEND_URL:
     CORS_ALLOWED_ORIGINS.append(FRONTEND_URL)
 
 CORS_ALLOW_CREDENTIALS = True
+# Cabeceras de throttling legibles desde el frontend
+CORS_EXPOSE_HEADERS = ['RateLimit-Limit', 'RateLimit-Remaining', 'RateLimit-Reset', 'RateLimit-Policy', 'Retry-After']
 
 # Configuraciones adicionales para CSRF y sesiones
 CSRF_TRUSTED_ORIGINS = [
@@ -252,7 +401,10 @@ SESSION_COOKIE_NAME = 'sessionid'
 SESSION_COOKIE_AGE = 86400  # 24 hours
 SESSION_COOKIE_HTTPONLY = True
 SESSION_COOKIE_SAMESITE = 'Lax'  # Allow cross-site requests for authentication
-SESSION_SAVE_EVERY_REQUEST = True
+# La sesión solo se guarda cuando cambia; SessionRefreshMiddleware renueva la
+# expiración cuando queda menos de SESSION_REFRESH_THRESHOLD segundos.
+SESSION_SAVE_EVERY_REQUEST = False
+SESSION_REFRESH_THRESHOLD = int(os.getenv('SESSION_REFRESH_THRESHOLD', str(SESSION_COOKIE_AGE // 4)))
 SESSION_EXPIRE_AT_BROWSER_CLOSE = False
 
 CSRF_COOKIE_NAME = 'csrftoken'
@@ -277,7 +429,10 @@ if redis_url and IS_PRODUCTION:
     CELERY_BROKER_TRANSPORT_OPTIONS = {
         'retry_policy': {
             'timeout': 5.0
-        }
+        },
+        # Con acks_late, una tarea sin confirmar se reentrega pasado este
+        # tiempo: debe superar la duración y el countdown de cualquier tarea
+        'visibility_timeout': 3600,
     }
 elif redis_url and not IS_PRODUCTION:
     # Development with local Redis
@@ -288,12 +443,98 @@ else:
     CELERY_TASK_ALWAYS_EAGER = True
     CELERY_TASK_EAGER_PROPAGATES = True
 
+# Colas: 'interactiva' para lo que espera un usuario (subida de imágenes) y
+# 'mantenimiento' para las tareas programadas largas, con workers separados
+# (ver Procfile) para que una limpieza no retrase a las tareas cortas.
+CELERY_TASK_DEFAULT_QUEUE = 'interactiva'
+CELERY_TASK_ROUTES = {
+    'blog.tasks.finalizar_subida_imagen': {'queue': 'interactiva'},
+    'blog.tasks.eliminar_ofertas_expiradas': {'queue': 'mantenimiento'},
+    'blog.tasks.generar_reporte_estadisticas': {'queue': 'mantenimiento'},
+    'blog.tasks.limpiar_logs_antiguos': {'queue': 'mantenimiento'},
+    'blog.tasks.limpiar_sesiones_expiradas': {'queue': 'mantenimiento'},
+}
+# Confirmar al terminar (las tareas son idempotentes): si el worker muere a
+# mitad de una tarea, se reentrega en lugar de perderse
+CELERY_TASK_ACKS_LATE = True
+CELERY_TASK_REJECT_ON_WORKER_LOST = True
+# Una tarea reservada por proceso: sin esto un proceso ocupado retiene tareas cortas
+CELERY_WORKER_PREFETCH_MULTIPLIER = int(os.getenv('CELERY_WORKER_PREFETCH_MULTIPLIER', '1'))
+CELERY_WORKER_MAX_TASKS_PER_CHILD = int(os.getenv('CELERY_WORKER_MAX_TASKS_PER_CHILD', '200'))
+# Límites por defecto (cada tarea define los suyos en blog/tasks.py)
+CELERY_TASK_SOFT_TIME_LIMIT = int(os.getenv('CELERY_TASK_SOFT_TIME_LIMIT', '240'))
+CELERY_TASK_TIME_LIMIT = int(os.getenv('CELERY_TASK_TIME_LIMIT', '300'))
+# Nadie consulta los resultados: no se guardan, y los que se guarden caducan
+CELERY_TASK_IGNORE_RESULT = os.getenv('CELERY_TASK_IGNORE_RESULT', 'True').lower() == 'true'
+CELERY_RESULT_EXPIRES = int(os.getenv('CELERY_RESULT_EXPIRES', '3600'))
+# Métricas de las tareas (blog/task_metrics.py, /api/metrics/tasks/), guardadas
+# en la caché por defecto: contadores por hora y últimas ejecuciones por tarea
+TASK_METRICS_ENABLED = os.getenv('TASK_METRICS_ENABLED', 'True').lower() == 'true'
+TASK_METRICS_WINDOW_HOURS = int(os.getenv('TASK_METRICS_WINDOW_HOURS', '168'))  # 7 días
+TASK_METRICS_SAMPLES = int(os.getenv('TASK_METRICS_SAMPLES', '100'))
+
+# Cache: Redis compartido entre workers si está disponible
+if redis_url:
+    CACHES = {
+        'default': {
+            'BACKEND': 'django.core.cache.backends.redis.RedisCache',
+            'LOCATION': redis_url,
+            'KEY_PREFIX': 'djangorail',
+        }
+    }
+else:
+    CACHES = {
+        'default': {
+            'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+        }
+    }
+
+# Caché de autenticación (usuario por sesión y por token), ver blog/authentication.py.
+# Sin Redis cada proceso tendría su propia copia y la invalidación no llegaría
+# al resto de workers, así que se desactiva por defecto.
+AUTH_CACHE_TTL = int(os.getenv('AUTH_CACHE_TTL', '60' if redis_url else '0'))
+# ModelBackend se mantiene para las sesiones creadas antes de la caché, que
+# guardan su ruta en `_auth_user_backend`; las nuevas usan el backend cacheado
+AUTHENTICATION_BACKENDS = [
+    'blog.authentication.CachedModelBackend',
+    'django.contrib.auth.backends.ModelBackend',
+]
+
+# Tokens firmados sin estado (POST /api/auth/token/), ver blog/tokens.py
+SIGNED_TOKEN_ACCESS_TTL = int(os.getenv('SIGNED_TOKEN_ACCESS_TTL', '300'))  # 5 minutos
+SIGNED_TOKEN_REFRESH_TTL = int(os.getenv('SIGNED_TOKEN_REFRESH_TTL', '604800'))  # 7 días
+
+# Motor de sesiones (SESSION_BACKEND): cached_db, cache o db.
+# Sin Redis la caché es local a cada proceso y un logout en un worker no
+# invalidaría la sesión cacheada en otro, así que se usa la base de datos.
+SESSION_BACKEND = os.getenv('SESSION_BACKEND', 'cached_db' if redis_url else 'db').lower()
+if not redis_url and SESSION_BACKEND != 'db':
+    print(f"SESSION_BACKEND={SESSION_BACKEND} requiere REDIS_URL; usando sesiones en base de datos")
+    SESSION_BACKEND = 'db'
+SESSION_ENGINE = {
+    'cache': 'django.contrib.sessions.backends.cache',
+    'cached_db': 'django.contrib.sessions.backends.cached_db',
+}.get(SESSION_BACKEND, 'django.contrib.sessions.backends.db')
+
+# Ciclo de vida de los logs (blog/log_lifecycle.py, tarea limpiar_logs_antiguos):
+# retención por antigüedad y por tamaño total, y copias rotadas comprimidas con gzip
+LOGS_DIR = os.path.join(BASE_DIR, 'logs')
+LOG_RETENTION_DAYS = int(os.getenv('LOG_RETENTION_DAYS', '30'))
+LOG_RETENTION_MAX_BYTES = int(os.getenv('LOG_RETENTION_MAX_BYTES', str(200 * 1024 * 1024)))  # 200 MB
+LOG_COMPRESS_ROTATED = os.getenv('LOG_COMPRESS_ROTATED', 'True').lower() == 'true'
+LOG_COMPRESSION_LEVEL = int(os.getenv('LOG_COMPRESSION_LEVEL', '6'))
+LOG_COMPRESSION_WORKERS = int(os.getenv('LOG_COMPRESSION_WORKERS', '2'))
+
 # Celery Beat Schedule - siempre definido
 CELERY_BEAT_SCHEDULE = {
     'eliminar_ofertas_expiradas': {
         'task': 'blog.tasks.eliminar_ofertas_expiradas',
         'schedule': 86400.0,  # Every 24 hours
     },
+    'limpiar_sesiones_expiradas': {
+        'task': 'blog.tasks.limpiar_sesiones_expiradas',
+        'schedule': 86400.0,  # Every 24 hours
+    },
 }
 
 if not IS_PRODUCTION:
@@ -305,8 +546,8 @@ if not IS_PRODUCTION:
         },
         'limpiar_logs_antiguos': {
             'task': 'blog.tasks.limpiar_logs_antiguos',
-            'schedule': 2592000.0,  # Every 30 days
-            'kwargs': {'dias': 30}
+            'schedule': 86400.0,  # Every 24 hours (comprime las copias rotadas)
+            'kwargs': {'dias': LOG_RETENTION_DAYS}
         },
     })
 
@@ -319,7 +560,41 @@ CLOUDINARY_STORAGE = {
     'API_SECRET': os.getenv('CLOUDINARY_API_SECRET'),
 }
 
+# Variantes de imagen expuestas como <campo>_variantes (se les añade f_auto,q_auto)
+CLOUDINARY_VARIANTES = {
+    'thumbnail': os.getenv('CLOUDINARY_VARIANTE_THUMBNAIL', 'c_fill,g_auto,h_150,w_150'),
+    'card': os.getenv('CLOUDINARY_VARIANTE_CARD', 'c_limit,w_640'),
+    'full': os.getenv('CLOUDINARY_VARIANTE_FULL', 'c_limit,w_1600'),
+}
+CLOUDINARY_SRCSET_ANCHOS = [
+    int(ancho) for ancho in os.getenv('CLOUDINARY_SRCSET_ANCHOS', '320,640,960,1280').split(',') if ancho.strip()
+]
+
+# Pre-procesado de las imágenes subidas (blog/preprocesado.py): lado máximo,
+# sin EXIF y recodificadas (WEBP, AVIF si Pillow lo soporta, o JPEG)
+IMAGE_PREPROCESS = os.getenv('IMAGE_PREPROCESS', 'True').lower() == 'true'
+IMAGE_PREPROCESS_MAX_SIZE = int(os.getenv('IMAGE_PREPROCESS_MAX_SIZE', '2048'))
+IMAGE_PREPROCESS_FORMAT = os.getenv('IMAGE_PREPROCESS_FORMAT', 'WEBP').upper()
+IMAGE_PREPROCESS_QUALITY = int(os.getenv('IMAGE_PREPROCESS_QUALITY', '82'))
+
+# Subida diferida de imágenes (blog/subidas.py): la petición guarda el archivo en
+# IMAGE_UPLOAD_STAGING_DIR y una tarea de Celery lo sube con IMAGE_UPLOAD_BACKEND.
+# El directorio temporal debe estar compartido entre los procesos web y el worker.
+IMAGE_UPLOAD_ASYNC = os.getenv('IMAGE_UPLOAD_ASYNC', 'False').lower() == 'true'
+IMAGE_UPLOAD_BACKEND = os.getenv('IMAGE_UPLOAD_BACKEND', 'blog.subidas.SubidaCloudinary')
+IMAGE_UPLOAD_STAGING_DIR = os.getenv('IMAGE_UPLOAD_STAGING_DIR', os.path.join(BASE_DIR, 'media', 'subidas_pendientes'))
+# Destino de blog.subidas.SubidaLocal (sustituto de Cloudinary en pruebas)
+IMAGE_UPLOAD_LOCAL_DIR = os.getenv('IMAGE_UPLOAD_LOCAL_DIR', os.path.join(BASE_DIR, 'media', 'imagenes'))
+
 # Logging Configuration
+# LOG_FORMAT: formatter de la consola ('json' para agregadores de logs,
+# 'verbose' o 'simple'). Con LOG_QUEUE los handlers escriben en un hilo aparte
+# (blog.structured_logging.ColaHandler) y las peticiones solo encolan; si la
+# cola (LOG_QUEUE_SIZE registros) se llena, se descartan registros.
+LOG_FORMAT = os.getenv('LOG_FORMAT', 'json' if IS_PRODUCTION else 'simple')
+LOG_QUEUE = os.getenv('LOG_QUEUE', 'True').lower() == 'true'
+LOG_QUEUE_SIZE = int(os.getenv('LOG_QUEUE_SIZE', '10000'))
+
 if IS_PRODUCTION:
     # Production logging (console only)
     LOGGING = {
@@ -335,15 +610,14 @@ if IS_PRODUCTION:
                 'style': '{',
             },
             'json': {
-                'format': '{"level": "%(levelname)s", "time": "%(asctime)s", "module": "%(module)s", "message": "%(message)s"}',
-                'style': '%',
+                '()': 'blog.structured_logging.JSONFormatter',
             },
         },
         'handlers': {
             'console': {
                 'level': 'INFO',
                 'class': 'logging.StreamHandler',
-                'formatter': 'verbose',
+                'formatter': LOG_FORMAT,
             },
             'console_json': {
                 'level': 'INFO',
@@ -392,8 +666,7 @@ else:
                 'style': '{',
             },
             'json': {
-                'format': '{"level": "%(levelname)s", "time": "%(asctime)s", "module": "%(module)s", "message": "%(message)s"}',
-                'style': '%',
+                '()': 'blog.structured_logging.JSONFormatter',
             },
         },
         'handlers': {
@@ -403,7 +676,7 @@ else:
             'file': {
                 'level': 'INFO',
                 'class': 'logging.handlers.RotatingFileHandler',
-                'filename': os.path.join(BASE_DIR, 'logs', 'django.log'),
+                'filename': os.path.join(LOGS_DIR, 'django.log'),
                 'maxBytes': 1024*1024*10,  # 10 MB
                 'backupCount': 5,
                 'formatter': 'verbose',
@@ -411,7 +684,7 @@ else:
             'api_usage_file': {
                 'level': 'INFO',
                 'class': 'logging.handlers.RotatingFileHandler',
-                'filename': os.path.join(BASE_DIR, 'logs', 'api_usage.log'),
+                'filename': os.path.join(LOGS_DIR, 'api_usage.log'),
                 'maxBytes': 1024*1024*5,  # 5 MB
                 'backupCount': 3,
                 'formatter': 'json',
@@ -419,7 +692,7 @@ else:
             'error_file': {
                 'level': 'ERROR',
                 'class': 'logging.handlers.RotatingFileHandler',
-                'filename': os.path.join(BASE_DIR, 'logs', 'errors.log'),
+                'filename': os.path.join(LOGS_DIR, 'errors.log'),
                 'maxBytes': 1024*1024*10,  # 10 MB
                 'backupCount': 5,
                 'formatter': 'verbose',
@@ -427,7 +700,7 @@ else:
             'console': {
                 'level': 'DEBUG',
                 'class': 'logging.StreamHandler',
-                'formatter': 'simple',
+                'formatter': LOG_FORMAT,
             },
         },
         'root': {
@@ -457,6 +730,19 @@ else:
         },
     }
 
+if LOG_QUEUE:
+    # Cada logger escribe en una cola que reparte a sus handlers originales.
+    # dictConfig crea los handlers por orden alfabético: el prefijo '~' deja
+    # las colas para el final, cuando sus destinos ya existen.
+    for _logger in [LOGGING['root'], *LOGGING['loggers'].values()]:
+        _nombre = '~cola:' + '+'.join(_logger['handlers'])
+        LOGGING['handlers'].setdefault(_nombre, {
+            '()': 'blog.structured_logging.ColaHandler',
+            'handlers': [f'cfg://handlers.{nombre}' for nombre in _logger['handlers']],
+            'tamano': LOG_QUEUE_SIZE,
+        })
+        _logger['handlers'] = [_nombre]
+
 # Security settings for production
 if IS_PRODUCTION:
     SECURE_SSL_REDIRECT = True
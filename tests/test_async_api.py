@@ -0,0 +1,99 @@
+"""
+Pruebas del modo ASGI: las vistas asíncronas deben responder lo mismo
+que los ViewSets síncronos.
+"""
+
+import cloudinary
+from asgiref.sync import sync_to_async
+from django.conf import settings
+from django.contrib.auth.models import User
+from django.core.cache import cache
+from django.test import TestCase, override_settings
+from django.urls import include, path
+
+from blog.Models.ConferenciasModel import Conferencias
+from blog.Models.NoticiasModel import Noticias
+from blog.Views.AsyncReadView import rutas_asincronas
+from blog.Views.ConferenciasView import ConferenciasViewSet
+from blog.Views.NoticiasView import NoticiasViewSet
+
+urlpatterns = [
+    path('api/async/', include(
+        rutas_asincronas('conferencias', ConferenciasViewSet, 'conferencias', ['estadisticas'])
+        + rutas_asincronas('noticias', NoticiasViewSet, 'noticias')
+    )),
+    path('api/', include('blog.urls')),
+]
+
+
+@override_settings(ROOT_URLCONF=__name__)
+class AsyncReadViewTestCase(TestCase):
+    """Compara las respuestas de la ruta asíncrona con las de la síncrona."""
+
+    def setUp(self):
+        cloudinary.config(cloud_name='demo')
+        self.user = User.objects.create_user(username='lector', password='clave-segura-123')
+        for i in range(25):
+            Noticias.objects.create(
+                nombre_noticia=f'Noticia {i}',
+                link_noticia='https://example.com/noticia',
+                description_noticia='Contenido de prueba',
+                creador=self.user,
+                fuente='Fuente',
+                imagen_noticia='image/upload/v1/noticias/foto.jpg',
+            )
+            Conferencias.objects.create(
+                nombre_conferencia=f'Conferencia {i}',
+                ponente_conferencia='Ponente',
+                descripcion_conferencia='Descripción',
+                imagen_conferencia='image/upload/v1/conferencias/cartel.png',
+                link_conferencia='https://example.com/conferencia',
+                creador=self.user,
+            )
+
+    async def _comparar(self, ruta, **params):
+        sincrona = await self.async_client.get(f'/api/hl4/v1/{ruta}', params, HTTP_ACCEPT='application/json')
+        asincrona = await self.async_client.get(f'/api/async/{ruta}', params, HTTP_ACCEPT='application/json')
+        self.assertEqual(asincrona.status_code, sincrona.status_code)
+        return sincrona, asincrona
+
+    async def test_listado_paginado_identico(self):
+        sincrona, asincrona = await self._comparar('noticias/', page='2')
+        datos_sync, datos_async = sincrona.json(), asincrona.json()
+        self.assertEqual(datos_async['results'], datos_sync['results'])
+        self.assertEqual(datos_async['count'], datos_sync['count'])
+
+    async def test_listado_con_paginacion_personalizada(self):
+        sincrona, asincrona = await self._comparar('conferencias/', ordering='nombre_conferencia')
+        self.assertEqual(asincrona.json()['results'], sincrona.json()['results'])
+        self.assertEqual(
+            asincrona.json()['pagination']['total_pages'],
+            sincrona.json()['pagination']['total_pages'],
+        )
+
+    async def test_detalle_y_no_encontrado(self):
+        noticia = await Noticias.objects.afirst()
+        sincrona, asincrona = await self._comparar(f'noticias/{noticia.pk}/')
+        self.assertEqual(asincrona.json(), sincrona.json())
+
+        sincrona, asincrona = await self._comparar('noticias/999999/')
+        self.assertEqual(asincrona.status_code, 404)
+
+    async def test_estadisticas(self):
+        sincrona, asincrona = await self._comparar('conferencias/estadisticas/')
+        self.assertEqual(asincrona.json(), sincrona.json())
+
+    async def test_pagina_invalida_delega_al_viewset(self):
+        sincrona, asincrona = await self._comparar('noticias/', page='99')
+        self.assertEqual(asincrona.status_code, 404)
+
+    async def test_escritura_anonima_delegada(self):
+        respuesta = await self.async_client.post('/api/async/noticias/', {})
+        self.assertEqual(respuesta.status_code, 403)
+
+    @override_settings(REST_FRAMEWORK={**settings.REST_FRAMEWORK, 'DEFAULT_THROTTLE_RATES': {'anon': '10/min'}})
+    async def test_delegacion_cobra_una_sola_vez(self):
+        await sync_to_async(cache.clear)()
+        respuesta = await self.async_client.get('/api/async/noticias/999999/', HTTP_ACCEPT='application/json')
+        self.assertEqual(respuesta.status_code, 404)
+        self.assertEqual(respuesta['RateLimit-Remaining'], '9')
@@ -0,0 +1,80 @@
+"""
+Pruebas de la caché de autenticación por token y por sesión.
+"""
+
+from django.contrib.auth.models import User
+from django.core.cache import cache
+from django.db import connection
+from django.test import TestCase, override_settings
+from django.test.utils import CaptureQueriesContext
+from rest_framework.authtoken.models import Token
+from rest_framework.test import APIClient
+
+
+@override_settings(AUTH_CACHE_TTL=60)
+class AuthCacheTestCase(TestCase):
+    """Verifica que la resolución del usuario sea un acierto de caché y se invalide."""
+
+    def setUp(self):
+        cache.clear()
+        self.user = User.objects.create_user(username='autora', password='clave-segura-123')
+        self.token = Token.objects.create(user=self.user)
+        self.cliente = APIClient()
+
+    def consultas_de_auth(self, cliente):
+        with CaptureQueriesContext(connection) as consultas:
+            respuesta = cliente.get('/api/auth/profile/')
+        sql = [c['sql'] for c in consultas.captured_queries]
+        return respuesta, [q for q in sql if 'auth_user' in q or 'authtoken_token' in q]
+
+    def test_token_resuelto_desde_cache(self):
+        self.cliente.credentials(HTTP_AUTHORIZATION=f'Token {self.token.key}')
+        respuesta, consultas = self.consultas_de_auth(self.cliente)
+        self.assertEqual(respuesta.status_code, 200)
+        self.assertEqual(len(consultas), 1)
+
+        respuesta, consultas = self.consultas_de_auth(self.cliente)
+        self.assertEqual(respuesta.status_code, 200)
+        self.assertEqual(respuesta.data['username'], 'autora')
+        self.assertEqual(consultas, [])
+
+    def test_desactivar_usuario_invalida_la_cache(self):
+        self.cliente.credentials(HTTP_AUTHORIZATION=f'Token {self.token.key}')
+        self.assertEqual(self.cliente.get('/api/auth/profile/').status_code, 200)
+
+        self.user.is_active = False
+        self.user.save()
+
+        self.assertIn(self.cliente.get('/api/auth/profile/').status_code, (401, 403))
+
+    def test_eliminar_token_invalida_la_cache(self):
+        self.cliente.credentials(HTTP_AUTHORIZATION=f'Token {self.token.key}')
+        self.assertEqual(self.cliente.get('/api/auth/profile/').status_code, 200)
+
+        self.token.delete()
+
+        self.assertIn(self.cliente.get('/api/auth/profile/').status_code, (401, 403))
+
+    def test_sesion_cacheada_y_cambio_de_contrasena(self):
+        self.client.post(
+            '/api/auth/login/',
+            {'username': 'autora', 'password': 'clave-segura-123'},
+            content_type='application/json',
+        )
+        self.consultas_de_auth(self.client)
+        respuesta, consultas = self.consultas_de_auth(self.client)
+        self.assertEqual(respuesta.status_code, 200)
+        self.assertEqual(consultas, [])
+
+        self.user.set_password('otra-clave-segura-456')
+        self.user.save()
+
+        # El hash de sesión ya no coincide con el usuario recargado
+        self.assertIn(self.client.get('/api/auth/profile/').status_code, (401, 403))
+
+    def test_sesion_con_backend_anterior(self):
+        # Sesiones iniciadas antes de CachedModelBackend
+        self.client.force_login(self.user, backend='django.contrib.auth.backends.ModelBackend')
+        respuesta = self.client.get('/api/auth/profile/')
+        self.assertEqual(respuesta.status_code, 200)
+        self.assertEqual(respuesta.data['username'], 'autora')
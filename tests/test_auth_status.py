@@ -0,0 +1,59 @@
+"""
+Pruebas del modo compacto de auth/status con ETag.
+"""
+
+from django.contrib.auth.models import User
+from django.core.cache import cache
+from django.db import connection
+from django.test import TestCase, override_settings
+from django.test.utils import CaptureQueriesContext
+from rest_framework.authtoken.models import Token
+from rest_framework.test import APIClient
+
+
+@override_settings(AUTH_CACHE_TTL=60)
+class AuthStatusCompactoTestCase(TestCase):
+    """Verifica el resumen compacto, el 304 y la invalidación del ETag."""
+
+    def setUp(self):
+        cache.clear()
+        self.user = User.objects.create_user(username='sondeo', password='clave-segura-123', first_name='Eva')
+        self.cliente = APIClient()
+        self.cliente.credentials(HTTP_AUTHORIZATION=f'Token {Token.objects.create(user=self.user).key}')
+
+    def test_resumen_compacto(self):
+        respuesta = self.cliente.get('/api/auth/status/?compact=1')
+
+        self.assertEqual(respuesta.status_code, 200)
+        self.assertEqual(respuesta.data['user'], {
+            'id': self.user.pk, 'username': 'sondeo', 'full_name': 'Eva',
+            'is_staff': False, 'is_superuser': False,
+        })
+        self.assertEqual(respuesta['ETag'], f'W/"{respuesta.data["version"]}"')
+        self.assertEqual(respuesta['Cache-Control'], 'private, no-cache')
+        self.assertIn('Authorization', respuesta['Vary'])
+
+    def test_sondeo_repetido_responde_304_sin_consultas(self):
+        etag = self.cliente.get('/api/auth/status/?compact=1')['ETag']
+
+        with CaptureQueriesContext(connection) as consultas:
+            respuesta = self.cliente.get('/api/auth/status/?compact=1', HTTP_IF_NONE_MATCH=etag)
+
+        self.assertEqual(respuesta.status_code, 304)
+        self.assertEqual(respuesta.content, b'')
+        self.assertEqual(len(consultas), 0)
+
+    def test_cambio_de_usuario_cambia_el_etag(self):
+        etag = self.cliente.get('/api/auth/status/?compact=1')['ETag']
+
+        self.user.is_staff = True
+        self.user.save()
+
+        respuesta = self.cliente.get('/api/auth/status/?compact=1', HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(respuesta.status_code, 200)
+        self.assertTrue(respuesta.data['user']['is_staff'])
+
+    def test_anonimo(self):
+        respuesta = APIClient().get('/api/auth/status/?compact=true')
+        self.assertEqual(respuesta.status_code, 200)
+        self.assertEqual(respuesta.data, {'authenticated': False, 'user': None, 'version': respuesta.data['version']})
@@ -0,0 +1,57 @@
+"""
+Pruebas de la configuración de colas y límites de Celery.
+"""
+
+from datetime import timedelta
+from unittest import mock
+
+from django.contrib.auth.models import User
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+from django.utils import timezone
+
+from blog import tasks
+from blog.Models.OfertasEmpleoModel import OfertasEmpleo
+from mysite.celery import app
+
+
+class CeleryConfigTestCase(TestCase):
+    """Verifica el enrutado, la confirmación tardía y los lotes."""
+
+    def cola(self, nombre):
+        return app.amqp.router.route({}, nombre)['queue'].name
+
+    def test_colas_y_limites(self):
+        self.assertEqual(self.cola('blog.tasks.finalizar_subida_imagen'), 'interactiva')
+        self.assertEqual(self.cola('blog.tasks.limpiar_logs_antiguos'), 'mantenimiento')
+        self.assertEqual(self.cola('blog.tasks.tarea_sin_ruta'), 'interactiva')
+        self.assertEqual(app.conf.worker_prefetch_multiplier, 1)
+        self.assertTrue(app.conf.task_acks_late)
+        self.assertTrue(app.conf.result_expires)
+
+        for nombre, tarea in app.tasks.items():
+            if nombre.startswith('blog.tasks.'):
+                with self.subTest(tarea=nombre):
+                    self.assertTrue(tarea.acks_late)
+                    self.assertLess(tarea.soft_time_limit, tarea.time_limit)
+
+    def test_ofertas_expiradas_por_lotes(self):
+        user = User.objects.create_user(username='autor', password='x')
+        ahora = timezone.now()
+        OfertasEmpleo.objects.bulk_create([
+            OfertasEmpleo(
+                titulo_empleo=f'Oferta {i}', empresa='ACME', descripcion_empleo='Backend',
+                link_oferta='https://example.com/oferta', creador=user, imagen='image/upload/v1/ofertas/logo.png',
+                fecha_expiracion=ahora + timedelta(days=-1 if i < 5 else 30),
+            )
+            for i in range(6)
+        ])
+
+        with mock.patch.object(tasks, 'TAMANO_LOTE', 2), CaptureQueriesContext(connection) as consultas:
+            resultado = tasks.eliminar_ofertas_expiradas()
+
+        borrados = [consulta for consulta in consultas if consulta['sql'].startswith('DELETE')]
+        self.assertEqual(len(borrados), 3)
+        self.assertEqual((resultado['status'], resultado['eliminadas']), ('success', 5))
+        self.assertEqual(OfertasEmpleo.objects.get().titulo_empleo, 'Oferta 5')
@@ -0,0 +1,76 @@
+"""
+Pruebas del middleware de compresión de respuestas de la API.
+"""
+
+import gzip
+import zlib
+
+import brotli
+import cloudinary
+from django.contrib.auth.models import User
+from django.http import HttpResponse, StreamingHttpResponse
+from django.test import RequestFactory, TestCase, override_settings
+from rest_framework.test import APIClient
+
+from blog.middleware import CompressionMiddleware, elegir_codificacion
+from blog.Models.NoticiasModel import Noticias
+
+
+class CompresionTestCase(TestCase):
+    """Verifica la negociación, el umbral, el streaming y los ETags."""
+
+    def setUp(self):
+        cloudinary.config(cloud_name='demo')
+        user = User.objects.create_user(username='autor', password='x')
+        for i in range(10):
+            Noticias.objects.create(
+                nombre_noticia=f'Noticia {i}', link_noticia='https://example.com/n',
+                description_noticia='Contenido largo de la noticia. ' * 30, creador=user,
+                imagen_noticia='image/upload/v1/noticias/foto.jpg',
+            )
+        self.cliente = APIClient()
+
+    def test_negociacion(self):
+        self.assertEqual(elegir_codificacion('gzip, deflate, br'), 'br')
+        self.assertEqual(elegir_codificacion('br;q=0.5, gzip'), 'gzip')
+        self.assertEqual(elegir_codificacion('br;q=0, *'), 'gzip')
+        self.assertIsNone(elegir_codificacion('identity'))
+        self.assertIsNone(elegir_codificacion('gzip;q=0'))
+
+    def test_listado_comprimido_con_cabeceras(self):
+        original = self.cliente.get('/api/hl4/v1/noticias/')
+        self.assertNotIn('Content-Encoding', original)
+
+        for codificacion, descomprimir in (('br', brotli.decompress), ('gzip', gzip.decompress)):
+            with self.subTest(codificacion=codificacion):
+                respuesta = self.cliente.get('/api/hl4/v1/noticias/', HTTP_ACCEPT_ENCODING=codificacion)
+                self.assertEqual(respuesta['Content-Encoding'], codificacion)
+                self.assertIn('Accept-Encoding', respuesta['Vary'])
+                self.assertEqual(int(respuesta['Content-Length']), len(respuesta.content))
+                self.assertLess(len(respuesta.content), len(original.content) / 4)
+                self.assertEqual(descomprimir(respuesta.content), original.content)
+                # Las cabeceras de SecurityHeadersMiddleware se conservan
+                self.assertEqual(respuesta['X-Content-Type-Options'], 'nosniff')
+                self.assertIn('no-store', respuesta['Cache-Control'])
+
+    @override_settings(COMPRESSION_MIN_SIZE=10 ** 6)
+    def test_por_debajo_del_umbral(self):
+        respuesta = self.cliente.get('/api/hl4/v1/noticias/', HTTP_ACCEPT_ENCODING='br')
+        self.assertNotIn('Content-Encoding', respuesta)
+
+    def test_streaming_y_etag(self):
+        middleware = CompressionMiddleware(lambda request: None)
+        request = RequestFactory().get('/api/hl4/v1/exportar/', HTTP_ACCEPT_ENCODING='gzip')
+
+        fragmentos = [b'{"fila": %d}\n' % i * 50 for i in range(20)]
+        respuesta = middleware.process_response(
+            request, StreamingHttpResponse(iter(fragmentos), content_type='application/json')
+        )
+        self.assertEqual(respuesta['Content-Encoding'], 'gzip')
+        self.assertEqual(gzip.decompress(b''.join(respuesta.streaming_content)), b''.join(fragmentos))
+
+        respuesta = HttpResponse(b'{"a": 1}' * 500, content_type='application/json')
+        respuesta['ETag'] = '"abc"'
+        respuesta = middleware.process_response(request, respuesta)
+        self.assertEqual(respuesta['ETag'], 'W/"abc"')
+        self.assertEqual(zlib.decompress(respuesta.content, 31), b'{"a": 1}' * 500)
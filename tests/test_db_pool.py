@@ -0,0 +1,79 @@
+"""
+Pruebas de la configuración de conexiones a la base de datos y sus métricas.
+"""
+
+import os
+import sys
+import types
+from unittest import mock
+
+from django.contrib.auth.models import User
+from django.db import connection
+from django.db.backends.signals import connection_created
+from django.test import SimpleTestCase, TestCase
+from rest_framework.test import APIClient
+
+from blog import db_metrics
+from mysite.runtime import opciones_conexion_db, tamano_pool_db
+
+
+class OpcionesConexionTestCase(SimpleTestCase):
+    """Verifica las opciones generadas para cada DB_POOL_MODE."""
+
+    def test_modos_persistentes(self):
+        self.assertEqual(opciones_conexion_db('none'), {'CONN_MAX_AGE': 0})
+
+        with mock.patch.dict(os.environ, {'DB_CONN_MAX_AGE': '120'}):
+            persistente = opciones_conexion_db('persistent')
+        self.assertEqual(persistente, {'CONN_MAX_AGE': 120, 'CONN_HEALTH_CHECKS': True})
+
+        pgbouncer = opciones_conexion_db('pgbouncer')
+        self.assertTrue(pgbouncer['DISABLE_SERVER_SIDE_CURSORS'])
+        self.assertTrue(pgbouncer['CONN_HEALTH_CHECKS'])
+
+    def test_pool_sin_psycopg3_usa_conexiones_persistentes(self):
+        with mock.patch.dict(sys.modules, {'psycopg': None, 'psycopg_pool': None}):
+            opciones = opciones_conexion_db('pool')
+        self.assertGreater(opciones['CONN_MAX_AGE'], 0)
+        self.assertNotIn('OPTIONS', opciones)
+
+    def test_pool_dimensionado_por_hilos_y_limite_del_servidor(self):
+        modulos = {'psycopg': types.ModuleType('psycopg'), 'psycopg_pool': types.ModuleType('psycopg_pool')}
+        entorno = {'GUNICORN_WORKERS': '4', 'GUNICORN_THREADS': '6'}
+        with mock.patch.dict(sys.modules, modulos), mock.patch.dict(os.environ, entorno):
+            opciones = opciones_conexion_db('pool')
+            self.assertEqual(opciones['CONN_MAX_AGE'], 0)
+            self.assertEqual(opciones['OPTIONS']['pool']['max_size'], 6)
+
+            # 25 conexiones - 5 reservadas = 20 entre 4 workers
+            with mock.patch.dict(os.environ, {'DB_MAX_CONNECTIONS': '25'}):
+                self.assertEqual(tamano_pool_db(), 5)
+
+
+class MetricasConexionTestCase(TestCase):
+    """Verifica los contadores de rotación de conexiones."""
+
+    def setUp(self):
+        db_metrics.reiniciar()
+
+    def test_contadores_de_conexiones_y_peticiones(self):
+        connection_created.send(sender=type(connection), connection=connection)
+        self.client.get('/api/auth/status/')
+        self.client.get('/api/auth/status/')
+
+        resumen = db_metrics.resumen()
+        self.assertEqual(resumen['peticiones'], 2)
+        self.assertEqual(resumen['conexiones_por_alias'], {'default': 1})
+        self.assertEqual(resumen['conexiones_por_peticion'], 0.5)
+        self.assertIsNone(resumen['pool'])
+
+    def test_endpoint_solo_staff(self):
+        cliente = APIClient()
+        self.assertIn(cliente.get('/api/metrics/db/').status_code, (401, 403))
+
+        cliente.force_authenticate(User.objects.create_user('dba', password='clave-segura-123', is_staff=True))
+        respuesta = cliente.get('/api/metrics/db/')
+
+        self.assertEqual(respuesta.status_code, 200)
+        self.assertIn('modo', respuesta.data['configuracion'])
+        self.assertIn('conexiones_creadas', respuesta.data['proceso'])
@@ -0,0 +1,80 @@
+"""
+Pruebas de las facetas con conteos en los listados.
+"""
+
+from django.contrib.auth.models import User
+from django.core.cache import cache
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+from django.utils import timezone
+from rest_framework.test import APIClient
+
+from blog.Models.IntegrantesModel import Integrantes
+from blog.Models.ProyectosModel import Proyectos
+
+
+class FacetasTestCase(TestCase):
+    """Verifica el cálculo, la caché y la invalidación de facetas."""
+
+    def setUp(self):
+        cache.clear()
+        self.user = User.objects.create_user(username='autor', password='x')
+        self.cliente = APIClient()
+        for indice, (semestre, estado) in enumerate([('5', True), ('5', True), ('7', False), ('8', True)]):
+            self.crear_integrante(indice, semestre, estado)
+
+    def crear_integrante(self, indice, semestre, estado):
+        return Integrantes.objects.create(
+            nombre_integrante=f'Integrante {indice}',
+            semestre=semestre,
+            correo=f'integrante{indice}@example.com',
+            link_git=f'https://github.com/integrante{indice}',
+            creador=self.user,
+            estado=estado,
+        )
+
+    def consultas_de_facetas(self, params):
+        with CaptureQueriesContext(connection) as consultas:
+            respuesta = self.cliente.get('/api/hl4/v1/integrantes/', params)
+        return respuesta, [c['sql'] for c in consultas.captured_queries if 'faceta_total' in c['sql']]
+
+    def test_facetas_en_una_consulta_sobre_el_queryset_filtrado(self):
+        respuesta, consultas = self.consultas_de_facetas({'facets': 'semestre,estado'})
+        self.assertEqual(respuesta.status_code, 200)
+        self.assertEqual(len(consultas), 1)
+        self.assertEqual(respuesta.data['count'], 4)
+        self.assertEqual(respuesta.data['facets'], {
+            'semestre': [{'valor': '5', 'total': 2}, {'valor': '7', 'total': 1}, {'valor': '8', 'total': 1}],
+            'estado': [{'valor': True, 'total': 3}, {'valor': False, 'total': 1}],
+        })
+
+        respuesta = self.cliente.get('/api/hl4/v1/integrantes/', {'facets': 'semestre', 'estado': 'true'})
+        self.assertEqual(respuesta.data['facets']['semestre'], [
+            {'valor': '5', 'total': 2}, {'valor': '8', 'total': 1},
+        ])
+
+    def test_cache_por_firma_e_invalidacion(self):
+        self.consultas_de_facetas({'facets': 'semestre'})
+        respuesta, consultas = self.consultas_de_facetas({'facets': 'semestre', 'page': 1})
+        self.assertEqual(consultas, [])
+
+        self.crear_integrante(9, '7', True)
+        respuesta, consultas = self.consultas_de_facetas({'facets': 'semestre'})
+        self.assertEqual(len(consultas), 1)
+        self.assertIn({'valor': '7', 'total': 2}, respuesta.data['facets']['semestre'])
+
+    def test_faceta_desconocida_y_relacion_inversa(self):
+        respuesta = self.cliente.get('/api/hl4/v1/integrantes/', {'facets': 'correo'})
+        self.assertEqual(respuesta.status_code, 400)
+        self.assertIn('facets', respuesta.data)
+
+        for descripcion in ('Django y React', 'Django'):
+            Proyectos.objects.create(
+                nombre_proyecto='Proyecto', fecha_proyecto=timezone.now(),
+                link_proyecto='https://example.com', description_proyecto=descripcion, creador=self.user,
+            )
+        respuesta = self.cliente.get('/api/hl4/v1/proyectos/', {'facets': 'tecnologia'})
+        self.assertEqual(respuesta.data['facets']['tecnologia'], [
+            {'valor': 'django', 'total': 2}, {'valor': 'react', 'total': 1},
+        ])
@@ -0,0 +1,84 @@
+"""
+Pruebas de ida y vuelta de los formatos binarios (MessagePack y CBOR).
+"""
+
+import datetime
+import json
+import unittest
+from decimal import Decimal
+
+import cloudinary
+from django.contrib.auth.models import User
+from django.test import TestCase
+from rest_framework.test import APIClient
+from rest_framework.utils.encoders import JSONEncoder
+
+from blog.Models.CursosModel import Cursos
+from blog.Models.NoticiasModel import Noticias
+from blog.renderers import CBORRenderer, MessagePackRenderer, cbor2, msgpack
+
+FORMATOS = {
+    'application/msgpack': lambda contenido: msgpack.unpackb(contenido, raw=False),
+    'application/cbor': lambda contenido: cbor2.loads(contenido),
+}
+
+
+@unittest.skipIf(msgpack is None, 'msgpack no instalado')
+class FormatosBinariosTestCase(TestCase):
+    """Verifica que los formatos binarios devuelvan los mismos datos que el JSON."""
+
+    def setUp(self):
+        cloudinary.config(cloud_name='demo')
+        self.user = User.objects.create_user(username='autor', password='x')
+        self.cliente = APIClient()
+        Noticias.objects.create(
+            nombre_noticia='Noticia', link_noticia='https://example.com/n', description_noticia='Texto',
+            creador=self.user, imagen_noticia='image/upload/v1/noticias/foto.jpg',
+        )
+
+    def formatos(self):
+        return {tipo: decodificar for tipo, decodificar in FORMATOS.items() if tipo != 'application/cbor' or cbor2}
+
+    def test_misma_respuesta_que_json(self):
+        esperado = self.cliente.get('/api/hl4/v1/noticias/').json()
+        self.assertTrue(esperado['results'][0]['imagen_noticia'].startswith('http'))
+        for tipo, decodificar in self.formatos().items():
+            with self.subTest(formato=tipo):
+                respuesta = self.cliente.get('/api/hl4/v1/noticias/', HTTP_ACCEPT=tipo)
+                self.assertEqual(respuesta['Content-Type'], tipo)
+                self.assertEqual(decodificar(respuesta.content), esperado)
+
+    def test_tipos_especiales_como_en_json(self):
+        datos = {
+            'fecha': datetime.datetime(2024, 5, 1, 12, 30, tzinfo=datetime.timezone.utc),
+            'dia': datetime.date(2024, 5, 1),
+            'importe': Decimal('9.90'),
+            'etiquetas': ('django', 'react'),
+        }
+        esperado = json.loads(json.dumps(datos, cls=JSONEncoder))
+        self.assertEqual(msgpack.unpackb(MessagePackRenderer().render(datos), raw=False), esperado)
+        if cbor2:
+            self.assertEqual(cbor2.loads(CBORRenderer().render(datos)), esperado)
+
+    def test_peticiones_binarias(self):
+        self.cliente.force_authenticate(self.user)
+        curso = {
+            'nombre_curso': 'Curso binario',
+            'link_curso': 'https://example.com/curso',
+            'descripcion_curso': 'Enviado en MessagePack',
+            'fechainicial_curso': datetime.datetime(2024, 3, 1, 8, 0, tzinfo=datetime.timezone.utc),
+            'creador': self.user.pk,
+        }
+        respuesta = self.cliente.post(
+            '/api/hl4/v1/cursos/',
+            msgpack.packb(curso, datetime=True),
+            content_type='application/msgpack',
+            HTTP_ACCEPT='application/msgpack',
+        )
+        self.assertEqual(respuesta.status_code, 201, respuesta.content)
+        creado = msgpack.unpackb(respuesta.content, raw=False)
+        self.assertEqual(creado['fechainicial_curso'], '2024-03-01T08:00:00Z')
+        self.assertEqual(Cursos.objects.get().nombre_curso, 'Curso binario')
+
+        respuesta = self.cliente.post('/api/hl4/v1/cursos/', b'\xc1', content_type='application/msgpack')
+        self.assertEqual(respuesta.status_code, 400)
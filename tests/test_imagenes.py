@@ -0,0 +1,78 @@
+"""
+Pruebas de las URLs de Cloudinary generadas sin el SDK por fila.
+"""
+
+import cloudinary
+from cloudinary import CloudinaryResource
+from django.contrib.auth.models import User
+from django.test import SimpleTestCase, TestCase, override_settings
+from rest_framework.test import APIClient
+
+from blog.imagenes import ConstructorURL, url_imagen
+from blog.Models.NoticiasModel import Noticias
+
+RECURSOS = [
+    dict(public_id='noticias/foto', format='jpg', version='1712345678'),
+    dict(public_id='noticias/foto', format='png', version=None),
+    dict(public_id='perfil', format=None, version=None),
+    dict(public_id='v2/archivo', format='jpg', version=None),
+    dict(public_id='carpeta/con espacio ñ', format='jpg', version='3'),
+    dict(public_id='https://example.com/remota.jpg', format=None, version=None),
+]
+
+
+class ConfiguracionCloudinaryMixin:
+    """Restaura la configuración global de Cloudinary tras cada prueba."""
+
+    def setUp(self):
+        super().setUp()
+        anterior = dict(cloudinary.config().__dict__)
+        self.addCleanup(lambda: (cloudinary.config().__dict__.clear(), cloudinary.config().__dict__.update(anterior)))
+        cloudinary.config(cloud_name='demo')
+
+
+class ConstructorURLTestCase(ConfiguracionCloudinaryMixin, SimpleTestCase):
+    """Compara las URLs con las del SDK en distintas configuraciones."""
+
+    def comparar(self):
+        for datos in RECURSOS:
+            recurso = CloudinaryResource(type='upload', resource_type='image', **datos)
+            with self.subTest(config=cloudinary.config().__dict__, recurso=datos):
+                self.assertEqual(url_imagen(recurso), recurso.url)
+                self.assertEqual(
+                    url_imagen(recurso, 'c_limit,w_640,f_auto,q_auto'),
+                    recurso.build_url(raw_transformation='c_limit,w_640,f_auto,q_auto'),
+                )
+
+    def test_configuraciones(self):
+        self.comparar()
+        for opciones in ({'secure': True}, {'force_version': False}, {'private_cdn': True, 'secure': True},
+                         {'cname': 'img.example.com'}, {'sign_url': True, 'api_secret': 'secreto'},
+                         {'cdn_subdomain': True}):
+            cloudinary.config(**opciones)
+            self.comparar()
+
+    def test_prefijo_cacheado_por_configuracion(self):
+        self.assertIs(ConstructorURL.actual(), ConstructorURL.actual())
+        cloudinary.config(secure=True)
+        self.assertTrue(url_imagen(CloudinaryResource(public_id='a', type='upload')).startswith('https://'))
+
+
+class VariantesAPITestCase(ConfiguracionCloudinaryMixin, TestCase):
+    """Verifica las variantes expuestas por la API."""
+
+    @override_settings(CLOUDINARY_VARIANTES={'thumbnail': 'c_fill,h_150,w_150'}, CLOUDINARY_SRCSET_ANCHOS=[320, 640])
+    def test_variantes_en_el_listado(self):
+        user = User.objects.create_user(username='autor', password='x')
+        Noticias.objects.create(
+            nombre_noticia='Noticia', link_noticia='https://example.com/n', description_noticia='Texto',
+            creador=user, imagen_noticia='image/upload/v5/noticias/foto.jpg',
+        )
+        noticia = APIClient().get('/api/hl4/v1/noticias/').json()['results'][0]
+        base = 'http://res.cloudinary.com/demo/image/upload'
+        self.assertEqual(noticia['imagen_noticia'], f'{base}/v5/noticias/foto.jpg')
+        self.assertEqual(noticia['imagen_noticia_variantes'], {
+            'thumbnail': f'{base}/c_fill,h_150,w_150,f_auto,q_auto/v5/noticias/foto.jpg',
+            'srcset': f'{base}/c_limit,w_320,f_auto,q_auto/v5/noticias/foto.jpg 320w, '
+                      f'{base}/c_limit,w_640,f_auto,q_auto/v5/noticias/foto.jpg 640w',
+        })
@@ -0,0 +1,79 @@
+"""
+Pruebas del ciclo de vida de los archivos de log.
+"""
+
+import gzip
+import os
+import shutil
+import tempfile
+import time
+from unittest import mock
+
+from django.test import SimpleTestCase
+
+from blog import log_lifecycle
+
+DIA = 86400
+
+
+class GestionLogsTestCase(SimpleTestCase):
+    """Verifica la retención por antigüedad y tamaño y la compresión."""
+
+    def setUp(self):
+        self.directorio = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.directorio)
+        activos = {os.path.join(self.directorio, nombre) for nombre in ('app.log', 'errors.log')}
+        parche = mock.patch.object(log_lifecycle, 'archivos_activos', return_value=activos)
+        parche.start()
+        self.addCleanup(parche.stop)
+        self.ahora = time.time()
+
+    def crear(self, nombre, contenido, dias=0):
+        ruta = os.path.join(self.directorio, nombre)
+        with open(ruta, 'wb') as archivo:
+            archivo.write(contenido)
+        os.utime(ruta, (self.ahora - dias * DIA, self.ahora - dias * DIA))
+        return ruta
+
+    def gestionar(self, **kwargs):
+        opciones = {'dias': 30, 'max_bytes': 10 ** 9, 'comprimir_rotados': True, 'hilos': 2, 'ahora': self.ahora}
+        return log_lifecycle.gestionar_logs(self.directorio, **{**opciones, **kwargs})
+
+    def test_antiguedad_y_compresion(self):
+        linea = b'INFO 2024-05-01 12:00:00 views 1 2 GET /api/hl4/v1/noticias/ 200\n'
+        self.crear('app.log', b'activo\n', dias=90)
+        rotado = self.crear('app.log.1', linea * 2000, dias=1)
+        self.crear('errors.log.2', linea * 10, dias=60)
+        self.crear('antiguo.txt', b'x' * 100, dias=40)
+        self.crear('reciente.txt', b'x' * 100)
+
+        resumen = self.gestionar()
+
+        restantes = sorted(os.listdir(self.directorio))
+        comprimido = next(nombre for nombre in restantes if nombre.endswith('.gz'))
+        self.assertRegex(comprimido, r'^app\.log\.\d{8}-\d{6}\.gz$')
+        self.assertEqual(sorted(set(restantes) - {comprimido}), ['app.log', 'reciente.txt'])
+        with gzip.open(os.path.join(self.directorio, comprimido)) as archivo:
+            self.assertEqual(archivo.read(), linea * 2000)
+        self.assertAlmostEqual(os.path.getmtime(os.path.join(self.directorio, comprimido)), self.ahora - DIA, 0)
+        self.assertFalse(os.path.exists(rotado))
+
+        self.assertEqual((resumen['archivos_eliminados'], resumen['archivos_comprimidos']), (2, 1))
+        self.assertEqual(resumen['bytes_recuperados']['antiguedad'], len(linea) * 10 + 100)
+        self.assertGreater(resumen['bytes_recuperados']['compresion'], len(linea) * 1900)
+        self.assertEqual(
+            resumen['bytes_despues'],
+            sum(os.path.getsize(os.path.join(self.directorio, nombre)) for nombre in os.listdir(self.directorio)),
+        )
+
+    def test_retencion_por_tamano(self):
+        self.crear('errors.log', b'x' * 5000, dias=20)
+        for dias in (5, 3, 1):
+            self.crear(f'errors.log.{dias}.gz', b'x' * 1000, dias=dias)
+
+        resumen = self.gestionar(max_bytes=2000)
+
+        self.assertEqual(
+            sorted(os.listdir(self.directorio)), ['errors.log', 'errors.log.1.gz', 'errors.log.3.gz'],
+        )
+        self.assertEqual(resumen['bytes_recuperados'], {'antiguedad': 0, 'compresion': 0, 'tamano': 1000})
@@ -0,0 +1,127 @@
+"""
+Pruebas de la guardia del login y del rehash transparente de contraseñas.
+"""
+
+from unittest import mock
+
+from django.contrib.auth.models import User
+from django.core.cache import cache
+from django.test import SimpleTestCase, TestCase, override_settings
+from rest_framework.test import APIClient
+
+from blog.ratelimit import VentanaDeslizante, parse_tasa
+
+HASHERS_ARGON2 = [
+    'blog.hashers.TunedArgon2PasswordHasher',
+    'django.contrib.auth.hashers.PBKDF2PasswordHasher',
+]
+
+
+class VentanaDeslizanteTestCase(SimpleTestCase):
+    """Verifica el parseo de tasas y el contador de ventana deslizante."""
+
+    def setUp(self):
+        cache.clear()
+
+    def test_parse_tasa(self):
+        self.assertEqual(parse_tasa('20/min'), (20, 60))
+        self.assertEqual(parse_tasa('5/15m'), (5, 900))
+        self.assertEqual(parse_tasa('1000/hour'), (1000, 3600))
+        with self.assertRaises(ValueError):
+            parse_tasa('muchos')
+
+    def test_bloquea_al_superar_el_limite(self):
+        ventana = VentanaDeslizante('prueba', 3, 60)
+        self.assertEqual([ventana.registrar('ip') for _ in range(3)], [0, 0, 0])
+        self.assertGreater(ventana.registrar('ip'), 0)
+        self.assertEqual(ventana.registrar('otra-ip'), 0)
+
+        ventana.reiniciar('ip')
+        self.assertEqual(ventana.estado('ip'), 0)
+
+
+@override_settings(LOGIN_RATE_IP='100/m', LOGIN_RATE_USERNAME='3/m')
+class GuardiaLoginTestCase(TestCase):
+    """Verifica que los intentos bloqueados no lleguen a calcular el hash."""
+
+    def setUp(self):
+        cache.clear()
+        self.user = User.objects.create_user(username='victima', password='clave-segura-123')
+        self.cliente = APIClient()
+
+    def login(self, password, username='victima', url='/api/auth/login/'):
+        return self.cliente.post(url, {'username': username, 'password': password}, format='json')
+
+    def test_bloqueo_por_usuario_sin_autenticar(self):
+        for _ in range(3):
+            self.assertEqual(self.login('incorrecta').status_code, 400)
+
+        with mock.patch('blog.Serializers.AuthSerializer.authenticate') as autenticar:
+            respuesta = self.login('clave-segura-123')
+        autenticar.assert_not_called()
+        self.assertEqual(respuesta.status_code, 429)
+        self.assertGreater(int(respuesta['Retry-After']), 0)
+
+        # Otros usuarios no se ven afectados
+        self.assertEqual(self.login('x', username='otro').status_code, 400)
+
+    def test_login_correcto_reinicia_los_fallos(self):
+        for _ in range(2):
+            self.login('incorrecta')
+        self.assertEqual(self.login('clave-segura-123').status_code, 200)
+        for _ in range(2):
+            self.assertEqual(self.login('incorrecta').status_code, 400)
+
+    @override_settings(LOGIN_RATE_IP='2/m')
+    def test_bloqueo_por_ip_en_endpoint_de_tokens(self):
+        self.login('incorrecta', url='/api/auth/token/')
+        self.login('incorrecta', username='otro', url='/api/auth/token/')
+        respuesta = self.login('clave-segura-123', url='/api/auth/token/')
+        self.assertEqual(respuesta.status_code, 429)
+        self.assertIn('Retry-After', respuesta)
+
+    @override_settings(LOGIN_RATE_IP='2/m', NUM_PROXIES=1)
+    def test_x_forwarded_for_falso_no_cambia_de_ip(self):
+        # El cliente inventa la primera entrada; el proxy añade la IP real al final
+        for n, url in enumerate(('/api/auth/login/', '/api/auth/token/', '/api/auth/login/')):
+            respuesta = self.cliente.post(
+                url, {'username': f'usuario{n}', 'password': 'x'}, format='json',
+                HTTP_X_FORWARDED_FOR=f'203.0.113.{n}, 198.51.100.7',
+            )
+        self.assertEqual(respuesta.status_code, 429)
+
+    def test_cuerpo_que_no_es_un_objeto(self):
+        for url in ('/api/auth/login/', '/api/auth/token/'):
+            respuesta = self.cliente.post(url, [], format='json')
+            self.assertEqual(respuesta.status_code, 400, url)
+
+
+@override_settings(LOGIN_RATE_IP='100/m', LOGIN_RATE_USERNAME='100/m')
+class RehashContrasenaTestCase(TestCase):
+    """Verifica que el hasher preferido se aplique en el siguiente login."""
+
+    def setUp(self):
+        cache.clear()
+        self.user = User.objects.create_user(username='migrada', password='clave-segura-123')
+
+    def test_rehash_a_argon2_en_login(self):
+        self.assertTrue(self.user.password.startswith('pbkdf2_sha256$'))
+
+        with override_settings(PASSWORD_HASHERS=HASHERS_ARGON2):
+            respuesta = APIClient().post(
+                '/api/auth/login/', {'username': 'migrada', 'password': 'clave-segura-123'}, format='json'
+            )
+        self.assertEqual(respuesta.status_code, 200)
+
+        self.user.refresh_from_db()
+        self.assertTrue(self.user.password.startswith('argon2$argon2id$'))
+        self.assertIn('m=19456,t=2,p=1', self.user.password)
+
+    def test_cambio_de_parametros_rehashea(self):
+        with override_settings(PASSWORD_HASHERS=HASHERS_ARGON2):
+            self.user.set_password('clave-segura-123')
+            self.user.save()
+            with override_settings(ARGON2_TIME_COST=3):
+                self.assertTrue(self.user.check_password('clave-segura-123'))
+        self.user.refresh_from_db()
+        self.assertIn('t=3', self.user.password)
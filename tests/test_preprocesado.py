@@ -0,0 +1,102 @@
+"""
+Pruebas del pre-procesado de imágenes con Pillow.
+"""
+
+import io
+from unittest import mock
+
+import cloudinary
+from django.contrib.auth.models import User
+from django.core.files.uploadedfile import SimpleUploadedFile, UploadedFile
+from django.test import SimpleTestCase, TestCase, override_settings
+from PIL import Image
+from rest_framework import serializers
+from rest_framework.test import APIClient
+
+from blog.Models.NoticiasModel import Noticias
+from blog.Serializers.CloudinaryImageField import CloudinaryImageField
+from blog.preprocesado import formato_disponible, preprocesar_imagen
+
+
+def foto(tamano=(1200, 900), formato='JPEG', modo='RGB', nombre='foto.jpg', exif=True):
+    contenido = io.BytesIO()
+    imagen = Image.linear_gradient('L').resize(tamano).convert(modo)
+    if modo == 'RGBA':
+        imagen.putalpha(Image.linear_gradient('L').resize(tamano))
+    opciones = {}
+    if exif:
+        datos = Image.Exif()
+        datos[0x0112] = 6  # Orientación: girada 90º
+        datos[0x8825] = {0x0002: (40.0, 25.0, 0.0)}  # GPS
+        opciones['exif'] = datos
+    imagen.save(contenido, formato, **opciones)
+    return SimpleUploadedFile(nombre, contenido.getvalue(), content_type=f'image/{formato.lower()}')
+
+
+@override_settings(
+    IMAGE_PREPROCESS=True, IMAGE_PREPROCESS_MAX_SIZE=400, IMAGE_PREPROCESS_FORMAT='WEBP', IMAGE_PREPROCESS_QUALITY=80,
+)
+class PreprocesadoTestCase(SimpleTestCase):
+    """Verifica el redimensionado, la limpieza de metadatos y los formatos."""
+
+    def test_redimensiona_gira_y_limpia_exif(self):
+        original = foto()
+        resultado, informe = preprocesar_imagen(original)
+
+        self.assertIsInstance(resultado, UploadedFile)
+        self.assertEqual(resultado.name, 'foto.webp')
+        self.assertEqual(informe['bytes_ahorrados'], original.size - resultado.size)
+        self.assertGreater(informe['bytes_ahorrados'], 0)
+        with Image.open(resultado) as imagen:
+            self.assertEqual((imagen.format, imagen.size), ('WEBP', (300, 400)))
+            self.assertEqual(dict(imagen.getexif()), {})
+
+    def test_transparencia_y_formatos(self):
+        png = foto((600, 600), 'PNG', 'RGBA', 'logo.png', exif=False)
+        resultado, _ = preprocesar_imagen(png)
+        with Image.open(resultado) as imagen:
+            self.assertEqual(imagen.mode, 'RGBA')
+
+        resultado, informe = preprocesar_imagen(png, formato='JPEG', lado_maximo=100)
+        self.assertEqual((resultado.name, informe['dimensiones']), ('logo.jpg', [100, 100]))
+        self.assertIn(formato_disponible('AVIF'), ('AVIF', 'WEBP'))
+
+    def test_imagen_ya_optimizada_sin_cambios(self):
+        pequena = foto((50, 50), 'WEBP', nombre='icono.webp', exif=False)
+        resultado, informe = preprocesar_imagen(pequena, calidad=100)
+        self.assertIs(resultado, pequena)
+        self.assertEqual((informe['procesada'], informe['bytes_ahorrados']), (False, 0))
+
+    def test_imagen_truncada_es_error_de_validacion(self):
+        completa = foto((3000, 2000), exif=False).read()
+        truncada = SimpleUploadedFile('rota.jpg', completa[:len(completa) // 2], content_type='image/jpeg')
+        with self.assertRaises(serializers.ValidationError) as error:
+            CloudinaryImageField().run_validation(truncada)
+        self.assertEqual(error.exception.detail[0].code, 'invalid_image')
+
+
+class PreprocesadoAPITestCase(TestCase):
+    """Verifica que las subidas de la API se pre-procesen antes de guardarse."""
+
+    @override_settings(IMAGE_PREPROCESS_MAX_SIZE=400)
+    def test_subida_preprocesada(self):
+        cloudinary.config(cloud_name='demo')
+        user = User.objects.create_user(username='autor', password='x')
+        cliente = APIClient()
+        cliente.force_authenticate(user)
+        subidas = []
+
+        def subir(archivo, **opciones):
+            with Image.open(archivo) as imagen:
+                subidas.append((archivo.name, imagen.format, imagen.size))
+            return cloudinary.CloudinaryResource('noticias/foto', version='1', format='webp')
+
+        with override_settings(IMAGE_PREPROCESS=True), mock.patch('cloudinary.uploader.upload_resource', subir):
+            respuesta = cliente.post('/api/hl4/v1/noticias/', {
+                'nombre_noticia': 'Noticia', 'link_noticia': 'https://example.com/n',
+                'description_noticia': 'Texto', 'creador': user.pk, 'imagen_noticia': foto(),
+            }, format='multipart')
+
+        self.assertEqual(respuesta.status_code, 201, respuesta.content)
+        self.assertEqual(subidas, [('foto.webp', 'WEBP', (300, 400))])
+        self.assertTrue(Noticias.objects.exists())
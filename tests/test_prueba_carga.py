@@ -0,0 +1,76 @@
+"""
+Pruebas del arnés de generación de carga.
+"""
+
+import asyncio
+import os
+import tempfile
+
+import httpx
+from django.test import SimpleTestCase
+
+from blog.benchmarks.carga import (
+    MEZCLA_POR_DEFECTO,
+    Peticion,
+    SelectorPeticiones,
+    ejecutar_perfil,
+    mezcla_desde_log,
+    percentil,
+)
+
+
+class PruebaCargaTestCase(SimpleTestCase):
+    """Verifica el cálculo de percentiles, la mezcla y la ejecución de perfiles."""
+
+    def test_percentil_rango_mas_cercano(self):
+        valores = [float(i) for i in range(1, 101)]
+        self.assertEqual(percentil(valores, 50), 50.0)
+        self.assertEqual(percentil(valores, 99), 99.0)
+        self.assertEqual(percentil(valores, 100), 100.0)
+        self.assertEqual(percentil([], 90), 0.0)
+
+    def test_selector_respeta_pesos(self):
+        mezcla = (Peticion('a', '/a/', 9), Peticion('b', '/b/?search={termino}', 1))
+        selector = SelectorPeticiones(mezcla, semilla=1)
+        elegidas = [selector.siguiente() for _ in range(2000)]
+        proporcion_a = sum(1 for peticion, _ in elegidas if peticion.nombre == 'a') / len(elegidas)
+        self.assertAlmostEqual(proporcion_a, 0.9, delta=0.05)
+        self.assertTrue(all('{termino}' not in ruta for _, ruta in elegidas))
+
+    def test_mezcla_desde_log(self):
+        lineas = [
+            '{"level": "INFO", "message": "{"method": "GET", "endpoint": "/api/hl4/v1/noticias/"}"}',
+            '{"level": "INFO", "message": "{"method": "GET", "endpoint": "/api/hl4/v1/noticias/"}"}',
+            '{"level": "INFO", "message": "{"method": "POST", "endpoint": "/api/auth/login/"}"}',
+            '{"level": "INFO", "message": "{"method": "GET", "endpoint": "/api/auth/status/"}"}',
+        ]
+        with tempfile.NamedTemporaryFile('w', suffix='.log', delete=False) as archivo:
+            archivo.write('\n'.join(lineas))
+        try:
+            mezcla = mezcla_desde_log(archivo.name)
+        finally:
+            os.unlink(archivo.name)
+
+        self.assertEqual([p.ruta for p in mezcla], ['/api/hl4/v1/noticias/', '/api/auth/status/'])
+        self.assertEqual(mezcla[0].peso, 2)
+
+    def test_ejecutar_perfil_con_transporte_simulado(self):
+        def responder(request):
+            if request.url.path == '/api/auth/status/':
+                return httpx.Response(429)
+            return httpx.Response(200, json={'results': []})
+
+        resultado = asyncio.run(ejecutar_perfil(
+            'http://servidor.test',
+            MEZCLA_POR_DEFECTO,
+            concurrencia=4,
+            duracion=0.2,
+            semilla=3,
+            transport=httpx.MockTransport(responder),
+        ))
+        resumen = resultado.resumen()
+
+        self.assertGreater(resumen['peticiones'], 0)
+        self.assertEqual(resumen['concurrencia'], 4)
+        self.assertEqual(resumen['errores'], resumen['endpoints']['auth_status']['errores'])
+        self.assertIn('200', resumen['estados'])
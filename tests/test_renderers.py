@@ -0,0 +1,58 @@
+"""
+Pruebas del renderer JSON rápido y la negociación de contenido.
+"""
+
+import datetime
+import decimal
+import uuid
+from collections import OrderedDict
+
+from django.test import SimpleTestCase, TestCase
+from django.utils import timezone
+from django.utils.translation import gettext_lazy
+from rest_framework.renderers import JSONRenderer
+from rest_framework.settings import api_settings
+from rest_framework.test import APIClient
+
+from blog.renderers import FastJSONRenderer
+
+
+class FastJSONRendererTestCase(SimpleTestCase):
+    """Verifica que la salida sea idéntica a la del JSONRenderer de DRF."""
+
+    def test_misma_salida_que_drf(self):
+        datos = OrderedDict([
+            ('fecha', timezone.now()),
+            ('dia', datetime.date(2024, 5, 1)),
+            ('hora', datetime.time(9, 30, 0, 250)),
+            ('decimal', decimal.Decimal('12.50')),
+            ('perezosa', gettext_lazy('Creación')),
+            ('uuid', uuid.UUID(int=7)),
+            (3, 'clave entera'),
+            ('texto', 'ñandú   fin'),
+            ('anidado', [{'a': 1, 'b': None}, {1, 2}]),
+        ])
+        self.assertEqual(FastJSONRenderer().render(datos), JSONRenderer().render(datos))
+        self.assertEqual(FastJSONRenderer().render(None), b'')
+
+    def test_sangria_y_enteros_grandes_usan_la_ruta_estandar(self):
+        datos = {'grande': 2 ** 70, 'lista': [1, 2]}
+        self.assertEqual(FastJSONRenderer().render(datos), JSONRenderer().render(datos))
+        pedido = 'application/json; indent=4'
+        self.assertEqual(
+            FastJSONRenderer().render(datos, pedido),
+            JSONRenderer().render(datos, pedido),
+        )
+
+
+class NegociacionTestCase(TestCase):
+    """Verifica que las respuestas usen el renderer rápido por defecto."""
+
+    def test_json_compacto_por_defecto(self):
+        clases = [clase.__name__ for clase in api_settings.DEFAULT_RENDERER_CLASSES]
+        self.assertEqual(clases[0], 'FastJSONRenderer')
+
+        respuesta = APIClient().get('/api/hl4/v1/noticias/')
+        self.assertEqual(respuesta.status_code, 200)
+        self.assertEqual(respuesta['Content-Type'], 'application/json')
+        self.assertTrue(respuesta.content.startswith(b'{"count":0,'))
@@ -0,0 +1,77 @@
+"""
+Pruebas del enrutamiento de lecturas hacia réplicas.
+"""
+
+from django.contrib.sessions.models import Session
+from django.http import HttpResponse
+from django.test import RequestFactory, SimpleTestCase, override_settings
+
+from blog.middleware import ReplicaRoutingMiddleware
+from blog.Models.NoticiasModel import Noticias
+from blog.routers import ReplicaRouter, leer_de_replica
+
+REPLICAS = {'DATABASE_REPLICAS': ['replica_1']}
+
+
+@override_settings(**REPLICAS)
+class ReplicaRouterTestCase(SimpleTestCase):
+    """Verifica a qué base de datos se envía cada operación."""
+
+    def setUp(self):
+        self.router = ReplicaRouter()
+
+    def test_lecturas_solo_en_contexto_de_replica(self):
+        self.assertEqual(self.router.db_for_read(Noticias), 'default')
+        with leer_de_replica():
+            self.assertEqual(self.router.db_for_read(Noticias), 'replica_1')
+            self.assertEqual(self.router.db_for_write(Noticias), 'default')
+            # Sesiones y tokens nunca se leen de una réplica retrasada
+            self.assertEqual(self.router.db_for_read(Session), 'default')
+            with leer_de_replica(False):
+                self.assertEqual(self.router.db_for_read(Noticias), 'default')
+        self.assertEqual(self.router.db_for_read(Noticias), 'default')
+
+    def test_sin_replicas_configuradas_usa_primaria(self):
+        with override_settings(DATABASE_REPLICAS=[]), leer_de_replica():
+            self.assertEqual(self.router.db_for_read(Noticias), 'default')
+
+    def test_migraciones_solo_en_primaria(self):
+        self.assertTrue(self.router.allow_migrate('default', 'blog'))
+        self.assertFalse(self.router.allow_migrate('replica_1', 'blog'))
+
+
+@override_settings(**REPLICAS)
+class ReplicaRoutingMiddlewareTestCase(SimpleTestCase):
+    """Verifica el uso de réplicas por método y la persistencia tras escribir."""
+
+    def setUp(self):
+        self.factory = RequestFactory()
+        self.destinos = []
+
+        def vista(request):
+            self.destinos.append(ReplicaRouter().db_for_read(Noticias))
+            return HttpResponse()
+
+        self.middleware = ReplicaRoutingMiddleware(vista)
+
+    def test_get_lee_de_replica_y_post_de_primaria(self):
+        self.middleware(self.factory.get('/api/hl4/v1/noticias/'))
+        respuesta = self.middleware(self.factory.post('/api/hl4/v1/noticias/'))
+
+        self.assertEqual(self.destinos, ['replica_1', 'default'])
+        self.assertIn('db_primaria', respuesta.cookies)
+        self.assertEqual(respuesta.cookies['db_primaria']['max-age'], 15)
+
+    def test_lectura_tras_escritura_sigue_en_primaria(self):
+        peticion = self.factory.get('/api/hl4/v1/noticias/')
+        peticion.COOKIES['db_primaria'] = '1'
+        respuesta = self.middleware(peticion)
+
+        self.assertEqual(self.destinos, ['default'])
+        self.assertNotIn('db_primaria', respuesta.cookies)
+
+    def test_escritura_fallida_no_fija_la_cookie(self):
+        middleware = ReplicaRoutingMiddleware(lambda request: HttpResponse(status=400))
+        respuesta = middleware(self.factory.post('/api/hl4/v1/noticias/'))
+
+        self.assertNotIn('db_primaria', respuesta.cookies)
@@ -0,0 +1,76 @@
+"""
+Pruebas del dimensionamiento de gunicorn y las estadísticas por worker.
+"""
+
+import json
+import os
+import tempfile
+from unittest import mock
+
+from django.contrib.auth.models import User
+from django.test import SimpleTestCase, TestCase
+from rest_framework.test import APIClient
+
+from mysite.runtime import (
+    EstadisticasWorker,
+    calcular_hilos,
+    calcular_workers,
+    configuracion_gunicorn,
+    leer_estadisticas_workers,
+)
+
+
+class DimensionamientoTestCase(SimpleTestCase):
+    """Verifica el cálculo de workers e hilos."""
+
+    def test_workers_limitados_por_memoria(self):
+        self.assertEqual(calcular_workers(4, None), 9)
+        self.assertEqual(calcular_workers(4, 8192), 9)
+        # 512 MB: (512 - 128) // 160 = 2 workers
+        self.assertEqual(calcular_workers(4, 512), 2)
+        self.assertEqual(calcular_workers(1, 200), 1)
+
+    def test_hilos_compensan_workers_recortados(self):
+        self.assertEqual(calcular_hilos(1, 3), 2)
+        self.assertEqual(calcular_hilos(4, 2), 8)
+
+    def test_variables_de_entorno_tienen_prioridad(self):
+        with mock.patch.dict(os.environ, {'WEB_CONCURRENCY': '6', 'GUNICORN_THREADS': '3'}):
+            configuracion = configuracion_gunicorn()
+        self.assertEqual(configuracion['workers'], 6)
+        self.assertEqual(configuracion['threads'], 3)
+
+    def test_estadisticas_agregadas_y_limpieza_de_workers_muertos(self):
+        with tempfile.TemporaryDirectory() as directorio:
+            estadisticas = EstadisticasWorker(os.getpid(), directorio)
+            estadisticas.registrar(0.02, 200)
+            estadisticas.registrar(0.04, 503)
+            estadisticas.volcar()
+
+            muerto = os.path.join(directorio, 'worker-999999999.json')
+            with open(muerto, 'w', encoding='utf-8') as archivo:
+                json.dump({'pid': 999999999, 'peticiones': 5, 'errores': 0, 'memoria_max_mb': 1}, archivo)
+
+            datos = leer_estadisticas_workers(directorio)
+
+            self.assertEqual(datos['workers_activos'], 1)
+            self.assertEqual(datos['peticiones'], 2)
+            self.assertEqual(datos['errores'], 1)
+            self.assertEqual(datos['workers'][0]['duracion_media_ms'], 30.0)
+            self.assertFalse(os.path.exists(muerto))
+
+
+class WorkersMetricsViewTestCase(TestCase):
+    """Verifica que el endpoint de métricas solo sea accesible para staff."""
+
+    def test_solo_staff(self):
+        cliente = APIClient()
+        self.assertIn(cliente.get('/api/metrics/workers/').status_code, (401, 403))
+
+        staff = User.objects.create_user('operador', password='clave-segura-123', is_staff=True)
+        cliente.force_authenticate(staff)
+        respuesta = cliente.get('/api/metrics/workers/')
+
+        self.assertEqual(respuesta.status_code, 200)
+        self.assertIn('recursos', respuesta.data)
+        self.assertIn('workers_activos', respuesta.data)
@@ -0,0 +1,73 @@
+"""
+Pruebas de la expiración deslizante de sesiones y su limpieza.
+"""
+
+import time
+from datetime import timedelta
+
+from django.conf import settings
+from django.contrib.auth.models import User
+from django.contrib.sessions.models import Session
+from django.db import connection
+from django.test import TestCase, override_settings
+from django.test.utils import CaptureQueriesContext
+from django.utils import timezone
+
+from blog.middleware import SessionRefreshMiddleware
+from blog.tasks import limpiar_sesiones_expiradas
+
+
+class SesionesTestCase(TestCase):
+    """Verifica que las lecturas no escriban la sesión salvo cerca de expirar."""
+
+    def setUp(self):
+        User.objects.create_user(username='lectora', password='clave-segura-123')
+        respuesta = self.client.post(
+            '/api/auth/login/',
+            {'username': 'lectora', 'password': 'clave-segura-123'},
+            content_type='application/json',
+        )
+        self.assertEqual(respuesta.status_code, 200)
+
+    def escrituras_de_sesion(self):
+        with CaptureQueriesContext(connection) as consultas:
+            respuesta = self.client.get('/api/auth/status/')
+        self.assertTrue(respuesta.json()['authenticated'])
+        return [
+            consulta['sql'] for consulta in consultas.captured_queries
+            if 'django_session' in consulta['sql'] and not consulta['sql'].startswith('SELECT')
+        ]
+
+    def test_lectura_no_escribe_la_sesion(self):
+        self.assertEqual(self.escrituras_de_sesion(), [])
+        self.assertEqual(self.escrituras_de_sesion(), [])
+
+    def test_sesion_cerca_de_expirar_se_renueva(self):
+        session = self.client.session
+        hace = int(time.time()) - settings.SESSION_COOKIE_AGE + settings.SESSION_REFRESH_THRESHOLD - 60
+        session[SessionRefreshMiddleware.CLAVE_RENOVACION] = hace
+        session.save()
+
+        self.assertEqual(len(self.escrituras_de_sesion()), 1)
+        self.assertGreater(self.client.session[SessionRefreshMiddleware.CLAVE_RENOVACION], hace)
+        # Ya renovada: las siguientes lecturas vuelven a no escribir
+        self.assertEqual(self.escrituras_de_sesion(), [])
+
+    def test_logout_no_recrea_la_sesion(self):
+        self.client.post('/api/auth/logout/')
+        self.assertEqual(Session.objects.count(), 0)
+
+
+@override_settings(SESSION_ENGINE='django.contrib.sessions.backends.db')
+class LimpiarSesionesTestCase(TestCase):
+    """Verifica la tarea de limpieza de sesiones expiradas."""
+
+    def test_elimina_solo_expiradas(self):
+        ahora = timezone.now()
+        Session.objects.create(session_key='expirada', session_data='', expire_date=ahora - timedelta(days=1))
+        Session.objects.create(session_key='vigente', session_data='', expire_date=ahora + timedelta(days=1))
+
+        resultado = limpiar_sesiones_expiradas()
+
+        self.assertEqual(resultado['sesiones_eliminadas'], 1)
+        self.assertEqual(list(Session.objects.values_list('session_key', flat=True)), ['vigente'])
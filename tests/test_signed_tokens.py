@@ -0,0 +1,80 @@
+"""
+Pruebas del modo de autenticación con tokens firmados sin estado.
+"""
+
+from unittest import mock
+
+from django.contrib.auth.models import User
+from django.core.cache import cache
+from django.db import connection
+from django.test import TestCase, override_settings
+from django.test.utils import CaptureQueriesContext
+from rest_framework.test import APIClient
+
+
+class SignedTokensTestCase(TestCase):
+    """Verifica emisión, verificación sin base de datos, refresco y revocación."""
+
+    def setUp(self):
+        cache.clear()
+        self.user = User.objects.create_user(
+            username='frontend', password='clave-segura-123', first_name='Ana', is_staff=True
+        )
+        self.cliente = APIClient()
+        respuesta = self.cliente.post(
+            '/api/auth/token/', {'username': 'frontend', 'password': 'clave-segura-123'}, format='json'
+        )
+        self.assertEqual(respuesta.status_code, 200)
+        self.tokens = respuesta.data
+
+    def autenticar(self, access):
+        self.cliente.credentials(HTTP_AUTHORIZATION=f'Bearer {access}')
+
+    def test_acceso_sin_consultas_a_la_base_de_datos(self):
+        self.autenticar(self.tokens['access'])
+        with CaptureQueriesContext(connection) as consultas:
+            respuesta = self.cliente.get('/api/auth/status/')
+
+        self.assertEqual(respuesta.status_code, 200)
+        self.assertTrue(respuesta.data['authenticated'])
+        self.assertEqual(respuesta.data['user'], self.tokens['user'])
+        self.assertEqual(respuesta.data['user']['full_name'], 'Ana')
+        self.assertEqual(len(consultas), 0)
+
+    def test_token_alterado_o_expirado(self):
+        self.autenticar(self.tokens['access'][:-2] + 'xx')
+        self.assertIn(self.cliente.get('/api/auth/profile/').status_code, (401, 403))
+
+        self.autenticar(self.tokens['access'])
+        with override_settings(SIGNED_TOKEN_ACCESS_TTL=0), mock.patch('time.time', return_value=2 ** 33):
+            self.assertIn(self.cliente.get('/api/auth/profile/').status_code, (401, 403))
+
+    def test_refresco_rota_el_token(self):
+        respuesta = self.cliente.post('/api/auth/token/refresh/', {'refresh': self.tokens['refresh']}, format='json')
+        self.assertEqual(respuesta.status_code, 200)
+        self.assertNotEqual(respuesta.data['access'], self.tokens['access'])
+
+        # El token de refresco usado ya no vale
+        repetido = self.cliente.post('/api/auth/token/refresh/', {'refresh': self.tokens['refresh']}, format='json')
+        self.assertEqual(repetido.status_code, 401)
+
+    def test_cambio_de_contrasena_invalida_el_refresco(self):
+        self.user.set_password('nueva-clave-segura-456')
+        self.user.save()
+
+        respuesta = self.cliente.post('/api/auth/token/refresh/', {'refresh': self.tokens['refresh']}, format='json')
+        self.assertEqual(respuesta.status_code, 401)
+
+    def test_revocacion(self):
+        self.autenticar(self.tokens['access'])
+        respuesta = self.cliente.post('/api/auth/token/revoke/', {'refresh': self.tokens['refresh']}, format='json')
+        self.assertEqual(respuesta.status_code, 200)
+
+        self.assertIn(self.cliente.get('/api/auth/profile/').status_code, (401, 403))
+        self.cliente.credentials()
+        refresco = self.cliente.post('/api/auth/token/refresh/', {'refresh': self.tokens['refresh']}, format='json')
+        self.assertEqual(refresco.status_code, 401)
+
+    def test_token_de_refresco_no_sirve_como_acceso(self):
+        self.autenticar(self.tokens['refresh'])
+        self.assertIn(self.cliente.get('/api/auth/profile/').status_code, (401, 403))
@@ -0,0 +1,90 @@
+"""
+Pruebas del logging estructurado.
+"""
+
+import json
+import logging
+import sys
+
+import cloudinary
+from django.test import TestCase
+
+from blog.structured_logging import ColaHandler, JSONFormatter, desvincular, vincular
+
+
+class ListaHandler(logging.Handler):
+    def __init__(self, level=logging.NOTSET):
+        super().__init__(level)
+        self.registros = []
+        self.setFormatter(JSONFormatter())
+
+    def emit(self, record):
+        self.registros.append(json.loads(self.format(record)))
+
+
+def registro(mensaje, *args, **kwargs):
+    return logging.LogRecord('blog', logging.INFO, __file__, 1, mensaje, args, None, **kwargs)
+
+
+class JSONFormatterTestCase(TestCase):
+    """Verifica que cada registro es JSON válido con sus campos."""
+
+    def test_escapa_mensaje_y_anade_extra(self):
+        entrada = registro('Guardando noticia: %s', 'Título "con comillas"\ny salto')
+        entrada.oferta = 7
+        datos = json.loads(JSONFormatter().format(entrada))
+
+        self.assertEqual(datos['message'], 'Guardando noticia: Título "con comillas"\ny salto')
+        self.assertEqual((datos['level'], datos['logger'], datos['oferta']), ('INFO', 'blog', 7))
+        self.assertNotIn('args', datos)
+
+    def test_contexto_y_excepcion(self):
+        token = vincular(request_id='abc', method='GET')
+        self.addCleanup(desvincular, token)
+        try:
+            raise ValueError('fallo')
+        except ValueError:
+            entrada = logging.LogRecord('blog', logging.ERROR, __file__, 1, 'error', (), sys.exc_info())
+        datos = json.loads(JSONFormatter().format(entrada))
+
+        self.assertEqual((datos['request_id'], datos['method']), ('abc', 'GET'))
+        self.assertIn('ValueError: fallo', datos['exception'])
+
+
+class ColaHandlerTestCase(TestCase):
+    """Verifica la entrega en otro hilo, los niveles y el descarte."""
+
+    def test_entrega_con_contexto_del_hilo_que_registra(self):
+        destino, errores = ListaHandler(), ListaHandler(logging.ERROR)
+        cola = ColaHandler([destino, errores])
+        self.addCleanup(cola.close)
+        token = vincular(request_id='r1')
+        cola.handle(registro('hola %s', 'mundo'))
+        desvincular(token)
+        cola.detener()
+
+        self.assertEqual(len(destino.registros), 1)
+        self.assertEqual(destino.registros[0]['message'], 'hola mundo')
+        self.assertEqual(destino.registros[0]['request_id'], 'r1')
+        self.assertEqual(errores.registros, [])
+
+    def test_cola_llena_descarta(self):
+        cola = ColaHandler([ListaHandler()], tamano=1)
+        self.addCleanup(cola.close)
+        cola.enqueue(registro('uno'))
+        cola.enqueue(registro('dos'))
+        self.assertEqual(cola.descartados, 1)
+
+
+class LogContextMiddlewareTestCase(TestCase):
+    """Verifica la cabecera X-Request-ID."""
+
+    def setUp(self):
+        cloudinary.config(cloud_name='demo')
+
+    def test_request_id(self):
+        propio = self.client.get('/api/hl4/v1/noticias/', HTTP_X_REQUEST_ID='balanceador-42')
+        invalido = self.client.get('/api/hl4/v1/noticias/', HTTP_X_REQUEST_ID='a b"c')
+
+        self.assertEqual(propio['X-Request-ID'], 'balanceador-42')
+        self.assertRegex(invalido['X-Request-ID'], r'^[0-9a-f]{32}$')
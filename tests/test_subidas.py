@@ -0,0 +1,105 @@
+"""
+Pruebas de la subida diferida de imágenes.
+"""
+
+import io
+import os
+import shutil
+import tempfile
+from unittest import mock
+
+import cloudinary
+from django.contrib.auth.models import User
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.test import TestCase, override_settings
+from PIL import Image
+from rest_framework.test import APIClient
+
+from blog.Models.NoticiasModel import Noticias
+from blog.Models.SubidaImagenModel import SubidaImagen
+from blog.subidas import SubidaLocal
+
+
+def imagen_png(nombre='foto.png'):
+    contenido = io.BytesIO()
+    Image.new('RGB', (8, 8), 'red').save(contenido, 'PNG')
+    return SimpleUploadedFile(nombre, contenido.getvalue(), content_type='image/png')
+
+
+class SubidaDiferidaTestCase(TestCase):
+    """Verifica el estado pendiente, la finalización y los reemplazos."""
+
+    def setUp(self):
+        cloudinary.config(cloud_name='demo')
+        directorio = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, directorio)
+        self.temporal = os.path.join(directorio, 'pendientes')
+        self.destino = os.path.join(directorio, 'imagenes')
+        ajustes = override_settings(
+            IMAGE_UPLOAD_ASYNC=True, IMAGE_UPLOAD_BACKEND='blog.subidas.SubidaLocal',
+            IMAGE_UPLOAD_STAGING_DIR=self.temporal, IMAGE_UPLOAD_LOCAL_DIR=self.destino, IMAGE_PREPROCESS=False,
+        )
+        ajustes.enable()
+        self.addCleanup(ajustes.disable)
+        self.user = User.objects.create_user(username='autor', password='x')
+        self.cliente = APIClient()
+        self.cliente.force_authenticate(self.user)
+
+    def crear(self):
+        return self.cliente.post('/api/hl4/v1/noticias/', {
+            'nombre_noticia': 'Noticia', 'link_noticia': 'https://example.com/n',
+            'description_noticia': 'Texto', 'creador': self.user.pk, 'imagen_noticia': imagen_png(),
+        }, format='multipart')
+
+    def archivos(self, directorio):
+        return [nombre for _, _, nombres in os.walk(directorio) for nombre in nombres]
+
+    def test_pendiente_y_finalizada(self):
+        with self.captureOnCommitCallbacks() as callbacks:
+            respuesta = self.crear()
+        self.assertEqual(respuesta.status_code, 201, respuesta.content)
+        self.assertIsNone(respuesta.data['imagen_noticia'])
+        self.assertEqual(respuesta.data['imagenes_pendientes'], ['imagen_noticia'])
+        subida = SubidaImagen.objects.get()
+        self.assertEqual(subida.estado, SubidaImagen.PENDIENTE)
+        self.assertEqual(len(self.archivos(self.temporal)), 1)
+
+        for callback in callbacks:
+            callback()
+
+        subida.refresh_from_db()
+        self.assertEqual((subida.estado, subida.intentos), (SubidaImagen.COMPLETADA, 1))
+        self.assertEqual(self.archivos(self.temporal), [])
+        self.assertEqual(self.archivos(self.destino), ['foto.png'])
+        imagen = Noticias.objects.get().imagen_noticia
+        self.assertEqual((imagen.public_id, imagen.format), ('noticias/foto', 'png'))
+        detalle = self.cliente.get(f"/api/hl4/v1/noticias/{respuesta.data['idnoticia']}/").json()
+        self.assertRegex(detalle['imagen_noticia'], r'/image/upload/v\d+/noticias/foto\.png$')
+        self.assertNotIn('imagenes_pendientes', detalle)
+
+    def test_subida_reemplazada(self):
+        with self.captureOnCommitCallbacks() as callbacks:
+            idnoticia = self.crear().data['idnoticia']
+            self.cliente.patch(
+                f'/api/hl4/v1/noticias/{idnoticia}/', {'imagen_noticia': imagen_png('nueva.png')}, format='multipart',
+            )
+        for callback in callbacks:
+            callback()
+
+        self.assertEqual(
+            list(SubidaImagen.objects.order_by('pk').values_list('estado', flat=True)),
+            [SubidaImagen.REEMPLAZADA, SubidaImagen.COMPLETADA],
+        )
+        self.assertEqual(Noticias.objects.get().imagen_noticia.public_id, 'noticias/nueva')
+        self.assertEqual(self.archivos(self.temporal), [])
+
+    def test_error_sin_broker(self):
+        with self.captureOnCommitCallbacks() as callbacks:
+            self.crear()
+        with mock.patch.object(SubidaLocal, 'subir', side_effect=OSError('sin conexión')):
+            for callback in callbacks:
+                callback()
+
+        subida = SubidaImagen.objects.get()
+        self.assertEqual((subida.estado, subida.intentos, subida.error), (SubidaImagen.ERROR, 1, 'sin conexión'))
+        self.assertFalse(Noticias.objects.get().imagen_noticia)
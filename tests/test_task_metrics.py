@@ -0,0 +1,67 @@
+"""
+Pruebas de las métricas de las tareas de Celery.
+"""
+
+import time
+from datetime import timedelta
+from unittest import mock
+
+from django.contrib.auth.models import User
+from django.core.cache import cache
+from django.test import TestCase
+from django.utils import timezone
+from rest_framework.test import APIClient
+
+from blog import task_metrics, tasks
+from blog.Models.OfertasEmpleoModel import OfertasEmpleo
+
+TAREA = 'blog.tasks.eliminar_ofertas_expiradas'
+
+
+class TaskMetricsTestCase(TestCase):
+    """Verifica el registro por señales y el endpoint de staff."""
+
+    def setUp(self):
+        cache.clear()
+        self.user = User.objects.create_user(username='autor', password='x')
+
+    def crear_ofertas(self, expiradas):
+        OfertasEmpleo.objects.bulk_create([
+            OfertasEmpleo(
+                titulo_empleo=f'Oferta {i}', empresa='ACME', descripcion_empleo='Backend',
+                link_oferta='https://example.com/oferta', creador=self.user, imagen='image/upload/v1/ofertas/logo.png',
+                fecha_expiracion=timezone.now() - timedelta(days=1),
+            )
+            for i in range(expiradas)
+        ])
+
+    def test_ejecuciones_filas_y_errores(self):
+        self.crear_ofertas(3)
+        tasks.eliminar_ofertas_expiradas.delay()
+        tasks.eliminar_ofertas_expiradas.apply(headers={'publicado_en': time.time() - 2})
+        with mock.patch.object(OfertasEmpleo.objects, 'filter', side_effect=RuntimeError('sin base de datos')):
+            tasks.eliminar_ofertas_expiradas.delay()
+
+        resumen = task_metrics.resumen_tarea(TAREA)
+        self.assertEqual(
+            (resumen['ejecuciones'], resumen['errores'], resumen['filas_afectadas']), (3, 1, 3),
+        )
+        self.assertGreaterEqual(resumen['espera_p95_ms'], 2000)
+        self.assertEqual([m['estado'] for m in resumen['ultimas']], ['error', 'ok', 'ok'])
+        self.assertEqual(resumen['ultimas'][-1]['filas'], 3)
+
+    def test_endpoint_solo_staff(self):
+        tasks.eliminar_ofertas_expiradas.delay()
+        cliente = APIClient()
+        cliente.force_authenticate(self.user)
+        self.assertEqual(cliente.get('/api/metrics/tasks/').status_code, 403)
+
+        self.user.is_staff = True
+        self.user.save()
+        respuesta = cliente.get('/api/metrics/tasks/', {'horas': 1})
+        self.assertEqual(respuesta.status_code, 200)
+        datos = respuesta.json()['tareas'][TAREA]
+        self.assertEqual((datos['cola'], datos['ejecuciones']), ('mantenimiento', 1))
+        self.assertEqual(datos['limites_s'], {'soft': 120, 'hard': 150})
+        self.assertIn('blog.tasks.finalizar_subida_imagen', respuesta.json()['tareas'])
+        self.assertEqual(cliente.get('/api/metrics/tasks/', {'horas': 'x'}).status_code, 400)
@@ -0,0 +1,93 @@
+"""
+Pruebas del índice de tecnologías de proyectos.
+"""
+
+from io import StringIO
+
+from django.contrib.auth.models import User
+from django.core.cache import cache
+from django.core.management import call_command
+from django.test import SimpleTestCase, TestCase, override_settings
+from django.utils import timezone
+from rest_framework.test import APIClient
+
+from blog.Models.ProyectosModel import Proyectos
+from blog.Models.TecnologiaProyectoModel import TecnologiaProyecto
+from blog.tecnologias import extraer_tecnologias
+
+
+class ExtraerTecnologiasTestCase(SimpleTestCase):
+    """Verifica la detección de palabras clave con límites de palabra."""
+
+    def test_limites_de_palabra(self):
+        texto = 'API en Django y JavaScript; despliegue con Docker. Sin javaee ni gitlab.'
+        self.assertEqual(extraer_tecnologias(texto), {'django', 'javascript', 'docker'})
+
+    @override_settings(TECNOLOGIAS_PROYECTOS=['node.js', 'node', 'c++', 'c'])
+    def test_palabras_con_simbolos(self):
+        self.assertEqual(extraer_tecnologias('Backend en Node.js y motor en C++'), {'node.js', 'c++'})
+        self.assertEqual(extraer_tecnologias(''), set())
+
+
+class TecnologiasProyectoTestCase(TestCase):
+    """Verifica la indexación al guardar y el endpoint de popularidad."""
+
+    def setUp(self):
+        cache.clear()
+        self.user = User.objects.create_user(username='autor', password='x')
+
+    def crear(self, descripcion):
+        return Proyectos.objects.create(
+            nombre_proyecto='Proyecto',
+            fecha_proyecto=timezone.now(),
+            link_proyecto='https://example.com',
+            description_proyecto=descripcion,
+            creador=self.user,
+        )
+
+    def etiquetas(self, proyecto):
+        return set(proyecto.tecnologias.values_list('tecnologia', flat=True))
+
+    def test_indexa_al_guardar_y_actualiza(self):
+        proyecto = self.crear('Django con PostgreSQL')
+        self.assertEqual(self.etiquetas(proyecto), {'django', 'postgresql'})
+
+        proyecto.description_proyecto = 'Migrado a React con Django'
+        proyecto.save()
+        self.assertEqual(self.etiquetas(proyecto), {'django', 'react'})
+
+    def test_sin_cambios_en_la_descripcion_no_reindexa(self):
+        proyecto = Proyectos.objects.get(pk=self.crear('Django con PostgreSQL').pk)
+        proyecto.nombre_proyecto = 'Renombrado'
+        # Solo el UPDATE, sin leer las tecnologías
+        with self.assertNumQueries(1):
+            proyecto.save()
+
+        proyecto.description_proyecto = 'Django con Redis'
+        proyecto.save()
+        self.assertEqual(self.etiquetas(proyecto), {'django', 'redis'})
+
+    def test_endpoint_agrupa_en_una_consulta(self):
+        self.crear('Python y Django')
+        self.crear('Django y React')
+        self.crear('React Native')
+
+        with self.assertNumQueries(1):
+            respuesta = APIClient().get('/api/hl4/v1/proyectos/tecnologias_populares/')
+        self.assertEqual(respuesta.status_code, 200)
+        self.assertEqual(respuesta.data, [
+            {'tecnologia': 'django', 'proyectos': 2},
+            {'tecnologia': 'react', 'proyectos': 2},
+            {'tecnologia': 'python', 'proyectos': 1},
+        ])
+
+    def test_filtro_y_reindexado(self):
+        proyecto = self.crear('Servicio en Java y Go')
+        self.crear('Frontend en JavaScript')
+        respuesta = APIClient().get('/api/hl4/v1/proyectos/', {'tecnologia': 'java'})
+        self.assertEqual(respuesta.data['count'], 1)
+
+        with override_settings(TECNOLOGIAS_PROYECTOS=['java', 'go']):
+            call_command('reindexar_tecnologias', stdout=StringIO())
+            self.assertEqual(self.etiquetas(proyecto), {'java', 'go'})
+        self.assertEqual(TecnologiaProyecto.objects.count(), 2)
@@ -0,0 +1,69 @@
+"""
+Pruebas del throttling por endpoint con ventanas deslizantes.
+"""
+
+from django.conf import settings
+from django.contrib.auth.models import User
+from django.core.cache import cache
+from django.test import TestCase, override_settings
+from rest_framework.test import APIClient
+
+
+def tasas(**rates):
+    return {**settings.REST_FRAMEWORK, 'DEFAULT_THROTTLE_RATES': rates}
+
+
+class ThrottlingTestCase(TestCase):
+    """Verifica límites por endpoint, cabeceras RateLimit-* y respuestas 429."""
+
+    def setUp(self):
+        cache.clear()
+        self.cliente = APIClient()
+
+    @override_settings(REST_FRAMEWORK=tasas(anon='3/min', user='100/min'))
+    def test_cabeceras_y_429_al_superar_el_limite(self):
+        restantes = []
+        for _ in range(3):
+            respuesta = self.cliente.get('/api/hl4/v1/noticias/')
+            self.assertEqual(respuesta.status_code, 200)
+            self.assertEqual(respuesta['RateLimit-Limit'], '3')
+            self.assertEqual(respuesta['RateLimit-Policy'], '3;w=60')
+            restantes.append(int(respuesta['RateLimit-Remaining']))
+        self.assertEqual(restantes, [2, 1, 0])
+
+        respuesta = self.cliente.get('/api/hl4/v1/noticias/')
+        self.assertEqual(respuesta.status_code, 429)
+        self.assertGreater(int(respuesta['Retry-After']), 0)
+        self.assertEqual(respuesta['RateLimit-Remaining'], '0')
+
+    @override_settings(REST_FRAMEWORK=tasas(anon='2/min'))
+    def test_contadores_independientes_por_endpoint(self):
+        for _ in range(2):
+            self.cliente.get('/api/hl4/v1/noticias/')
+        self.assertEqual(self.cliente.get('/api/hl4/v1/noticias/').status_code, 429)
+        self.assertEqual(self.cliente.get('/api/hl4/v1/cursos/').status_code, 200)
+
+    @override_settings(REST_FRAMEWORK=tasas(**{'anon': '100/min', 'user': '1/min', 'ofertas.anon': '1/min'}))
+    def test_tasa_especifica_del_endpoint(self):
+        self.assertEqual(self.cliente.get('/api/hl4/v1/ofertasempleo/').status_code, 200)
+        self.assertEqual(self.cliente.get('/api/hl4/v1/ofertasempleo/').status_code, 429)
+        self.assertEqual(self.cliente.get('/api/hl4/v1/noticias/').status_code, 200)
+
+        # Los usuarios autenticados tienen su propio contador y tasa
+        self.cliente.force_authenticate(User.objects.create_user(username='lectora', password='x'))
+        respuesta = self.cliente.get('/api/hl4/v1/ofertasempleo/')
+        self.assertEqual(respuesta.status_code, 200)
+        self.assertEqual(respuesta['RateLimit-Limit'], '1')
+
+    @override_settings(REST_FRAMEWORK=tasas(anon='7/min'), THROTTLE_SEARCH_COST=3)
+    def test_coste_de_acciones_y_busquedas(self):
+        # estadisticas cuesta 5 de los 7 del presupuesto de conferencias
+        respuesta = self.cliente.get('/api/hl4/v1/conferencias/estadisticas/')
+        self.assertEqual(respuesta.status_code, 200)
+        self.assertEqual(respuesta['RateLimit-Remaining'], '2')
+        self.assertEqual(self.cliente.get('/api/hl4/v1/conferencias/estadisticas/').status_code, 429)
+
+        # Las lecturas baratas siguen cabiendo, una búsqueda (3) ya no
+        self.assertEqual(self.cliente.get('/api/hl4/v1/conferencias/').status_code, 200)
+        self.assertEqual(self.cliente.get('/api/hl4/v1/conferencias/', {'search': 'django'}).status_code, 429)
+        self.assertEqual(self.cliente.get('/api/hl4/v1/conferencias/').status_code, 200)
@@ -0,0 +1,128 @@
+"""
+Pruebas de instantánea del serializador de lectura desde `.values()`:
+su salida debe ser idéntica a la de los serializers de DRF.
+"""
+
+from datetime import timedelta
+
+import cloudinary
+from django.contrib.auth.models import User
+from django.test import TestCase, override_settings
+from django.utils import timezone
+from rest_framework import serializers
+from rest_framework.renderers import JSONRenderer
+from rest_framework.request import Request
+from rest_framework.test import APIClient, APIRequestFactory
+
+from blog.Models.AuditLogModel import AuditLog
+from blog.Models.ConferenciasModel import Conferencias
+from blog.Models.CursosModel import Cursos
+from blog.Models.IntegrantesModel import Integrantes
+from blog.Models.NoticiasModel import Noticias
+from blog.Models.OfertasEmpleoModel import OfertasEmpleo
+from blog.Models.ProyectosIntegrantesModel import ProyectosIntegrantesProyecto
+from blog.Models.ProyectosModel import Proyectos
+from blog.Serializers.AuditLogSerializer import AuditLogSerializer
+from blog.Serializers.ConferenciasSerializer import ConferenciasSerializer
+from blog.Serializers.CursosSerializer import CursosSerializer
+from blog.Serializers.IntegrantesSerializer import IntegrantesSerializer
+from blog.Serializers.NoticiasSerializer import NoticiasSerializer
+from blog.Serializers.OfertasSerializer import OfertasEmpleoSerializer
+from blog.Serializers.ProyectosSerializer import ProyectosSerializer
+from blog.Serializers.ValuesSerializer import ValuesSerializer
+
+
+class ValuesSerializerTestCase(TestCase):
+    """Compara la salida renderizada con la de cada serializer de DRF."""
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.create_user(username='autor', password='x')
+        ahora = timezone.now()
+        for i in range(3):
+            Noticias.objects.create(
+                nombre_noticia=f'Noticia {i}', link_noticia='https://example.com/n',
+                description_noticia='Texto', creador=cls.user, fuente=None if i else 'Fuente',
+                imagen_noticia='image/upload/v1/noticias/foto.jpg',
+            )
+            Conferencias.objects.create(
+                nombre_conferencia=f'Conferencia {i}', ponente_conferencia='Ponente',
+                descripcion_conferencia='Descripción', link_conferencia='https://example.com/c',
+                imagen_conferencia='image/upload/v2/conferencias/cartel.png', creador=cls.user,
+                fecha_conferencia=None if i else ahora + timedelta(days=3),
+            )
+            Cursos.objects.create(
+                nombre_curso=f'Curso {i}', link_curso='https://example.com/curso',
+                descripcion_curso='Curso', creador=cls.user, fechainicial_curso=ahora,
+            )
+            OfertasEmpleo.objects.create(
+                titulo_empleo=f'Oferta {i}', empresa='ACME', descripcion_empleo='Backend',
+                link_oferta='https://example.com/o', creador=cls.user,
+                imagen='image/upload/v1/ofertas/logo.png', fecha_expiracion=ahora + timedelta(days=i),
+            )
+            integrante = Integrantes.objects.create(
+                nombre_integrante=f'Integrante {2 - i}', semestre='5', correo=f'i{i}@example.com',
+                link_git='https://github.com/i', creador=cls.user, estado=bool(i % 2),
+                imagen='image/upload/v1/integrantes/perfil.jpg', reseña='Django',
+            )
+            proyecto = Proyectos.objects.create(
+                nombre_proyecto=f'Proyecto {i}', fecha_proyecto=ahora, link_proyecto='https://example.com/p',
+                description_proyecto='Django', creador=cls.user,
+            )
+            if i:
+                ProyectosIntegrantesProyecto.objects.create(proyectos=proyecto, integrantes=integrante)
+            AuditLog.objects.create(
+                user=cls.user, table_name='blog_noticias', change_type='UPDATE',
+                affected_record_id=i, modified_data={'antes': {'titulo': 'a'}, 'despues': [1, 2.5, None]},
+            )
+
+    def setUp(self):
+        cloudinary.config(cloud_name='demo')
+        self.contexto = {'request': Request(APIRequestFactory().get('/api/hl4/v1/'))}
+
+    def comparar(self, serializer_class):
+        modelo = serializer_class.Meta.model
+        esperado = serializer_class(modelo.objects.all(), many=True, context=self.contexto).data
+        rapido = ValuesSerializer.para(serializer_class, self.contexto)
+        self.assertIsNotNone(rapido)
+        obtenido = rapido.serializar(rapido.preparar(modelo.objects.all()))
+        self.assertEqual(JSONRenderer().render(obtenido), JSONRenderer().render(esperado))
+
+        instancia = modelo.objects.last()
+        self.assertEqual(
+            JSONRenderer().render(rapido.serializar_instancia(instancia)),
+            JSONRenderer().render(serializer_class(instancia, context=self.contexto).data),
+        )
+
+    def test_instantaneas_identicas(self):
+        for serializer_class in (
+            NoticiasSerializer, ConferenciasSerializer, CursosSerializer, IntegrantesSerializer,
+            OfertasEmpleoSerializer, ProyectosSerializer, AuditLogSerializer,
+        ):
+            with self.subTest(serializer=serializer_class.__name__):
+                self.comparar(serializer_class)
+
+    def test_serializer_no_compatible(self):
+        class ConResumen(serializers.ModelSerializer):
+            resumen = serializers.SerializerMethodField()
+
+            class Meta:
+                model = Noticias
+                fields = ['nombre_noticia', 'resumen']
+
+        self.assertIsNone(ValuesSerializer.para(ConResumen))
+
+    def test_endpoints_identicos_con_y_sin_ruta_rapida(self):
+        cliente = APIClient()
+        for url in ('/api/hl4/v1/proyectos/', '/api/hl4/v1/noticias/?ordering=nombre_noticia',
+                    f'/api/hl4/v1/integrantes/{Integrantes.objects.first().pk}/'):
+            with self.subTest(url=url):
+                rapida = cliente.get(url)
+                with override_settings(FAST_READ_SERIALIZERS=False):
+                    normal = cliente.get(url)
+                self.assertEqual(rapida.status_code, 200)
+                self.assertEqual(rapida.content, normal.content)
+
+        # Conteo, página y una sola consulta para los integrantes de todos los proyectos
+        with self.assertNumQueries(3):
+            cliente.get('/api/hl4/v1/proyectos/')